@@ -3,10 +3,11 @@
 """
 This script demonstrates how to use pyo to do synthesis batch generation.
 
+The files are rendered in parallel, one offline server per CPU.
+
 """
-import os
+import os, functools
 from pyo import *
-s = Server(duplex=0, audio="offline")
 
 # output folder
 output_folder = os.path.join(os.path.expanduser("~"), "pyo_batch_synth")
@@ -16,24 +17,28 @@ if not os.path.isdir(output_folder):
 # output file duration
 dur = 2
 
-NUM = 12
-for i in range(NUM):
-    s.boot()
-    note = 60 + i
-    noteFreq = midiToHz(note)
-    s.recordOptions(dur=dur+.1, filename=os.path.join(output_folder, "file_%02d.wav" % note), 
-                    fileformat=0, sampletype=0)
-
+def synth(note):
     ### processing goes here ###
+    noteFreq = midiToHz(note)
     env = Adsr(attack=0.005, decay=0.15, sustain=0.7, release=1.7, dur=dur).play()
     qenv = Pow(env, 4, mul=0.8)
     osc1 = SineLoop(freq=noteFreq, feedback=0.075, mul=qenv).out()
     osc2 = SineLoop(freq=noteFreq*1.01, feedback=0.075, mul=qenv).out(1)
-
-    # start th render
-    s.start()
-    # cleanup
-    s.shutdown()
-
-print "Batch processing done"
-
+    # the objects must be kept alive during the rendering
+    return [env, qenv, osc1, osc2]
+
+if __name__ == "__main__":
+    NUM = 12
+    jobs = []
+    for i in range(NUM):
+        note = 60 + i
+        jobs.append((functools.partial(synth, note), dur+.1,
+                     os.path.join(output_folder, "file_%02d.wav" % note)))
+
+    for report in batchRender(jobs, fileformat=0, sampletype=0):
+        if report['error'] != None:
+            print "%s failed: %s" % (report['path'], report['error'])
+        else:
+            print "%s rendered in %.3f sec (%.1f x realtime)" % (report['path'], report['time'], report['speed'])
+
+    print "Batch processing done"
@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+This script shows how to drive the midi objects without any midi device.
+
+The events are injected in the midi input queue of the server at precise
+times, and the result is rendered offline, so a midi setup can be tested
+(or played from a score) on a computer without midi hardware.
+
+"""
+import os
+from pyo import *
+
+s = Server(audio="offline").boot()
+s.recordOptions(dur=4, filename=os.path.join(os.path.expanduser("~"), "midi_injection.wav"))
+
+notes = Notein(poly=8, scale=1)
+amp = MidiAdsr(notes["velocity"], attack=0.005, decay=0.1, sustain=0.5, release=0.3, mul=0.15)
+cutoff = Midictl(ctlnumber=74, minscale=500, maxscale=5000, init=1000)
+bend = Bendin(brange=2, scale=1)
+osc = SuperSaw(freq=notes["pitch"]*bend, detune=0.6, bal=0.7, mul=amp)
+filt = ButLP(osc.mix(1), freq=cutoff).mix(2).out()
+
+# A chord, a filter sweep and a pitch bend. The events happen at the exact
+# sample given by their time.
+for i, pitch in enumerate([48, 55, 60, 64, 67]):
+    s.schedule(0.5 + i * 0.05, s.addMidiEvent, 0x90, pitch, 100)
+    s.schedule(3, s.addMidiEvent, 0x80, pitch, 0)
+for i in range(64):
+    s.schedule(1 + i * 0.02, s.addMidiEvent, 0xB0, 74, i * 2)
+for i in range(33):
+    value = 8192 + i * 128
+    s.schedule(2 + i * 0.01, s.addMidiEvent, 0xE0, value & 0x7F, value >> 7)
+
+s.start()
@@ -0,0 +1,66 @@
+/**************************************************************************
+ * Copyright 2009-2015 Olivier Belanger                                   *
+ *                                                                        *
+ * This file is part of pyo, a python module to help digital signal       *
+ * processing script creation.                                            *
+ *                                                                        *
+ * pyo is free software: you can redistribute it and/or modify            *
+ * it under the terms of the GNU Lesser General Public License as         *
+ * published by the Free Software Foundation, either version 3 of the     *
+ * License, or (at your option) any later version.                        *
+ *                                                                        *
+ * pyo is distributed in the hope that it will be useful,                 *
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of         *
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the          *
+ * GNU Lesser General Public License for more details.                    *
+ *                                                                        *
+ * You should have received a copy of the GNU Lesser General Public       *
+ * License along with pyo.  If not, see <http://www.gnu.org/licenses/>.   *
+ *                                                                        *
+ * Analysis bus. The analyzers write their frames in a preallocated ring, *
+ * optionally in a memory-mapped file shared with other processes, and   *
+ * the readers access the frames in place through the buffer protocol.   *
+ *                                                                        *
+ * Memory layout (also the layout of the shared file):                    *
+ *   - header, ANALYSISBUS_HEADER bytes: AnalysisBusHeader.               *
+ *   - one 64-bit sequence number per channel, the number of frames       *
+ *     written in the channel. The last frame written is at the index     *
+ *     (sequence - 1) % frames.                                           *
+ *   - the frames, 32-bit floats, as [channels][frames][framesize].       *
+ *************************************************************************/
+
+#ifndef Py_ANALYSISBUSMODULE_H
+#define Py_ANALYSISBUSMODULE_H
+
+#include <Python.h>
+#include "pyomodule.h"
+
+#define ANALYSISBUS_MAGIC "PYOABUS1"
+#define ANALYSISBUS_HEADER 64
+
+typedef struct {
+    char magic[8];
+    int channels;
+    int frames;
+    int framesize;
+} AnalysisBusHeader;
+
+typedef struct {
+    PyObject_HEAD
+    int channels;
+    int frames;
+    int framesize;
+    char *memory;
+    size_t memsize;
+    int mapped; /* 1 if the memory is a mapped file */
+    volatile unsigned PY_LONG_LONG *sequences;
+    float *data;
+    Py_ssize_t view_shape[3]; /* filled for the buffer protocol */
+    Py_ssize_t view_strides[3];
+} AnalysisBus;
+
+extern void AnalysisBus_write(AnalysisBus *self, int chnl, MYFLT *values, int count);
+extern PyObject * AnalysisBus_setTarget(AnalysisBus **bus, int *buschnl, PyObject *args);
+extern PyTypeObject AnalysisBusType;
+
+#endif
@@ -32,4 +32,29 @@ void irealfft_packed(MYFLT *data, MYFLT *outdata, int size, MYFLT *twiddle);
 /* Prototype for array generation of twiddle factors */
 void fft_compute_split_twiddle(MYFLT **twiddle, int size);
 void fft_compute_radix2_twiddle(MYFLT *twiddle, int size);
+
+/* Maximum number of stages of the mixed-radix ffts */
+#define FFT_MAX_STAGES 32
+
+/* Twiddle factors and analysis window shared by the objects using the same size and window */
+typedef struct _FFTPlan {
+    int size;
+    int wintype; /* -1 for a plan without window */
+    int refcount;
+    int stages; /* mixed-radix stages of the half size complex fft */
+    int radix[FFT_MAX_STAGES];
+    MYFLT *factors; /* complex twiddle factors of the mixed-radix stages */
+    MYFLT *rfactors; /* complex twiddle factors of the real spectrum unpacking */
+    MYFLT *window; /* NULL for a plan without window */
+    struct _FFTPlan *next;
+} FFTPlan;
+
+/* 1 if the size is even, at least 4, and half the size has no prime factors other than 2, 3 and 5 */
+int fft_size_is_valid(int size);
+/* NULL if the size is not valid */
+FFTPlan * fft_plan_acquire(int size, int wintype);
+void fft_plan_release(FFTPlan *plan);
+/* mixed-radix transforms, same layout and scaling as the split-radix ones */
+void realfft_plan(MYFLT *data, MYFLT *outdata, FFTPlan *plan);
+void irealfft_plan(MYFLT *data, MYFLT *outdata, FFTPlan *plan);
 #endif
@@ -27,7 +27,9 @@ typedef struct {
     PyObject_HEAD
     int width;
     int height;
-    MYFLT **data;
+    MYFLT **data; /* rows share one block of (height+1) * (width+1) samples */
+    Py_ssize_t view_shape[2]; /* filled for the buffer protocol */
+    Py_ssize_t view_strides[2];
 } MatrixStream;
 
 
@@ -0,0 +1,76 @@
+/**************************************************************************
+ * Copyright 2009-2015 Olivier Belanger                                   *
+ *                                                                        *
+ * This file is part of pyo, a python module to help digital signal       *
+ * processing script creation.                                            *
+ *                                                                        *
+ * pyo is free software: you can redistribute it and/or modify            *
+ * it under the terms of the GNU Lesser General Public License as         *
+ * published by the Free Software Foundation, either version 3 of the     *
+ * License, or (at your option) any later version.                        *
+ *                                                                        *
+ * pyo is distributed in the hope that it will be useful,                 *
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of         *
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the          *
+ * GNU Lesser General Public License for more details.                    *
+ *                                                                        *
+ * You should have received a copy of the GNU Lesser General Public       *
+ * License along with pyo.  If not, see <http://www.gnu.org/licenses/>.   *
+ *                                                                        *
+ * Open Sound Control output. The audio thread only stores the values of  *
+ * its senders, a single background thread collects them and sends, for   *
+ * each destination, all the messages ready in one OSC bundle, so the     *
+ * audio callback never waits on the network.                             *
+ *************************************************************************/
+
+#ifndef _OSCSENDER_
+#define _OSCSENDER_
+
+#include "lo/lo.h"
+#include "ringbuffer.h"
+
+/* Maximum number of messages waiting to be sent by a message sender. */
+#define OSCSENDER_MESSAGES 256
+
+/* A host and port, shared by all the senders targeting it. */
+typedef struct _OscDestination {
+    char *host;
+    char *port;
+    lo_address address;
+    int refcount;
+    lo_bundle bundle; /* messages collected by the sending thread in the current pass */
+    lo_message first;
+    const char *first_path;
+    int pending;
+    struct _OscDestination *next;
+} OscDestination;
+
+/* One address on a destination. A value sender keeps only the last value pushed, a message
+ * sender queues the messages pushed (see OscSender_pushMessage). */
+typedef struct _OscSender {
+    OscDestination *dest;
+    char *path;
+    volatile float value;
+    volatile unsigned long pushed; /* number of values pushed by the producer */
+    unsigned long seen; /* number of values taken by the sending thread */
+    RingBuffer *messages; /* lo_message pointers, NULL for a value sender */
+    double interval; /* minimum time, in seconds, between two messages (0 = no limit) */
+    double lasttime;
+    int changes; /* 1 = a value equal to the last one sent is not sent again */
+    int hassent;
+    float lastvalue;
+    /* counters */
+    volatile long sent;
+    volatile long coalesced; /* values replaced by a newer one before being sent */
+    volatile long filtered; /* values not sent because they did not change */
+    volatile long dropped; /* messages that did not fit in the queue */
+    struct _OscSender *next;
+} OscSender;
+
+OscSender * OscSender_new(const char *host, int port, const char *path, int messages);
+void OscSender_free(OscSender *self);
+void OscSender_pushValue(OscSender *self, float value, int blocking);
+int OscSender_pushMessage(OscSender *self, lo_message msg, int blocking);
+void OscSender_setMaxRate(OscSender *self, double rate);
+void OscSender_setChangesOnly(OscSender *self, int state);
+#endif
@@ -51,6 +51,7 @@
 #define TYPE_O_IF "O|if"
 #define TYPE_O_IFS "O|ifs"
 #define TYPE_S_IFF "s|iff"
+#define TYPE_S_IFFI "s|iffi"
 #define TYPE_S_FIFF "s|fiff"
 #define TYPE_S_FFIFF "s|ffiff"
 #define TYPE_S__OIFI "s|Oifi"
@@ -79,6 +80,7 @@
 #define TYPE_O_IFFO "O|iffO"
 #define TYPE_O_OOIF "O|OOif"
 #define TYPE_O_FFFFIOO "O|ffffiOO"
+#define TYPE_O_FFFFIIOO "O|ffffiiOO"
 #define TYPE_OO_FOO "OO|fOO"
 #define TYPE_OO_FFOO "OO|ffOO"
 #define TYPE_O_IFIOO "O|ifiOO"
@@ -135,6 +137,7 @@
 #define TYPE_O_IF "O|id"
 #define TYPE_O_IFS "O|ids"
 #define TYPE_S_IFF "s|idd"
+#define TYPE_S_IFFI "s|iddi"
 #define TYPE_S_FIFF "s|didd"
 #define TYPE_S_FFIFF "s|ddidd"
 #define TYPE_S__OIFI "s|Oidi"
@@ -163,6 +166,7 @@
 #define TYPE_O_IFFO "O|iddO"
 #define TYPE_O_OOIF "O|OOid"
 #define TYPE_O_FFFFIOO "O|ddddiOO"
+#define TYPE_O_FFFFIIOO "O|ddddiiOO"
 #define TYPE_OO_FOO "OO|dOO"
 #define TYPE_OO_FFOO "OO|ddOO"
 #define TYPE_O_IFIOO "O|idiOO"
@@ -197,6 +201,8 @@
 #endif
 #endif
 
+#include "vectorops.h"
+
 #ifdef COMPILE_EXTERNALS
 #include "externalmodule.h"
 #endif
@@ -315,6 +321,9 @@ extern PyTypeObject TouchinType;
 extern PyTypeObject PrograminType;
 extern PyTypeObject MidiAdsrType;
 extern PyTypeObject MidiDelAdsrType;
+extern PyTypeObject VoicePoolType;
+extern PyTypeObject VoicePoolNoteType;
+extern PyTypeObject VoicePoolMixType;
 extern PyTypeObject DummyType;
 extern PyTypeObject TriggerDummyType;
 extern PyTypeObject RecordType;
@@ -581,6 +590,9 @@ extern PyTypeObject AtanTableType;
 
 #define pyo_CLEAR \
     if (PyServer_get_server() != NULL) { \
+        /* Without the GIL, the audio thread must not compute an object being cleared. */ \
+        if (self->stream != NULL && ((Server *)self->server)->gilfree == 1) \
+            Server_removeStream((Server *)self->server, Stream_getStreamId(self->stream)); \
         Py_INCREF(self->server); \
         Py_CLEAR(self->server); \
     } \
@@ -605,9 +617,12 @@ extern PyTypeObject AtanTableType;
     Py_CLEAR(self->matrixstream); \
 
 #define pyo_DEALLOC \
-    if (PyServer_get_server() != NULL) \
+    if (PyServer_get_server() != NULL) { \
         Server_removeStream((Server *)self->server, Stream_getStreamId(self->stream)); \
-    free(self->data); \
+        Server_freeData((Server *)self->server, self->data, self->bufsize); \
+    } \
+    else \
+        free(self->data); \
 
 /* INIT INPUT STREAM */
 #define INIT_INPUT_STREAM \
@@ -637,13 +652,11 @@ extern PyTypeObject AtanTableType;
     self->server = PyServer_get_server(); \
     self->mul = PyFloat_FromDouble(1); \
     self->add = PyFloat_FromDouble(0); \
-    self->bufsize = PyInt_AsLong(PyObject_CallMethod(self->server, "getBufferSize", NULL)); \
-    self->sr = PyFloat_AsDouble(PyObject_CallMethod(self->server, "getSamplingRate", NULL)); \
-    self->nchnls = PyInt_AsLong(PyObject_CallMethod(self->server, "getNchnls", NULL)); \
-    self->ichnls = PyInt_AsLong(PyObject_CallMethod(self->server, "getIchnls", NULL)); \
-    self->data = (MYFLT *)realloc(self->data, (self->bufsize) * sizeof(MYFLT)); \
-    for (i=0; i<self->bufsize; i++) \
-        self->data[i] = 0.0; \
+    self->bufsize = ((Server *)self->server)->bufferSize; \
+    self->sr = ((Server *)self->server)->samplingRate; \
+    self->nchnls = ((Server *)self->server)->nchnls; \
+    self->ichnls = ((Server *)self->server)->ichnls; \
+    self->data = Server_allocData((Server *)self->server, self->bufsize); \
     MAKE_NEW_STREAM(self->stream, &StreamType, NULL); \
     Stream_setStreamObject(self->stream, (PyObject *)self); \
     Stream_setStreamId(self->stream, Stream_getNewStreamId()); \
@@ -663,20 +676,40 @@ extern PyTypeObject AtanTableType;
         self->interp_func_ptr = cubic; \
 
 /* Set data */
+/* Accepts a list of floats or an array.array of native samples
+   ('f' for _pyo, 'd' for _pyo64), copied without conversion. */
 #define SET_TABLE_DATA \
     int i; \
+    const void *samples = NULL; \
+    Py_ssize_t nbytes = 0; \
+    PyObject *typecode = NULL; \
     if (! PyList_Check(arg)) { \
-        PyErr_SetString(PyExc_TypeError, "The data must be a list of floats."); \
-        return PyInt_FromLong(-1); \
+        if (PyObject_HasAttrString(arg, "typecode")) \
+            typecode = PyObject_GetAttrString(arg, "typecode"); \
+        if (typecode == NULL || ! PyString_Check(typecode) || \
+            strcmp(PyString_AsString(typecode), sizeof(MYFLT) == sizeof(float) ? "f" : "d") != 0 || \
+            PyObject_AsReadBuffer(arg, &samples, &nbytes) < 0) { \
+            Py_XDECREF(typecode); \
+            PyErr_Clear(); \
+            PyErr_SetString(PyExc_TypeError, "The data must be a list of floats or an array of native samples."); \
+            return PyInt_FromLong(-1); \
+        } \
+        Py_DECREF(typecode); \
+        self->size = nbytes / sizeof(MYFLT); \
     } \
-    self->size = PyList_Size(arg); \
+    else \
+        self->size = PyList_Size(arg); \
     self->data = (MYFLT *)realloc(self->data, (self->size+1) * sizeof(MYFLT)); \
     TableStream_setSize(self->tablestream, self->size+1); \
  \
-    for (i=0; i<(self->size); i++) { \
-        self->data[i] = PyFloat_AS_DOUBLE(PyNumber_Float(PyList_GET_ITEM(arg, i))); \
+    if (samples != NULL) \
+        memcpy(self->data, samples, self->size * sizeof(MYFLT)); \
+    else { \
+        for (i=0; i<(self->size); i++) { \
+            self->data[i] = PyFloat_AS_DOUBLE(PyNumber_Float(PyList_GET_ITEM(arg, i))); \
+        } \
     } \
-    self->data[self->size] = self->data[0]; \
+    self->data[self->size] = self->size > 0 ? self->data[0] : 0.0; \
     TableStream_setData(self->tablestream, self->data); \
  \
     Py_INCREF(Py_None); \
@@ -684,6 +717,7 @@ extern PyTypeObject AtanTableType;
 
 #define SET_MATRIX_DATA \
     int i, j; \
+    MYFLT *samples; \
     PyObject *innerlist; \
  \
     if (! PyList_Check(arg)) { \
@@ -692,9 +726,11 @@ extern PyTypeObject AtanTableType;
     } \
     self->height = PyList_Size(arg); \
     self->width = PyList_Size(PyList_GetItem(arg, 0)); \
-    self->data = (MYFLT **)realloc(self->data, (self->height + 1) * sizeof(MYFLT)); \
-    for (i=0; i<(self->height+1); i++) { \
-        self->data[i] = (MYFLT *)realloc(self->data[i], (self->width + 1) * sizeof(MYFLT)); \
+    samples = self->data[0]; \
+    self->data = (MYFLT **)realloc(self->data, (self->height + 1) * sizeof(MYFLT *)); \
+    self->data[0] = (MYFLT *)realloc(samples, (self->height + 1) * (self->width + 1) * sizeof(MYFLT)); \
+    for (i=1; i<(self->height+1); i++) { \
+        self->data[i] = self->data[0] + i * (self->width + 1); \
     } \
     MatrixStream_setWidth(self->matrixstream, self->width); \
     MatrixStream_setHeight(self->matrixstream, self->height); \
@@ -1546,111 +1582,48 @@ extern PyTypeObject AtanTableType;
 
 /* Post processing (mul & add) macros */
 #define POST_PROCESSING_II \
-    MYFLT mul, add, old, val; \
-    int i; \
+    MYFLT mul, add; \
     mul = PyFloat_AS_DOUBLE(self->mul); \
     add = PyFloat_AS_DOUBLE(self->add); \
-    if (mul != 1 || add != 0) { \
-        for (i=0; i<self->bufsize; i++) { \
-            old = self->data[i]; \
-            val = mul * old + add; \
-            self->data[i] = val; \
-        } \
-    }
+    if (mul != 1 || add != 0) \
+        vector_muladd_ii(self->data, mul, add, self->bufsize);
 
 #define POST_PROCESSING_AI \
-    MYFLT add, old, val; \
-    int i; \
     MYFLT *mul = Stream_getData((Stream *)self->mul_stream); \
-    add = PyFloat_AS_DOUBLE(self->add); \
-    for (i=0; i<self->bufsize; i++) { \
-        old = self->data[i]; \
-        val = mul[i] * old + add; \
-        self->data[i] = val; \
-    }
+    MYFLT add = PyFloat_AS_DOUBLE(self->add); \
+    vector_muladd_ai(self->data, mul, add, self->bufsize);
 
 #define POST_PROCESSING_IA \
-    MYFLT mul, old, val; \
-    int i; \
-    mul = PyFloat_AS_DOUBLE(self->mul); \
+    MYFLT mul = PyFloat_AS_DOUBLE(self->mul); \
     MYFLT *add = Stream_getData((Stream *)self->add_stream); \
-    for (i=0; i<self->bufsize; i++) { \
-        old = self->data[i]; \
-        val = mul * old + add[i]; \
-        self->data[i] = val; \
-    }
+    vector_muladd_ia(self->data, mul, add, self->bufsize);
 
 #define POST_PROCESSING_AA \
-    MYFLT old, val; \
-    int i; \
     MYFLT *mul = Stream_getData((Stream *)self->mul_stream); \
     MYFLT *add = Stream_getData((Stream *)self->add_stream); \
-    for (i=0; i<self->bufsize; i++) { \
-        old = self->data[i]; \
-        val = mul[i] * old + add[i]; \
-        self->data[i] = val; \
-    }
+    vector_muladd_aa(self->data, mul, add, self->bufsize);
 
 #define POST_PROCESSING_REVAI \
-    MYFLT tmp, add, old, val; \
-    int i; \
     MYFLT *mul = Stream_getData((Stream *)self->mul_stream); \
-    add = PyFloat_AS_DOUBLE(self->add); \
-    for (i=0; i<self->bufsize; i++) { \
-        old = self->data[i]; \
-        tmp = mul[i]; \
-        if (tmp < 0.00001 && tmp > -0.00001) \
-            tmp = 0.00001; \
-        val = old / tmp + add; \
-        self->data[i] = val; \
-    }
+    MYFLT add = PyFloat_AS_DOUBLE(self->add); \
+    vector_divadd_ai(self->data, mul, add, self->bufsize);
 
 #define POST_PROCESSING_REVAA \
-    MYFLT tmp, old, val; \
-    int i; \
     MYFLT *mul = Stream_getData((Stream *)self->mul_stream); \
     MYFLT *add = Stream_getData((Stream *)self->add_stream); \
-    for (i=0; i<self->bufsize; i++) { \
-        old = self->data[i]; \
-        tmp = mul[i]; \
-        if (tmp < 0.00001 && tmp > -0.00001) \
-            tmp = 0.00001; \
-        val = old / tmp + add[i]; \
-        self->data[i] = val; \
-    }
+    vector_divadd_aa(self->data, mul, add, self->bufsize);
 
 #define POST_PROCESSING_IREVA \
-    MYFLT mul, old, val; \
-    int i; \
-    mul = PyFloat_AS_DOUBLE(self->mul); \
+    MYFLT mul = PyFloat_AS_DOUBLE(self->mul); \
     MYFLT *add = Stream_getData((Stream *)self->add_stream); \
-    for (i=0; i<self->bufsize; i++) { \
-        old = self->data[i]; \
-        val = mul * old - add[i]; \
-        self->data[i] = val; \
-    }
+    vector_mulsub_ia(self->data, mul, add, self->bufsize);
 
 #define POST_PROCESSING_AREVA \
-    MYFLT old, val; \
-    int i; \
     MYFLT *mul = Stream_getData((Stream *)self->mul_stream); \
     MYFLT *add = Stream_getData((Stream *)self->add_stream); \
-    for (i=0; i<self->bufsize; i++) { \
-        old = self->data[i]; \
-        val = mul[i] * old - add[i]; \
-        self->data[i] = val; \
-    }
+    vector_mulsub_aa(self->data, mul, add, self->bufsize);
 
 #define POST_PROCESSING_REVAREVA \
-    MYFLT tmp, old, val; \
-    int i; \
     MYFLT *mul = Stream_getData((Stream *)self->mul_stream); \
     MYFLT *add = Stream_getData((Stream *)self->add_stream); \
-    for (i=0; i<self->bufsize; i++) { \
-        old = self->data[i]; \
-        tmp = mul[i]; \
-        if (tmp < 0.00001 && tmp > -0.00001) \
-            tmp = 0.00001; \
-        val = old / tmp - add[i]; \
-        self->data[i] = val; \
-    }
+    vector_divsub_aa(self->data, mul, add, self->bufsize);
@@ -0,0 +1,68 @@
+/**************************************************************************
+ * Copyright 2009-2015 Olivier Belanger                                   *
+ *                                                                        *
+ * This file is part of pyo, a python module to help digital signal       *
+ * processing script creation.                                            *
+ *                                                                        *
+ * pyo is free software: you can redistribute it and/or modify            *
+ * it under the terms of the GNU Lesser General Public License as         *
+ * published by the Free Software Foundation, either version 3 of the     *
+ * License, or (at your option) any later version.                        *
+ *                                                                        *
+ * pyo is distributed in the hope that it will be useful,                 *
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of         *
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the          *
+ * GNU Lesser General Public License for more details.                    *
+ *                                                                        *
+ * You should have received a copy of the GNU Lesser General Public       *
+ * License along with pyo.  If not, see <http://www.gnu.org/licenses/>.   *
+ *                                                                        *
+ * Lock-free single producer / single consumer ring buffer. One thread    *
+ * writes items, another one reads them, without any lock. Used to pass   *
+ * data between the audio thread and the other threads of the server.     *
+ * RingQueue chains ring buffers to make a queue that never fills up.     *
+ *************************************************************************/
+
+#ifndef _RINGBUFFER_
+#define _RINGBUFFER_
+
+typedef struct {
+    char *buffer;
+    int itemsize;
+    unsigned int size; /* number of items, always a power of two */
+    unsigned int mask;
+    volatile unsigned int head; /* only modified by the producer */
+    volatile unsigned int tail; /* only modified by the consumer */
+} RingBuffer;
+
+RingBuffer * RingBuffer_new(int count, int itemsize);
+void RingBuffer_free(RingBuffer *self);
+int RingBuffer_readAvailable(RingBuffer *self);
+int RingBuffer_writeAvailable(RingBuffer *self);
+int RingBuffer_write(RingBuffer *self, const void *items, int count);
+int RingBuffer_read(RingBuffer *self, void *items, int count);
+void * RingBuffer_getItem(RingBuffer *self, int index);
+void RingBuffer_clear(RingBuffer *self);
+
+typedef struct _RingQueueSegment {
+    RingBuffer *ring;
+    struct _RingQueueSegment * volatile next;
+} RingQueueSegment;
+
+/* Unbounded single producer / single consumer queue. When its ring is full,
+   the producer links a new one, twice as big, and the consumer moves to it
+   once the previous one is empty. The producer frees the emptied rings. */
+typedef struct {
+    int itemsize;
+    RingQueueSegment *first; /* oldest segment not freed yet, producer side */
+    RingQueueSegment *write; /* segment written by the producer */
+    RingQueueSegment * volatile read; /* segment read by the consumer */
+} RingQueue;
+
+RingQueue * RingQueue_new(int count, int itemsize);
+void RingQueue_free(RingQueue *self);
+int RingQueue_write(RingQueue *self, const void *items, int count);
+void * RingQueue_peek(RingQueue *self);
+int RingQueue_read(RingQueue *self, void *items, int count);
+void RingQueue_clear(RingQueue *self);
+#endif
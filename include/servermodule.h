@@ -28,10 +28,13 @@
 extern "C" {
 #endif
 
+#include <pthread.h>
 #include "portaudio.h"
 #include "portmidi.h"
 #include "sndfile.h"
 #include "pyomodule.h"
+#include "ringbuffer.h"
+#include "sfwriter.h"
 
 #ifdef USE_JACK
 #include <jack/jack.h>
@@ -54,6 +57,20 @@ typedef struct {
     PaStream *stream;
 } PyoPaBackendData;
 
+/* Maximum number of midi events given to the objects in one buffer, the others wait for the next buffer. */
+#define PYO_MIDI_EVENTS 200
+
+typedef struct {
+    PmEvent event; /* message and PortMidi timestamp, in milliseconds */
+    unsigned long time; /* position on the sample clock of the server */
+} PyoMidiEvent;
+
+/* Entry of the index of the streams list, sid 0 marks an empty entry. */
+typedef struct {
+    int sid;
+    PyObject *stream; /* borrowed, the streams list holds the reference. */
+} PyoStreamSlot;
+
 typedef struct {
 #ifdef USE_JACK
     jack_client_t *jack_client;
@@ -76,8 +93,15 @@ typedef struct {
     PmStream *midiout[64];
     int midiin_count;
     int midiout_count;
-    PmEvent midiEvents[200];
+    PmEvent midiEvents[PYO_MIDI_EVENTS]; /* events of the current buffer, timestamp is the sample offset */
     int midi_count;
+    RingQueue *midiqueue; /* events read from the midi inputs by the midi thread. */
+    RingQueue *midiinject; /* events added with addMidiEvent. */
+    pthread_t midi_thread;
+    int midi_running;
+    volatile int midi_quit;
+    double midi_clock; /* smoothed difference, in samples, between the PortMidi clock and the sample clock. */
+    int midi_clock_valid;
     double samplingRate;
     int nchnls;
     int ichnls;
@@ -94,7 +118,12 @@ typedef struct {
     int server_started;
     int server_stopped; /* for fadeout */
     int server_booted;
-    int stream_count;
+    int stream_count; /* size of the streams list, removed streams included. */
+    int stream_holes; /* removed streams, left as None in the list until it is compacted. */
+    PyoStreamSlot *stream_index; /* open addressing hash table from stream id to stream. */
+    int stream_index_size; /* power of two */
+    int stream_index_count;
+    int processing; /* 1 while the audio callback computes the streams, the list is not compacted. */
     int record;
     int thisServerID;       /* To keep the reference index in the array of servers */
 
@@ -112,14 +141,20 @@ typedef struct {
 
     /* rendering offline of the first "startoffset" seconds */
     double startoffset;
+    int rendering_offline; /* 1 while the startoffset is rendered faster than real time. */
+
+    /* disk streaming */
+    double prefetch; /* seconds of sound read ahead from the disk for each soundfile player. */
 
     /* rendering settings */
     double recdur;
     char *recpath;
     int recformat;
     int rectype;
-    SNDFILE *recfile;
+    int recsync; /* fsync policy of the recordings, see SfWriterSyncPolicy. */
     SF_INFO recinfo;
+    SfWriter *recwriter; /* writes the recorded frames from a background thread. */
+    long recoverruns; /* overruns of the last recording, once it is stopped. */
 
     /* GUI VUMETER */
     int withGUI;
@@ -139,14 +174,60 @@ typedef struct {
     int verbosity; /* a sum of values to display different levels: 1 = error */
                    /* 2 = message, 4 = warning , 8 = debug. Default 7.*/
     int globalSeed; /* initial seed for random objects. If -1, objects are seeded with the clock. */
+
+    /* Parallel processing */
+    int threads; /* number of threads used to compute the streams. 1 means serial processing. */
+    void *pool; /* worker threads and scheduling buffers, only allocated when threads > 1. */
+    int stream_edits; /* incremented each time the streams list is modified. */
+
+    /* Sleeping of the silent streams */
+    int sleep_silent; /* if 1, the streams with a tail are skipped while their inputs are silent. */
+    int streams_asleep; /* number of streams skipped during the last buffer. */
+
+    /* GIL-free processing */
+    int gilfree; /* if 1, the audio thread doesn't acquire the GIL, python calls are deferred. */
+    int gilfree_running; /* 1 when the current audio backend processes without the GIL. */
+    pthread_mutex_t dsp_mutex; /* held by the audio thread while processing and by python threads modifying objects. */
+    RingBuffer *callbacks; /* python calls pushed by the audio thread. */
+    int callbacks_dropped;
+    pthread_t callback_thread; /* executes the deferred python calls. */
+    pthread_mutex_t callback_mutex;
+    pthread_cond_t callback_cond;
+    int callback_running;
+    int callback_quit;
+
+    /* Data buffers of the deleted objects, reused by the new ones */
+    MYFLT **datapool;
+    int datapool_count;
+    int datapool_bufsize; /* size of the buffers in the pool */
+
+    /* Event scheduler */
+    struct _ScheduledEvent **events; /* binary min-heap of the pending events, ordered by time. */
+    int events_count;
+    int events_size;
+    unsigned long events_order; /* keeps the events scheduled at the same time in order. */
+    int in_event; /* 1 while an event is called. */
+    unsigned long event_time; /* time of the event being called, events scheduled from it start there. */
+    int event_offset; /* sample position of the event being called in the current buffer. */
 } Server;
 
 PyObject * PyServer_get_server();
 extern PyObject * Server_removeStream(Server *self, int sid);
+extern void Server_appendStream(Server *self, PyObject *stream);
+extern MYFLT * Server_allocData(Server *self, int size);
+extern void Server_freeData(Server *self, MYFLT *data, int size);
 extern MYFLT * Server_getInputBuffer(Server *self);
 extern PmEvent * Server_getMidiEventBuffer(Server *self);
 extern int Server_getMidiEventCount(Server *self);
 extern int Server_generateSeed(Server *self, int oid);
+extern int Server_isRenderingOffline(Server *self);
+extern double Server_getPrefetch(Server *self);
+extern int Server_getEventOffset(Server *self);
+extern void Server_streamsChanged(Server *self);
+extern void Server_lockDsp(Server *self);
+extern void Server_unlockDsp(Server *self);
+extern void Server_deferCall(Server *self, PyObject *obj, void (*func)(PyObject *, MYFLT *), MYFLT *args, int nargs);
+extern void Server_deferStop(Server *self, PyObject *obj);
 extern PyTypeObject ServerType;
 
 #ifdef __cplusplus
@@ -0,0 +1,68 @@
+/**************************************************************************
+ * Copyright 2009-2015 Olivier Belanger                                   *
+ *                                                                        *
+ * This file is part of pyo, a python module to help digital signal       *
+ * processing script creation.                                            *
+ *                                                                        *
+ * pyo is free software: you can redistribute it and/or modify            *
+ * it under the terms of the GNU Lesser General Public License as         *
+ * published by the Free Software Foundation, either version 3 of the     *
+ * License, or (at your option) any later version.                        *
+ *                                                                        *
+ * pyo is distributed in the hope that it will be useful,                 *
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of         *
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the          *
+ * GNU Lesser General Public License for more details.                    *
+ *                                                                        *
+ * You should have received a copy of the GNU Lesser General Public       *
+ * License along with pyo.  If not, see <http://www.gnu.org/licenses/>.   *
+ *                                                                        *
+ * Disk streaming for the soundfile players. A single background thread   *
+ * reads the sound files ahead of the audio thread in a prefetch ring     *
+ * per file and keeps the loop points in memory, so the audio callback    *
+ * never touches the disk.                                                *
+ *************************************************************************/
+
+#ifndef _SFSTREAMER_
+#define _SFSTREAMER_
+
+#include <pthread.h>
+#include "sndfile.h"
+#include "pyomodule.h"
+
+typedef struct {
+    MYFLT *data;
+    long start; /* first frame held in the cache */
+    long frames; /* number of valid frames, 0 = empty */
+    volatile long request; /* requested loop point, written by the reader */
+    volatile int request_dir;
+    volatile int requested;
+    volatile unsigned int version; /* odd while the disk thread rewrites the cache */
+} SfStreamerCache;
+
+typedef struct _SfStreamer {
+    SNDFILE *sf;
+    int chnls;
+    long frames; /* length of the sound in frames */
+    int blocking; /* 1 = wait for the disk on a miss (offline rendering) */
+    pthread_mutex_t sf_mutex; /* serializes the accesses to the file handle */
+    MYFLT *ring; /* interleaved frames, frame f lives at index (f % size) */
+    long size; /* ring capacity in frames */
+    volatile long start; /* frames [start, end) are valid in the ring */
+    volatile long end;
+    volatile unsigned int version; /* odd while the disk thread invalidates frames */
+    volatile long position; /* where the reader is, published for the disk thread */
+    volatile int direction;
+    SfStreamerCache cache[2]; /* loop points */
+    int next_cache;
+    volatile long underruns;
+    struct _SfStreamer *next;
+} SfStreamer;
+
+SfStreamer * SfStreamer_new(SNDFILE *sf, int chnls, long frames, long size, long position, int blocking);
+void SfStreamer_free(SfStreamer *self);
+int SfStreamer_read(SfStreamer *self, long position, MYFLT *buffer, int frames, int direction);
+void SfStreamer_seek(SfStreamer *self, long position, int direction);
+void SfStreamer_setLoopPoint(SfStreamer *self, long position, int direction);
+long SfStreamer_getUnderruns(SfStreamer *self);
+#endif
@@ -0,0 +1,54 @@
+/**************************************************************************
+ * Copyright 2009-2015 Olivier Belanger                                   *
+ *                                                                        *
+ * This file is part of pyo, a python module to help digital signal       *
+ * processing script creation.                                            *
+ *                                                                        *
+ * pyo is free software: you can redistribute it and/or modify            *
+ * it under the terms of the GNU Lesser General Public License as         *
+ * published by the Free Software Foundation, either version 3 of the     *
+ * License, or (at your option) any later version.                        *
+ *                                                                        *
+ * pyo is distributed in the hope that it will be useful,                 *
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of         *
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the          *
+ * GNU Lesser General Public License for more details.                    *
+ *                                                                        *
+ * You should have received a copy of the GNU Lesser General Public       *
+ * License along with pyo.  If not, see <http://www.gnu.org/licenses/>.   *
+ *                                                                        *
+ * Disk writing for the recordings. The audio thread pushes its frames in *
+ * a lock-free ring per file and a single background thread writes them  *
+ * to the disk, so the audio callback never waits on the disk.            *
+ *************************************************************************/
+
+#ifndef _SFWRITER_
+#define _SFWRITER_
+
+#include "sndfile.h"
+#include "ringbuffer.h"
+#include "pyomodule.h"
+
+/* When the data written to the disk is flushed to the device (see sf_write_sync). */
+typedef enum {
+    SfWriterSyncNever = 0,
+    SfWriterSyncOnClose = 1,
+    SfWriterSyncAlways = 2
+} SfWriterSyncPolicy;
+
+typedef struct _SfWriter {
+    SNDFILE *sf;
+    int chnls;
+    int single; /* 1 = the frames are floats, 0 = MYFLTs */
+    int sync;
+    RingBuffer *ring; /* interleaved frames waiting to be written */
+    char *chunk; /* frames read from the ring by the writing thread */
+    volatile long overruns; /* number of pushes that did not fit entirely in the ring */
+    struct _SfWriter *next;
+} SfWriter;
+
+SfWriter * SfWriter_new(SNDFILE *sf, int chnls, long size, int single, int sync);
+int SfWriter_write(SfWriter *self, const void *frames, int count, int blocking);
+void SfWriter_close(SfWriter *self);
+long SfWriter_getOverruns(SfWriter *self);
+#endif
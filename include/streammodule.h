@@ -21,10 +21,14 @@
 #include <Python.h>
 #include "pyomodule.h"
 
+/* Output samples below this amplitude are silent (-120 dB). */
+#define PYO_SILENCE 1.0e-6
+
 typedef struct {
     PyObject_HEAD
     PyObject *streamobject;
     void (*funcptr)();
+    void (*resetfuncptr)(); /* clears the state of an object with a tail when its stream falls asleep. */
     int sid;
     int chnl;
     int bufsize;
@@ -33,6 +37,18 @@ typedef struct {
     int duration;
     int bufferCountWait;
     int bufferCount;
+    int serial; /* Parallel processing: 1 = keeps its order among serial streams (shared state, ie. rand()),
+                   2 = uses the python API, always computed by the thread holding the GIL,
+                   3 = calls python through Server_deferCall, always computed by the audio thread. */
+    int computed; /* set by the parallel processing, the stream has already been computed for this buffer. */
+    int pos; /* position in the streams list of the server, maintained by the server. */
+    int tail; /* samples during which the object still sounds after its inputs fell silent, -1 if it never sleeps. */
+    int silence; /* samples since the output became silent, measured when the server lets silent streams sleep. */
+    int asleep; /* 1 while the stream is skipped because its inputs and output are silent. */
+    int ringing; /* set by an object with a tail while its output, before mul and add, is not silent. */
+    int kcapable; /* 1 if the object can be computed at control rate. */
+    int krate; /* 0 = audio rate, 1 = control rate (first buffer), 2 = control rate. */
+    MYFLT klast; /* value computed for the previous buffer at control rate. */
     MYFLT *data;
 } Stream;
 
@@ -47,6 +63,8 @@ extern int Stream_getStreamToDac(Stream *self);
 extern MYFLT * Stream_getData(Stream *self);
 extern void Stream_setData(Stream * self, MYFLT *data);
 extern void Stream_setFunctionPtr(Stream *self, void *ptr);
+extern void Stream_setResetFunctionPtr(Stream *self, void *ptr);
+extern void Stream_measureRinging(Stream *self);
 extern void Stream_callFunction(Stream *self);
 extern void Stream_IncrementBufferCount(Stream *self);
 extern void Stream_IncrementDurationCount(Stream *self);
@@ -57,6 +75,11 @@ extern PyTypeObject StreamType;
   if ((self) == rt_error) { return rt_error; } \
  \
   (self)->sid = (self)->chnl = (self)->todac = (self)->bufferCountWait = (self)->bufferCount = (self)->bufsize = (self)->duration = 0; \
+  (self)->serial = (self)->computed = (self)->pos = (self)->silence = (self)->asleep = (self)->ringing = 0; \
+  (self)->resetfuncptr = NULL; \
+  (self)->kcapable = (self)->krate = 0; \
+  (self)->klast = 0.0; \
+  (self)->tail = -1; \
   (self)->active = 1;
 
 
@@ -87,6 +110,9 @@ extern PyTypeObject TriggerStreamType;
 #define Stream_setBufferCountWait(op, v) (((Stream *)(op))->bufferCountWait = (v))
 #define Stream_setDuration(op, v) (((Stream *)(op))->duration = (v))
 #define Stream_setBufferSize(op, v) (((Stream *)(op))->bufsize = (v))
+#define Stream_setTail(op, v) (((Stream *)(op))->tail = (v))
+#define Stream_setControlRateCapable(op, v) (((Stream *)(op))->kcapable = (v))
+#define Stream_setSerial(op, v) (((Stream *)(op))->serial = (v))
 
 #endif
 /* __STREAMMODULE */
\ No newline at end of file
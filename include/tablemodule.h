@@ -28,6 +28,11 @@ typedef struct {
     int size;
     double samplingRate;
     MYFLT *data;
+    MYFLT *mipmap; /* band-limited versions of the data, from the level 1, NULL if not computed */
+    int mipmap_levels; /* number of levels, the data itself (level 0) included */
+    int mipmap_size; /* size of the table when the levels were computed */
+    Py_ssize_t view_shape[1]; /* filled for the buffer protocol */
+    Py_ssize_t view_strides[1];
 } TableStream;
 
 
@@ -42,6 +47,8 @@ if ((self) == rt_error) { return rt_error; }	\
 int TableStream_getSize(PyObject *self);
 double TableStream_getSamplingRate(PyObject *self);
 MYFLT * TableStream_getData(PyObject *self);
+int TableStream_hasMipmap(PyObject *self);
+MYFLT TableStream_readMipmap(PyObject *self, MYFLT (*interp)(MYFLT *, int, MYFLT, int), int ipart, MYFLT fpart, double inc);
 extern PyTypeObject TableStreamType;
 
 #endif
\ No newline at end of file
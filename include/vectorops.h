@@ -0,0 +1,53 @@
+/**************************************************************************
+ * Copyright 2009-2015 Olivier Belanger                                   *
+ *                                                                        *
+ * This file is part of pyo, a python module to help digital signal       *
+ * processing script creation.                                            *
+ *                                                                        *
+ * pyo is free software: you can redistribute it and/or modify            *
+ * it under the terms of the GNU Lesser General Public License as         *
+ * published by the Free Software Foundation, either version 3 of the     *
+ * License, or (at your option) any later version.                        *
+ *                                                                        *
+ * pyo is distributed in the hope that it will be useful,                 *
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of         *
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the          *
+ * GNU Lesser General Public License for more details.                    *
+ *                                                                        *
+ * You should have received a copy of the GNU Lesser General Public       *
+ * License along with pyo.  If not, see <http://www.gnu.org/licenses/>.   *
+ *                                                                        *
+ * Block kernels used by the mul/add post-processing macros and by the    *
+ * server output mixdown. Vectorized with SSE, AVX or NEON when the       *
+ * compiler targets them, scalar loops otherwise.                         *
+ *************************************************************************/
+
+/* Included by pyomodule.h, after the definition of MYFLT. */
+
+#ifndef _VECTOROPS_
+#define _VECTOROPS_
+
+/* data[i] = data[i] * mul */
+void vector_scale(MYFLT *data, MYFLT mul, int n);
+/* data[i] = data[i] + add */
+void vector_offset(MYFLT *data, MYFLT add, int n);
+/* data[i] = mul * data[i] + add */
+void vector_muladd_ii(MYFLT *data, MYFLT mul, MYFLT add, int n);
+void vector_muladd_ai(MYFLT *data, MYFLT *mul, MYFLT add, int n);
+void vector_muladd_ia(MYFLT *data, MYFLT mul, MYFLT *add, int n);
+void vector_muladd_aa(MYFLT *data, MYFLT *mul, MYFLT *add, int n);
+/* data[i] = mul * data[i] - add */
+void vector_mulsub_ia(MYFLT *data, MYFLT mul, MYFLT *add, int n);
+void vector_mulsub_aa(MYFLT *data, MYFLT *mul, MYFLT *add, int n);
+/* data[i] = data[i] / div + add, div is kept away from 0 */
+void vector_divadd_ai(MYFLT *data, MYFLT *div, MYFLT add, int n);
+void vector_divadd_aa(MYFLT *data, MYFLT *div, MYFLT *add, int n);
+/* data[i] = data[i] / div - add, div is kept away from 0 */
+void vector_divsub_aa(MYFLT *data, MYFLT *div, MYFLT *add, int n);
+/* data[i] = data[i] clipped between min and max */
+void vector_clip(MYFLT *data, MYFLT min, MYFLT max, int n);
+/* out[i] = out[i] + in[i] */
+void vector_mix(MYFLT *out, MYFLT *in, int n);
+/* out[i] = out[i] + in[i] * gain */
+void vector_mix_scaled(MYFLT *out, MYFLT *in, MYFLT gain, int n);
+#endif
@@ -19,7 +19,7 @@ You should have received a copy of the GNU Lesser General Public
 License along with pyo.  If not, see <http://www.gnu.org/licenses/>.
 """
 from types import ListType, TupleType, SliceType, FloatType, StringType, UnicodeType, NoneType
-import random, os, sys, inspect, tempfile
+import random, os, sys, inspect, tempfile, struct, array, zlib, ast
 from subprocess import call
 from weakref import proxy
 
@@ -61,7 +61,8 @@ FUNCTIONS_INIT_LINES = {"pa_count_host_apis": "pa_count_host_apis()", "pa_list_h
                         "reducePoints": "reducePoints(pointlist, tolerance=0.02)", "serverCreated": "serverCreated()", "serverBooted": "serverBooted()",
                         "example": "example(cls, dur=5, toprint=True, double=False)", "class_args": "class_args(cls)", "getVersion": "getVersion()",
                         "convertStringToSysEncoding": "convertStringToSysEncoding(str)", "convertArgsToLists": "convertArgsToLists(*args)",
-                        "wrap": "wrap(arg, i)", "floatmap": "floatmap(x, min=0, max=1, exp=1)"
+                        "wrap": "wrap(arg, i)", "floatmap": "floatmap(x, min=0, max=1, exp=1)",
+                        "batchRender": "batchRender(jobs, processes=None, sr=44100, nchnls=2, buffersize=256, fileformat=0, sampletype=0)"
                         }
 
 def convertStringToSysEncoding(str):
@@ -253,6 +254,148 @@ class WeakMethod(object):
         else:
             return self.method(*args, **kwargs)
 
+### Binary data files
+_BINARY_MAGIC = "PYOB"
+_BINARY_VERSION = 1
+_BINARY_KINDS = {'table': 0, 'matrix': 1, 'control': 2, 'notes': 3}
+_BINARY_HEADER = "<4sBBBBI"
+_BINARY_CHUNK = 65536
+if hasattr(__builtin__, 'pyo_use_double'):
+    _NATIVE_TYPECODE = 'd'
+else:
+    _NATIVE_TYPECODE = 'f'
+
+def _isBinaryDataFile(path):
+    """
+    Returns True if the file at `path` is in the pyo binary data format.
+
+    """
+    f = open(path, "rb")
+    magic = f.read(len(_BINARY_MAGIC))
+    f.close()
+    return magic == _BINARY_MAGIC
+
+def _writeBinaryData(path, kind, typecode, streams, compress=False):
+    """
+    Writes streams of samples in the pyo binary data format.
+
+    The file starts with a header (magic "PYOB", version, kind, item size
+    in bytes, compression flag and number of streams). Each stream follows
+    with its shape (rows, cols), the length of its zlib payload if the
+    file is compressed, then the samples, little-endian and row-major.
+
+    :Args:
+
+        path : string
+            Full path of the generated file.
+        kind : string
+            One of 'table', 'matrix', 'control' or 'notes'.
+        typecode : string
+            'f' for 32-bit floats, 'd' for 64-bit floats.
+        streams : list of tuples
+            One (rows, cols, chunks) tuple per stream, `chunks` being an
+            iterable of arrays (of type `typecode`) holding the samples.
+        compress : boolean, optional
+            If True, the samples are compressed with zlib. Defaults to False.
+
+    """
+    itemsize = array.array(typecode).itemsize
+    f = open(path, "wb")
+    f.write(struct.pack(_BINARY_HEADER, _BINARY_MAGIC, _BINARY_VERSION, _BINARY_KINDS[kind],
+                        itemsize, int(compress), len(streams)))
+    for rows, cols, chunks in streams:
+        f.write(struct.pack("<II", rows, cols))
+        if compress:
+            lenpos = f.tell()
+            f.write(struct.pack("<Q", 0))
+            compobj = zlib.compressobj()
+            nbytes = 0
+        for chunk in chunks:
+            if sys.byteorder != "little":
+                chunk.byteswap()
+            data = chunk.tostring()
+            if compress:
+                data = compobj.compress(data)
+                nbytes += len(data)
+            f.write(data)
+        if compress:
+            data = compobj.flush()
+            nbytes += len(data)
+            f.write(data)
+            endpos = f.tell()
+            f.seek(lenpos)
+            f.write(struct.pack("<Q", nbytes))
+            f.seek(endpos)
+    f.close()
+
+def _readBinaryData(path, kind):
+    """
+    Reads a file written by `_writeBinaryData`.
+
+    Returns a list of (rows, cols, samples) tuples, one per stream, where
+    `samples` is an array of 32 or 64-bit floats, as stored in the file.
+    The file is read chunk by chunk, without intermediate copy when it
+    is not compressed.
+
+    :Args:
+
+        path : string
+            Full path of the file to read.
+        kind : string
+            Expected kind of data, one of 'table', 'matrix', 'control'
+            or 'notes'.
+
+    """
+    f = open(path, "rb")
+    header = f.read(struct.calcsize(_BINARY_HEADER))
+    try:
+        magic, version, filekind, itemsize, compress, nstreams = struct.unpack(_BINARY_HEADER, header)
+    except struct.error:
+        magic = None
+    if magic != _BINARY_MAGIC or version > _BINARY_VERSION or itemsize not in [4, 8]:
+        f.close()
+        raise PyoError("%s is not a valid pyo binary data file." % path)
+    if filekind != _BINARY_KINDS[kind]:
+        f.close()
+        raise PyoError("%s does not contain %s data." % (path, kind))
+    typecode = {4: 'f', 8: 'd'}[itemsize]
+    streams = []
+    for i in range(nstreams):
+        rows, cols = struct.unpack("<II", f.read(8))
+        samples = array.array(typecode)
+        if compress:
+            nbytes, = struct.unpack("<Q", f.read(8))
+            decompobj = zlib.decompressobj()
+            pending = ""
+            while nbytes > 0:
+                data = f.read(min(nbytes, _BINARY_CHUNK * itemsize))
+                if not data:
+                    break
+                nbytes -= len(data)
+                pending += decompobj.decompress(data)
+                usable = len(pending) - len(pending) % itemsize
+                samples.fromstring(pending[:usable])
+                pending = pending[usable:]
+            samples.fromstring(pending + decompobj.flush())
+        else:
+            samples.fromfile(f, rows * cols)
+        if sys.byteorder != "little":
+            samples.byteswap()
+        streams.append((rows, cols, samples))
+    f.close()
+    return streams
+
+def _arrayChunks(values, typecode, flatten=False):
+    "Yields `values` (a list of floats or of tuples) as arrays of _BINARY_CHUNK items."
+    for i in range(0, len(values), _BINARY_CHUNK):
+        chunk = array.array(typecode)
+        if flatten:
+            for v in values[i:i+_BINARY_CHUNK]:
+                chunk.extend(v)
+        else:
+            chunk.fromlist(list(values[i:i+_BINARY_CHUNK]))
+        yield chunk
+
 class PyoError(Exception):
     """Base class for all pyo exceptions."""
 
@@ -845,6 +988,29 @@ class PyoObject(PyoObjectBase):
         x, lmax = convertArgsToLists(x)
         [obj.setDiv(wrap(x,i/self._op_duplicate)) for i, obj in enumerate(self._base_objs)]
 
+    def setControlRate(self, x):
+        """
+        Compute the object at control rate.
+
+        At control rate, the object computes a single value per buffer
+        and its output is a linear ramp from the value of the previous
+        buffer, which saves most of its processing. Audio inputs are read
+        once per buffer and the output lags one buffer behind. Only the
+        slow modulators support this mode: LFO, Randi, SigTo, Port, Fader,
+        Adsr, Scale and MToF.
+
+        :Args:
+
+            x : boolean
+                True to compute at control rate, False to compute every
+                sample.
+
+        """
+        for obj in self._base_objs:
+            if not obj._getStream().setControlRate(x):
+                print "%s can't be computed at control rate." % self.__class__.__name__
+                break
+
     def set(self, attr, value, port=0.025):
         """
         Replace any attribute with portamento.
@@ -945,6 +1111,7 @@ class PyoTableObject(PyoObjectBase):
     """
 
     _STREAM_TYPE = 'table'
+    _mipmap = False
 
     def __init__(self, size=0):
         PyoObjectBase.__init__(self)
@@ -994,24 +1161,40 @@ class PyoTableObject(PyoObjectBase):
                 format = FILE_FORMATS[ext]
         savefileFromTable(self, path, format, sampletype)
 
-    def write(self, path, oneline=True):
+    def write(self, path, oneline=True, binary=True, compress=False):
         """
-        Writes the content of the table in a text file.
+        Writes the content of the table in a file.
 
-        This function can be used to store the table data as a
-        list of floats into a text file.
+        By default, the samples are written in the pyo binary data format,
+        a small header followed by the raw 32-bit (64-bit with the double
+        precision module) floats of each table stream. The text format,
+        a list of lists of floats, is still available with `binary=False`.
 
         :Args:
 
             path : string
                 Full path of the generated file.
             oneline : boolean, optional
-                If True, list of samples will inserted on one line.
+                Text format only. If True, list of samples will inserted
+                on one line.
 
                 If False, list of samples will be truncated to 8 floats
                 per line.
+            binary : boolean, optional
+                If True, the samples are written in binary format.
+                Otherwise, they are written as text. Defaults to True.
+            compress : boolean, optional
+                Binary format only. If True, the samples are compressed
+                with zlib. Defaults to False.
 
         """
+        if binary:
+            streams = []
+            for obj in self._base_objs:
+                size = obj.getSize()
+                streams.append((size, 1, self._getBufferChunks(obj, size)))
+            _writeBinaryData(path, 'table', _NATIVE_TYPECODE, streams, compress)
+            return
         f = open(path, "w")
         if oneline:
             f.write(str([obj.getTable() for obj in self._base_objs]))
@@ -1028,9 +1211,17 @@ class PyoTableObject(PyoObjectBase):
             f.write(text)
         f.close()
 
+    def _getBufferChunks(self, obj, size):
+        "Yields the samples of a table stream as arrays, without going through python floats."
+        view = memoryview(obj.getTableStream())
+        for i in range(0, size, _BINARY_CHUNK):
+            chunk = array.array(_NATIVE_TYPECODE)
+            chunk.fromstring(view[i:min(i+_BINARY_CHUNK, size)].tobytes())
+            yield chunk
+
     def read(self, path):
         """
-        Reads the content of a text file and replaces the table data
+        Reads the content of a file and replaces the table data
         with the values stored in the file.
 
         :Args:
@@ -1038,8 +1229,10 @@ class PyoTableObject(PyoObjectBase):
             path : string
                 Full path of the file to read.
 
-        The format is a list of lists of floats. For example, A two
-        tablestreams object must be given a content like this:
+        The file can be in the binary format created by the `write`
+        method or in the text format. The text format is a list of
+        lists of floats. For example, A two tablestreams object must
+        be given a content like this:
 
         [ [ 0.0, 1.0, 0.5, ... ], [ 1.0, 0.99, 0.98, 0.97, ... ] ]
 
@@ -1047,10 +1240,17 @@ class PyoTableObject(PyoObjectBase):
         length of the lists.
 
         """
-        f = open(path, "r")
-        f_list = eval(f.read())
+        if _isBinaryDataFile(path):
+            f_list = []
+            for rows, cols, samples in _readBinaryData(path, 'table'):
+                if samples.typecode != _NATIVE_TYPECODE:
+                    samples = array.array(_NATIVE_TYPECODE, samples)
+                f_list.append(samples)
+        else:
+            f = open(path, "r")
+            f_list = ast.literal_eval(f.read())
+            f.close()
         f_len = len(f_list)
-        f.close()
         [obj.setData(f_list[i%f_len]) for i, obj in enumerate(self._base_objs)]
         self.refreshView()
 
@@ -1146,6 +1346,44 @@ class PyoTableObject(PyoObjectBase):
         else:
             return self._base_objs[0].getTable()
 
+    def getBuffer(self, all=False):
+        """
+        Returns the table memory as an object supporting the buffer protocol.
+
+        The returned object gives direct read/write access to the samples,
+        without any copy, through `memoryview` or numpy:
+
+        >>> import numpy
+        >>> arr = numpy.asarray(table.getBuffer())
+        >>> arr *= 0.5
+
+        The samples are 32-bit floats (64-bit with the double precision
+        module). The buffer does not include the guard point used for
+        interpolation, which keeps the value it had before the change.
+
+        The buffer is valid as long as the table exists and is not
+        resized (setSize, setData, read, append, insert...). Using it
+        after one of these operations accesses freed memory.
+
+        The audio thread reads the same memory while the server runs.
+        Single samples are always written atomically, but a bulk write
+        can be seen half done by the audio thread. For glitch-free
+        updates, write into another table and swap it with `setTable`
+        on the reading objects.
+
+        :Args:
+
+            all : boolean, optional
+                If True, a list of buffers, one per table stream, is
+                returned. Otherwise, only the buffer of the first stream
+                is returned. Defaults to False.
+
+        """
+        if all:
+            return [obj.getTableStream() for obj in self._base_objs]
+        else:
+            return self._base_objs[0].getTableStream()
+
     def normalize(self):
         """
         Normalize table samples between -1 and 1.
@@ -1365,6 +1603,41 @@ class PyoTableObject(PyoObjectBase):
             [obj.copy(self[i]) for i, obj in enumerate(newtable.getBaseObjects())]
         return newtable
 
+    def setMipmap(self, x):
+        """
+        Computes band-limited versions of the table for the oscillators.
+
+        With a mipmap, Osc, OscLoop, TableRead and Pointer read the table
+        through octave-spaced band-limited versions of it, chosen and
+        crossfaded according to their reading speed. Harmonics that would
+        go above the nyquist frequency are removed, so a bright waveform
+        played at high pitch doesn't alias.
+
+        The mipmap is computed again each time the table is modified with
+        its methods. Samples written by other objects (TableRec,
+        TableWrite, ...) or through the buffer protocol are taken into
+        account by calling `setMipmap(True)` again.
+
+        :Args:
+
+            x : boolean
+                True to compute the mipmap, False to remove it.
+
+        .. note::
+
+            Tables whose size is not even with prime factors 2, 3 and 5
+            only (sound tables most of the time) are resampled to compute
+            the mipmap, which costs a little more time and precision. A
+            mipmap takes about log2(size) times the memory of the table.
+
+        """
+        self._mipmap = all([obj.getTableStream().setMipmap(x) for obj in self._base_objs])
+        return self
+
+    def _refreshMipmap(self):
+        if self._mipmap:
+            [obj.getTableStream().setMipmap(True) for obj in self._base_objs]
+
     def view(self, title="Table waveform", wxnoserver=False):
         """
         Opens a window showing the contents of the table.
@@ -1395,6 +1668,7 @@ class PyoTableObject(PyoObjectBase):
         Updates the graphical display of the table, if applicable.
 
         """
+        self._refreshMipmap()
         if self.viewFrame != None:
             size = self.viewFrame.wavePanel.GetSize()
             samples = self._base_objs[0].getViewTable((size[0], size[1]))
@@ -1409,6 +1683,13 @@ class PyoTableObject(PyoObjectBase):
     @size.setter
     def size(self, x): self.setSize(x)
 
+    @property
+    def mipmap(self):
+        """boolean. Band-limited versions of the table for the oscillators."""
+        return self._mipmap
+    @mipmap.setter
+    def mipmap(self, x): self.setMipmap(x)
+
 ######################################################################
 ### PyoMatrixObject -> base class for pyo matrix objects
 ######################################################################
@@ -1431,30 +1712,47 @@ class PyoMatrixObject(PyoObjectBase):
         PyoObjectBase.__init__(self)
         self.viewFrame = None
 
-    def write(self, path):
+    def write(self, path, binary=True, compress=False):
         """
-        Writes the content of the matrix into a text file.
+        Writes the content of the matrix into a file.
 
-        This function can be used to store the matrix data as a
-        list of list of floats into a text file.
+        By default, the matrix is written in the pyo binary data format.
+        The text format, a list of list of floats, is still available
+        with `binary=False`.
 
         :Args:
 
             path : string
                 Full path of the generated file.
+            binary : boolean, optional
+                If True, the samples are written in binary format.
+                Otherwise, they are written as text. Defaults to True.
+            compress : boolean, optional
+                Binary format only. If True, the samples are compressed
+                with zlib. Defaults to False.
 
         """
+        if binary:
+            streams = []
+            for obj in self._base_objs:
+                rows = obj.getData()
+                cols = len(rows[0]) if rows else 0
+                streams.append((len(rows), cols, _arrayChunks(rows, _NATIVE_TYPECODE, flatten=True)))
+            _writeBinaryData(path, 'matrix', _NATIVE_TYPECODE, streams, compress)
+            return
         f = open(path, "w")
         f.write(str([obj.getData() for obj in self._base_objs]))
         f.close()
 
     def read(self, path):
         """
-        Reads the content of a text file and replaces the matrix data
+        Reads the content of a file and replaces the matrix data
         with the values in the file.
 
-        Format is a list of lists of floats. For example, A two
-        matrixstreams object must be given a content like this:
+        The file can be in the binary format created by the `write`
+        method or in the text format. The text format is a list of
+        lists of floats. For example, A two matrixstreams object must
+        be given a content like this:
 
         [ [ [0.0 ,1.0, 0.5, ... ], [1.0, 0.99, 0.98, 0.97, ... ] ],
         [ [0.0, 1.0, 0.5, ... ], [1.0, 0.99, 0.98, 0.97, ... ] ] ]
@@ -1469,10 +1767,16 @@ class PyoMatrixObject(PyoObjectBase):
                 Full path of the file to read.
 
         """
-        f = open(path, "r")
-        f_list = eval(f.read())
+        if _isBinaryDataFile(path):
+            f_list = []
+            for rows, cols, samples in _readBinaryData(path, 'matrix'):
+                samples = samples.tolist()
+                f_list.append([samples[i*cols:(i+1)*cols] for i in range(rows)])
+        else:
+            f = open(path, "r")
+            f_list = ast.literal_eval(f.read())
+            f.close()
         f_len = len(f_list)
-        f.close()
         [obj.setData(f_list[i%f_len]) for i, obj in enumerate(self._base_objs)]
 
     def getSize(self):
@@ -1553,6 +1857,37 @@ class PyoMatrixObject(PyoObjectBase):
         if len(values) == 1: return values[0]
         else: return values
 
+    def getBuffer(self, all=False):
+        """
+        Returns the matrix memory as an object supporting the buffer protocol.
+
+        The returned object gives direct read/write access to the samples,
+        without any copy, as a 2 dimensions (height, width) array:
+
+        >>> import numpy
+        >>> arr = numpy.asarray(matrix.getBuffer())
+        >>> arr[0, :] = 0.0
+
+        Rows are padded with a guard point, so only strided consumers
+        (memoryview, numpy.asarray) are supported, not numpy.frombuffer.
+
+        The buffer is valid as long as the matrix exists and is not
+        resized with `setData` or `read`. The audio thread reads the same
+        memory while the server runs, a bulk write can be seen half done.
+
+        :Args:
+
+            all : boolean, optional
+                If True, a list of buffers, one per matrix stream, is
+                returned. Otherwise, only the buffer of the first stream
+                is returned. Defaults to False.
+
+        """
+        if all:
+            return [obj.getMatrixStream() for obj in self._base_objs]
+        else:
+            return self._base_objs[0].getMatrixStream()
+
     def view(self, title="Matrix viewer", wxnoserver=False):
         """
         Opens a window showing the contents of the matrix.
@@ -350,6 +350,12 @@ class Yin(PyoObject):
             of the lowest desired frequency.
 
             Available at initialization time only.  Defaults to 1024.
+        hopsize : int, optional
+            Number of samples between two analyses. Smaller values follow
+            the pitch more closely at a higher cost. 0 means one analysis
+            every `winsize` samples.
+
+            Available at initialization time only.  Defaults to 0.
 
 
     >>> s = Server(duplex=1).boot()
@@ -362,7 +368,7 @@ class Yin(PyoObject):
     >>> a = LFO(freq*1.5, type=2, mul=0.2).out(1)
 
     """
-    def __init__(self, input, tolerance=0.2, minfreq=40, maxfreq=1000, cutoff=1000, winsize=1024, mul=1, add=0):
+    def __init__(self, input, tolerance=0.2, minfreq=40, maxfreq=1000, cutoff=1000, winsize=1024, mul=1, add=0, hopsize=0):
         PyoObject.__init__(self, mul, add)
         self._input = input
         self._tolerance = tolerance
@@ -370,8 +376,8 @@ class Yin(PyoObject):
         self._maxfreq = maxfreq
         self._cutoff = cutoff
         self._in_fader = InputFader(input)
-        in_fader, tolerance, minfreq, maxfreq, cutoff, winsize, mul, add, lmax = convertArgsToLists(self._in_fader, tolerance, minfreq, maxfreq, cutoff, winsize, mul, add)
-        self._base_objs = [Yin_base(wrap(in_fader,i), wrap(tolerance,i), wrap(minfreq,i), wrap(maxfreq,i), wrap(cutoff,i), wrap(winsize,i), wrap(mul,i), wrap(add,i)) for i in range(lmax)]
+        in_fader, tolerance, minfreq, maxfreq, cutoff, winsize, hopsize, mul, add, lmax = convertArgsToLists(self._in_fader, tolerance, minfreq, maxfreq, cutoff, winsize, hopsize, mul, add)
+        self._base_objs = [Yin_base(wrap(in_fader,i), wrap(tolerance,i), wrap(minfreq,i), wrap(maxfreq,i), wrap(cutoff,i), wrap(winsize,i), wrap(hopsize,i), wrap(mul,i), wrap(add,i)) for i in range(lmax)]
 
     def setInput(self, x, fadetime=0.05):
         """
@@ -444,6 +450,24 @@ class Yin(PyoObject):
         x, lmax = convertArgsToLists(x)
         [obj.setCutoff(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
 
+    def setMethod(self, x):
+        """
+        Chooses how the difference function of the algorithm is computed.
+
+        The difference function is computed from the autocorrelation of the
+        window, obtained with a FFT, in O(n log n). The original time-domain
+        computation, in O(n^2), is kept as a reference.
+
+        :Args:
+
+            x : int {0, 1}
+                0 for the FFT computation (default), 1 for the time-domain
+                computation.
+
+        """
+        x, lmax = convertArgsToLists(x)
+        [obj.setMethod(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+
     def out(self, chnl=0, inc=1, dur=0, delay=0):
         return self.play(dur, delay)
 
@@ -820,6 +844,7 @@ class Spectrum(PyoObject):
         self._in_fader = InputFader(input)
         in_fader, size, wintype, lmax = convertArgsToLists(self._in_fader, size, wintype)
         self._base_objs = [Spectrum_base(wrap(in_fader,i), wrap(size,i), wrap(wintype,i)) for i in range(lmax)]
+        self._bus = None
         if function == None:
             self.view()
         self._timer = Pattern(self.refreshView, 0.05).play()
@@ -1057,6 +1082,63 @@ class Spectrum(PyoObject):
         x, lmax = convertArgsToLists(x)
         [obj.setGain(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
 
+    def setBus(self, x):
+        """
+        Sets the analysis bus receiving the magnitudes.
+
+        Each stream writes in the channel of the bus corresponding to
+        its index (modulo the number of channels of the bus). The frames
+        are written by the audio thread, without any python call.
+
+        The internal timer only builds the display points, it is stopped
+        while a bus is set if the object has no `function` and no window.
+
+        :Args:
+
+            x : AnalysisBus
+                The bus, or None to stop writing in the current bus.
+
+        """
+        self._bus = x
+        if x == None:
+            [obj.setBus(None) for obj in self._base_objs]
+        else:
+            [obj.setBus(x._base, i % x.channels) for i, obj in enumerate(self._base_objs)]
+        if x != None and self._function == None and self.viewFrame == None:
+            self._timer.stop()
+        elif x == None:
+            self._timer.play()
+
+    def createBus(self, frames=16, path=None):
+        """
+        Creates an AnalysisBus fitting the object, sets it and returns it.
+
+        The bus has one channel per stream and frames of `size` / 2
+        values, the linear magnitudes of the bins, from 0 Hz to the
+        Nyquist frequency. A new frame is written every `size` / 2 samples.
+
+
+        :Args:
+
+            frames : int, optional
+                Number of frames kept in the ring of each channel.
+                Defaults to 16.
+            path : string, optional
+                If given, the bus is created in this file, mapped in
+                memory, so other processes can read it. Defaults to None.
+
+        """
+        bus = AnalysisBus(max(convertArgsToLists(self._size)[0]) / 2, frames, len(self._base_objs), path)
+        self.setBus(bus)
+        return bus
+
+    def getBus(self):
+        """
+        Returns the AnalysisBus receiving the magnitudes, or None.
+
+        """
+        return self._bus
+
     def view(self, title="Spectrum", wxnoserver=False):
         """
         Opens a window showing the result of the analysis.
@@ -1207,6 +1289,7 @@ class Scope(PyoObject):
         self._in_fader = InputFader(input)
         in_fader, lmax = convertArgsToLists(self._in_fader)
         self._base_objs = [Scope_base(wrap(in_fader,i), length) for i in range(lmax)]
+        self._bus = None
         self.view()
         self._timer = Pattern(self.refreshView, length).play()
 
@@ -1303,6 +1386,64 @@ class Scope(PyoObject):
         self._height = x
         [obj.setHeight(x) for obj in self._base_objs]
 
+    def setBus(self, x):
+        """
+        Sets the analysis bus receiving the waveforms.
+
+        Each stream writes in the channel of the bus corresponding to
+        its index (modulo the number of channels of the bus). The frames
+        are written by the audio thread, without any python call.
+
+        The internal timer only builds the display points, it is stopped
+        while a bus is set if the object has no window.
+
+        :Args:
+
+            x : AnalysisBus
+                The bus, or None to stop writing in the current bus.
+
+        """
+        self._bus = x
+        if x == None:
+            [obj.setBus(None) for obj in self._base_objs]
+        else:
+            [obj.setBus(x._base, i % x.channels) for i, obj in enumerate(self._base_objs)]
+        if x != None and self.viewFrame == None:
+            self._timer.stop()
+        elif x == None:
+            self._timer.play()
+
+    def createBus(self, frames=16, path=None):
+        """
+        Creates an AnalysisBus fitting the object, sets it and returns it.
+
+        The bus has one channel per stream and frames of `length`
+        seconds of samples. A new frame is written every `length` seconds.
+        If the length is changed, the frames are truncated, or completed
+        with zeros, to the size of the bus.
+
+
+        :Args:
+
+            frames : int, optional
+                Number of frames kept in the ring of each channel.
+                Defaults to 16.
+            path : string, optional
+                If given, the bus is created in this file, mapped in
+                memory, so other processes can read it. Defaults to None.
+
+        """
+        bus = AnalysisBus(int(self._length * self.getSamplingRate()), frames, len(self._base_objs), path)
+        self.setBus(bus)
+        return bus
+
+    def getBus(self):
+        """
+        Returns the AnalysisBus receiving the waveforms, or None.
+
+        """
+        return self._bus
+
     def view(self, title="Scope", wxnoserver=False):
         """
         Opens a window showing the result of the analysis.
@@ -1370,6 +1511,10 @@ class PeakAmp(PyoObject):
 
     >>> def getValues(*args)
 
+    For many meters, an AnalysisBus (see `createBus`) avoids the python
+    call of each buffer size: the peaks are written in the bus by the
+    audio thread and read when needed.
+
     :Parent: :py:class:`PyoObject`
 
     :Args:
@@ -1402,9 +1547,12 @@ class PeakAmp(PyoObject):
         self._in_fader = InputFader(input)
         in_fader, mul, add, lmax = convertArgsToLists(self._in_fader, mul, add)
         self._base_objs = [PeakAmp_base(wrap(in_fader,i), wrap(mul,i), wrap(add,i)) for i in range(lmax)]
+        self._bus = None
         sr = self.getSamplingRate()
         bs = self.getBufferSize()
-        self._timer = Pattern(self._buildList, bs/sr).play()
+        self._timer = Pattern(self._buildList, bs/sr)
+        if self._function != None:
+            self._timer.play()
 
     def setInput(self, x, fadetime=0.05):
         """
@@ -1433,10 +1581,61 @@ class PeakAmp(PyoObject):
         """
         if callable(x):
             self._function = getWeakMethodRef(x)
+            if not self._timer.isPlaying():
+                self._timer.play()
 
     def out(self, chnl=0, inc=1, dur=0, delay=0):
         return self.play(dur, delay)
 
+    def setBus(self, x):
+        """
+        Sets the analysis bus receiving the peaks.
+
+        Each stream writes in the channel of the bus corresponding to
+        its index (modulo the number of channels of the bus). The frames
+        are written by the audio thread, without any python call.
+
+        :Args:
+
+            x : AnalysisBus
+                The bus, or None to stop writing in the current bus.
+
+        """
+        self._bus = x
+        if x == None:
+            [obj.setBus(None) for obj in self._base_objs]
+        else:
+            [obj.setBus(x._base, i % x.channels) for i, obj in enumerate(self._base_objs)]
+
+    def createBus(self, frames=16, path=None):
+        """
+        Creates an AnalysisBus fitting the object, sets it and returns it.
+
+        The bus has one channel per stream and frames of one value,
+        the peak amplitude of each buffer size.
+
+
+        :Args:
+
+            frames : int, optional
+                Number of frames kept in the ring of each channel.
+                Defaults to 16.
+            path : string, optional
+                If given, the bus is created in this file, mapped in
+                memory, so other processes can read it. Defaults to None.
+
+        """
+        bus = AnalysisBus(1, frames, len(self._base_objs), path)
+        self.setBus(bus)
+        return bus
+
+    def getBus(self):
+        """
+        Returns the AnalysisBus receiving the peaks, or None.
+
+        """
+        return self._bus
+
     def _buildList(self):
         if self._function != None:
             values = [obj.getValue() for obj in self._base_objs]
@@ -1458,4 +1657,122 @@ class PeakAmp(PyoObject):
         """PyoObject. function signal to process."""
         return self._function
     @function.setter
-    def function(self, x): self.setFunction(x)
\ No newline at end of file
+    def function(self, x): self.setFunction(x)
+
+class AnalysisBus(object):
+    """
+    Rings of analysis frames, read in place without any python object creation.
+
+    An analysis bus is a preallocated memory area where the analyzers
+    (Spectrum, Scope and PeakAmp, see their `setBus` and `createBus`
+    methods) write their frames from the audio thread. Each channel of
+    the bus is a ring of `frames` frames of `framesize` 32-bit floats,
+    with a sequence number, the number of frames written in the channel.
+
+    The bus supports the buffer protocol, as an array of shape
+    (channels, frames, framesize), so it can be read as a numpy array
+    without copy:
+
+    >>> import numpy
+    >>> arr = numpy.asarray(bus.getBuffer())
+    >>> last = arr[0, bus.getLastIndex(0)]
+
+    If `path` is given, the bus is a file mapped in memory and other
+    processes can open it with an AnalysisBus created with the same path
+    and no `framesize`. The file starts with a header of 64 bytes (the
+    string "PYOABUS1" and the channels, frames and framesize as 32-bit
+    integers), followed by the sequence numbers (one 64-bit unsigned
+    integer per channel) and the frames.
+
+    :Args:
+
+        framesize : int, optional
+            Number of values in a frame. If 0, the bus given by `path`
+            is opened, otherwise it is created. Defaults to 0.
+        frames : int, optional
+            Number of frames kept in each channel. Defaults to 16.
+        channels : int, optional
+            Number of channels. Defaults to 1.
+        path : string, optional
+            File holding the bus, to share it between processes. The file
+            is created (or replaced) if `framesize` is greater than 0.
+            On Linux, a path in /dev/shm stays in memory. If None, the bus
+            is only accessible to this process. Defaults to None.
+
+    .. note::
+
+        The frames are overwritten while they are read. To be sure that a
+        copied frame is complete, check that the sequence number has not
+        advanced by more than `frames` - 1 after the copy.
+
+    >>> s = Server().boot()
+    >>> s.start()
+    >>> a = SfPlayer(SNDS_PATH + "/transparent.aif", loop=True, mul=.4).out()
+    >>> amp = PeakAmp(a)
+    >>> bus = amp.createBus(frames=32)
+    >>> import numpy
+    >>> print numpy.asarray(bus.getBuffer())[0, bus.getLastIndex()]
+
+    """
+    def __init__(self, framesize=0, frames=16, channels=1, path=None):
+        self._base = AnalysisBus_base(framesize, frames, channels, path)
+        self._path = path
+
+    def getBuffer(self):
+        """
+        Returns the frames as an object supporting the buffer protocol.
+
+        The buffer is an array of shape (channels, frames, framesize) of
+        32-bit floats, valid as long as the bus exists.
+
+        """
+        return self._base
+
+    def getSequence(self, chnl=0):
+        """
+        Returns the number of frames written in a channel.
+
+        :Args:
+
+            chnl : int, optional
+                Channel number. Defaults to 0.
+
+        """
+        return self._base.getSequence(chnl)
+
+    def getLastIndex(self, chnl=0):
+        """
+        Returns the index, in the ring of a channel, of the last frame written.
+
+        Returns None if no frame has been written yet.
+
+        :Args:
+
+            chnl : int, optional
+                Channel number. Defaults to 0.
+
+        """
+        seq = self._base.getSequence(chnl)
+        if seq == 0:
+            return None
+        return int((seq - 1) % self._base.getFrames())
+
+    @property
+    def channels(self):
+        """int. Number of channels."""
+        return self._base.getChannels()
+
+    @property
+    def frames(self):
+        """int. Number of frames in each channel."""
+        return self._base.getFrames()
+
+    @property
+    def framesize(self):
+        """int. Number of values in a frame."""
+        return self._base.getFrameSize()
+
+    @property
+    def path(self):
+        """string. File holding the bus, or None."""
+        return self._path
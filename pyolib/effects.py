@@ -754,8 +754,11 @@ class Convolve(PyoObject):
 
     .. note::
 
-        Convolution is very expensive to compute, so the impulse response must
-        be kept very short to run in real time.
+        Impulse responses longer than 256 samples are processed with a
+        uniformly partitioned FFT convolution, preceded by a direct form
+        head block, so the output is not delayed. Shorter impulses use
+        the direct form only. When the content of the table changes,
+        the partitions are updated at the next partition boundary.
 
         Usually convolution generates a high amplitude level, take care of the
         `mul` parameter!
@@ -50,10 +50,11 @@ class FFT(PyoObject):
 
         input : PyoObject
             Input signal to process.
-        size : int {pow-of-two > 4}, optional
-            FFT size. Must be a power of two greater than 4.
-            The FFT size is the number of samples used in each
-            analysis frame. Defaults to 1024.
+        size : int {even > 4}, optional
+            FFT size. Must be an even number greater than 4 with no
+            prime factors other than 2, 3 and 5, ie. a power of two,
+            480, 960 or 1536. The FFT size is the number of samples
+            used in each analysis frame. Defaults to 1024.
         overlaps : int, optional
             The number of overlaped analysis block. Must be a
             positive integer. More overlaps can greatly improved
@@ -108,18 +109,16 @@ class FFT(PyoObject):
         self._wintype = wintype
         self._in_fader = InputFader(input)
         in_fader, size, wintype, lmax = convertArgsToLists(self._in_fader, size, wintype)
-        self._base_players = []
-        for j in range(overlaps):
-            for i in range(lmax):
-                hopsize = wrap(size,i) * j / overlaps
-                self._base_players.append(FFTMain_base(wrap(in_fader,i), wrap(size,i), hopsize, wrap(wintype,i)))
+        # One analyser per channel computes all the overlaps.
+        self._base_players = [FFTMain_base(wrap(in_fader,i), wrap(size,i), overlaps, wrap(wintype,i)) for i in range(lmax)]
         self._real_objs = []
         self._imag_objs = []
         self._bin_objs = []
-        for j in range(len(self._base_players)):
-            self._real_objs.append(FFT_base(wrap(self._base_players,j), 0, self._mul, self._add))
-            self._imag_objs.append(FFT_base(wrap(self._base_players,j), 1, self._mul, self._add))
-            self._bin_objs.append(FFT_base(wrap(self._base_players,j), 2, self._mul, self._add))
+        for j in range(overlaps):
+            for i in range(lmax):
+                self._real_objs.append(FFT_base(self._base_players[i], j*3, self._mul, self._add))
+                self._imag_objs.append(FFT_base(self._base_players[i], j*3+1, self._mul, self._add))
+                self._bin_objs.append(FFT_base(self._base_players[i], j*3+2, self._mul, self._add))
 
     def __len__(self):
         return len(self._real_objs)
@@ -206,11 +205,7 @@ class FFT(PyoObject):
         """
         self._size = x
         x, lmax = convertArgsToLists(x)
-        poly = len(self._base_players) / self._overlaps
-        for j in range(self._overlaps):
-            for i in range(poly):
-                hopsize = wrap(x,i) * j / self._overlaps
-                self._base_players[j*poly+i].setSize(wrap(x,i), hopsize)
+        [obj.setSize(wrap(x,i)) for i, obj in enumerate(self._base_players)]
 
     def setWinType(self, x):
         """
@@ -266,10 +261,11 @@ class IFFT(PyoObject):
             Input `real` signal.
         inimag : PyoObject
             Input `imaginary` signal.
-        size : int {pow-of-two > 4}, optional
-            FFT size. Must be a power of two greater than 4.
-            The FFT size is the number of samples used in each
-            analysis frame. This value must match the `size`
+        size : int {even > 4}, optional
+            FFT size. Must be an even number greater than 4 with no
+            prime factors other than 2, 3 and 5, ie. a power of two,
+            480, 960 or 1536. The FFT size is the number of samples
+            used in each analysis frame. This value must match the `size`
             attribute of the former FFT object. Defaults to 1024.
         overlaps : int, optional
             The number of overlaped analysis block. Must be a
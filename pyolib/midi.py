@@ -1218,4 +1218,187 @@ class MidiDelAdsr(PyoObject):
         """float. Duration of the release phase in seconds."""
         return self._release
     @release.setter
-    def release(self, x): self.setRelease(x)
\ No newline at end of file
+    def release(self, x): self.setRelease(x)
+
+class VoicePool(PyoObject):
+    """
+    Preallocated polyphonic voices with automatic activation and stealing.
+
+    VoicePool calls the `voice` function `poly` times to build the
+    voices of an instrument, once and for all. Only the voices playing
+    a note are computed, the objects of the other voices are kept
+    inactive by the pool. The cost of the instrument follows the number
+    of sounding voices instead of the polyphony.
+
+    A voice is started by a note (from a Midi device or the noteOn
+    method) and is stopped automatically when its envelope has been
+    silent for a whole buffer after the note off. When all the voices
+    are busy, a new note steals a voice according to the `steal` policy,
+    released voices being stolen before held ones.
+
+    :Parent: :py:class:`PyoObject`
+
+    :Args:
+
+        voice : callable
+            Function building one voice. It is called with two PyoObjects,
+            the pitch and the velocity (between 0 and 1, 0 after the note
+            off) of the voice's notes, and must return the output of the
+            voice or a tuple (output, envelope). The voice is finished when
+            the envelope, or the output if no envelope is given, is silent.
+            The output must not be sent to the audio outs, the pool mixes
+            the voices.
+        poly : int, optional
+            Number of voices. Defaults to 16.
+        steal : string {"oldest", "quietest", "none"}, optional
+            Voice stealing policy when all the voices are busy. "oldest"
+            steals the voice started first, "quietest" the voice with the
+            lowest envelope and "none" ignores the new notes. Defaults to
+            "oldest".
+        scale : int, optional
+            Pitch output format.
+                0. Midi
+                1. Hertz
+
+            Defaults to 1.
+        channel : int, optional
+            Midi channel. 0 means all channels. Defaults to 0.
+
+    .. note::
+
+        The objects of a voice, returned by the `voice` function, are
+        available with the `voices` attribute.
+
+    >>> s = Server().boot()
+    >>> s.start()
+    >>> def synth(pitch, velocity):
+    ...     env = MidiAdsr(velocity, attack=.005, decay=.1, sustain=.5, release=.5)
+    ...     return SineLoop(freq=pitch, feedback=.05, mul=env), env
+    >>> pool = VoicePool(synth, poly=64, mul=.2).out()
+    >>> pool.noteOn(60, 100)
+
+    """
+    def __init__(self, voice, poly=16, steal="oldest", scale=1, channel=0, mul=1, add=0):
+        PyoObject.__init__(self, mul, add)
+        self._voice = voice
+        self._poly = poly
+        self._steal = steal
+        self._scale = scale
+        self._channel = channel
+        self._base_handler = VoicePool_base(poly, self._stealToInt(steal), scale, channel)
+        server = self._base_handler.getServer()
+        self._note_objs = []
+        self._voices = []
+        outs = []
+        for i in range(poly):
+            before = set([id(stream) for stream in server.getStreams()])
+            pitch = Dummy([VoicePoolNote_base(self._base_handler, i, 0)])
+            velocity = Dummy([VoicePoolNote_base(self._base_handler, i, 1)])
+            result = voice(pitch, velocity)
+            if isinstance(result, TupleType):
+                output, env = result
+            else:
+                output, env = result, result
+            streams = [stream for stream in server.getStreams() if id(stream) not in before]
+            self._base_handler.setVoice(i, streams, [obj._getStream() for obj in env.getBaseObjects()])
+            self._note_objs.append((pitch, velocity))
+            self._voices.append(result)
+            outs.append([obj._getStream() for obj in output.getBaseObjects()])
+        mul, add, lmax = convertArgsToLists(mul, add)
+        chnls = max([len(streams) for streams in outs])
+        self._base_objs = [VoicePoolMix_base(self._base_handler, [wrap(streams,i) for streams in outs], wrap(mul,i), wrap(add,i))
+                           for i in range(max(chnls, lmax))]
+
+    def _stealToInt(self, x):
+        return {"none": 0, "oldest": 1, "quietest": 2}.get(x, 1)
+
+    def noteOn(self, pitch, velocity=127):
+        """
+        Starts a note on a free voice, or on a stolen one.
+
+        :Args:
+
+            pitch : int
+                Midi pitch of the note.
+            velocity : int, optional
+                Midi velocity of the note, a velocity of 0 stops the
+                note. Defaults to 127.
+
+        """
+        self._base_handler.noteOn(int(pitch), int(velocity))
+
+    def noteOff(self, pitch):
+        """
+        Releases the voice playing `pitch`.
+
+        :Args:
+
+            pitch : int
+                Midi pitch of the note.
+
+        """
+        self._base_handler.noteOff(int(pitch))
+
+    def getActiveVoices(self):
+        """
+        Returns the number of voices currently computed.
+
+        """
+        return self._base_handler.getActiveVoices()
+
+    def setSteal(self, x):
+        """
+        Replace the `steal` attribute.
+
+        :Args:
+
+            x : string {"oldest", "quietest", "none"}
+                new `steal` attribute.
+
+        """
+        self._steal = x
+        self._base_handler.setSteal(self._stealToInt(x))
+
+    def setChannel(self, x):
+        """
+        Replace the `channel` attribute.
+
+        :Args:
+
+            x : int
+                new `channel` attribute.
+
+        """
+        self._channel = x
+        self._base_handler.setChannel(x)
+
+    def play(self, dur=0, delay=0):
+        self._base_handler.play()
+        return PyoObject.play(self, dur, delay)
+
+    def out(self, chnl=0, inc=1, dur=0, delay=0):
+        self._base_handler.play()
+        return PyoObject.out(self, chnl, inc, dur, delay)
+
+    def stop(self):
+        self._base_handler.stop()
+        return PyoObject.stop(self)
+
+    @property
+    def voices(self):
+        """list. Objects returned by the `voice` function, for each voice."""
+        return self._voices
+
+    @property
+    def steal(self):
+        """string. Voice stealing policy."""
+        return self._steal
+    @steal.setter
+    def steal(self, x): self.setSteal(x)
+
+    @property
+    def channel(self):
+        """int. Midi channel. 0 means all channels."""
+        return self._channel
+    @channel.setter
+    def channel(self, x): self.setChannel(x)
@@ -47,6 +47,14 @@ class OscSend(PyoObject):
     computers. Only the first value of each input buffersize will be
     sent on the OSC port.
 
+    The values are sent by a background thread, never by the audio
+    callback. All the values waiting to be sent to the same host and
+    port are grouped in a single OSC bundle. If the thread does not
+    keep up with the audio, only the most recent value of an address
+    is sent. When the server renders offline, the audio waits for the
+    thread instead and every value is sent, unless `setMaxRate` limits
+    the rate.
+
     :Parent: :py:class:`PyoObject`
 
     :Args:
@@ -74,6 +82,8 @@ class OscSend(PyoObject):
     >>> s.start()
     >>> a = Sine(freq=[1,1.5], mul=[100,.1], add=[600, .1])
     >>> b = OscSend(a, port=10001, address=['/pitch','/amp'])
+    >>> b.setMaxRate(50)
+    >>> b.setChangesOnly(True)
 
     """
     def __init__(self, input, port, address, host="127.0.0.1"):
@@ -120,6 +130,49 @@ class OscSend(PyoObject):
         """
         [obj.setBufferRate(x) for obj in self._base_objs]
 
+    def setMaxRate(self, x):
+        """
+        Sets the maximum number of values sent per second for each address.
+
+        The values produced faster than this rate are coalesced, only
+        the most recent one is sent.
+
+        :Args:
+
+            x : float
+                Maximum number of values per second. 0 means no limit,
+                which is the default.
+
+        """
+        [obj.setMaxRate(x) for obj in self._base_objs]
+
+    def setChangesOnly(self, x):
+        """
+        If True, a value is sent only if it differs from the last value sent.
+
+        :Args:
+
+            x : boolean
+                True to filter out the repeated values, False to send them
+                all. Defaults to False.
+
+        """
+        [obj.setChangesOnly(x) for obj in self._base_objs]
+
+    def getStats(self):
+        """
+        Returns the counters of the sending thread, one dictionary per address.
+
+        Each dictionary has the keys:
+            - "sent" : number of values sent.
+            - "coalesced" : values replaced by a newer one before being sent.
+            - "filtered" : values not sent because they did not change
+              (see setChangesOnly).
+            - "dropped" : always 0, kept for compatibility with OscDataSend.
+
+        """
+        return [obj.getStats() for obj in self._base_objs]
+
     @property
     def input(self):
         """PyoObject. Input signal."""
@@ -132,8 +185,10 @@ class OscReceive(PyoObject):
     Receives values over a network via the Open Sound Control protocol.
 
     Uses the OSC protocol to receive values from other softwares or
-    other computers. Get a value at the beginning of each buffersize
-    and fill its buffer with it.
+    other computers. The messages are received by a separate thread,
+    which stores the last value of each address. The object reads it
+    at the beginning of each buffersize and fills its buffer with it,
+    interpolated if the interpolation is activated.
 
     :Parent: :py:class:`PyoObject`
 
@@ -244,6 +299,23 @@ class OscReceive(PyoObject):
         """
         [obj.setInterpolation(x) for obj in self._base_objs]
 
+    def setRamp(self, x):
+        """
+        Sets the duration of the interpolation.
+
+        By default (0), the interpolation smoothes the changes over about
+        10 milliseconds. A positive duration replaces the smoothing by a
+        linear ramp, of this duration, from the current value to each new
+        value received.
+
+        :Args:
+
+            x : float
+                Duration of the ramp in seconds.
+
+        """
+        [obj.setRamp(x) for obj in self._base_objs]
+
     def setValue(self, path, value):
         """
         Sets value for a given address.
@@ -302,6 +374,13 @@ class OscDataSend(PyoObject):
     computers. Values are sent on the form of a list containing `types`
     elements.
 
+    The messages are queued by the `send` method and sent by a background
+    thread, grouped in OSC bundles per host and port. Up to 256 messages
+    per address can wait to be sent, the messages sent while the queue is
+    full are dropped (see getStats). When the server renders offline, a
+    full queue is sent before the new message is queued, so no message is
+    dropped. Nothing is sent while the object is stopped.
+
     :Parent: :py:class:`PyoObject`
 
     :Args:
@@ -437,6 +516,35 @@ class OscDataSend(PyoObject):
         else:
             self._addresses[address].send(msg)
 
+    def setMaxRate(self, x):
+        """
+        Sets the maximum number of messages sent per second for each address.
+
+        The messages sent faster than this rate wait in the queue.
+
+        :Args:
+
+            x : float
+                Maximum number of messages per second. 0 means no limit,
+                which is the default.
+
+        """
+        [obj.setMaxRate(x) for obj in self._base_objs]
+
+    def getStats(self):
+        """
+        Returns the counters of the sending thread, as a dictionary of
+        dictionaries, one per address.
+
+        Each dictionary has the keys:
+            - "sent" : number of messages sent.
+            - "coalesced" : always 0, messages are never coalesced.
+            - "filtered" : always 0, messages are never filtered.
+            - "dropped" : messages dropped because the queue was full.
+
+        """
+        return dict([(adr, obj.getStats()) for adr, obj in self._addresses.items()])
+
 class OscDataReceive(PyoObject):
     """
     Receives data values over a network via the Open Sound Control protocol.
@@ -49,9 +49,10 @@ class PVAnal(PyoPVObject):
 
         input : PyoObject
             Input signal to process.
-        size : int {pow-of-two > 4}, optional
-            FFT size. Must be a power of two greater than 4.
-            Defaults to 1024.
+        size : int {even > 4}, optional
+            FFT size. Must be an even number greater than 4 with no
+            prime factors other than 2, 3 and 5, ie. a power of two,
+            480, 960 or 1536. Defaults to 1024.
 
             The FFT size is the number of samples used in each
             analysis frame.
@@ -207,6 +207,20 @@ class SfPlayer(PyoObject):
         x, lmax = convertArgsToLists(x)
         [obj.setInterp(wrap(x,i)) for i, obj in enumerate(self._base_players)]
 
+    def getUnderruns(self):
+        """
+        Returns the number of buffers that could not be read from the disk in time.
+
+        The sound is read ahead by a background thread (see the `setPrefetch`
+        method of the Server). If the audio callback needs samples that are
+        not yet loaded, silence is output and the underrun is counted, once
+        per buffer. Returns a list if the object controls more than one sound.
+
+        """
+        underruns = [obj.getUnderruns() for obj in self._base_players]
+        if len(underruns) == 1: return underruns[0]
+        return underruns
+
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(-2., 2., 'lin', 'speed', self._speed),
                           SLMap(1, 4, 'lin', 'interp', self._interp, res="int", dataOnly=True),
@@ -355,6 +369,20 @@ class SfMarkerShuffler(PyoObject):
         """
         return self._markers
 
+    def getUnderruns(self):
+        """
+        Returns the number of buffers that could not be read from the disk in time.
+
+        The sound is read ahead by a background thread (see the `setPrefetch`
+        method of the Server). If the audio callback needs samples that are
+        not yet loaded, silence is output and the underrun is counted, once
+        per buffer. Returns a list if the object controls more than one sound.
+
+        """
+        underruns = [obj.getUnderruns() for obj in self._base_players]
+        if len(underruns) == 1: return underruns[0]
+        return underruns
+
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(0.01, 2., 'lin', 'speed', self._speed),
                           SLMap(1, 4, 'lin', 'interp', self._interp, res="int", dataOnly=True),
@@ -493,6 +521,20 @@ class SfMarkerLooper(PyoObject):
         """
         return self._markers
 
+    def getUnderruns(self):
+        """
+        Returns the number of buffers that could not be read from the disk in time.
+
+        The sound is read ahead by a background thread (see the `setPrefetch`
+        method of the Server). If the audio callback needs samples that are
+        not yet loaded, silence is output and the underrun is counted, once
+        per buffer. Returns a list if the object controls more than one sound.
+
+        """
+        underruns = [obj.getUnderruns() for obj in self._base_players]
+        if len(underruns) == 1: return underruns[0]
+        return underruns
+
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(0.01, 2., 'lin', 'speed', self._speed),
                           SLMap(0, len(self._markers)-1, 'lin', 'mark', self._mark, 'int'),
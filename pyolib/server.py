@@ -18,7 +18,7 @@ GNU Lesser General Public License for more details.
 You should have received a copy of the GNU Lesser General Public
 License along with pyo.  If not, see <http://www.gnu.org/licenses/>.
 """
-import os, time
+import os, time, multiprocessing
 from _core import *
 from _widgets import createServerGUI
 
@@ -74,6 +74,14 @@ class Server(object):
             Name of jack client. Defaults to 'pyo'
         ichnls : int, optional
             Number of input channels if different of output channels. If None (default), ichnls = nchnls.
+        threads : int, optional
+            Number of threads used to compute the audio objects. Defaults to 1.
+
+            With more than one thread, the objects that don't depend on each other
+            are computed in parallel. The order of computation of dependent objects
+            is preserved, so the output is the same as with a single thread. Objects
+            calling python functions (Pattern, TrigFunc, etc.) are always computed
+            by the audio thread.
 
     .. note::
 
@@ -92,8 +100,9 @@ class Server(object):
         - setNchnls(x) : Set the number of output (and input if `ichnls` = None) channels used by the server.
         - setIchnls(x) : Set the number of input channels (if different of output channels) used by the server.
         - setDuplex(x) : Set the duplex mode used by the server.
+        - setGilFree(x) : Run the audio callback without holding the Python interpreter lock.
         - setVerbosity(x) : Set the server's verbosity.
-        - reinit(sr, nchnls, buffersize, duplex, audio, jackname) : Reinit the server's settings.
+        - reinit(sr, nchnls, buffersize, duplex, audio, jackname, ichnls, threads) : Reinit the server's settings.
 
     >>> # For an 8 channels server in duplex mode with
     >>> # a sampling rate of 48000 Hz and buffer size of 512
@@ -102,7 +111,7 @@ class Server(object):
 
     """
     def __init__(self, sr=44100, nchnls=2, buffersize=256, duplex=1,
-                 audio='portaudio', jackname='pyo', ichnls=None):
+                 audio='portaudio', jackname='pyo', ichnls=None, threads=1):
         if os.environ.has_key("PYO_SERVER_AUDIO") and "offline" not in audio and "embedded" not in audio:
             audio = os.environ["PYO_SERVER_AUDIO"]
         self._time = time
@@ -118,7 +127,8 @@ class Server(object):
         self._filename = None
         self._fileformat = 0
         self._sampletype = 0
-        self._server = Server_base(sr, nchnls, buffersize, duplex, audio, jackname, self._ichnls)
+        self._recsync = 0
+        self._server = Server_base(sr, nchnls, buffersize, duplex, audio, jackname, self._ichnls, threads)
         self._server._setDefaultRecPath(os.path.join(os.path.expanduser("~"), "pyo_rec.wav"))
 
     def __del__(self):
@@ -132,7 +142,7 @@ class Server(object):
             self._time.sleep(.25)
 
     def reinit(self, sr=44100, nchnls=2, buffersize=256, duplex=1,
-               audio='portaudio', jackname='pyo', ichnls=None):
+               audio='portaudio', jackname='pyo', ichnls=None, threads=1):
         """
         Reinit the server'settings. Useful to alternate between real-time and offline server.
 
@@ -153,8 +163,9 @@ class Server(object):
         self._filename = None
         self._fileformat = 0
         self._sampletype = 0
+        self._recsync = 0
         self._globalseed = 0
-        self._server.__init__(sr, nchnls, buffersize, duplex, audio, jackname, self._ichnls)
+        self._server.__init__(sr, nchnls, buffersize, duplex, audio, jackname, self._ichnls, threads)
 
     def gui(self, locals=None, meter=True, timer=True, exit=True):
         """
@@ -408,6 +419,55 @@ class Server(object):
         """
         self._server.setDuplex(x)
 
+    def setGilFree(self, x):
+        """
+        Run the audio callback without holding the Python interpreter lock.
+
+        When activated, the audio thread computes the processing chain
+        without the GIL. Python functions triggered by the audio thread
+        (Pattern, TrigFunc, CallAfter, CtlScan, etc.) are queued and called
+        later by a dedicated thread, and methods called on audio objects
+        are applied between two buffers. Objects that must use the
+        interpreter while computing still take the lock for themselves.
+
+        Must be called before booting the server. Not available with the
+        "offline" and "embedded" audio backends.
+
+        :Args:
+
+            x : boolean
+                True to activate the GIL-free callback, False to deactivate it.
+
+        """
+        self._server.setGilFree(x)
+
+    def setSleepWhenSilent(self, x):
+        """
+        Skip the computation of the objects whose inputs are silent.
+
+        When activated, the objects keeping a state (filters, delays and
+        reverbs) stop computing once their output and all their audio
+        inputs, parameters given as audio objects included, have been
+        silent for longer than the object's own tail (the length of its
+        delay lines for delays and reverbs). The output of the object is
+        measured before `mul` and `add`, so a small `mul` does not put it
+        to sleep early. Its output is then zero and its internal memories
+        are cleared. It is computed again as soon as an input is not
+        silent anymore or a method of the object is called. Samples below
+        -120 dB are considered silent.
+
+        In patches that are idle most of the time, this saves most of the
+        processing of the effect chains.
+
+        :Args:
+
+            x : boolean
+                True to let the silent objects sleep, False to always
+                compute every object.
+
+        """
+        self._server.setSleepWhenSilent(x)
+
     def setVerbosity(self, x):
         """
         Set the server's verbosity.
@@ -494,6 +554,27 @@ class Server(object):
         self._startoffset = x
         self._server.setStartOffset(x)
 
+    def setPrefetch(self, x):
+        """
+        Set the duration of sound read ahead from the disk by the soundfile players.
+
+        SfPlayer, SfMarkerShuffler and SfMarkerLooper never read the disk in
+        the audio callback, a background thread keeps `x` seconds of each
+        sound in memory ahead of the reading pointer. Longer durations protect
+        against slow storage at the cost of memory. Applies to players created
+        after the call.
+
+        The same duration is buffered in memory, behind the disk, by the
+        recordings (Server.recstart and Record objects) started after the call.
+
+        :Args:
+
+            x : float
+                Duration, in seconds, of the prefetch buffers. Defaults to 1.
+
+        """
+        self._server.setPrefetch(x)
+
     def setAmp(self, x):
         """
         Set the overall amplitude.
@@ -553,7 +634,7 @@ class Server(object):
         """
         self._server.stop()
 
-    def recordOptions(self, dur=-1, filename=None, fileformat=0, sampletype=0):
+    def recordOptions(self, dur=-1, filename=None, fileformat=0, sampletype=0, sync=0):
         """
         Sets options for soundfile created by offline rendering or global recording.
 
@@ -590,6 +671,12 @@ class Server(object):
                     4. 64 bits float
                     5. U-Law encoded
                     6. A-Law encoded
+            sync : int, optional
+                When the recorded samples are flushed from the system's cache
+                to the storage device. Supported policies are:
+                    0. Never, the system decides (default)
+                    1. When the recording stops
+                    2. After each write to the disk (safest, but slowest)
 
         """
 
@@ -608,7 +695,8 @@ class Server(object):
             print 'Warning: Filename has no extension. Using fileformat value.'
         self._fileformat = fileformat
         self._sampletype = sampletype
-        self._server.recordOptions(dur, filename, fileformat, sampletype)
+        self._recsync = sync
+        self._server.recordOptions(dur, filename, fileformat, sampletype, sync)
 
     def recstart(self, filename=None):
         """
@@ -636,7 +724,7 @@ class Server(object):
                 fileformat = FILE_FORMATS[ext]
                 if fileformat != self._fileformat:
                     self._fileformat = fileformat
-                    self._server.recordOptions(self._dur, filename, self._fileformat, self._sampletype)
+                    self._server.recordOptions(self._dur, filename, self._fileformat, self._sampletype, self._recsync)
 
         self._server.recstart(filename)
 
@@ -647,6 +735,116 @@ class Server(object):
         """
         self._server.recstop()
 
+    def getRecOverruns(self):
+        """
+        Returns the number of buffers that could not be written to the disk in time.
+
+        The recorded samples are written to the disk by a background thread
+        (see the `setPrefetch` method for the amount of sound it can hold). If
+        the disk falls behind and the buffer is full, the samples of the current
+        buffer are lost and the overrun is counted. Returns the count of the
+        recording in progress, or of the last recording.
+
+        """
+        return self._server.getRecOverruns()
+
+    def schedule(self, time, function, *args):
+        """
+        Calls a function, with arguments, at a precise time.
+
+        The events are kept by the server in a single queue, sorted by time,
+        and called at the beginning of the buffer in which they fall. An
+        idle event costs nothing, so any number of them can be pending
+        without the overhead of one Pattern or CallAfter object per timer.
+
+        An event knows its position inside the buffer. Trig, Fader and Adsr
+        objects started (`play` method) by the function start at this exact
+        sample instead of at the beginning of the buffer.
+
+        An event scheduled by the function of another event is delayed from
+        the time of that event rather than from the current buffer, so that
+        a function rescheduling itself produces a sample-accurate sequence.
+
+        Returns a handle with the following methods:
+            - cancel() : cancels the event, returns True if it was pending.
+            - isPending() : returns True if the event was not called or
+              cancelled yet.
+            - getTime() : returns the time of the event, in seconds since
+              the server was booted.
+
+        :Args:
+
+            time : float
+                Delay, in seconds, before calling the function.
+            function : Python callable
+                Function to call.
+            *args : any
+                Arguments given to the function.
+
+        .. note::
+
+            The server must be booted. Pending events are dropped when the
+            server is shut down.
+
+            When the server processes without the GIL (see the `setGilFree`
+            method), the functions are called from a separate thread, shortly
+            after their buffer, and the objects they start begin at the next
+            buffer.
+
+        >>> s = Server().boot()
+        >>> s.start()
+        >>> env = Adsr(attack=.005, decay=.1, sustain=.3, release=.2, dur=.25, mul=.3)
+        >>> a = SineLoop(freq=300, feedback=.05, mul=env).out()
+        >>> def step(count):
+        ...     env.play()
+        ...     if count > 1:
+        ...         s.schedule(.25, step, count-1)
+        >>> ev = s.schedule(.5, step, 16)
+
+        """
+        return self._server.schedule(time, function, args)
+
+    def addMidiEvent(self, status, data1=0, data2=0):
+        """
+        Adds a MIDI event to the input queue, as if it was received from a device.
+
+        The midi objects (Notein, Midictl, Bendin, etc.) receive the event
+        exactly as the ones read from the midi inputs, which allows to play
+        or test a midi setup without any hardware, and to drive midi objects
+        in offline rendering.
+
+        Called from the function of an event (see the `schedule` method),
+        the midi event happens at the exact time of that event. Otherwise,
+        it happens at the beginning of the next buffer.
+
+        :Args:
+
+            status : int
+                Status byte of the message, the kind of message plus the
+                midi channel minus 1 (ex.: 0x90 is a noteon on channel 1).
+            data1 : int, optional
+                First data byte, between 0 and 127. Defaults to 0.
+            data2 : int, optional
+                Second data byte, between 0 and 127. Defaults to 0.
+
+        .. note::
+
+            The events received from the midi inputs are timestamped by
+            the midi thread and happen one buffer later, at the position
+            they had in the buffer in which they were received.
+
+        >>> s = Server(audio="offline").boot()
+        >>> s.recordOptions(dur=2, filename="notes.wav")
+        >>> notes = Notein(poly=4)
+        >>> amp = MidiAdsr(notes["velocity"], attack=.005, decay=.1, sustain=.5, release=.2)
+        >>> osc = Sine(freq=notes["pitch"], mul=amp*.25).out()
+        >>> ev1 = s.schedule(.25, s.addMidiEvent, 0x90, 60, 100)
+        >>> ev2 = s.schedule(1, s.addMidiEvent, 0x80, 60, 0)
+        >>> s.start()
+
+        """
+        self._server.addMidiEvent(status, data1, data2)
+
     def noteout(self, pitch, velocity, channel=0, timestamp=0):
         """
         Send a MIDI note message to the selected midi output device.
@@ -863,6 +1061,15 @@ class Server(object):
         """
         return len(self._server.getStreams())
 
+    def getNumberOfSleepingStreams(self):
+        """
+        Returns the number of streams skipped during the last buffer.
+
+        Streams only sleep when activated with `setSleepWhenSilent`.
+
+        """
+        return self._server.getNumberOfSleepingStreams()
+
     def setServer(self):
         """
         Sets this server as the one to use for new objects when using the embedded device
@@ -939,4 +1146,116 @@ class Server(object):
         if (type(x) == int):
             self.setGlobalSeed(x)
         else:
-            raise Exception("global seed must be an integer")
\ No newline at end of file
+            raise Exception("global seed must be an integer")
+
+######################################################################
+### Batch offline rendering
+######################################################################
+_batch_server = None
+_batch_options = None
+
+def _batchInit(sr, nchnls, buffersize, fileformat, sampletype):
+    "Creates the offline server of a batch rendering worker process."
+    global _batch_server, _batch_options
+    _batch_server = Server(sr=sr, nchnls=nchnls, buffersize=buffersize, duplex=0, audio="offline")
+    _batch_server.setVerbosity(1)
+    _batch_options = (fileformat, sampletype)
+
+def _batchRender(job):
+    "Renders one job in a worker process and returns its report."
+    function, dur, path = job
+    report = {'path': path, 'dur': dur, 'time': 0.0, 'speed': 0.0, 'error': None}
+    server = _batch_server
+    objs = None
+    start = time.time()
+    try:
+        server.boot()
+        server.recordOptions(dur=dur, filename=path, fileformat=_batch_options[0], sampletype=_batch_options[1])
+        objs = function()
+        server.start()
+    except Exception, e:
+        report['error'] = "%s: %s" % (e.__class__.__name__, e)
+    if server.getIsBooted():
+        server.shutdown()
+    del objs
+    report['time'] = time.time() - start
+    if report['error'] == None and report['time'] > 0:
+        report['speed'] = dur / report['time']
+    return report
+
+def batchRender(jobs, processes=None, sr=44100, nchnls=2, buffersize=256, fileformat=0, sampletype=0):
+    """
+    Renders a list of offline jobs across a pool of processes.
+
+    Each worker process owns an offline Server, booted and shut down for
+    every job it renders, so jobs run in parallel as fast as the CPUs
+    allow. Returns one report per job, in the order of `jobs`.
+
+    Each report is a dictionary with the following keys:
+        - path : the output file.
+        - dur : the duration of the file, in seconds.
+        - time : the time spent to render the job, in seconds.
+        - speed : the realtime factor (`dur` / `time`).
+        - error : None, or the message of the exception raised by the job.
+
+    :Args:
+
+        jobs : list of tuples
+            One (function, dur, path) tuple per output file. `function`
+            is called, without argument, once the worker's server is
+            booted and must create the processing chain (sending sound
+            to the outputs). It must return the objects to keep alive
+            during the rendering (a list, a dictionary, ...). `dur` is
+            the duration in seconds and `path` the file to create.
+        processes : int, optional
+            Number of worker processes. Defaults to None, which uses
+            the number of CPUs.
+        sr : int, optional
+            Sampling rate of the rendering servers. Defaults to 44100.
+        nchnls : int, optional
+            Number of channels of the output files. Defaults to 2.
+        buffersize : int, optional
+            Buffer size of the rendering servers. Defaults to 256.
+        fileformat : int, optional
+            Format of the output files when it can't be deduced from the
+            file extension. See `Server.recordOptions`. Defaults to 0.
+        sampletype : int, optional
+            Bit depth encoding of the output files. See
+            `Server.recordOptions`. Defaults to 0.
+
+    .. note::
+
+        The functions are sent to the worker processes, so they must be
+        picklable: module level functions, or `functools.partial` of
+        module level functions to give them arguments.
+
+        On Windows, the script calling batchRender must be protected by
+        an `if __name__ == "__main__":` statement.
+
+        The worker processes are forked from the calling process and
+        create their own Server, so batchRender must be called before a
+        Server is created in the calling process (or after it has been
+        shut down and deleted). Otherwise, PyoServerStateException is
+        raised.
+
+    >>> import functools
+    >>> def synth(freq):
+    ...     env = Adsr(attack=0.005, decay=0.15, sustain=0.7, release=1.7, dur=2).play()
+    ...     osc = SineLoop(freq=[freq, freq*1.01], feedback=0.075, mul=env).out()
+    ...     return [env, osc]
+    >>> jobs = [(functools.partial(synth, midiToHz(n)), 2.1, "note_%d.wav" % n) for n in range(48, 72)]
+    >>> for report in batchRender(jobs):
+    ...     print report['path'], report['time'], report['speed']
+
+    """
+    if serverCreated():
+        raise PyoServerStateException("batchRender can't be called while a Server exists, its worker processes create their own.")
+    if processes == None:
+        processes = multiprocessing.cpu_count()
+    pool = multiprocessing.Pool(processes, _batchInit, (sr, nchnls, buffersize, fileformat, sampletype))
+    try:
+        reports = pool.map(_batchRender, jobs, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+    return reports
@@ -53,7 +53,7 @@ class Osc(PyoObject):
 
     .. seealso::
 
-        :py:class:`Phasor`, :py:class:`Sine`
+        :py:class:`Phasor`, :py:class:`Sine`, :py:meth:`PyoTableObject.setMipmap`
 
     >>> s = Server().boot()
     >>> s.start()
@@ -191,7 +191,7 @@ class OscLoop(PyoObject):
 
     .. seealso::
 
-        :py:class:`Osc`, :py:class:`SineLoop`
+        :py:class:`Osc`, :py:class:`SineLoop`, :py:meth:`PyoTableObject.setMipmap`
 
     >>> s = Server().boot()
     >>> s.start()
@@ -772,7 +772,7 @@ class TableRead(PyoObject):
 
     .. seealso::
 
-        :py:class:`Osc`
+        :py:class:`Osc`, :py:meth:`PyoTableObject.setMipmap`
 
     >>> s = Server().boot()
     >>> s.start()
@@ -1098,6 +1098,10 @@ class Pointer(PyoObject):
         index : PyoObject
             Normalized position in the table between 0 and 1.
 
+    .. seealso::
+
+        :py:meth:`PyoTableObject.setMipmap`
+
     >>> s = Server().boot()
     >>> s.start()
     >>> t = SndTable(SNDS_PATH + '/transparent.aif')
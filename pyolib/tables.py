@@ -1343,6 +1343,19 @@ class SndTable(PyoTableObject):
             Stops reading at `stop` seconds into the file. Available at
             initialization time only. The default (None) means the end of
             the file.
+        mmap : boolean, optional
+            If True, the table is backed by a memory-mapped cache file
+            instead of being loaded in memory. Only the parts of the
+            sound actually read are paged in, and tables (even in other
+            processes) loading the same sound share the memory. Available
+            at initialization time only. Defaults to False.
+
+    .. note::
+
+        With `mmap` set to True, each channel of the sound is converted
+        once to a raw file in the directory given by the PYO_CACHE_DIR
+        environment variable (defaults to a "pyo-cache" directory in the
+        temporary folder). The cache is rebuilt when the sound file changes.
 
     >>> s = Server().boot()
     >>> s.start()
@@ -1352,7 +1365,7 @@ class SndTable(PyoTableObject):
     >>> a = Osc(table=t, freq=[freq, freq*.995], mul=.3).out()
 
     """
-    def __init__(self, path=None, chnl=None, start=0, stop=None, initchnls=1):
+    def __init__(self, path=None, chnl=None, start=0, stop=None, initchnls=1, mmap=False):
         PyoTableObject.__init__(self)
         self._path = path
         self._chnl = chnl
@@ -1369,14 +1382,14 @@ class SndTable(PyoTableObject):
                 _size, _dur, _snd_sr, _snd_chnls, _format, _type = sndinfo(p)
                 if chnl == None:
                     if stop == None:
-                        self._base_objs.extend([SndTable_base(p, i, start) for i in range(_snd_chnls)])
+                        self._base_objs.extend([SndTable_base(p, i, start, mmap=int(mmap)) for i in range(_snd_chnls)])
                     else:
-                        self._base_objs.extend([SndTable_base(p, i, start, stop) for i in range(_snd_chnls)])
+                        self._base_objs.extend([SndTable_base(p, i, start, stop, int(mmap)) for i in range(_snd_chnls)])
                 else:
                     if stop == None:
-                        self._base_objs.append(SndTable_base(p, chnl, start))
+                        self._base_objs.append(SndTable_base(p, chnl, start, mmap=int(mmap)))
                     else:
-                        self._base_objs.append(SndTable_base(p, chnl, start, stop))
+                        self._base_objs.append(SndTable_base(p, chnl, start, stop, int(mmap)))
                 self._size.append(self._base_objs[-1].getSize())
                 self._dur.append(self._size[-1] / float(_snd_sr))
             if lmax == 1:
@@ -1653,6 +1666,7 @@ class SndTable(PyoTableObject):
         createSndViewTableWindow(self, title, wxnoserver, self.__class__.__name__, mouse_callback)
 
     def refreshView(self):
+        self._refreshMipmap()
         if self.viewFrame != None:
             self.viewFrame.update()
 
@@ -1854,6 +1868,7 @@ class NewTable(PyoTableObject):
         createSndViewTableWindow(self, title, wxnoserver, self.__class__.__name__, mouse_callback)
 
     def refreshView(self):
+        self._refreshMipmap()
         if self.viewFrame != None:
             self.viewFrame.update()
 
@@ -23,6 +23,7 @@ You should have received a copy of the GNU Lesser General Public
 License along with pyo.  If not, see <http://www.gnu.org/licenses/>.
 """
 from _core import *
+from _core import _isBinaryDataFile, _writeBinaryData, _readBinaryData, _arrayChunks
 from _maps import *
 from types import SliceType
 import threading, time
@@ -569,10 +570,16 @@ class Record(PyoObject):
                 5. U-Law encoded
                 6. A-Law encoded
         buffering : int, optional
-            Number of bufferSize to wait before writing samples to disk.
+            Number of bufferSize to wait before sending samples to the disk.
 
-            High buffering uses more memory but improves performance.
-            Defaults to 4.
+            The samples are written to the disk by a background thread,
+            the audio callback never waits for the disk. Defaults to 4.
+        sync : int, optional
+            When the recorded samples are flushed from the system's cache
+            to the storage device. Supported policies are:
+                0. Never, the system decides (default)
+                1. When the recording stops
+                2. After each write to the disk (safest, but slowest)
 
     .. note::
 
@@ -600,7 +607,7 @@ class Record(PyoObject):
     >>> clean.start()
 
     """
-    def __init__(self, input, filename, chnls=2, fileformat=0, sampletype=0, buffering=4):
+    def __init__(self, input, filename, chnls=2, fileformat=0, sampletype=0, buffering=4, sync=0):
         PyoObject.__init__(self)
         self._input = input
         self._in_fader = InputFader(input)
@@ -613,11 +620,22 @@ class Record(PyoObject):
                 print 'Warning: Unknown file extension. Using fileformat value.'
         else:
             print 'Warning: Filename has no extension. Using fileformat value.'
-        self._base_objs = [Record_base(self._in_fader.getBaseObjects(), filename, chnls, fileformat, sampletype, buffering)]
+        self._base_objs = [Record_base(self._in_fader.getBaseObjects(), filename, chnls, fileformat, sampletype, buffering, sync)]
 
     def out(self, chnl=0, inc=1, dur=0, delay=0):
         return self.play(dur, delay)
 
+    def getOverruns(self):
+        """
+        Returns the number of buffers that could not be written to the disk in time.
+
+        If the disk falls behind and the memory buffer of the recording is
+        full (see the `setPrefetch` method of the Server), the samples are
+        lost and the overrun is counted.
+
+        """
+        return self._base_objs[0].getOverruns()
+
     def setInput(self, x, fadetime=0.05):
         """
         Replace the `input` attribute.
@@ -694,14 +712,14 @@ class Denorm(PyoObject):
 
 class ControlRec(PyoObject):
     """
-    Records control values and writes them in a text file.
+    Records control values and writes them in a file.
 
     `input` parameter must be a valid PyoObject managing any number
     of streams, other parameters can't be in list format. The user
-    must call the `write` method to create text files on the disk.
+    must call the `write` method to create the files on the disk.
 
-    Each line in the text files contains two values, the absolute time
-    in seconds and the sampled value.
+    Each record contains two values, the absolute time in seconds and
+    the sampled value.
 
     The play() method starts the recording and is not called at the
     object creation time.
@@ -772,19 +790,34 @@ class ControlRec(PyoObject):
     def out(self, chnl=0, inc=1, dur=0, delay=0):
         return self.play(dur, delay)
 
-    def write(self):
+    def write(self, binary=True, compress=False):
         """
-        Writes recorded values in text files on the disk.
+        Writes recorded values in files on the disk.
+
+        :Args:
+
+            binary : boolean, optional
+                If True, the (time, value) pairs are written as 64-bit
+                floats in the pyo binary data format. Otherwise, they are
+                written as text lines. Defaults to True.
+            compress : boolean, optional
+                Binary format only. If True, the data is compressed with
+                zlib. Defaults to False.
 
         """
         for i, obj in enumerate(self._base_objs):
-            f = open(os.path.join(self._path, "%s_%03d" % (self._name, i)), "w")
+            path = os.path.join(self._path, "%s_%03d" % (self._name, i))
+            if binary:
+                data = obj.getData()
+                _writeBinaryData(path, 'control', 'd', [(len(data), 2, _arrayChunks(data, 'd', flatten=True))], compress)
+                continue
+            f = open(path, "w")
             [f.write("%f %f\n" % p) for p in obj.getData()]
             f.close()
 
 class ControlRead(PyoObject):
     """
-    Reads control values previously stored in text files.
+    Reads control values previously stored in files.
 
     Read sampled sound from a table, with optional looping mode.
 
@@ -850,9 +883,12 @@ class ControlRead(PyoObject):
         self._base_objs = []
         for i in range(len(files)):
             path = os.path.join(self._path, files[i])
-            f = open(path, "r")
-            values = [float(l.split()[1]) for l in f.readlines()]
-            f.close()
+            if _isBinaryDataFile(path):
+                values = _readBinaryData(path, 'control')[0][2].tolist()[1::2]
+            else:
+                f = open(path, "r")
+                values = [float(l.split()[1]) for l in f.readlines()]
+                f.close()
             self._base_objs.append(ControlRead_base(values, rate, loop, interp, wrap(mul,i), wrap(add,i)))
         self._trig_objs = Dummy([TriggerDummy_base(obj) for obj in self._base_objs])
 
@@ -924,14 +960,14 @@ class ControlRead(PyoObject):
 
 class NoteinRec(PyoObject):
     """
-    Records Notein inputs and writes them in a text file.
+    Records Notein inputs and writes them in a file.
 
     `input` parameter must be a Notein object managing any number
     of streams, other parameters can't be in list format. The user
-    must call the `write` method to create text files on the disk.
+    must call the `write` method to create the files on the disk.
 
-    Each line in the text files contains three values, the absolute time
-    in seconds, the Midi pitch and the normalized velocity.
+    Each record contains three values, the absolute time in seconds,
+    the Midi pitch and the normalized velocity.
 
     The play() method starts the recording and is not called at the
     object creation time.
@@ -988,19 +1024,34 @@ class NoteinRec(PyoObject):
     def out(self, chnl=0, inc=1, dur=0, delay=0):
         return self.play(dur, delay)
 
-    def write(self):
+    def write(self, binary=True, compress=False):
         """
-        Writes recorded values in text files on the disk.
+        Writes recorded values in files on the disk.
+
+        :Args:
+
+            binary : boolean, optional
+                If True, the (time, pitch, velocity) triplets are written
+                as 64-bit floats in the pyo binary data format. Otherwise,
+                they are written as text lines. Defaults to True.
+            compress : boolean, optional
+                Binary format only. If True, the data is compressed with
+                zlib. Defaults to False.
 
         """
         for i, obj in enumerate(self._base_objs):
-            f = open(os.path.join(self._path, "%s_%03d" % (self._name, i)), "w")
+            path = os.path.join(self._path, "%s_%03d" % (self._name, i))
+            if binary:
+                data = obj.getData()
+                _writeBinaryData(path, 'notes', 'd', [(len(data), 3, _arrayChunks(data, 'd', flatten=True))], compress)
+                continue
+            f = open(path, "w")
             [f.write("%f %f %f\n" % p) for p in obj.getData()]
             f.close()
 
 class NoteinRead(PyoObject):
     """
-    Reads Notein values previously stored in text files.
+    Reads Notein values previously stored in files.
 
     :Parent: :py:class:`PyoObject`
 
@@ -1058,12 +1109,16 @@ class NoteinRead(PyoObject):
         self._poly = len(files)
         for i in range(self._poly):
             path = os.path.join(self._path, files[i])
-            f = open(path, "r")
-            vals = [l.split() for l in f.readlines()]
-            timestamps = [float(v[0]) for v in vals]
-            pitches = [float(v[1]) for v in vals]
-            amps = [float(v[2]) for v in vals]
-            f.close()
+            if _isBinaryDataFile(path):
+                vals = _readBinaryData(path, 'notes')[0][2].tolist()
+                timestamps, pitches, amps = vals[0::3], vals[1::3], vals[2::3]
+            else:
+                f = open(path, "r")
+                vals = [l.split() for l in f.readlines()]
+                timestamps = [float(v[0]) for v in vals]
+                pitches = [float(v[1]) for v in vals]
+                amps = [float(v[2]) for v in vals]
+                f.close()
             self._base_objs.append(NoteinRead_base(pitches, timestamps, loop))
             self._base_objs.append(NoteinRead_base(amps, timestamps, loop, wrap(mul,i), wrap(add,i)))
             _trig_objs_tmp.append(TriggerDummy_base(self._base_objs[-1]))
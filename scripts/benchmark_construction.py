@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+Measures the time needed to build large patches.
+
+Each test builds, from scratch, a patch of many voices and reports the
+total time, the number of audio streams created and the time per
+stream.
+
+Usage: python benchmark_construction.py [voices] [repeats]
+
+"""
+import sys, time
+from pyo import *
+
+VOICES = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+REPEATS = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+s = Server(audio="offline", buffersize=256).boot()
+patches = []
+
+def synth_voices(n):
+    objs = []
+    for i in range(n):
+        env = Adsr(attack=0.01, decay=0.1, sustain=0.5, release=0.2, mul=0.01)
+        osc = SineLoop(freq=100+i, feedback=0.05, mul=env)
+        filt = ButLP(osc, freq=2000)
+        pan = Pan(filt, outs=2, pan=0.5)
+        objs.extend([env, osc, filt, pan])
+    return objs
+
+def midi_voices(n):
+    notes = Notein(poly=n, scale=1)
+    amp = MidiAdsr(notes["velocity"], mul=0.01)
+    osc = SuperSaw(freq=notes["pitch"], mul=amp)
+    return [notes, amp, osc]
+
+def measure(build):
+    times = []
+    for i in range(REPEATS):
+        before = s.getNumberOfStreams()
+        start = time.time()
+        objs = build(VOICES)
+        times.append(time.time() - start)
+        streams = s.getNumberOfStreams() - before
+        patches.append(objs)
+    return min(times), streams
+
+print "%d voices, best of %d" % (VOICES, REPEATS)
+for name, build in [("synth voices", synth_voices), ("Notein voices", midi_voices)]:
+    elapsed, streams = measure(build)
+    print "%-14s %8.2f ms  %6d streams  %6.2f us/stream" % (name, elapsed * 1000, streams, elapsed * 1000000 / max(streams, 1))
@@ -0,0 +1,130 @@
+/*
+ * Measures the real fft of the plans against the split-radix fft.
+ *
+ * For each power-of-two size from 64 to 65536, a forward and an inverse
+ * transform are timed with realfft_split/irealfft_split and with
+ * realfft_plan/irealfft_plan. The sizes that only the plans can compute
+ * (ie. 480, 960, 1536) are compared with the split-radix fft of the next
+ * power of two, which is what they required before. Times are the best
+ * of a few runs, in microseconds per forward + inverse pair.
+ *
+ * Build and run from the root of the sources:
+ *
+ *   gcc -O3 -std=gnu99 -I include `python-config --includes` \
+ *       scripts/benchmark_fft.c src/engine/fft.c src/engine/wind.c -lm -o benchmark_fft
+ *   ./benchmark_fft
+ *
+ * Add -DUSE_DOUBLE to measure the double precision transforms.
+ */
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+#include "fft.h"
+
+#define RUNS 5
+
+static double
+now(void) {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec + ts.tv_nsec * 1e-9;
+}
+
+/* Best time, in microseconds, of a forward + inverse pair with the split-radix fft. */
+static double
+time_split(int size) {
+    int i, r, reps = 5000000 / size + 1;
+    double start, elapsed, best = 1e9;
+    MYFLT **twiddle, *input, *data, *out;
+
+    twiddle = (MYFLT **)malloc(4 * sizeof(MYFLT *));
+    for (i=0; i<4; i++)
+        twiddle[i] = (MYFLT *)malloc(((size >> 3) + 1) * sizeof(MYFLT));
+    fft_compute_split_twiddle(twiddle, size);
+    input = (MYFLT *)malloc(size * sizeof(MYFLT));
+    data = (MYFLT *)malloc(size * sizeof(MYFLT));
+    out = (MYFLT *)malloc(size * sizeof(MYFLT));
+    for (i=0; i<size; i++)
+        input[i] = rand() / (MYFLT)RAND_MAX - 0.5;
+
+    for (r=0; r<RUNS; r++) {
+        start = now();
+        for (i=0; i<reps; i++) {
+            memcpy(data, input, size * sizeof(MYFLT));
+            realfft_split(data, out, size, twiddle);
+            irealfft_split(out, data, size, twiddle);
+        }
+        elapsed = (now() - start) / reps;
+        if (elapsed < best)
+            best = elapsed;
+    }
+
+    for (i=0; i<4; i++)
+        free(twiddle[i]);
+    free(twiddle);
+    free(input);
+    free(data);
+    free(out);
+    return best * 1e6;
+}
+
+/* Best time, in microseconds, of a forward + inverse pair with a plan. */
+static double
+time_plan(int size) {
+    int i, r, reps = 5000000 / size + 1;
+    double start, elapsed, best = 1e9;
+    MYFLT *input, *data, *out;
+    FFTPlan *plan = fft_plan_acquire(size, -1);
+
+    input = (MYFLT *)malloc(size * sizeof(MYFLT));
+    data = (MYFLT *)malloc(size * sizeof(MYFLT));
+    out = (MYFLT *)malloc(size * sizeof(MYFLT));
+    for (i=0; i<size; i++)
+        input[i] = rand() / (MYFLT)RAND_MAX - 0.5;
+
+    for (r=0; r<RUNS; r++) {
+        start = now();
+        for (i=0; i<reps; i++) {
+            memcpy(data, input, size * sizeof(MYFLT));
+            realfft_plan(data, out, plan);
+            irealfft_plan(out, data, plan);
+        }
+        elapsed = (now() - start) / reps;
+        if (elapsed < best)
+            best = elapsed;
+    }
+
+    fft_plan_release(plan);
+    free(input);
+    free(data);
+    free(out);
+    return best * 1e6;
+}
+
+int
+main(void) {
+    int i, size, pow2;
+    double split, plan;
+    static const int mixed[] = {480, 960, 1536, 1920, 3840, 6144, 7680, 15360, 30720, 61440};
+
+    printf("%s precision, microseconds per forward + inverse transform\n\n", sizeof(MYFLT) == sizeof(double) ? "double" : "single");
+    printf("%8s %12s %12s %8s\n", "size", "split", "plan", "speedup");
+    for (size=64; size<=65536; size*=2) {
+        split = time_split(size);
+        plan = time_plan(size);
+        printf("%8d %12.2f %12.2f %7.2fx\n", size, split, plan, split / plan);
+    }
+
+    printf("\n%8s %12s %12s %8s\n", "size", "split (pow2)", "plan", "speedup");
+    for (i=0; i<(int)(sizeof(mixed)/sizeof(int)); i++) {
+        size = mixed[i];
+        pow2 = 1;
+        while (pow2 < size)
+            pow2 *= 2;
+        split = time_split(pow2);
+        plan = time_plan(size);
+        printf("%8d %12.2f %12.2f %7.2fx\n", size, split, plan, split / plan);
+    }
+    return 0;
+}
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+Measures the time needed to add, reorder and remove many audio streams.
+
+A population of objects is created, then deleted in random order, while
+another population stays alive on the server. The reordering test moves
+streams in front of others, as the Server window does when the order of
+the streams is changed. Times are reported per stream.
+
+Usage: python benchmark_stream_churn.py [objects] [repeats]
+
+"""
+import sys, time, random, gc
+from pyo import *
+
+OBJECTS = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+REPEATS = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+s = Server(audio="offline", buffersize=256).boot()
+random.seed(1)
+gc.disable()
+
+# Streams living on the server during the whole benchmark.
+resident = [Sig(i) for i in range(OBJECTS)]
+
+def churn(n):
+    start = time.time()
+    objs = [Sig(i) for i in range(n)]
+    created = time.time() - start
+    random.shuffle(objs)
+    start = time.time()
+    while objs:
+        objs.pop()
+    removed = time.time() - start
+    return created, removed
+
+def reorder(n):
+    streams = [obj.getBaseObjects()[0]._getStream() for obj in resident]
+    server = resident[0].getBaseObjects()[0].getServer()
+    pairs = [(random.choice(streams), random.choice(streams)) for i in range(n)]
+    start = time.time()
+    for ref, cur in pairs:
+        if ref is not cur:
+            server.changeStreamPosition(ref, cur)
+    return time.time() - start
+
+print "%d objects, %d resident streams, best of %d" % (OBJECTS, s.getNumberOfStreams(), REPEATS)
+results = [churn(OBJECTS) for i in range(REPEATS)]
+created = min([r[0] for r in results])
+removed = min([r[1] for r in results])
+print "%-10s %8.2f ms  %6.2f us/stream" % ("create", created * 1000, created * 1000000 / OBJECTS)
+print "%-10s %8.2f ms  %6.2f us/stream" % ("remove", removed * 1000, removed * 1000000 / OBJECTS)
+elapsed = min([reorder(OBJECTS) for i in range(REPEATS)])
+print "%-10s %8.2f ms  %6.2f us/stream" % ("reorder", elapsed * 1000, elapsed * 1000000 / OBJECTS)
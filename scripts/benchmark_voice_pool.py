@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+Compares the cost of a polyphonic synth built with VoicePool to the
+same synth built on Notein, where every voice is always computed.
+
+A few notes are held during the whole rendering while the polyphony
+grows. With VoicePool, the rendering time should follow the number of
+sounding voices rather than the polyphony.
+
+Usage: python benchmark_voice_pool.py [held notes] [duration]
+
+"""
+import sys, time
+from pyo import *
+
+HELD = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+DUR = float(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+def synth(pitch, velocity):
+    env = MidiAdsr(velocity, attack=.005, decay=.1, sustain=.5, release=.2)
+    lfo = Sine(freq=5, mul=.01, add=1)
+    osc = SineLoop(freq=pitch * lfo, feedback=.05, mul=env)
+    return ButLP(osc, freq=3000), env
+
+def render(poly, pooled):
+    s = Server(audio="offline", buffersize=256).boot()
+    if pooled:
+        voices = VoicePool(synth, poly=poly, mul=.1).out()
+        notes = voices
+    else:
+        notes = Notein(poly=poly, scale=1)
+        voices = Mix(synth(notes['pitch'], notes['velocity'])[0], voices=1, mul=.1).out()
+        for i in range(HELD):
+            s.addMidiEvent(144, 48 + i * 3, 100)
+    if pooled:
+        for i in range(HELD):
+            notes.noteOn(48 + i * 3, 100)
+    s.recordOptions(dur=DUR, filename="benchmark_voice_pool.wav")
+    start = time.time()
+    s.start()
+    elapsed = time.time() - start
+    s.shutdown()
+    return elapsed
+
+print "%d held notes, %g seconds of sound" % (HELD, DUR)
+print "%6s %12s %12s" % ("poly", "Notein", "VoicePool")
+for poly in [8, 16, 32, 64]:
+    print "%6d %10.3f s %10.3f s" % (poly, render(poly, False), render(poly, True))
@@ -67,7 +67,8 @@ if sys.platform == "darwin":
 
 path = 'src/engine/'
 files = ['pyomodule.c', 'servermodule.c', 'pvstreammodule.c', 'streammodule.c', 'dummymodule.c', 
-        'mixmodule.c', 'inputfadermodule.c', 'interpolation.c', 'fft.c', "wind.c"]
+        'mixmodule.c', 'inputfadermodule.c', 'interpolation.c', 'fft.c', "wind.c",
+        'analysisbusmodule.c', 'oscsender.c', 'ringbuffer.c', 'sfstreamer.c', 'sfwriter.c', 'vectorops.c']
 source_files = [path + f for f in files]
 
 path = 'src/objects/'
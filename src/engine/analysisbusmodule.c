@@ -0,0 +1,355 @@
+/**************************************************************************
+ * Copyright 2009-2015 Olivier Belanger                                   *
+ *                                                                        *
+ * This file is part of pyo, a python module to help digital signal       *
+ * processing script creation.                                            *
+ *                                                                        *
+ * pyo is free software: you can redistribute it and/or modify            *
+ * it under the terms of the GNU Lesser General Public License as         *
+ * published by the Free Software Foundation, either version 3 of the     *
+ * License, or (at your option) any later version.                        *
+ *                                                                        *
+ * pyo is distributed in the hope that it will be useful,                 *
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of         *
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the          *
+ * GNU Lesser General Public License for more details.                    *
+ *                                                                        *
+ * You should have received a copy of the GNU Lesser General Public       *
+ * License along with pyo.  If not, see <http://www.gnu.org/licenses/>.   *
+ *                                                                        *
+ *************************************************************************/
+
+#include <Python.h>
+#include <string.h>
+#include "pyomodule.h"
+#include "analysisbusmodule.h"
+#ifndef _WIN32
+#include <unistd.h>
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#endif
+
+static size_t
+AnalysisBus_memorySize(int channels, int frames, int framesize)
+{
+    return ANALYSISBUS_HEADER + channels * sizeof(unsigned PY_LONG_LONG) + (size_t)channels * frames * framesize * sizeof(float);
+}
+
+static void
+AnalysisBus_setMemory(AnalysisBus *self, char *memory, size_t memsize)
+{
+    AnalysisBusHeader *header = (AnalysisBusHeader *)memory;
+
+    self->memory = memory;
+    self->memsize = memsize;
+    self->channels = header->channels;
+    self->frames = header->frames;
+    self->framesize = header->framesize;
+    self->sequences = (volatile unsigned PY_LONG_LONG *)(memory + ANALYSISBUS_HEADER);
+    self->data = (float *)(memory + ANALYSISBUS_HEADER + self->channels * sizeof(unsigned PY_LONG_LONG));
+}
+
+static void
+AnalysisBus_initHeader(char *memory, int channels, int frames, int framesize)
+{
+    AnalysisBusHeader *header = (AnalysisBusHeader *)memory;
+
+    memcpy(header->magic, ANALYSISBUS_MAGIC, 8);
+    header->channels = channels;
+    header->frames = frames;
+    header->framesize = framesize;
+}
+
+/* Maps the file `path`. If framesize is 0, the file must already be a bus, created by
+ * another process, otherwise it is (re)created. Returns 0 on success. */
+static int
+AnalysisBus_map(AnalysisBus *self, const char *path, int channels, int frames, int framesize)
+{
+#ifndef _WIN32
+    int fd;
+    char *memory;
+    size_t memsize;
+    struct stat st;
+    AnalysisBusHeader header;
+
+    if (framesize > 0) {
+        fd = open(path, O_RDWR | O_CREAT | O_TRUNC, 0644);
+        if (fd < 0) {
+            PyErr_Format(PyExc_IOError, "AnalysisBus can't create the file %s.", path);
+            return -1;
+        }
+        memsize = AnalysisBus_memorySize(channels, frames, framesize);
+        if (ftruncate(fd, (off_t)memsize) != 0) {
+            close(fd);
+            PyErr_Format(PyExc_IOError, "AnalysisBus can't resize the file %s.", path);
+            return -1;
+        }
+    }
+    else {
+        fd = open(path, O_RDWR);
+        if (fd < 0) {
+            PyErr_Format(PyExc_IOError, "AnalysisBus can't open the file %s.", path);
+            return -1;
+        }
+        if (fstat(fd, &st) != 0 || st.st_size < ANALYSISBUS_HEADER ||
+            read(fd, &header, sizeof(header)) != sizeof(header) || memcmp(header.magic, ANALYSISBUS_MAGIC, 8) != 0 ||
+            header.channels < 1 || header.frames < 1 || header.framesize < 1 ||
+            (size_t)st.st_size < AnalysisBus_memorySize(header.channels, header.frames, header.framesize)) {
+            close(fd);
+            PyErr_Format(PyExc_ValueError, "%s is not an analysis bus.", path);
+            return -1;
+        }
+        memsize = AnalysisBus_memorySize(header.channels, header.frames, header.framesize);
+    }
+
+    memory = (char *)mmap(NULL, memsize, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+    close(fd);
+    if (memory == MAP_FAILED) {
+        PyErr_Format(PyExc_IOError, "AnalysisBus can't map the file %s.", path);
+        return -1;
+    }
+    if (framesize > 0)
+        AnalysisBus_initHeader(memory, channels, frames, framesize);
+    AnalysisBus_setMemory(self, memory, memsize);
+    self->mapped = 1;
+    return 0;
+#else
+    PyErr_SetString(PyExc_NotImplementedError, "Shared analysis buses are not available on Windows.");
+    return -1;
+#endif
+}
+
+/* Audio thread. Writes a frame in the channel `chnl`. The frame is truncated, or completed
+ * with zeros, to the frame size of the bus. Only one thread must write in a channel. */
+void
+AnalysisBus_write(AnalysisBus *self, int chnl, MYFLT *values, int count)
+{
+    int i;
+    unsigned PY_LONG_LONG sequence;
+    float *frame;
+
+    if (chnl < 0 || chnl >= self->channels)
+        return;
+
+    sequence = self->sequences[chnl];
+    frame = self->data + ((size_t)chnl * self->frames + (size_t)(sequence % self->frames)) * self->framesize;
+    if (count > self->framesize)
+        count = self->framesize;
+    for (i=0; i<count; i++)
+        frame[i] = (float)values[i];
+    for (i=count; i<self->framesize; i++)
+        frame[i] = 0.0;
+    /* The frame must be complete before the readers see the new sequence number. */
+    __sync_synchronize();
+    self->sequences[chnl] = sequence + 1;
+}
+
+/* Body of the setBus(bus, chnl=0) method of the analyzers. `bus` and `buschnl` are the
+ * fields of the analyzer, None as bus detaches it. */
+PyObject *
+AnalysisBus_setTarget(AnalysisBus **bus, int *buschnl, PyObject *args)
+{
+    int chnl = 0;
+    PyObject *bustmp, *old;
+
+    if (! PyArg_ParseTuple(args, "O|i", &bustmp, &chnl))
+        return NULL;
+
+    if (bustmp != Py_None && ! PyObject_TypeCheck(bustmp, &AnalysisBusType)) {
+        PyErr_SetString(PyExc_TypeError, "The bus must be an AnalysisBus or None.");
+        return NULL;
+    }
+
+    old = (PyObject *)*bus;
+    if (bustmp == Py_None)
+        *bus = NULL;
+    else {
+        Py_INCREF(bustmp);
+        *buschnl = chnl;
+        *bus = (AnalysisBus *)bustmp;
+    }
+    Py_XDECREF(old);
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static void
+AnalysisBus_dealloc(AnalysisBus* self)
+{
+#ifndef _WIN32
+    if (self->mapped)
+        munmap(self->memory, self->memsize);
+    else
+#endif
+        free(self->memory);
+    self->ob_type->tp_free((PyObject*)self);
+}
+
+static PyObject *
+AnalysisBus_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    int framesize = 0, frames = 16, channels = 1;
+    char *path = NULL;
+    char *memory;
+    size_t memsize;
+    AnalysisBus *self;
+
+    static char *kwlist[] = {"framesize", "frames", "channels", "path", NULL};
+
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, "|iiiz", kwlist, &framesize, &frames, &channels, &path))
+        return NULL;
+
+    if (framesize < 0 || frames < 1 || channels < 1 || (framesize == 0 && (path == NULL || path[0] == '\0'))) {
+        PyErr_SetString(PyExc_ValueError, "AnalysisBus needs a positive framesize, frames and channels.");
+        return NULL;
+    }
+
+    self = (AnalysisBus *)type->tp_alloc(type, 0);
+    if (self == NULL)
+        return NULL;
+    self->memory = NULL;
+    self->mapped = 0;
+
+    if (path != NULL && path[0] != '\0') {
+        if (AnalysisBus_map(self, path, channels, frames, framesize) != 0) {
+            Py_DECREF(self);
+            return NULL;
+        }
+    }
+    else {
+        memsize = AnalysisBus_memorySize(channels, frames, framesize);
+        memory = (char *)calloc(memsize, 1);
+        if (memory == NULL) {
+            Py_DECREF(self);
+            return PyErr_NoMemory();
+        }
+        AnalysisBus_initHeader(memory, channels, frames, framesize);
+        AnalysisBus_setMemory(self, memory, memsize);
+    }
+
+    return (PyObject *)self;
+}
+
+static PyObject *
+AnalysisBus_getSequence(AnalysisBus *self, PyObject *args)
+{
+    int chnl = 0;
+
+    if (! PyArg_ParseTuple(args, "|i", &chnl))
+        return NULL;
+
+    if (chnl < 0 || chnl >= self->channels) {
+        PyErr_SetString(PyExc_IndexError, "AnalysisBus channel out of range.");
+        return NULL;
+    }
+    return PyLong_FromUnsignedLongLong(self->sequences[chnl]);
+}
+
+static PyObject * AnalysisBus_getChannels(AnalysisBus *self) { return PyInt_FromLong(self->channels); }
+static PyObject * AnalysisBus_getFrames(AnalysisBus *self) { return PyInt_FromLong(self->frames); }
+static PyObject * AnalysisBus_getFrameSize(AnalysisBus *self) { return PyInt_FromLong(self->framesize); }
+
+static Py_ssize_t
+AnalysisBus_getReadBuffer(AnalysisBus *self, Py_ssize_t index, const void **ptr)
+{
+    if (index != 0) {
+        PyErr_SetString(PyExc_SystemError, "AnalysisBus has only one buffer segment.");
+        return -1;
+    }
+    *ptr = (void *)self->data;
+    return (Py_ssize_t)self->channels * self->frames * self->framesize * sizeof(float);
+}
+
+static Py_ssize_t
+AnalysisBus_getSegCount(AnalysisBus *self, Py_ssize_t *lenp)
+{
+    if (lenp)
+        *lenp = (Py_ssize_t)self->channels * self->frames * self->framesize * sizeof(float);
+    return 1;
+}
+
+static int
+AnalysisBus_getBuffer(AnalysisBus *self, Py_buffer *view, int flags)
+{
+    if (PyBuffer_FillInfo(view, (PyObject *)self, (void *)self->data,
+                          (Py_ssize_t)self->channels * self->frames * self->framesize * sizeof(float), 0, flags) < 0)
+        return -1;
+    view->itemsize = sizeof(float);
+    if ((flags & PyBUF_FORMAT) == PyBUF_FORMAT)
+        view->format = "f";
+    if ((flags & PyBUF_ND) == PyBUF_ND) {
+        view->ndim = 3;
+        self->view_shape[0] = self->channels;
+        self->view_shape[1] = self->frames;
+        self->view_shape[2] = self->framesize;
+        view->shape = self->view_shape;
+    }
+    if ((flags & PyBUF_STRIDES) == PyBUF_STRIDES) {
+        self->view_strides[0] = self->frames * self->framesize * sizeof(float);
+        self->view_strides[1] = self->framesize * sizeof(float);
+        self->view_strides[2] = sizeof(float);
+        view->strides = self->view_strides;
+    }
+    return 0;
+}
+
+static PyBufferProcs AnalysisBus_as_buffer = {
+(readbufferproc)AnalysisBus_getReadBuffer, /*bf_getreadbuffer*/
+(writebufferproc)AnalysisBus_getReadBuffer, /*bf_getwritebuffer*/
+(segcountproc)AnalysisBus_getSegCount, /*bf_getsegcount*/
+0, /*bf_getcharbuffer*/
+(getbufferproc)AnalysisBus_getBuffer, /*bf_getbuffer*/
+0, /*bf_releasebuffer*/
+};
+
+static PyMethodDef AnalysisBus_methods[] = {
+{"getSequence", (PyCFunction)AnalysisBus_getSequence, METH_VARARGS, "Returns the number of frames written in a channel."},
+{"getChannels", (PyCFunction)AnalysisBus_getChannels, METH_NOARGS, "Returns the number of channels."},
+{"getFrames", (PyCFunction)AnalysisBus_getFrames, METH_NOARGS, "Returns the number of frames in the ring of each channel."},
+{"getFrameSize", (PyCFunction)AnalysisBus_getFrameSize, METH_NOARGS, "Returns the number of values in a frame."},
+{NULL}  /* Sentinel */
+};
+
+PyTypeObject AnalysisBusType = {
+PyObject_HEAD_INIT(NULL)
+0, /*ob_size*/
+"_pyo.AnalysisBus_base", /*tp_name*/
+sizeof(AnalysisBus), /*tp_basicsize*/
+0, /*tp_itemsize*/
+(destructor)AnalysisBus_dealloc, /*tp_dealloc*/
+0, /*tp_print*/
+0, /*tp_getattr*/
+0, /*tp_setattr*/
+0, /*tp_compare*/
+0, /*tp_repr*/
+0, /*tp_as_number*/
+0, /*tp_as_sequence*/
+0, /*tp_as_mapping*/
+0, /*tp_hash */
+0, /*tp_call*/
+0, /*tp_str*/
+0, /*tp_getattro*/
+0, /*tp_setattro*/
+&AnalysisBus_as_buffer, /*tp_as_buffer*/
+Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
+"Analysis bus, rings of frames written by the analyzers.", /* tp_doc */
+0, /* tp_traverse */
+0, /* tp_clear */
+0, /* tp_richcompare */
+0, /* tp_weaklistoffset */
+0, /* tp_iter */
+0, /* tp_iternext */
+AnalysisBus_methods, /* tp_methods */
+0, /* tp_members */
+0, /* tp_getset */
+0, /* tp_base */
+0, /* tp_dict */
+0, /* tp_descr_get */
+0, /* tp_descr_set */
+0, /* tp_dictoffset */
+0, /* tp_init */
+0, /* tp_alloc */
+AnalysisBus_new, /* tp_new */
+};
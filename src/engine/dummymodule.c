@@ -113,7 +113,6 @@ Dummy_dealloc(Dummy* self)
 PyObject *
 Dummy_initialize(Dummy *self)
 {
-    int i;
 	self->modebuffer[0] = 0;
 	self->modebuffer[1] = 0;
 
@@ -121,7 +120,7 @@ Dummy_initialize(Dummy *self)
     Stream_setFunctionPtr(self->stream, Dummy_compute_next_data_frame);
     self->mode_func_ptr = Dummy_setProcMode;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     Stream_setStreamActive(self->stream, 1);
 
@@ -374,7 +373,6 @@ TriggerDummy_dealloc(TriggerDummy* self)
 static PyObject *
 TriggerDummy_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp;
     TriggerDummy *self;
     self = (TriggerDummy *)type->tp_alloc(type, 0);
@@ -393,7 +391,7 @@ TriggerDummy_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_INPUT_TRIGGER_STREAM
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -37,7 +37,10 @@
 **  Original file can be found on musicdsp.org :
 **  http://www.musicdsp.org/archive.php?classid=2#79
 ****************************************************** */
+#include <stdlib.h>
+#include <pthread.h>
 #include "fft.h"
+#include "wind.h"
 #include "pyomodule.h"
 #include <math.h>
 
@@ -581,3 +584,319 @@ void irealfft_packed(MYFLT *data, MYFLT *outdata, int size, MYFLT *twiddle) {
 	for (i=0; i<size; i++)
 	    outdata[i] = data[i] * 2;
 }
+
+/* *****************************************************
+** Mixed-radix real fft
+**
+** Real fft of any even size whose half has no prime
+** factors other than 2, 3 and 5 (ie. 480, 960, 1536
+** and the powers of two). The plans use it for all
+** sizes, it is faster than the split-radix fft for
+** the powers of two too.
+** The input is packed as a complex sequence of half
+** the size, transformed by a Stockham autosort fft
+** made of radix-4, 2, 3 and 5 stages, and unpacked to
+** the split-radix layout (see realfft_split). The
+** stages ping-pong between the two buffers given by
+** the caller, their inner loops run over contiguous
+** complex values so the compiler can vectorize them.
+******************************************************* */
+static int fft_factorize(int size, int *radix) {
+
+    int i, m, stages = 0;
+    static const int radices[4] = {4, 2, 3, 5};
+
+    if (size < 4 || size % 2 != 0)
+        return -1;
+    m = size / 2;
+    for (i=0; i<4; i++) {
+        while (m % radices[i] == 0) {
+            if (stages == FFT_MAX_STAGES)
+                return -1;
+            radix[stages++] = radices[i];
+            m /= radices[i];
+        }
+    }
+    return m == 1 ? stages : -1;
+}
+
+int fft_size_is_valid(int size) {
+    int radix[FFT_MAX_STAGES];
+    return fft_factorize(size, radix) >= 0;
+}
+
+/* One stage of a forward complex fft of length `len` made of `len / radix` groups
+   of `stride` butterflies. The last stage (len == radix) can be computed in place. */
+static void fft_stage(MYFLT *x, MYFLT *y, int len, int stride, int radix, MYFLT *factors) {
+
+    int p, q, m, r;
+    MYFLT *a0, *a1, *a2, *a3, *a4, *y0, *y1, *y2, *y3, *y4, *w;
+    MYFLT t0r, t0i, t1r, t1i, t2r, t2i, t3r, t3i, t4r, t4i, b1r, b1i, b2r, b2i, d1r, d1i, d2r, d2i;
+    static const MYFLT s3 = 0.86602540378443865; /* sin(2pi/3) */
+    static const MYFLT c51 = 0.30901699437494742, c52 = -0.80901699437494742; /* cos(2pi/5), cos(4pi/5) */
+    static const MYFLT s51 = 0.95105651629515357, s52 = 0.58778525229247313; /* sin(2pi/5), sin(4pi/5) */
+
+    m = len / radix;
+    r = m * stride * 2;
+    for (p=0; p<m; p++) {
+        w = factors + p * (radix - 1) * 2;
+        a0 = x + p * stride * 2;
+        y0 = y + p * radix * stride * 2;
+        switch (radix) {
+            case 2:
+                a1 = a0 + r;
+                y1 = y0 + stride * 2;
+                for (q=0; q<stride*2; q+=2) {
+                    t0r = a0[q] + a1[q]; t0i = a0[q+1] + a1[q+1];
+                    t1r = a0[q] - a1[q]; t1i = a0[q+1] - a1[q+1];
+                    y0[q] = t0r; y0[q+1] = t0i;
+                    y1[q] = t1r * w[0] - t1i * w[1]; y1[q+1] = t1r * w[1] + t1i * w[0];
+                }
+                break;
+            case 3:
+                a1 = a0 + r; a2 = a1 + r;
+                y1 = y0 + stride * 2; y2 = y1 + stride * 2;
+                for (q=0; q<stride*2; q+=2) {
+                    t1r = a1[q] + a2[q]; t1i = a1[q+1] + a2[q+1];
+                    d1r = (a1[q] - a2[q]) * s3; d1i = (a1[q+1] - a2[q+1]) * s3;
+                    t0r = a0[q] + t1r; t0i = a0[q+1] + t1i;
+                    b1r = a0[q] - 0.5 * t1r; b1i = a0[q+1] - 0.5 * t1i;
+                    t1r = b1r + d1i; t1i = b1i - d1r;
+                    t2r = b1r - d1i; t2i = b1i + d1r;
+                    y0[q] = t0r; y0[q+1] = t0i;
+                    y1[q] = t1r * w[0] - t1i * w[1]; y1[q+1] = t1r * w[1] + t1i * w[0];
+                    y2[q] = t2r * w[2] - t2i * w[3]; y2[q+1] = t2r * w[3] + t2i * w[2];
+                }
+                break;
+            case 4:
+                a1 = a0 + r; a2 = a1 + r; a3 = a2 + r;
+                y1 = y0 + stride * 2; y2 = y1 + stride * 2; y3 = y2 + stride * 2;
+                for (q=0; q<stride*2; q+=2) {
+                    t0r = a0[q] + a2[q]; t0i = a0[q+1] + a2[q+1];
+                    t1r = a0[q] - a2[q]; t1i = a0[q+1] - a2[q+1];
+                    t2r = a1[q] + a3[q]; t2i = a1[q+1] + a3[q+1];
+                    t3r = a1[q] - a3[q]; t3i = a1[q+1] - a3[q+1];
+                    b1r = t1r + t3i; b1i = t1i - t3r;
+                    b2r = t0r - t2r; b2i = t0i - t2i;
+                    d1r = t1r - t3i; d1i = t1i + t3r;
+                    y0[q] = t0r + t2r; y0[q+1] = t0i + t2i;
+                    y1[q] = b1r * w[0] - b1i * w[1]; y1[q+1] = b1r * w[1] + b1i * w[0];
+                    y2[q] = b2r * w[2] - b2i * w[3]; y2[q+1] = b2r * w[3] + b2i * w[2];
+                    y3[q] = d1r * w[4] - d1i * w[5]; y3[q+1] = d1r * w[5] + d1i * w[4];
+                }
+                break;
+            case 5:
+                a1 = a0 + r; a2 = a1 + r; a3 = a2 + r; a4 = a3 + r;
+                y1 = y0 + stride * 2; y2 = y1 + stride * 2; y3 = y2 + stride * 2; y4 = y3 + stride * 2;
+                for (q=0; q<stride*2; q+=2) {
+                    t1r = a1[q] + a4[q]; t1i = a1[q+1] + a4[q+1];
+                    t2r = a2[q] + a3[q]; t2i = a2[q+1] + a3[q+1];
+                    t3r = a1[q] - a4[q]; t3i = a1[q+1] - a4[q+1];
+                    t4r = a2[q] - a3[q]; t4i = a2[q+1] - a3[q+1];
+                    t0r = a0[q] + t1r + t2r; t0i = a0[q+1] + t1i + t2i;
+                    b1r = a0[q] + c51 * t1r + c52 * t2r; b1i = a0[q+1] + c51 * t1i + c52 * t2i;
+                    b2r = a0[q] + c52 * t1r + c51 * t2r; b2i = a0[q+1] + c52 * t1i + c51 * t2i;
+                    d1r = s51 * t3r + s52 * t4r; d1i = s51 * t3i + s52 * t4i;
+                    d2r = s52 * t3r - s51 * t4r; d2i = s52 * t3i - s51 * t4i;
+                    y0[q] = t0r; y0[q+1] = t0i;
+                    t1r = b1r + d1i; t1i = b1i - d1r;
+                    t4r = b1r - d1i; t4i = b1i + d1r;
+                    t2r = b2r + d2i; t2i = b2i - d2r;
+                    t3r = b2r - d2i; t3i = b2i + d2r;
+                    y1[q] = t1r * w[0] - t1i * w[1]; y1[q+1] = t1r * w[1] + t1i * w[0];
+                    y2[q] = t2r * w[2] - t2i * w[3]; y2[q+1] = t2r * w[3] + t2i * w[2];
+                    y3[q] = t3r * w[4] - t3i * w[5]; y3[q+1] = t3r * w[5] + t3i * w[4];
+                    y4[q] = t4r * w[6] - t4i * w[7]; y4[q+1] = t4r * w[7] + t4i * w[6];
+                }
+                break;
+        }
+    }
+}
+
+/* Complex fft of half the size of the plan, from `data` to `target`, using `other` as scratch buffer. */
+static MYFLT * fft_mixed_complex(FFTPlan *plan, MYFLT *data, MYFLT *other, MYFLT *target) {
+
+    int i, len, stride = 1;
+    MYFLT *tmp, *factors = plan->factors;
+
+    len = plan->size / 2;
+    for (i=0; i<plan->stages; i++) {
+        if (i == plan->stages - 1)
+            other = target;
+        fft_stage(data, other, len, stride, plan->radix[i], factors);
+        factors += (len / plan->radix[i]) * (plan->radix[i] - 1) * 2;
+        len /= plan->radix[i];
+        stride *= plan->radix[i];
+        tmp = data; data = other; other = tmp;
+    }
+    return data;
+}
+
+static void realfft_mixed(MYFLT *data, MYFLT *outdata, FFTPlan *plan) {
+
+    int k, n = plan->size, m = plan->size / 2;
+    MYFLT ar, ai, br, bi, er, ei, orr, oi, c, s, scl = 1.0 / n;
+    MYFLT *z, *w;
+
+    z = fft_mixed_complex(plan, data, outdata, data);
+    w = plan->rfactors;
+    outdata[0] = (z[0] + z[1]) * scl;
+    outdata[m] = (z[0] - z[1]) * scl;
+    for (k=1; k<=m/2; k++) {
+        ar = z[k*2]; ai = z[k*2+1];
+        br = z[(m-k)*2]; bi = -z[(m-k)*2+1];
+        er = (ar + br) * 0.5; ei = (ai + bi) * 0.5;
+        orr = (ar - br) * 0.5; oi = (ai - bi) * 0.5;
+        c = w[k*2]; s = w[k*2+1];
+        outdata[k] = (er - s * orr + c * oi) * scl;
+        outdata[n-k] = (ei - c * orr - s * oi) * scl;
+        if (k != m - k) {
+            outdata[m-k] = (er + s * orr - c * oi) * scl;
+            outdata[m+k] = (-ei - c * orr - s * oi) * scl;
+        }
+    }
+}
+
+static void irealfft_mixed(MYFLT *data, MYFLT *outdata, FFTPlan *plan) {
+
+    int k, n = plan->size, m = plan->size / 2;
+    MYFLT ar, ai, br, bi, pr, pi, qr, qi, c, s;
+    MYFLT *z, *w;
+
+    /* outdata receives the conjugate of the packed spectrum, the forward
+       transform of the conjugate is the conjugate of the inverse transform. */
+    w = plan->rfactors;
+    outdata[0] = data[0] + data[m];
+    outdata[1] = -(data[0] - data[m]);
+    for (k=1; k<=m/2; k++) {
+        ar = data[k]; ai = data[n-k];
+        br = data[m-k]; bi = -data[m+k];
+        pr = ar + br; pi = ai + bi;
+        qr = ar - br; qi = ai - bi;
+        c = w[k*2]; s = w[k*2+1];
+        outdata[k*2] = pr - s * qr - c * qi;
+        outdata[k*2+1] = -(pi + c * qr - s * qi);
+        if (k != m - k) {
+            outdata[(m-k)*2] = pr + s * qr + c * qi;
+            outdata[(m-k)*2+1] = -(-pi + c * qr - s * qi);
+        }
+    }
+    z = fft_mixed_complex(plan, outdata, data, outdata);
+    for (k=1; k<n; k+=2)
+        z[k] = -z[k];
+}
+
+/* *****************************************************
+** Shared fft plans
+**
+** The twiddle factors of a given size, and the
+** analysis window of a given window type, are computed
+** once and shared by all the objects using them. The
+** same plan serves the forward and inverse transforms,
+** and each precision has its own registry since _pyo
+** and _pyo64 are separate modules. A plan is freed
+** when its last user releases it. The registry is
+** locked since the plans are also acquired and
+** released from the audio and worker threads (ie.
+** when PVSynth follows the size of its input).
+******************************************************* */
+static FFTPlan *fft_plans = NULL;
+static pthread_mutex_t fft_plans_mutex = PTHREAD_MUTEX_INITIALIZER;
+
+FFTPlan * fft_plan_acquire(int size, int wintype) {
+
+    int i, j, t, len, count, stages, radix[FFT_MAX_STAGES];
+    MYFLT *factors;
+    FFTPlan *plan;
+
+    stages = fft_factorize(size, radix);
+    if (stages < 0)
+        return NULL;
+
+    pthread_mutex_lock(&fft_plans_mutex);
+    for (plan=fft_plans; plan!=NULL; plan=plan->next) {
+        if (plan->size == size && plan->wintype == wintype) {
+            plan->refcount++;
+            pthread_mutex_unlock(&fft_plans_mutex);
+            return plan;
+        }
+    }
+
+    plan = (FFTPlan *)malloc(sizeof(FFTPlan));
+    plan->size = size;
+    plan->wintype = wintype;
+    plan->refcount = 1;
+    plan->stages = stages;
+    count = 0;
+    len = size / 2;
+    for (i=0; i<stages; i++) {
+        plan->radix[i] = radix[i];
+        count += (len / radix[i]) * (radix[i] - 1);
+        len /= radix[i];
+    }
+    plan->factors = (MYFLT *)malloc((count + size / 4 + 1) * 2 * sizeof(MYFLT));
+    factors = plan->factors;
+    len = size / 2;
+    for (i=0; i<stages; i++) {
+        for (j=0; j<len/radix[i]; j++) {
+            for (t=1; t<radix[i]; t++) {
+                *factors++ = (MYFLT)cos(TWOPI * j * t / len);
+                *factors++ = (MYFLT)-sin(TWOPI * j * t / len);
+            }
+        }
+        len /= radix[i];
+    }
+    plan->rfactors = factors;
+    for (j=0; j<=size/4; j++) {
+        *factors++ = (MYFLT)cos(TWOPI * j / size);
+        *factors++ = (MYFLT)sin(TWOPI * j / size);
+    }
+
+    if (wintype >= 0) {
+        plan->window = (MYFLT *)malloc(size * sizeof(MYFLT));
+        gen_window(plan->window, size, wintype);
+    }
+    else
+        plan->window = NULL;
+
+    plan->next = fft_plans;
+    fft_plans = plan;
+    pthread_mutex_unlock(&fft_plans_mutex);
+    return plan;
+}
+
+void fft_plan_release(FFTPlan *plan) {
+
+    FFTPlan **link;
+
+    if (plan == NULL)
+        return;
+
+    pthread_mutex_lock(&fft_plans_mutex);
+    if (--plan->refcount > 0) {
+        pthread_mutex_unlock(&fft_plans_mutex);
+        return;
+    }
+    for (link=&fft_plans; *link!=NULL; link=&(*link)->next) {
+        if (*link == plan) {
+            *link = plan->next;
+            break;
+        }
+    }
+    pthread_mutex_unlock(&fft_plans_mutex);
+    free(plan->factors);
+    free(plan->window);
+    free(plan);
+}
+
+/* Forward real fft with a plan, same layout and scaling as realfft_split.
+   `data` is used as work buffer and must not be `outdata`. */
+void realfft_plan(MYFLT *data, MYFLT *outdata, FFTPlan *plan) {
+    realfft_mixed(data, outdata, plan);
+}
+
+/* Inverse real fft with a plan, same layout and scaling as irealfft_split.
+   `data` is used as work buffer and must not be `outdata`. */
+void irealfft_plan(MYFLT *data, MYFLT *outdata, FFTPlan *plan) {
+    irealfft_mixed(data, outdata, plan);
+}
@@ -146,7 +146,6 @@ InputFader_dealloc(InputFader* self)
 static PyObject *
 InputFader_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp=NULL, *streamtmp;
     InputFader *self;
     self = (InputFader *)type->tp_alloc(type, 0);
@@ -180,7 +179,7 @@ InputFader_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_XDECREF(self->input1_stream);
     self->input1_stream = (Stream *)streamtmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     return (PyObject *)self;
 }
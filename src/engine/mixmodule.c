@@ -133,7 +133,6 @@ Mix_dealloc(Mix* self)
 static PyObject *
 Mix_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp=NULL, *multmp=NULL, *addtmp=NULL;
     Mix *self;
     self = (Mix *)type->tp_alloc(type, 0);
@@ -162,7 +161,7 @@ Mix_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
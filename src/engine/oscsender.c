@@ -0,0 +1,391 @@
+/**************************************************************************
+ * Copyright 2009-2015 Olivier Belanger                                   *
+ *                                                                        *
+ * This file is part of pyo, a python module to help digital signal       *
+ * processing script creation.                                            *
+ *                                                                        *
+ * pyo is free software: you can redistribute it and/or modify            *
+ * it under the terms of the GNU Lesser General Public License as         *
+ * published by the Free Software Foundation, either version 3 of the     *
+ * License, or (at your option) any later version.                        *
+ *                                                                        *
+ * pyo is distributed in the hope that it will be useful,                 *
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of         *
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the          *
+ * GNU Lesser General Public License for more details.                    *
+ *                                                                        *
+ * You should have received a copy of the GNU Lesser General Public       *
+ * License along with pyo.  If not, see <http://www.gnu.org/licenses/>.   *
+ *                                                                        *
+ * Open Sound Control output. The audio thread only stores the values of  *
+ * its senders, a single background thread collects them and sends, for   *
+ * each destination, all the messages ready in one OSC bundle, so the     *
+ * audio callback never waits on the network.                             *
+ *                                                                        *
+ * A value sender keeps only its last value and a counter of the values   *
+ * pushed, the values pushed between two passes of the sending thread are *
+ * coalesced. The destinations, the senders and the messages collected in *
+ * a pass are only touched with the list mutex held.                      *
+ *************************************************************************/
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <pthread.h>
+#include <sys/time.h>
+#include "oscsender.h"
+
+/* Maximum number of messages in a bundle, a larger bundle may not fit in a UDP packet. */
+#define OSCSENDER_BUNDLE 64
+
+/* Longest sleep of the sending thread when no sender signals new values. */
+#define OSCSENDER_PERIOD 0.01
+
+static pthread_mutex_t sender_mutex = PTHREAD_MUTEX_INITIALIZER;
+static pthread_cond_t sender_cond = PTHREAD_COND_INITIALIZER;
+static OscSender *sender_list = NULL;
+static OscDestination *dest_list = NULL;
+static int sender_running = 0;
+static volatile int sender_signaled = 0;
+
+/* Messages added to the bundles of the current pass, freed once everything is sent. */
+static lo_message *collected = NULL;
+static int collected_count = 0;
+static int collected_size = 0;
+
+static double
+OscSender_time()
+{
+    struct timeval now;
+    gettimeofday(&now, NULL);
+    return now.tv_sec + now.tv_usec * 0.000001;
+}
+
+static void OscSender_send(OscDestination *dest);
+
+static void
+OscSender_collect(OscSender *self, lo_message msg)
+{
+    OscDestination *dest = self->dest;
+
+    if (dest->pending == OSCSENDER_BUNDLE)
+        OscSender_send(dest);
+
+    if (collected_count == collected_size) {
+        collected_size = collected_size ? collected_size * 2 : 64;
+        collected = (lo_message *)realloc(collected, collected_size * sizeof(lo_message));
+    }
+    collected[collected_count++] = msg;
+
+    /* A lone message is sent as is, the bundle is only built for the second one. */
+    if (dest->pending == 0) {
+        dest->first = msg;
+        dest->first_path = self->path;
+    }
+    else {
+        if (dest->pending == 1) {
+            dest->bundle = lo_bundle_new(LO_TT_IMMEDIATE);
+            lo_bundle_add_message(dest->bundle, dest->first_path, dest->first);
+        }
+        lo_bundle_add_message(dest->bundle, self->path, msg);
+    }
+    dest->pending++;
+    self->sent++;
+}
+
+/* Collects what the sender has to send. Returns the time, in seconds, before the sender
+ * can send again if it is rate limited with something waiting, otherwise a negative value. */
+static double
+OscSender_process(OscSender *self, double now)
+{
+    unsigned long pushed;
+    float value;
+    lo_message msg;
+
+    if (self->messages != NULL) {
+        if (RingBuffer_readAvailable(self->messages) == 0)
+            return -1.0;
+    }
+    else if (self->pushed == self->seen)
+        return -1.0;
+
+    if (self->interval > 0.0 && self->hassent && (now - self->lasttime) < self->interval)
+        return self->lasttime + self->interval - now;
+
+    if (self->messages != NULL) {
+        /* Without rate limit, the whole queue goes in the bundle. */
+        while (RingBuffer_read(self->messages, &msg, 1) == 1) {
+            OscSender_collect(self, msg);
+            if (self->interval > 0.0)
+                break;
+        }
+    }
+    else {
+        pushed = self->pushed;
+        __sync_synchronize();
+        value = self->value;
+        self->coalesced += pushed - self->seen - 1;
+        self->seen = pushed;
+        if (self->changes && self->hassent && value == self->lastvalue) {
+            self->filtered++;
+            return -1.0;
+        }
+        msg = lo_message_new();
+        lo_message_add_float(msg, value);
+        OscSender_collect(self, msg);
+        self->lastvalue = value;
+    }
+    self->hassent = 1;
+    self->lasttime = now;
+    return -1.0;
+}
+
+static void
+OscSender_send(OscDestination *dest)
+{
+    int err;
+
+    if (dest->pending == 0)
+        return;
+    else if (dest->pending == 1)
+        err = lo_send_message(dest->address, dest->first_path, dest->first);
+    else {
+        err = lo_send_bundle(dest->address, dest->bundle);
+        lo_bundle_free(dest->bundle);
+        dest->bundle = NULL;
+    }
+    if (err == -1)
+        printf("OSC error %d: %s\n", lo_address_errno(dest->address), lo_address_errstr(dest->address));
+    dest->pending = 0;
+}
+
+static void *
+OscSender_thread(void *arg)
+{
+    int i;
+    double now, wait, delay;
+    OscSender *sender;
+    OscDestination *dest;
+    struct timespec timeout;
+
+    pthread_mutex_lock(&sender_mutex);
+    while (sender_list != NULL) {
+        sender_signaled = 0;
+        now = OscSender_time();
+        wait = OSCSENDER_PERIOD;
+        for (sender=sender_list; sender!=NULL; sender=sender->next) {
+            delay = OscSender_process(sender, now);
+            if (delay >= 0.0 && delay < wait)
+                wait = delay;
+        }
+        for (dest=dest_list; dest!=NULL; dest=dest->next) {
+            OscSender_send(dest);
+        }
+        for (i=0; i<collected_count; i++) {
+            lo_message_free(collected[i]);
+        }
+        collected_count = 0;
+
+        /* New values pushed during the pass are processed right away. */
+        if (sender_signaled == 0) {
+            now += wait;
+            timeout.tv_sec = (time_t)now;
+            timeout.tv_nsec = (long)((now - timeout.tv_sec) * 1000000000.0);
+            pthread_cond_timedwait(&sender_cond, &sender_mutex, &timeout);
+        }
+    }
+    free(collected);
+    collected = NULL;
+    collected_size = 0;
+    sender_running = 0;
+    pthread_mutex_unlock(&sender_mutex);
+    return NULL;
+}
+
+/* Offline rendering. Sends now, in the calling thread, what the sender has waiting. */
+static void
+OscSender_flush(OscSender *self)
+{
+    int i;
+
+    pthread_mutex_lock(&sender_mutex);
+    OscSender_process(self, OscSender_time());
+    OscSender_send(self->dest);
+    for (i=0; i<collected_count; i++) {
+        lo_message_free(collected[i]);
+    }
+    collected_count = 0;
+    pthread_mutex_unlock(&sender_mutex);
+}
+
+/* Never blocks: if the sending thread is busy, it sees the flag at the end of its pass. */
+static void
+OscSender_wake()
+{
+    sender_signaled = 1;
+    if (pthread_mutex_trylock(&sender_mutex) == 0) {
+        pthread_cond_signal(&sender_cond);
+        pthread_mutex_unlock(&sender_mutex);
+    }
+}
+
+/* Must be called with the list mutex held. */
+static OscDestination *
+OscDestination_get(const char *host, int port)
+{
+    char buf[20];
+    OscDestination *dest;
+
+    if (host == NULL)
+        host = "";
+    sprintf(buf, "%i", port);
+
+    for (dest=dest_list; dest!=NULL; dest=dest->next) {
+        if (strcmp(dest->host, host) == 0 && strcmp(dest->port, buf) == 0) {
+            dest->refcount++;
+            return dest;
+        }
+    }
+
+    dest = (OscDestination *)malloc(sizeof(OscDestination));
+    dest->host = strdup(host);
+    dest->port = strdup(buf);
+    dest->address = lo_address_new(host[0] ? host : NULL, buf);
+    dest->refcount = 1;
+    dest->bundle = NULL;
+    dest->first = NULL;
+    dest->first_path = NULL;
+    dest->pending = 0;
+    dest->next = dest_list;
+    dest_list = dest;
+    return dest;
+}
+
+/* Must be called with the list mutex held. */
+static void
+OscDestination_release(OscDestination *self)
+{
+    OscDestination **tmp;
+
+    if (--self->refcount > 0)
+        return;
+
+    for (tmp=&dest_list; *tmp!=NULL; tmp=&(*tmp)->next) {
+        if (*tmp == self) {
+            *tmp = self->next;
+            break;
+        }
+    }
+    lo_address_free(self->address);
+    free(self->host);
+    free(self->port);
+    free(self);
+}
+
+/* Creates a sender for the address `path` on `host`:`port`. If `messages` is true, the sender
+ * queues complete messages (OscSender_pushMessage), otherwise it sends float values. */
+OscSender *
+OscSender_new(const char *host, int port, const char *path, int messages)
+{
+    pthread_t thread;
+    OscSender *self;
+
+    self = (OscSender *)malloc(sizeof(OscSender));
+    self->path = strdup(path);
+    self->value = 0.0;
+    self->pushed = self->seen = 0;
+    self->messages = messages ? RingBuffer_new(OSCSENDER_MESSAGES, sizeof(lo_message)) : NULL;
+    self->interval = self->lasttime = 0.0;
+    self->changes = self->hassent = 0;
+    self->lastvalue = 0.0;
+    self->sent = self->coalesced = self->filtered = self->dropped = 0;
+
+    pthread_mutex_lock(&sender_mutex);
+    self->dest = OscDestination_get(host, port);
+    self->next = sender_list;
+    sender_list = self;
+    if (sender_running == 0) {
+        if (pthread_create(&thread, NULL, OscSender_thread, NULL) == 0) {
+            pthread_detach(thread);
+            sender_running = 1;
+        }
+    }
+    pthread_mutex_unlock(&sender_mutex);
+
+    return self;
+}
+
+/* The values and messages not sent yet are discarded. Nothing must be pushed in this sender anymore. */
+void
+OscSender_free(OscSender *self)
+{
+    lo_message msg;
+    OscSender **tmp;
+
+    if (self == NULL)
+        return;
+
+    pthread_mutex_lock(&sender_mutex);
+    for (tmp=&sender_list; *tmp!=NULL; tmp=&(*tmp)->next) {
+        if (*tmp == self) {
+            *tmp = self->next;
+            break;
+        }
+    }
+    OscDestination_release(self->dest);
+    pthread_mutex_unlock(&sender_mutex);
+
+    if (self->messages != NULL) {
+        while (RingBuffer_read(self->messages, &msg, 1) == 1) {
+            lo_message_free(msg);
+        }
+        RingBuffer_free(self->messages);
+    }
+    free(self->path);
+    free(self);
+}
+
+/* Audio thread. Replaces the value waiting to be sent, if any, unless `blocking` is true
+ * (offline rendering), then the waiting value is first sent. */
+void
+OscSender_pushValue(OscSender *self, float value, int blocking)
+{
+    if (blocking && self->pushed != self->seen)
+        OscSender_flush(self);
+
+    self->value = value;
+    __sync_synchronize();
+    self->pushed++;
+    OscSender_wake();
+}
+
+/* Queues a message, the sender takes its ownership. If the queue is full, the message is
+ * freed and the drop is counted, unless `blocking` is true (offline rendering), then the
+ * queue is first sent. Returns 1 if the message was queued, 0 otherwise. */
+int
+OscSender_pushMessage(OscSender *self, lo_message msg, int blocking)
+{
+    if (RingBuffer_writeAvailable(self->messages) == 0 && blocking)
+        OscSender_flush(self);
+
+    if (RingBuffer_write(self->messages, &msg, 1) == 0) {
+        self->dropped++;
+        lo_message_free(msg);
+        return 0;
+    }
+    OscSender_wake();
+    return 1;
+}
+
+/* Maximum number of messages per second sent by the sender, 0 means no limit. */
+void
+OscSender_setMaxRate(OscSender *self, double rate)
+{
+    self->interval = rate > 0.0 ? 1.0 / rate : 0.0;
+}
+
+void
+OscSender_setChangesOnly(OscSender *self, int state)
+{
+    self->changes = state ? 1 : 0;
+}
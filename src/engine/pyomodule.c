@@ -29,6 +29,7 @@
 #include "dummymodule.h"
 #include "tablemodule.h"
 #include "matrixmodule.h"
+#include "analysisbusmodule.h"
 
 /** Note :
  ** Add an argument to pa_get_* and pm_get_* functions to allow printing to the console
@@ -2268,6 +2269,7 @@ init_pyo64(void)
     module_add_object(m, "TriggerDummy_base", &TriggerDummyType);
     module_add_object(m, "TableStream", &TableStreamType);
     module_add_object(m, "MatrixStream", &MatrixStreamType);
+    module_add_object(m, "AnalysisBus_base", &AnalysisBusType);
     module_add_object(m, "Record_base", &RecordType);
     module_add_object(m, "ControlRec_base", &ControlRecType);
     module_add_object(m, "ControlRead_base", &ControlReadType);
@@ -2401,6 +2403,9 @@ init_pyo64(void)
     module_add_object(m, "Programin_base", &PrograminType);
     module_add_object(m, "MidiAdsr_base", &MidiAdsrType);
     module_add_object(m, "MidiDelAdsr_base", &MidiDelAdsrType);
+    module_add_object(m, "VoicePool_base", &VoicePoolType);
+    module_add_object(m, "VoicePoolNote_base", &VoicePoolNoteType);
+    module_add_object(m, "VoicePoolMix_base", &VoicePoolMixType);
     module_add_object(m, "OscSend_base", &OscSendType);
     module_add_object(m, "OscDataSend_base", &OscDataSendType);
     module_add_object(m, "OscReceive_base", &OscReceiveType);
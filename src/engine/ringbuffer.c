@@ -0,0 +1,247 @@
+/**************************************************************************
+ * Copyright 2009-2015 Olivier Belanger                                   *
+ *                                                                        *
+ * This file is part of pyo, a python module to help digital signal       *
+ * processing script creation.                                            *
+ *                                                                        *
+ * pyo is free software: you can redistribute it and/or modify            *
+ * it under the terms of the GNU Lesser General Public License as         *
+ * published by the Free Software Foundation, either version 3 of the     *
+ * License, or (at your option) any later version.                        *
+ *                                                                        *
+ * pyo is distributed in the hope that it will be useful,                 *
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of         *
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the          *
+ * GNU Lesser General Public License for more details.                    *
+ *                                                                        *
+ * You should have received a copy of the GNU Lesser General Public       *
+ * License along with pyo.  If not, see <http://www.gnu.org/licenses/>.   *
+ *                                                                        *
+ * Lock-free single producer / single consumer ring buffer. One thread    *
+ * writes items, another one reads them, without any lock. Used to pass   *
+ * data between the audio thread and the other threads of the server.     *
+ * RingQueue chains ring buffers to make a queue that never fills up.     *
+ *************************************************************************/
+
+#include <stdlib.h>
+#include <string.h>
+#include "ringbuffer.h"
+
+/* Full memory barrier, makes the items visible before the index is updated. */
+#define RB_BARRIER() __sync_synchronize()
+
+RingBuffer *
+RingBuffer_new(int count, int itemsize)
+{
+    unsigned int size = 2;
+    RingBuffer *self;
+
+    while (size < (unsigned int)count)
+        size *= 2;
+
+    self = (RingBuffer *)malloc(sizeof(RingBuffer));
+    self->buffer = (char *)calloc(size, itemsize);
+    self->itemsize = itemsize;
+    self->size = size;
+    self->mask = size - 1;
+    self->head = self->tail = 0;
+    return self;
+}
+
+void
+RingBuffer_free(RingBuffer *self)
+{
+    if (self == NULL)
+        return;
+    free(self->buffer);
+    free(self);
+}
+
+int
+RingBuffer_readAvailable(RingBuffer *self)
+{
+    return (int)(self->head - self->tail);
+}
+
+int
+RingBuffer_writeAvailable(RingBuffer *self)
+{
+    return (int)(self->size - (self->head - self->tail));
+}
+
+/* Called by the producer only. Writes up to `count` items, returns the number of items written. */
+int
+RingBuffer_write(RingBuffer *self, const void *items, int count)
+{
+    unsigned int pos, first;
+    int avail = RingBuffer_writeAvailable(self);
+
+    if (count > avail)
+        count = avail;
+    if (count <= 0)
+        return 0;
+
+    pos = self->head & self->mask;
+    first = self->size - pos;
+    if ((unsigned int)count <= first)
+        memcpy(self->buffer + pos * self->itemsize, items, count * self->itemsize);
+    else {
+        memcpy(self->buffer + pos * self->itemsize, items, first * self->itemsize);
+        memcpy(self->buffer, (const char *)items + first * self->itemsize, (count - first) * self->itemsize);
+    }
+    RB_BARRIER();
+    self->head += count;
+    return count;
+}
+
+/* Called by the consumer only. Reads up to `count` items, returns the number of items read. */
+int
+RingBuffer_read(RingBuffer *self, void *items, int count)
+{
+    unsigned int pos, first;
+    int avail = RingBuffer_readAvailable(self);
+
+    if (count > avail)
+        count = avail;
+    if (count <= 0)
+        return 0;
+
+    RB_BARRIER();
+    pos = self->tail & self->mask;
+    first = self->size - pos;
+    if ((unsigned int)count <= first)
+        memcpy(items, self->buffer + pos * self->itemsize, count * self->itemsize);
+    else {
+        memcpy(items, self->buffer + pos * self->itemsize, first * self->itemsize);
+        memcpy((char *)items + first * self->itemsize, self->buffer, (count - first) * self->itemsize);
+    }
+    RB_BARRIER();
+    self->tail += count;
+    return count;
+}
+
+/* Returns the item at `index` from the read position, without consuming it. */
+void *
+RingBuffer_getItem(RingBuffer *self, int index)
+{
+    return self->buffer + ((self->tail + index) & self->mask) * self->itemsize;
+}
+
+/* Only safe when neither the producer nor the consumer are running. */
+void
+RingBuffer_clear(RingBuffer *self)
+{
+    self->head = self->tail = 0;
+}
+
+static RingQueueSegment *
+RingQueue_segment(int count, int itemsize)
+{
+    RingQueueSegment *seg = (RingQueueSegment *)malloc(sizeof(RingQueueSegment));
+    seg->ring = RingBuffer_new(count, itemsize);
+    seg->next = NULL;
+    return seg;
+}
+
+RingQueue *
+RingQueue_new(int count, int itemsize)
+{
+    RingQueue *self = (RingQueue *)malloc(sizeof(RingQueue));
+    self->itemsize = itemsize;
+    self->first = self->write = self->read = RingQueue_segment(count, itemsize);
+    return self;
+}
+
+void
+RingQueue_free(RingQueue *self)
+{
+    RingQueueSegment *seg, *next;
+
+    if (self == NULL)
+        return;
+    for (seg=self->first; seg!=NULL; seg=next) {
+        next = seg->next;
+        RingBuffer_free(seg->ring);
+        free(seg);
+    }
+    free(self);
+}
+
+/* Called by the producer only. Always writes the `count` items, growing the queue if needed. */
+int
+RingQueue_write(RingQueue *self, const void *items, int count)
+{
+    int size, written;
+    RingQueueSegment *seg, *read;
+
+    written = RingBuffer_write(self->write->ring, items, count);
+    if (written == count)
+        return count;
+
+    /* Frees the segments left behind by the consumer. */
+    read = self->read;
+    while (self->first != read) {
+        seg = self->first;
+        self->first = seg->next;
+        RingBuffer_free(seg->ring);
+        free(seg);
+    }
+
+    size = self->write->ring->size * 2;
+    if (size < count - written)
+        size = count - written;
+    seg = RingQueue_segment(size, self->itemsize);
+    RingBuffer_write(seg->ring, (const char *)items + written * self->itemsize, count - written);
+    RB_BARRIER();
+    self->write->next = seg;
+    self->write = seg;
+    return count;
+}
+
+/* Called by the consumer only. Returns the oldest item without consuming it, NULL if the queue is empty. */
+void *
+RingQueue_peek(RingQueue *self)
+{
+    RingQueueSegment *seg = self->read;
+
+    while (RingBuffer_readAvailable(seg->ring) == 0) {
+        if (seg->next == NULL)
+            return NULL;
+        /* The producer links a new segment after its last write in this one. */
+        RB_BARRIER();
+        if (RingBuffer_readAvailable(seg->ring) > 0)
+            break;
+        seg = seg->next;
+        self->read = seg;
+    }
+    return RingBuffer_getItem(seg->ring, 0);
+}
+
+/* Called by the consumer only. Reads up to `count` items, returns the number of items read. */
+int
+RingQueue_read(RingQueue *self, void *items, int count)
+{
+    int n, total = 0;
+
+    while (total < count && RingQueue_peek(self) != NULL) {
+        n = RingBuffer_read(self->read->ring, (char *)items + total * self->itemsize, count - total);
+        total += n;
+    }
+    return total;
+}
+
+/* Empties the queue. Only safe when neither the producer nor the consumer are running. */
+void
+RingQueue_clear(RingQueue *self)
+{
+    RingQueueSegment *seg;
+
+    while (self->first != self->write) {
+        seg = self->first;
+        self->first = seg->next;
+        RingBuffer_free(seg->ring);
+        free(seg);
+    }
+    RingBuffer_clear(self->write->ring);
+    self->read = self->write;
+}
@@ -25,6 +25,7 @@
 #include <time.h>
 #include <stdlib.h>
 #include <pthread.h>
+#include <sys/time.h>
 
 #include "structmember.h"
 #include "portaudio.h"
@@ -34,6 +35,10 @@
 #include "streammodule.h"
 #include "pyomodule.h"
 #include "servermodule.h"
+#include "tablemodule.h"
+#include "matrixmodule.h"
+#include "pvstreammodule.h"
+#include "analysisbusmodule.h"
 
 
 #define MAX_NBR_SERVER 256
@@ -47,6 +52,9 @@ static void Server_process_gui(Server *server);
 static void Server_process_time(Server *server);
 static inline void Server_process_buffers(Server *server);
 static int Server_start_rec_internal(Server *self, char *filename);
+static SfWriter * Server_detach_rec(Server *self);
+static void Server_stop_rec_internal(Server *self);
+static PyObject *Server_stop_rec(Server *self, PyObject *args);
 
 /* random objects count and multiplier to assign different seed to each instance. */
 #define num_rnd_objs 29
@@ -120,22 +128,111 @@ Server_debug(Server *self, char * format, ...)
     }
 }
 
-/* Portmidi get input events */
-static void portmidiGetEvents(Server *self)
+/* Portmidi input thread, reads the midi inputs into a queue, with their timestamps. */
+static void *
+Server_midi_thread(void *arg)
 {
-    int i;
-    PmError result;
-    PmEvent buffer;
-
-    for (i=0; i<self->midiin_count; i++) {
-        do {
-            result = Pm_Poll(self->midiin[i]);
-            if (result) {
-                if (Pm_Read(self->midiin[i], &buffer, 1) == pmBufferOverflow)
-                    continue;
-                self->midiEvents[self->midi_count++] = buffer;
+    int i, j, count;
+    PmEvent buffer[64];
+    PyoMidiEvent event;
+    Server *self = (Server *)arg;
+
+    event.time = 0;
+    while (self->midi_quit == 0) {
+        for (i=0; i<self->midiin_count; i++) {
+            while (Pm_Poll(self->midiin[i]) == TRUE) {
+                count = Pm_Read(self->midiin[i], buffer, 64);
+                if (count <= 0)
+                    break;
+                for (j=0; j<count; j++) {
+                    event.event = buffer[j];
+                    RingQueue_write(self->midiqueue, &event, 1);
+                }
             }
-        } while (result);
+        }
+        Pt_Sleep(1);
+    }
+    return NULL;
+}
+
+static void
+Server_start_midi_thread(Server *self)
+{
+    if (self->midi_running == 1)
+        return;
+    self->midiqueue = RingQueue_new(256, sizeof(PyoMidiEvent));
+    self->midi_clock_valid = 0;
+    self->midi_quit = 0;
+    if (pthread_create(&self->midi_thread, NULL, Server_midi_thread, self) != 0) {
+        Server_error(self, "Unable to create the midi thread.\n");
+        RingQueue_free(self->midiqueue);
+        self->midiqueue = NULL;
+        return;
+    }
+    self->midi_running = 1;
+}
+
+/* Called once the audio callback is stopped. */
+static void
+Server_stop_midi_thread(Server *self)
+{
+    if (self->midi_running == 0)
+        return;
+    self->midi_quit = 1;
+    pthread_join(self->midi_thread, NULL);
+    self->midi_running = 0;
+    RingQueue_free(self->midiqueue);
+    self->midiqueue = NULL;
+}
+
+/* Position of a PortMidi timestamp on the sample clock, one buffer later than it was received. */
+static unsigned long
+Server_midi_time(Server *self, PmTimestamp timestamp)
+{
+    double time = timestamp * self->samplingRate * 0.001 - self->midi_clock + self->bufferSize;
+    return time > 0.0 ? (unsigned long)time : 0;
+}
+
+/* Moves the midi events falling in the current buffer to midiEvents, in time order. */
+static void
+Server_collect_midi_events(Server *self)
+{
+    double diff;
+    unsigned long end = self->elapsedSamples + self->bufferSize;
+    PyoMidiEvent *event, *injected, tmp;
+    RingQueue *queue;
+    PmEvent *out;
+
+    self->midi_count = 0;
+    if (self->midiqueue != NULL) {
+        /* The buffers are not called at a steady pace, the clock difference is smoothed. */
+        diff = Pt_Time() * self->samplingRate * 0.001 - self->elapsedSamples;
+        if (self->midi_clock_valid == 0 || fabs(diff - self->midi_clock) > self->samplingRate * 0.1) {
+            self->midi_clock = diff;
+            self->midi_clock_valid = 1;
+        }
+        else
+            self->midi_clock += (diff - self->midi_clock) * 0.01;
+    }
+
+    while (self->midi_count < PYO_MIDI_EVENTS) {
+        event = NULL;
+        queue = NULL;
+        if (self->midiqueue != NULL && (event = (PyoMidiEvent *)RingQueue_peek(self->midiqueue)) != NULL) {
+            event->time = Server_midi_time(self, event->event.timestamp);
+            queue = self->midiqueue;
+        }
+        injected = (PyoMidiEvent *)RingQueue_peek(self->midiinject);
+        if (injected != NULL && (event == NULL || injected->time < event->time)) {
+            event = injected;
+            queue = self->midiinject;
+        }
+        if (event == NULL || event->time >= end)
+            break;
+        out = &self->midiEvents[self->midi_count++];
+        out->message = event->event.message;
+        out->timestamp = event->time > self->elapsedSamples ? (PmTimestamp)(event->time - self->elapsedSamples) : 0;
+        RingQueue_read(queue, &tmp, 1);
     }
 }
 
@@ -169,10 +266,6 @@ pa_callback_interleaved( const void *inputBuffer, void *outputBuffer,
     (void) timeInfo;
     (void) statusFlags;
 
-    if (server->withPortMidi == 1) {
-        portmidiGetEvents(server);
-    }
-
     if (server->duplex == 1) {
         float *in = (float *)inputBuffer;
         bufchnls = server->ichnls + server->input_offset;
@@ -194,7 +287,6 @@ pa_callback_interleaved( const void *inputBuffer, void *outputBuffer,
             out[index2+j] = (float) server->output_buffer[index1+j];
         }
     }
-    server->midi_count = 0;
 
 #ifdef _OSX_
     if (server->server_stopped == 1)
@@ -221,10 +313,6 @@ pa_callback_nonInterleaved( const void *inputBuffer, void *outputBuffer,
     (void) timeInfo;
     (void) statusFlags;
 
-    if (server->withPortMidi == 1) {
-        portmidiGetEvents(server);
-    }
-
     if (server->duplex == 1) {
         float **in = (float **)inputBuffer;
         for (i=0; i<server->bufferSize; i++) {
@@ -240,7 +328,6 @@ pa_callback_nonInterleaved( const void *inputBuffer, void *outputBuffer,
             out[j+server->output_offset][i] = (float) server->output_buffer[(i*server->nchnls)+j];
         }
     }
-    server->midi_count = 0;
 
 #ifdef _OSX_
     if (server->server_stopped == 1)
@@ -261,9 +348,6 @@ jack_callback (jack_nframes_t nframes, void *arg)
     assert(nframes == server->bufferSize);
     jack_default_audio_sample_t *in_buffers[server->ichnls], *out_buffers[server->nchnls];
 
-    if (server->withPortMidi == 1) {
-        portmidiGetEvents(server);
-    }
     PyoJackBackendData *be_data = (PyoJackBackendData *) server->audio_be_data;
     for (i = 0; i < server->ichnls; i++) {
         in_buffers[i] = jack_port_get_buffer (be_data->jack_in_ports[i+server->input_offset], server->bufferSize);
@@ -286,7 +370,6 @@ jack_callback (jack_nframes_t nframes, void *arg)
             out_buffers[j][i] = (jack_default_audio_sample_t) server->output_buffer[(i*server->nchnls)+j];
         }
     }
-    server->midi_count = 0;
     return 0;
 }
 
@@ -363,10 +446,6 @@ OSStatus coreaudio_output_callback(AudioDeviceID device, const AudioTimeStamp* i
 
     (void) inInputData;
 
-    if (server->withPortMidi == 1) {
-        portmidiGetEvents(server);
-    }
-
     Server_process_buffers(server);
     AudioBuffer* outputBuf = outOutputData->mBuffers;
     bufchnls = outputBuf->mNumberChannels;
@@ -379,7 +458,6 @@ OSStatus coreaudio_output_callback(AudioDeviceID device, const AudioTimeStamp* i
             bufdata[off1chnls+j] = server->output_buffer[off2chnls+j];
         }
     }
-    server->midi_count = 0;
 
     return kAudioHardwareNoError;
 }
@@ -1195,8 +1273,7 @@ void
             offline_process_block((Server *) self);
         }
         self->server_started = 0;
-        self->record = 0;
-        sf_close(self->recfile);
+        Server_stop_rec_internal(self);
         Server_message(self,"Offline Server rendering finished.\n");
     }
     return NULL;
@@ -1227,8 +1304,7 @@ Server_offline_start(Server *self)
         offline_process_block((Server *) self);
     }
     self->server_started = 0;
-    self->record = 0;
-    sf_close(self->recfile);
+    Server_stop_rec_internal(self);
     Server_message(self,"Offline Server rendering finished.\n");
     return 0;
 }
@@ -1322,40 +1398,1255 @@ of every processing callback, but function put to not break pyo */
 int
 Server_embedded_stop(Server *self)
 {
-    self->server_started = 0;
-    self->server_stopped = 1;
+    self->server_started = 0;
+    self->server_stopped = 1;
+    return 0;
+}
+
+/***************************************************/
+/*  GIL-free processing                            */
+/*                                                 */
+/* In GIL-free mode, the audio thread computes the */
+/* streams without the python interpreter lock.    */
+/* Instead, it holds the server's dsp mutex, which */
+/* python threads must acquire before modifying    */
+/* the objects (methods of the _base objects and   */
+/* streams list). Python calls made by the audio   */
+/* objects are pushed in a lock-free queue and     */
+/* executed by the callback thread.                */
+/***************************************************/
+
+#define PYO_DEFERRED_MAX_ARGS 8
+
+/* Common head of the audio, table and matrix objects. */
+typedef struct {
+    PyObject_HEAD
+    PyObject *server;
+    PyObject *stream; /* Stream, TableStream or MatrixStream */
+} PyoObjectHead;
+
+/* Returns the stream of an audio, table or matrix object, found through its "stream",
+ * "tablestream" or "matrixstream" member. Other types of the module (ie. AnalysisBus) don't
+ * have the PyoObjectHead layout and have no stream, NULL is returned for them. */
+static PyObject *
+Server_object_stream(PyObject *obj)
+{
+    PyMemberDef *member;
+
+    for (member=Py_TYPE(obj)->tp_members; member!=NULL && member->name!=NULL; member++) {
+        if (member->type == T_OBJECT_EX && member->offset == offsetof(PyoObjectHead, stream) &&
+            (strcmp(member->name, "stream") == 0 || strcmp(member->name, "tablestream") == 0 ||
+             strcmp(member->name, "matrixstream") == 0))
+            return ((PyoObjectHead *)obj)->stream;
+    }
+    return NULL;
+}
+
+typedef struct {
+    PyObject *obj;
+    void (*func)(PyObject *, MYFLT *);
+    MYFLT args[PYO_DEFERRED_MAX_ARGS];
+} PyoDeferredCall;
+
+/* Called from python threads, with the GIL. The GIL is released while waiting for the audio thread. */
+void
+Server_lockDsp(Server *self)
+{
+    if (self->gilfree == 0)
+        return;
+    while (pthread_mutex_trylock(&self->dsp_mutex) != 0) {
+        Py_BEGIN_ALLOW_THREADS
+        pthread_mutex_lock(&self->dsp_mutex);
+        pthread_mutex_unlock(&self->dsp_mutex);
+        Py_END_ALLOW_THREADS
+    }
+}
+
+void
+Server_unlockDsp(Server *self)
+{
+    if (self->gilfree == 0)
+        return;
+    pthread_mutex_unlock(&self->dsp_mutex);
+}
+
+/* Calls `func(obj, args)` now if the audio thread holds the GIL, otherwise in the callback thread. */
+void
+Server_deferCall(Server *self, PyObject *obj, void (*func)(PyObject *, MYFLT *), MYFLT *args, int nargs)
+{
+    PyoDeferredCall call;
+
+    if (self->gilfree_running == 0) {
+        (*func)(obj, args);
+        return;
+    }
+
+    call.obj = obj;
+    call.func = func;
+    if (nargs > PYO_DEFERRED_MAX_ARGS)
+        nargs = PYO_DEFERRED_MAX_ARGS;
+    if (nargs > 0)
+        memcpy(call.args, args, nargs * sizeof(MYFLT));
+    if (RingBuffer_write(self->callbacks, &call, 1) == 0)
+        __sync_fetch_and_add(&self->callbacks_dropped, 1);
+}
+
+static void
+Server_stop_object(PyObject *obj, MYFLT *args)
+{
+    PyObject_CallMethod(obj, "stop", NULL);
+}
+
+/* Stops an audio object. Without the GIL, its stream is deactivated right away. */
+void
+Server_deferStop(Server *self, PyObject *obj)
+{
+    if (self->gilfree_running == 1)
+        Stream_setStreamActive(((PyoObjectHead *)obj)->stream, 0);
+    Server_deferCall(self, obj, Server_stop_object, NULL, 0);
+}
+
+/* Removes the calls pending for an object about to be deleted. Called with the GIL and the dsp mutex. */
+static void
+Server_purge_deferred_calls(Server *self, PyObject *obj)
+{
+    int i, count;
+    PyoDeferredCall *call;
+
+    if (self->callbacks == NULL)
+        return;
+    count = RingBuffer_readAvailable(self->callbacks);
+    for (i=0; i<count; i++) {
+        call = (PyoDeferredCall *)RingBuffer_getItem(self->callbacks, i);
+        if (call->obj == obj)
+            call->obj = NULL;
+    }
+}
+
+static void *
+Server_callback_thread(void *arg)
+{
+    int dropped;
+    struct timeval now;
+    struct timespec timeout;
+    PyoDeferredCall call;
+    PyGILState_STATE s;
+    Server *self = (Server *)arg;
+
+    pthread_mutex_lock(&self->callback_mutex);
+    while (self->callback_quit == 0) {
+        if (RingBuffer_readAvailable(self->callbacks) == 0) {
+            /* The audio thread only signals when the mutex is free, so don't wait too long. */
+            gettimeofday(&now, NULL);
+            timeout.tv_sec = now.tv_sec;
+            timeout.tv_nsec = now.tv_usec * 1000 + 5000000;
+            if (timeout.tv_nsec >= 1000000000) {
+                timeout.tv_sec++;
+                timeout.tv_nsec -= 1000000000;
+            }
+            pthread_cond_timedwait(&self->callback_cond, &self->callback_mutex, &timeout);
+            continue;
+        }
+        pthread_mutex_unlock(&self->callback_mutex);
+
+        s = PyGILState_Ensure();
+        while (RingBuffer_read(self->callbacks, &call, 1) == 1) {
+            if (call.obj != NULL)
+                (*call.func)(call.obj, call.args);
+        }
+        dropped = __sync_fetch_and_and(&self->callbacks_dropped, 0);
+        if (dropped > 0)
+            Server_warning(self, "%d python calls dropped, the callback queue is full.\n", dropped);
+        PyGILState_Release(s);
+
+        pthread_mutex_lock(&self->callback_mutex);
+    }
+    pthread_mutex_unlock(&self->callback_mutex);
+    return NULL;
+}
+
+static void
+Server_wake_callback_thread(Server *self)
+{
+    if (RingBuffer_readAvailable(self->callbacks) > 0 && pthread_mutex_trylock(&self->callback_mutex) == 0) {
+        pthread_cond_signal(&self->callback_cond);
+        pthread_mutex_unlock(&self->callback_mutex);
+    }
+}
+
+static void
+Server_start_callback_thread(Server *self)
+{
+    if (self->callback_running == 1)
+        return;
+    if (self->callbacks == NULL)
+        self->callbacks = RingBuffer_new(4096, sizeof(PyoDeferredCall));
+    self->callback_quit = 0;
+    if (pthread_create(&self->callback_thread, NULL, Server_callback_thread, self) != 0) {
+        Server_error(self, "Unable to create the callback thread.\n");
+        return;
+    }
+    self->callback_running = 1;
+}
+
+/* Called with the GIL, which is released while joining the thread. */
+static void
+Server_stop_callback_thread(Server *self)
+{
+    if (self->callback_running == 0)
+        return;
+    pthread_mutex_lock(&self->callback_mutex);
+    self->callback_quit = 1;
+    pthread_cond_signal(&self->callback_cond);
+    pthread_mutex_unlock(&self->callback_mutex);
+    Py_BEGIN_ALLOW_THREADS
+    pthread_join(self->callback_thread, NULL);
+    Py_END_ALLOW_THREADS
+    self->callback_running = 0;
+    RingBuffer_clear(self->callbacks);
+}
+
+/* Called after a method of an object, a sleeping object is computed again on the next buffer. */
+static void
+Server_wake_object(PyObject *obj)
+{
+    PyObject *stream;
+
+    if (strncmp(Py_TYPE(obj)->tp_name, "_pyo", 4) != 0)
+        return;
+    stream = Server_object_stream(obj);
+    if (stream != NULL && PyObject_TypeCheck(stream, &StreamType))
+        ((Stream *)stream)->silence = 0;
+}
+
+/* Wrapper around the methods of the _base objects, holds the dsp mutex during the call
+ * and wakes the object if it sleeps. */
+typedef struct {
+    PyObject_HEAD
+    PyObject *method;
+} DspMethod;
+
+static void
+DspMethod_dealloc(DspMethod *self)
+{
+    Py_XDECREF(self->method);
+    self->ob_type->tp_free((PyObject*)self);
+}
+
+static PyObject *
+DspMethod_call(DspMethod *self, PyObject *args, PyObject *kwds)
+{
+    PyObject *result;
+    Server *server = (Server *)PyServer_get_server();
+
+    if (server == NULL || (server->gilfree == 0 && server->sleep_silent == 0))
+        return PyObject_Call(self->method, args, kwds);
+
+    Server_lockDsp(server);
+    result = PyObject_Call(self->method, args, kwds);
+    if (server->sleep_silent == 1 && PyTuple_GET_SIZE(args) > 0)
+        Server_wake_object(PyTuple_GET_ITEM(args, 0));
+    Server_unlockDsp(server);
+    return result;
+}
+
+static PyObject *
+DspMethod_get(DspMethod *self, PyObject *obj, PyObject *type)
+{
+    if (obj == NULL || obj == Py_None) {
+        Py_INCREF(self);
+        return (PyObject *)self;
+    }
+    return PyMethod_New((PyObject *)self, obj, type);
+}
+
+static PyObject *
+DspMethod_getattro(DspMethod *self, PyObject *name)
+{
+    return PyObject_GetAttr(self->method, name);
+}
+
+static PyTypeObject DspMethodType = {
+    PyObject_HEAD_INIT(NULL)
+    0,                         /*ob_size*/
+    "_pyo.DspMethod",         /*tp_name*/
+    sizeof(DspMethod),         /*tp_basicsize*/
+    0,                         /*tp_itemsize*/
+    (destructor)DspMethod_dealloc, /*tp_dealloc*/
+    0,                         /*tp_print*/
+    0,                         /*tp_getattr*/
+    0,                         /*tp_setattr*/
+    0,                         /*tp_compare*/
+    0,                         /*tp_repr*/
+    0,                         /*tp_as_number*/
+    0,                         /*tp_as_sequence*/
+    0,                         /*tp_as_mapping*/
+    0,                         /*tp_hash */
+    (ternaryfunc)DspMethod_call, /*tp_call*/
+    0,                         /*tp_str*/
+    (getattrofunc)DspMethod_getattro, /*tp_getattro*/
+    0,                         /*tp_setattro*/
+    0,                         /*tp_as_buffer*/
+    Py_TPFLAGS_DEFAULT,        /*tp_flags*/
+    "Method holding the server's dsp mutex while called.", /* tp_doc */
+    0,                         /* tp_traverse */
+    0,                         /* tp_clear */
+    0,                         /* tp_richcompare */
+    0,                         /* tp_weaklistoffset */
+    0,                         /* tp_iter */
+    0,                         /* tp_iternext */
+    0,                         /* tp_methods */
+    0,                         /* tp_members */
+    0,                         /* tp_getset */
+    0,                         /* tp_base */
+    0,                         /* tp_dict */
+    (descrgetfunc)DspMethod_get, /* tp_descr_get */
+    0,                         /* tp_descr_set */
+    0,                         /* tp_dictoffset */
+    0,                         /* tp_init */
+    0,                         /* tp_alloc */
+    0,                         /* tp_new */
+};
+
+/* Methods holding the dsp mutex themselves, only around their non blocking part, because
+ * they wait on the disk afterward ("<type name>.<method name>"). */
+static const char *DspMethod_unwrapped[] = {"Record_base.stop", NULL};
+
+static int
+DspMethod_is_unwrapped(const char *type, const char *method)
+{
+    int i;
+    size_t len = strlen(type);
+    for (i=0; DspMethod_unwrapped[i] != NULL; i++) {
+        if (strncmp(DspMethod_unwrapped[i], type, len) == 0 && DspMethod_unwrapped[i][len] == '.' &&
+            strcmp(DspMethod_unwrapped[i] + len + 1, method) == 0)
+            return 1;
+    }
+    return 0;
+}
+
+/* Replaces the methods of every _base type of the module by DspMethod wrappers (getters and
+ * DspMethod_unwrapped excepted). */
+static void
+Server_protect_methods(Server *self)
+{
+    static int done = 0;
+    Py_ssize_t pos = 0;
+    char *name;
+    PyObject *module, *key, *value, *method;
+    PyMethodDef *def;
+    PyTypeObject *type;
+    DspMethod *wrapper;
+
+    if (done == 1)
+        return;
+    if (PyType_Ready(&DspMethodType) < 0)
+        return;
+    module = PyImport_ImportModule(LIB_BASE_NAME);
+    if (module == NULL) {
+        PyErr_Clear();
+        return;
+    }
+
+    while (PyDict_Next(PyModule_GetDict(module), &pos, &key, &value)) {
+        name = PyString_AsString(key);
+        if (! PyType_Check(value) || value == (PyObject *)&ServerType || strlen(name) < 5 ||
+            strcmp(name + strlen(name) - 5, "_base") != 0)
+            continue;
+        type = (PyTypeObject *)value;
+        for (def=type->tp_methods; def != NULL && def->ml_name != NULL; def++) {
+            if (strncmp(def->ml_name, "get", 3) == 0 || strncmp(def->ml_name, "_get", 4) == 0 ||
+                DspMethod_is_unwrapped(name, def->ml_name))
+                continue;
+            method = PyDict_GetItemString(type->tp_dict, def->ml_name);
+            if (method == NULL || Py_TYPE(method) == &DspMethodType)
+                continue;
+            wrapper = PyObject_New(DspMethod, &DspMethodType);
+            Py_INCREF(method);
+            wrapper->method = method;
+            PyDict_SetItemString(type->tp_dict, def->ml_name, (PyObject *)wrapper);
+            Py_DECREF(wrapper);
+        }
+        PyType_Modified(type);
+    }
+    Py_DECREF(module);
+    done = 1;
+}
+
+/***************************************************/
+/*  Event scheduler                                */
+/*                                                 */
+/*  Server.schedule() pushes the events in a       */
+/*  binary heap ordered by time (in samples). At   */
+/*  the beginning of each buffer, the events due   */
+/*  in this buffer are removed from the heap and   */
+/*  called, with their position in the buffer      */
+/*  available to the objects they start.           */
+/***************************************************/
+typedef enum {
+    EventPending = 0, /* in the heap */
+    EventDue = 1, /* removed from the heap, the call is deferred */
+    EventDone = 2,
+    EventCancelled = 3
+} ScheduledEventState;
+
+typedef struct _ScheduledEvent {
+    PyObject_HEAD
+    Server *server;
+    unsigned long time; /* in samples, on the server's clock */
+    unsigned long order;
+    int index; /* position in the heap */
+    int state;
+    PyObject *callable;
+    PyObject *args;
+} ScheduledEvent;
+
+static int
+ScheduledEvent_before(ScheduledEvent *a, ScheduledEvent *b)
+{
+    return a->time < b->time || (a->time == b->time && a->order < b->order);
+}
+
+static void
+Server_events_place(Server *self, ScheduledEvent *event, int index)
+{
+    self->events[index] = event;
+    event->index = index;
+}
+
+static void
+Server_events_sift_up(Server *self, int index)
+{
+    int parent;
+    ScheduledEvent *event = self->events[index];
+
+    while (index > 0) {
+        parent = (index - 1) / 2;
+        if (! ScheduledEvent_before(event, self->events[parent]))
+            break;
+        Server_events_place(self, self->events[parent], index);
+        index = parent;
+    }
+    Server_events_place(self, event, index);
+}
+
+static void
+Server_events_sift_down(Server *self, int index)
+{
+    int child;
+    ScheduledEvent *event = self->events[index];
+
+    while ((child = 2 * index + 1) < self->events_count) {
+        if ((child + 1) < self->events_count && ScheduledEvent_before(self->events[child+1], self->events[child]))
+            child++;
+        if (! ScheduledEvent_before(self->events[child], event))
+            break;
+        Server_events_place(self, self->events[child], index);
+        index = child;
+    }
+    Server_events_place(self, event, index);
+}
+
+/* Takes a new reference to the event. Called with the GIL and the dsp mutex. */
+static void
+Server_events_push(Server *self, ScheduledEvent *event)
+{
+    if (self->events_count == self->events_size) {
+        self->events_size = self->events_size == 0 ? 64 : self->events_size * 2;
+        self->events = (ScheduledEvent **)realloc(self->events, self->events_size * sizeof(ScheduledEvent *));
+    }
+    Py_INCREF(event);
+    event->state = EventPending;
+    Server_events_place(self, event, self->events_count++);
+    Server_events_sift_up(self, event->index);
+}
+
+/* Removes the event at `index`, the caller receives the reference held by the heap. */
+static ScheduledEvent *
+Server_events_remove(Server *self, int index)
+{
+    ScheduledEvent *event = self->events[index];
+    ScheduledEvent *last;
+
+    self->events_count--;
+    if (index < self->events_count) {
+        last = self->events[self->events_count];
+        Server_events_place(self, last, index);
+        Server_events_sift_down(self, index);
+        Server_events_sift_up(self, last->index);
+    }
+    event->index = -1;
+    return event;
+}
+
+/* Drops the pending events. Called with the GIL, when the audio thread is stopped. */
+static void
+Server_events_clear(Server *self)
+{
+    ScheduledEvent *event;
+
+    while (self->events_count > 0) {
+        event = Server_events_remove(self, self->events_count - 1);
+        event->state = EventCancelled;
+        Py_DECREF(event);
+    }
+}
+
+/* Called with the GIL, releases the reference taken when the event was removed from the heap. */
+static void
+ScheduledEvent_fire(PyObject *obj, MYFLT *args)
+{
+    PyObject *result;
+    ScheduledEvent *self = (ScheduledEvent *)obj;
+    Server *server = self->server;
+    int in_event = server->in_event;
+    int offset = server->event_offset;
+    unsigned long time = server->event_time;
+
+    if (self->state == EventDue) {
+        self->state = EventDone;
+        server->in_event = 1;
+        server->event_time = self->time;
+        /* Without the GIL, the buffer of the event is already computed. */
+        server->event_offset = server->gilfree_running ? 0 : (int)args[0];
+        result = PyObject_Call(self->callable, self->args, NULL);
+        if (result == NULL)
+            PyErr_Print();
+        else
+            Py_DECREF(result);
+        server->in_event = in_event;
+        server->event_offset = offset;
+        server->event_time = time;
+    }
+    Py_DECREF(self);
+}
+
+/* Audio thread, at the beginning of a buffer. Calls the events due before the end of the buffer. */
+static void
+Server_process_events(Server *server)
+{
+    MYFLT offset;
+    ScheduledEvent *event;
+    unsigned long now = server->elapsedSamples;
+
+    while (server->events_count > 0 && server->events[0]->time < (now + server->bufferSize)) {
+        event = Server_events_remove(server, 0);
+        event->state = EventDue;
+        offset = event->time > now ? (MYFLT)(event->time - now) : 0.0;
+        Server_deferCall(server, (PyObject *)event, ScheduledEvent_fire, &offset, 1);
+    }
+}
+
+/* Position, in the current buffer, of the event being called. 0 outside of the events. */
+int
+Server_getEventOffset(Server *self)
+{
+    return self->in_event ? self->event_offset : 0;
+}
+
+/* Called by the objects activating or deactivating other streams during the processing. The
+   parallel processing, scheduled with the previous activity, leaves the buffer to the serial one. */
+void
+Server_streamsChanged(Server *self)
+{
+    self->stream_edits++;
+}
+
+static int
+ScheduledEvent_traverse(ScheduledEvent *self, visitproc visit, void *arg)
+{
+    Py_VISIT(self->callable);
+    Py_VISIT(self->args);
+    return 0;
+}
+
+static int
+ScheduledEvent_clear(ScheduledEvent *self)
+{
+    Py_CLEAR(self->callable);
+    Py_CLEAR(self->args);
+    return 0;
+}
+
+static void
+ScheduledEvent_dealloc(ScheduledEvent *self)
+{
+    PyObject_GC_UnTrack(self);
+    ScheduledEvent_clear(self);
+    Py_XDECREF(self->server);
+    PyObject_GC_Del(self);
+}
+
+static PyObject *
+ScheduledEvent_cancel(ScheduledEvent *self)
+{
+    int cancelled = 0;
+    ScheduledEvent *event = NULL;
+
+    Server_lockDsp(self->server);
+    if (self->state == EventPending)
+        event = Server_events_remove(self->server, self->index);
+    if (self->state == EventPending || self->state == EventDue) {
+        self->state = EventCancelled;
+        cancelled = 1;
+    }
+    Server_unlockDsp(self->server);
+    Py_XDECREF(event);
+
+    return PyBool_FromLong(cancelled);
+}
+
+static PyObject *
+ScheduledEvent_isPending(ScheduledEvent *self)
+{
+    return PyBool_FromLong(self->state == EventPending || self->state == EventDue);
+}
+
+static PyObject *
+ScheduledEvent_getTime(ScheduledEvent *self)
+{
+    return PyFloat_FromDouble(self->time / self->server->samplingRate);
+}
+
+static PyMethodDef ScheduledEvent_methods[] = {
+    {"cancel", (PyCFunction)ScheduledEvent_cancel, METH_NOARGS, "Cancels the event. Returns True if it was still pending."},
+    {"isPending", (PyCFunction)ScheduledEvent_isPending, METH_NOARGS, "Returns True if the event has not been called or cancelled yet."},
+    {"getTime", (PyCFunction)ScheduledEvent_getTime, METH_NOARGS, "Returns the time of the event, in seconds since the server was booted."},
+    {NULL}  /* Sentinel */
+};
+
+static PyTypeObject ScheduledEventType = {
+    PyObject_HEAD_INIT(NULL)
+    0,                         /*ob_size*/
+    "_pyo.ScheduledEvent",     /*tp_name*/
+    sizeof(ScheduledEvent),    /*tp_basicsize*/
+    0,                         /*tp_itemsize*/
+    (destructor)ScheduledEvent_dealloc, /*tp_dealloc*/
+    0,                         /*tp_print*/
+    0,                         /*tp_getattr*/
+    0,                         /*tp_setattr*/
+    0,                         /*tp_compare*/
+    0,                         /*tp_repr*/
+    0,                         /*tp_as_number*/
+    0,                         /*tp_as_sequence*/
+    0,                         /*tp_as_mapping*/
+    0,                         /*tp_hash */
+    0,                         /*tp_call*/
+    0,                         /*tp_str*/
+    0,                         /*tp_getattro*/
+    0,                         /*tp_setattro*/
+    0,                         /*tp_as_buffer*/
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+    "Handle of an event scheduled with Server.schedule.", /* tp_doc */
+    (traverseproc)ScheduledEvent_traverse, /* tp_traverse */
+    (inquiry)ScheduledEvent_clear, /* tp_clear */
+    0,                         /* tp_richcompare */
+    0,                         /* tp_weaklistoffset */
+    0,                         /* tp_iter */
+    0,                         /* tp_iternext */
+    ScheduledEvent_methods,    /* tp_methods */
+    0,                         /* tp_members */
+    0,                         /* tp_getset */
+    0,                         /* tp_base */
+    0,                         /* tp_dict */
+    0,                         /* tp_descr_get */
+    0,                         /* tp_descr_set */
+    0,                         /* tp_dictoffset */
+    0,                         /* tp_init */
+    0,                         /* tp_alloc */
+    0,                         /* tp_new */
+};
+
+/***************************************************/
+/*  Sleeping of the silent streams                 */
+/*                                                 */
+/*  When activated, the server measures how long   */
+/*  the output of every stream has been silent.    */
+/*  Objects with a state declare a tail, the time  */
+/*  they can keep sounding after their inputs fell */
+/*  silent, and report whether their output is     */
+/*  silent before mul and add. Once the output and */
+/*  all the audio inputs of such an object have    */
+/*  been silent for longer than its tail, its      */
+/*  state is cleared and the stream is skipped,    */
+/*  with a zeroed output, until an input sounds    */
+/*  again or a method of the object is called.     */
+/***************************************************/
+
+#define PYO_SILENCE_MAX 0x40000000
+
+typedef struct {
+    Stream *stream;
+    int silent;
+} SilenceVisit;
+
+static int
+Server_silence_visit(PyObject *o, void *arg)
+{
+    SilenceVisit *v = (SilenceVisit *)arg;
+
+    if (o == NULL || o == (PyObject *)v->stream || ! PyObject_TypeCheck(o, &StreamType))
+        return 0;
+    if (((Stream *)o)->silence <= v->stream->tail) {
+        v->silent = 0;
+        return 1;
+    }
+    return 0;
+}
+
+static void
+Server_measure_silence(Stream *stream)
+{
+    int i;
+    MYFLT *data = stream->data;
+
+    if (stream->ringing == 1) {
+        stream->ringing = 0;
+        stream->silence = 0;
+        return;
+    }
+    for (i=0; i<stream->bufsize; i++) {
+        if (data[i] > PYO_SILENCE || data[i] < -PYO_SILENCE) {
+            stream->silence = 0;
+            return;
+        }
+    }
+    if (stream->silence < PYO_SILENCE_MAX)
+        stream->silence += stream->bufsize;
+}
+
+/* Computes a stream, unless `sleep` is 1 and the stream and its inputs are silent. */
+static void
+Server_compute_stream(Stream *stream, int sleep)
+{
+    SilenceVisit v;
+    PyObject *obj = stream->streamobject;
+
+    if (sleep == 0) {
+        stream->asleep = 0;
+        Stream_callFunction(stream);
+        return;
+    }
+
+    if (stream->tail >= 0 && stream->silence > stream->tail && Py_TYPE(obj)->tp_traverse != NULL) {
+        v.stream = stream;
+        v.silent = 1;
+        Py_TYPE(obj)->tp_traverse(obj, Server_silence_visit, &v);
+        if (v.silent == 1) {
+            if (stream->asleep == 0) {
+                memset(stream->data, 0, stream->bufsize * sizeof(MYFLT));
+                if (stream->resetfuncptr != NULL)
+                    (*stream->resetfuncptr)(obj);
+                stream->asleep = 1;
+            }
+            if (stream->silence < PYO_SILENCE_MAX)
+                stream->silence += stream->bufsize;
+            return;
+        }
+    }
+    stream->asleep = 0;
+    Stream_callFunction(stream);
+    Server_measure_silence(stream);
+}
+
+/* Computes a stream, taking the GIL if it is needed and not already held by the audio thread. */
+static inline void
+Server_call_stream(Server *server, Stream *stream)
+{
+    PyGILState_STATE s;
+
+    if (server->gilfree_running == 1 && stream->serial == 2) {
+        s = PyGILState_Ensure();
+        Server_compute_stream(stream, server->sleep_silent);
+        PyGILState_Release(s);
+    }
+    else
+        Server_compute_stream(stream, server->sleep_silent);
+}
+
+/***************************************************/
+/*  Parallel processing of the streams             */
+/*                                                 */
+/* The order in which the streams must be computed */
+/* is derived, every buffer, from the objects'     */
+/* tp_traverse slot. Every object touched during   */
+/* the traversal is a resource read or written by  */
+/* the stream. A stream is given a level greater   */
+/* than the levels of the previous streams that    */
+/* conflict with it, so that the streams of the    */
+/* same level can be computed concurrently while   */
+/* giving exactly the same output as the serial    */
+/* processing. Objects holding python objects (ie. */
+/* callables) are computed alone by the audio      */
+/* thread, which holds the GIL.                    */
+/***************************************************/
+
+#define SCHED_MAX_TOUCHED 64
+#define SCHED_READ 0
+#define SCHED_WRITE 1
+
+typedef struct {
+    PyObject *key;
+    int stamp;
+    int write_level;
+    int read_level;
+} SchedResource;
+
+typedef struct {
+    pthread_t *threads;
+    int nthreads; /* number of worker threads, the audio thread also computes streams */
+    pthread_mutex_t mutex;
+    pthread_cond_t start_cond;
+    pthread_cond_t done_cond;
+    unsigned long generation;
+    int quit;
+    int pending;
+    Stream **jobs;
+    int njobs;
+    volatile int next;
+    int sleep; /* sleeping of the silent streams, copied from the server */
+
+    /* scheduling buffers */
+    int capacity;
+    int *levels;
+    int *order;
+    int *counts;
+    char *barrier;
+    SchedResource *resources;
+    int rescapacity;
+    int rescount;
+    int stamp;
+} PyoWorkerPool;
+
+typedef struct {
+    PyoWorkerPool *pool;
+    PyObject *owner;
+    int barrier;
+    int count;
+    int modes[SCHED_MAX_TOUCHED];
+    SchedResource *touched[SCHED_MAX_TOUCHED];
+} SchedVisit;
+
+/* Any address that can't be used by a python object, identifies the C library random generator. */
+static char sched_random_state;
+
+static void *
+Server_pool_worker(void *arg)
+{
+    int i;
+    unsigned long seen = 0;
+    PyoWorkerPool *pool = (PyoWorkerPool *)arg;
+
+    for (;;) {
+        pthread_mutex_lock(&pool->mutex);
+        while (pool->generation == seen && pool->quit == 0)
+            pthread_cond_wait(&pool->start_cond, &pool->mutex);
+        if (pool->quit == 1) {
+            pthread_mutex_unlock(&pool->mutex);
+            break;
+        }
+        seen = pool->generation;
+        pthread_mutex_unlock(&pool->mutex);
+
+        while ((i = __sync_fetch_and_add(&pool->next, 1)) < pool->njobs)
+            Server_compute_stream(pool->jobs[i], pool->sleep);
+
+        pthread_mutex_lock(&pool->mutex);
+        if (--pool->pending == 0)
+            pthread_cond_signal(&pool->done_cond);
+        pthread_mutex_unlock(&pool->mutex);
+    }
+    return NULL;
+}
+
+static void
+Server_pool_grow(PyoWorkerPool *pool, int size)
+{
+    int rescap;
+
+    if (size <= pool->capacity)
+        return;
+    pool->capacity = size * 2;
+    pool->levels = (int *)realloc(pool->levels, pool->capacity * sizeof(int));
+    pool->order = (int *)realloc(pool->order, pool->capacity * sizeof(int));
+    pool->counts = (int *)realloc(pool->counts, (pool->capacity + 1) * sizeof(int));
+    pool->barrier = (char *)realloc(pool->barrier, pool->capacity * sizeof(char));
+    pool->jobs = (Stream **)realloc(pool->jobs, pool->capacity * sizeof(Stream *));
+
+    /* Power of two, about eight resources per stream. */
+    rescap = 1024;
+    while (rescap < pool->capacity * 8)
+        rescap *= 2;
+    if (rescap > pool->rescapacity) {
+        free(pool->resources);
+        pool->rescapacity = rescap;
+        pool->resources = (SchedResource *)calloc(pool->rescapacity, sizeof(SchedResource));
+        pool->stamp = 0;
+    }
+}
+
+static PyoWorkerPool *
+Server_pool_new(Server *self, int nthreads)
+{
+    int i;
+    PyoWorkerPool *pool = (PyoWorkerPool *)calloc(1, sizeof(PyoWorkerPool));
+
+    pthread_mutex_init(&pool->mutex, NULL);
+    pthread_cond_init(&pool->start_cond, NULL);
+    pthread_cond_init(&pool->done_cond, NULL);
+    Server_pool_grow(pool, 256);
+
+    pool->threads = (pthread_t *)calloc(nthreads, sizeof(pthread_t));
+    for (i=0; i<nthreads; i++) {
+        if (pthread_create(&pool->threads[i], NULL, Server_pool_worker, pool) != 0) {
+            Server_warning(self, "Unable to create processing thread %d.\n", i+1);
+            break;
+        }
+    }
+    pool->nthreads = i;
+    Server_debug(self, "Parallel processing with %d worker threads.\n", pool->nthreads);
+    return pool;
+}
+
+static void
+Server_pool_free(PyoWorkerPool *pool)
+{
+    int i;
+
+    if (pool == NULL)
+        return;
+
+    pthread_mutex_lock(&pool->mutex);
+    pool->quit = 1;
+    pthread_cond_broadcast(&pool->start_cond);
+    pthread_mutex_unlock(&pool->mutex);
+    for (i=0; i<pool->nthreads; i++) {
+        pthread_join(pool->threads[i], NULL);
+    }
+    pthread_mutex_destroy(&pool->mutex);
+    pthread_cond_destroy(&pool->start_cond);
+    pthread_cond_destroy(&pool->done_cond);
+    free(pool->threads);
+    free(pool->levels);
+    free(pool->order);
+    free(pool->counts);
+    free(pool->barrier);
+    free(pool->jobs);
+    free(pool->resources);
+    free(pool);
+}
+
+/* Computes `njobs` streams concurrently, the calling thread included. */
+static void
+Server_pool_run(PyoWorkerPool *pool, Stream **jobs, int njobs)
+{
+    int i;
+
+    if (njobs < 2 || pool->nthreads == 0) {
+        for (i=0; i<njobs; i++)
+            Server_compute_stream(jobs[i], pool->sleep);
+        return;
+    }
+
+    pthread_mutex_lock(&pool->mutex);
+    pool->jobs = jobs;
+    pool->njobs = njobs;
+    pool->next = 0;
+    pool->pending = pool->nthreads;
+    pool->generation++;
+    pthread_cond_broadcast(&pool->start_cond);
+    pthread_mutex_unlock(&pool->mutex);
+
+    while ((i = __sync_fetch_and_add(&pool->next, 1)) < njobs)
+        Server_compute_stream(jobs[i], pool->sleep);
+
+    pthread_mutex_lock(&pool->mutex);
+    while (pool->pending > 0)
+        pthread_cond_wait(&pool->done_cond, &pool->mutex);
+    pthread_mutex_unlock(&pool->mutex);
+}
+
+static SchedResource *
+Server_sched_resource(PyoWorkerPool *pool, PyObject *key)
+{
+    unsigned long h;
+    SchedResource *res;
+    unsigned long mask = pool->rescapacity - 1;
+
+    h = ((unsigned long)key >> 4) * 2654435761UL;
+    for (;;) {
+        res = &pool->resources[h & mask];
+        if (res->stamp != pool->stamp) {
+            /* Keep the table at most half full, otherwise give up. */
+            if (pool->rescount * 2 >= pool->rescapacity)
+                return NULL;
+            pool->rescount++;
+            res->stamp = pool->stamp;
+            res->key = key;
+            res->write_level = res->read_level = -1;
+            return res;
+        }
+        if (res->key == key)
+            return res;
+        h++;
+    }
+}
+
+static void
+Server_sched_touch(SchedVisit *v, PyObject *key, int mode)
+{
+    SchedResource *res;
+
+    if (v->count == SCHED_MAX_TOUCHED || (res = Server_sched_resource(v->pool, key)) == NULL) {
+        v->barrier = 1;
+        return;
+    }
+    v->touched[v->count] = res;
+    v->modes[v->count++] = mode;
+}
+
+static int Server_sched_visit(PyObject *o, void *arg);
+
+static int
+Server_sched_visit_item(PyObject *o, SchedVisit *v, int nested)
+{
+    PyObject *key;
+    Py_ssize_t i;
+
+    if (o == NULL || o == Py_None || PyFloat_Check(o) || PyInt_Check(o) || PyLong_Check(o) ||
+        PyString_Check(o) || PyObject_TypeCheck(o, &ServerType))
+        return 0;
+
+    if (PyObject_TypeCheck(o, &StreamType)) {
+        if (((Stream *)o)->streamobject == v->owner)
+            Server_sched_touch(v, o, SCHED_WRITE);
+        else
+            Server_sched_touch(v, o, SCHED_READ);
+    }
+    else if (PyObject_TypeCheck(o, &TableStreamType) || PyObject_TypeCheck(o, &MatrixStreamType)) {
+        Server_sched_touch(v, o, SCHED_READ);
+    }
+    else if (PyObject_TypeCheck(o, &PVStreamType) || PyObject_TypeCheck(o, &TriggerStreamType) ||
+             PyObject_TypeCheck(o, &AnalysisBusType)) {
+        /* An analysis bus is written by the analyzers holding it. */
+        Server_sched_touch(v, o, SCHED_WRITE);
+    }
+    else if ((PyList_Check(o) || PyTuple_Check(o)) && nested == 0) {
+        for (i=0; i<PySequence_Fast_GET_SIZE(o); i++) {
+            Server_sched_visit_item(PySequence_Fast_GET_ITEM(o, i), v, 1);
+        }
+    }
+    else if (strncmp(Py_TYPE(o)->tp_name, "_pyo", 4) == 0) {
+        /* Another pyo object. Audio objects are read through their stream,
+           table and matrix objects are only held by objects writing in them. */
+        key = Server_object_stream(o);
+        if (key == NULL) {
+            /* A type without a stream, only used through the objects holding it. */
+            Server_sched_touch(v, o, SCHED_WRITE);
+            return 0;
+        }
+        if (PyObject_TypeCheck(key, &StreamType))
+            Server_sched_touch(v, key, ((Stream *)key)->streamobject == v->owner ? SCHED_WRITE : SCHED_READ);
+        else
+            Server_sched_touch(v, key, SCHED_WRITE);
+    }
+    else {
+        /* Python objects can only be used with the GIL. */
+        v->barrier = 1;
+    }
+    return 0;
+}
+
+static int
+Server_sched_visit(PyObject *o, void *arg)
+{
+    return Server_sched_visit_item(o, (SchedVisit *)arg, 0);
+}
+
+/* Assigns a level to every active stream. Returns the number of levels or -1 on failure. */
+static int
+Server_sched_levels(Server *server, PyoWorkerPool *pool)
+{
+    int i, j, level, maxlevel = -1, floor = 0;
+    Stream *stream_tmp;
+    PyObject *obj;
+    SchedResource *res;
+    SchedVisit v;
+
+    pool->stamp++;
+    pool->rescount = 0;
+    v.pool = pool;
+
+    for (i=0; i<server->stream_count; i++) {
+        stream_tmp = (Stream *)PyList_GET_ITEM(server->streams, i);
+        if ((PyObject *)stream_tmp == Py_None || Stream_getStreamActive(stream_tmp) == 0) {
+            pool->levels[i] = -1;
+            continue;
+        }
+        obj = stream_tmp->streamobject;
+        v.owner = obj;
+        v.barrier = 0;
+        v.count = 0;
+        Server_sched_touch(&v, (PyObject *)stream_tmp, SCHED_WRITE);
+        if (stream_tmp->serial == 1)
+            Server_sched_touch(&v, (PyObject *)&sched_random_state, SCHED_WRITE);
+        if (stream_tmp->serial >= 2 || Py_TYPE(obj)->tp_traverse == NULL)
+            v.barrier = 1;
+        else
+            Py_TYPE(obj)->tp_traverse(obj, Server_sched_visit, &v);
+
+        if (pool->rescount * 2 >= pool->rescapacity)
+            return -1;
+
+        if (v.barrier) {
+            level = maxlevel + 1;
+            floor = level + 1;
+        }
+        else {
+            level = floor;
+            for (j=0; j<v.count; j++) {
+                res = v.touched[j];
+                if (res->write_level >= level)
+                    level = res->write_level + 1;
+                if (v.modes[j] == SCHED_WRITE && res->read_level >= level)
+                    level = res->read_level + 1;
+            }
+            for (j=0; j<v.count; j++) {
+                res = v.touched[j];
+                if (v.modes[j] == SCHED_WRITE)
+                    res->write_level = level;
+                else if (level > res->read_level)
+                    res->read_level = level;
+            }
+        }
+        pool->levels[i] = level;
+        pool->barrier[i] = v.barrier;
+        if (level > maxlevel)
+            maxlevel = level;
+    }
+    return maxlevel + 1;
+}
+
+/* Computes the active streams, level by level. The computed streams are marked for the
+   post processing, which computes the remaining ones if the parallel processing stops early. */
+static int
+Server_process_parallel(Server *server)
+{
+    int i, l, nlevels, start, end;
+    int edits = server->stream_edits;
+    Stream *stream_tmp;
+    Stream **jobs;
+    PyoWorkerPool *pool = (PyoWorkerPool *)server->pool;
+
+    Server_pool_grow(pool, server->stream_count);
+    pool->sleep = server->sleep_silent;
+    nlevels = Server_sched_levels(server, pool);
+    if (nlevels < 0)
+        return -1;
+
+    /* Counting sort of the streams by level, keeping the list order inside a level. */
+    memset(pool->counts, 0, (nlevels + 1) * sizeof(int));
+    for (i=0; i<server->stream_count; i++) {
+        if (pool->levels[i] >= 0)
+            pool->counts[pool->levels[i]+1]++;
+    }
+    for (l=0; l<nlevels; l++) {
+        pool->counts[l+1] += pool->counts[l];
+    }
+    for (i=0; i<server->stream_count; i++) {
+        if (pool->levels[i] >= 0)
+            pool->order[pool->counts[pool->levels[i]]++] = i;
+    }
+
+    jobs = pool->jobs;
+    start = 0;
+    for (l=0; l<nlevels; l++) {
+        end = pool->counts[l];
+        for (i=start; i<end; i++) {
+            stream_tmp = (Stream *)PyList_GET_ITEM(server->streams, pool->order[i]);
+            stream_tmp->computed = 1;
+            jobs[i-start] = stream_tmp;
+        }
+        if (end - start == 1 && pool->barrier[pool->order[start]]) {
+            Server_call_stream(server, jobs[0]);
+            /* Python code may have modified the streams list, the post processing takes over. */
+            if (server->stream_edits != edits)
+                return 0;
+        }
+        else
+            Server_pool_run(pool, jobs, end - start);
+        start = end;
+    }
     return 0;
 }
 
 /***************************************************/
 /*  Main Processing functions                      */
 
+static void
+Server_increment_duration(Server *server, Stream *stream)
+{
+    if (server->gilfree_running == 0) {
+        Stream_IncrementDurationCount(stream);
+        return;
+    }
+    stream->bufferCount++;
+    if (stream->bufferCount >= stream->duration) {
+        Server_deferStop(server, stream->streamobject);
+        stream->duration = stream->bufferCount = 0;
+    }
+}
+
 static inline void
 Server_process_buffers(Server *server)
 {
     float *out = server->output_buffer;
     MYFLT buffer[server->nchnls][server->bufferSize];
-    int i, j, chnl;
+    int i, j, chnl, active, asleep = 0;
     int nchnls = server->nchnls;
+    int gilfree = server->gilfree_running;
+    int sleep = server->sleep_silent;
     MYFLT amp = server->amp;
     Stream *stream_tmp;
     MYFLT *data;
+    PyGILState_STATE s;
 
     memset(&buffer, 0, sizeof(buffer));
-    PyGILState_STATE s = PyGILState_Ensure();
+    if (gilfree)
+        pthread_mutex_lock(&server->dsp_mutex);
+    else
+        s = PyGILState_Ensure();
+    server->processing = 1;
+    if (server->events_count > 0)
+        Server_process_events(server);
+    Server_collect_midi_events(server);
+    if (server->threads > 1 && server->pool != NULL)
+        Server_process_parallel(server);
     for (i=0; i<server->stream_count; i++) {
         stream_tmp = (Stream *)PyList_GET_ITEM(server->streams, i);
-        if (Stream_getStreamActive(stream_tmp) == 1) {
-            Stream_callFunction(stream_tmp);
+        if ((PyObject *)stream_tmp == Py_None)
+            continue;
+        active = Stream_getStreamActive(stream_tmp);
+        /* Streams already computed by the parallel processing. */
+        if (stream_tmp->computed == 1) {
+            stream_tmp->computed = 0;
+            active = 1;
+        }
+        else if (active == 1)
+            Server_call_stream(server, stream_tmp);
+        else if (sleep == 1) {
+            stream_tmp->asleep = 0;
+            Server_measure_silence(stream_tmp);
+        }
+        if (active == 1) {
+            asleep += stream_tmp->asleep;
             if (Stream_getStreamToDac(stream_tmp) != 0) {
                 data = Stream_getData(stream_tmp);
                 chnl = Stream_getStreamChnl(stream_tmp);
-                for (j=0; j < server->bufferSize; j++) {
-                    buffer[chnl][j] += *data++;
-                }
+                vector_mix(buffer[chnl], data, server->bufferSize);
             }
             if (Stream_getDuration(stream_tmp) != 0) {
-                Stream_IncrementDurationCount(stream_tmp);
+                Server_increment_duration(server, stream_tmp);
             }
         }
         else if (Stream_getBufferCountWait(stream_tmp) != 0)
@@ -1368,7 +2659,15 @@ Server_process_buffers(Server *server)
         Server_process_time(server);
     }
     server->elapsedSamples += server->bufferSize;
-    PyGILState_Release(s);
+    server->midi_count = 0;
+    server->streams_asleep = asleep;
+    server->processing = 0;
+    if (gilfree) {
+        pthread_mutex_unlock(&server->dsp_mutex);
+        Server_wake_callback_thread(server);
+    }
+    else
+        PyGILState_Release(s);
     if (amp != server->lastAmp) {
         server->timeCount = 0;
         server->stepVal = (amp - server->currentAmp) / server->timeStep;
@@ -1385,14 +2684,47 @@ Server_process_buffers(Server *server)
         }
     }
     if (server->record == 1)
-        sf_write_float(server->recfile, out, server->bufferSize * server->nchnls);
+        SfWriter_write(server->recwriter, out, server->bufferSize, Server_isRenderingOffline(server));
+
+}
 
+static void
+Server_send_rms(PyObject *obj, MYFLT *args)
+{
+    Server *server = (Server *)obj;
+    switch (server->nchnls) {
+        case 1:
+            PyObject_CallMethod((PyObject *)server->GUI, "setRms", "f", args[0]);
+            break;
+        case 2:
+            PyObject_CallMethod((PyObject *)server->GUI, "setRms", "ff", args[0], args[1]);
+            break;
+        case 3:
+            PyObject_CallMethod((PyObject *)server->GUI, "setRms", "fff", args[0], args[1], args[2]);
+            break;
+        case 4:
+            PyObject_CallMethod((PyObject *)server->GUI, "setRms", "ffff", args[0], args[1], args[2], args[3]);
+            break;
+        case 5:
+            PyObject_CallMethod((PyObject *)server->GUI, "setRms", "fffff", args[0], args[1], args[2], args[3], args[4]);
+            break;
+        case 6:
+            PyObject_CallMethod((PyObject *)server->GUI, "setRms", "ffffff", args[0], args[1], args[2], args[3], args[4], args[5]);
+            break;
+        case 7:
+            PyObject_CallMethod((PyObject *)server->GUI, "setRms", "fffffff", args[0], args[1], args[2], args[3], args[4], args[5], args[6]);
+            break;
+        case 8:
+            PyObject_CallMethod((PyObject *)server->GUI, "setRms", "ffffffff", args[0], args[1], args[2], args[3], args[4], args[5], args[6], args[7]);
+            break;
+    }
 }
 
 static void
 Server_process_gui(Server *server)
 {
     float rms[server->nchnls];
+    MYFLT args[server->nchnls];
     float *out = server->output_buffer;
     float outAmp;
     int i,j;
@@ -1414,41 +2746,25 @@ Server_process_gui(Server *server)
     else {
         for (j=0; j<server->nchnls; j++) {
             server->lastRms[j] = (rms[j] + server->lastRms[j]) * 0.5;
+            args[j] = server->lastRms[j];
         }
-        switch (server->nchnls) {
-            case 1:
-                PyObject_CallMethod((PyObject *)server->GUI, "setRms", "f", server->lastRms[0]);
-                break;
-            case 2:
-                PyObject_CallMethod((PyObject *)server->GUI, "setRms", "ff", server->lastRms[0], server->lastRms[1]);
-                break;
-            case 3:
-                PyObject_CallMethod((PyObject *)server->GUI, "setRms", "fff", server->lastRms[0], server->lastRms[1], server->lastRms[2]);
-                break;
-            case 4:
-                PyObject_CallMethod((PyObject *)server->GUI, "setRms", "ffff", server->lastRms[0], server->lastRms[1], server->lastRms[2], server->lastRms[3]);
-                break;
-            case 5:
-                PyObject_CallMethod((PyObject *)server->GUI, "setRms", "fffff", server->lastRms[0], server->lastRms[1], server->lastRms[2], server->lastRms[3], server->lastRms[4]);
-                break;
-            case 6:
-                PyObject_CallMethod((PyObject *)server->GUI, "setRms", "ffffff", server->lastRms[0], server->lastRms[1], server->lastRms[2], server->lastRms[3], server->lastRms[4], server->lastRms[5]);
-                break;
-            case 7:
-                PyObject_CallMethod((PyObject *)server->GUI, "setRms", "fffffff", server->lastRms[0], server->lastRms[1], server->lastRms[2], server->lastRms[3], server->lastRms[4], server->lastRms[5], server->lastRms[6]);
-                break;
-            case 8:
-                PyObject_CallMethod((PyObject *)server->GUI, "setRms", "ffffffff", server->lastRms[0], server->lastRms[1], server->lastRms[2], server->lastRms[3], server->lastRms[4], server->lastRms[5], server->lastRms[6], server->lastRms[7]);
-                break;
-        }
+        Server_deferCall(server, (PyObject *)server, Server_send_rms, args, server->nchnls);
         server->gcount = 0;
     }
 }
 
+static void
+Server_send_time(PyObject *obj, MYFLT *args)
+{
+    Server *server = (Server *)obj;
+    PyObject_CallMethod((PyObject *)server->TIME, "setTime", "iiii", (int)args[0], (int)args[1], (int)args[2], (int)args[3]);
+}
+
 static void
 Server_process_time(Server *server)
 {
     int hours, minutes, seconds, milliseconds;
+    MYFLT args[4];
     float sr = server->samplingRate;
     double sampsToSecs;
 
@@ -1463,7 +2779,11 @@ Server_process_time(Server *server)
         hours = minutes / 60;
         minutes = minutes % 60;
         seconds = seconds % 60;
-        PyObject_CallMethod((PyObject *)server->TIME, "setTime", "iiii", hours, minutes, seconds, milliseconds);
+        args[0] = hours;
+        args[1] = minutes;
+        args[2] = seconds;
+        args[3] = milliseconds;
+        Server_deferCall(server, (PyObject *)server, Server_send_time, args, 4);
         server->tcount = 0;
     }
 }
@@ -1525,18 +2845,183 @@ Server_shut_down(Server *self)
         Server_error(self, "Error closing audio backend.\n");
     }
 
+    /* The audio callback is stopped, the recording in progress can be closed. */
+    if (self->record == 1)
+        Server_stop_rec_internal(self);
+    Server_events_clear(self);
+
+    Server_pool_free((PyoWorkerPool *)self->pool);
+    self->pool = NULL;
+    Server_stop_callback_thread(self);
+    self->gilfree_running = 0;
+
     Py_INCREF(Py_None);
     return Py_None;
 }
 
+/* The streams list is indexed by stream id and each stream knows its position in the list, so
+ * a stream is found without scanning the list. A removed stream leaves a hole (None) in the list,
+ * the audio callback skips the holes. The list is compacted from the python thread, once the
+ * holes are numerous enough. */
+#define PYO_STREAM_INDEX_MIN 64
+
+static inline unsigned int
+Server_index_hash(int sid, int size)
+{
+    return ((unsigned int)sid * 2654435761u) & (size - 1);
+}
+
+/* Returns the entry of a stream id in the index or -1. */
+static int
+Server_index_find(Server *self, int sid)
+{
+    unsigned int i;
+
+    if (self->stream_index == NULL)
+        return -1;
+    i = Server_index_hash(sid, self->stream_index_size);
+    while (self->stream_index[i].sid != 0) {
+        if (self->stream_index[i].sid == sid)
+            return i;
+        i = (i + 1) & (self->stream_index_size - 1);
+    }
+    return -1;
+}
+
+/* Adds a stream to the index, at the position `pos` of the list. */
+static void
+Server_index_add(Server *self, PyObject *stream, int pos)
+{
+    int i, oldsize, sid = Stream_getStreamId((Stream *)stream);
+    unsigned int j;
+    PyoStreamSlot *old;
+
+    if ((self->stream_index_count + 1) * 2 > self->stream_index_size) {
+        old = self->stream_index;
+        oldsize = self->stream_index_size;
+        self->stream_index_size = oldsize == 0 ? PYO_STREAM_INDEX_MIN : oldsize * 2;
+        self->stream_index = (PyoStreamSlot *)calloc(self->stream_index_size, sizeof(PyoStreamSlot));
+        for (i=0; i<oldsize; i++) {
+            if (old[i].sid == 0)
+                continue;
+            j = Server_index_hash(old[i].sid, self->stream_index_size);
+            while (self->stream_index[j].sid != 0)
+                j = (j + 1) & (self->stream_index_size - 1);
+            self->stream_index[j] = old[i];
+        }
+        free(old);
+    }
+
+    j = Server_index_hash(sid, self->stream_index_size);
+    while (self->stream_index[j].sid != 0 && self->stream_index[j].sid != sid)
+        j = (j + 1) & (self->stream_index_size - 1);
+    if (self->stream_index[j].sid == 0)
+        self->stream_index_count++;
+    self->stream_index[j].sid = sid;
+    self->stream_index[j].stream = stream;
+    ((Stream *)stream)->pos = pos;
+}
+
+/* Removes an entry, the following entries of the cluster are moved back to keep the probing valid. */
+static void
+Server_index_remove(Server *self, int entry)
+{
+    unsigned int i = entry, j = entry, k, mask = self->stream_index_size - 1;
+
+    for (;;) {
+        j = (j + 1) & mask;
+        if (self->stream_index[j].sid == 0)
+            break;
+        k = Server_index_hash(self->stream_index[j].sid, self->stream_index_size);
+        /* The entry at j can fill the hole at i if its home slot is not in (i, j]. */
+        if ((i <= j) ? (i < k && k <= j) : (i < k || k <= j))
+            continue;
+        self->stream_index[i] = self->stream_index[j];
+        i = j;
+    }
+    self->stream_index[i].sid = 0;
+    self->stream_index_count--;
+}
+
+/* Updates the positions of the streams from `start` to `end` (excluded). */
+static void
+Server_index_range(Server *self, int start, int end)
+{
+    int i;
+    PyObject *stream;
+
+    for (i=start; i<end; i++) {
+        stream = PyList_GET_ITEM(self->streams, i);
+        if (stream != Py_None)
+            ((Stream *)stream)->pos = i;
+    }
+}
+
+static void
+Server_index_clear(Server *self)
+{
+    if (self->stream_index != NULL)
+        memset(self->stream_index, 0, self->stream_index_size * sizeof(PyoStreamSlot));
+    self->stream_index_count = 0;
+    self->stream_holes = 0;
+}
+
+/* Removes the holes of the streams list. Called with the dsp mutex, never from the audio callback. */
+static void
+Server_compact_streams(Server *self)
+{
+    int i, n = 0;
+    PyObject *stream;
+
+    if (self->stream_holes == 0 || self->processing)
+        return;
+    for (i=0; i<self->stream_count; i++) {
+        stream = PyList_GET_ITEM(self->streams, i);
+        /* Swapped with the first hole, the references are kept. */
+        if (stream != Py_None) {
+            if (i != n) {
+                PyList_SET_ITEM(self->streams, i, PyList_GET_ITEM(self->streams, n));
+                PyList_SET_ITEM(self->streams, n, stream);
+            }
+            n++;
+        }
+    }
+    PyList_SetSlice(self->streams, n, self->stream_count, NULL);
+    self->stream_count = n;
+    self->stream_holes = 0;
+    self->stream_edits++;
+    Server_index_range(self, 0, n);
+}
+
+static void
+Server_maybe_compact_streams(Server *self)
+{
+    if (self->stream_holes > PYO_STREAM_INDEX_MIN && self->stream_holes * 2 > self->stream_count)
+        Server_compact_streams(self);
+}
+
 /* handling of PyObjects */
+static void
+Server_flushDataPool(Server *self)
+{
+    int i;
+    for (i=0; i<self->datapool_count; i++) {
+        free(self->datapool[i]);
+    }
+    self->datapool_count = 0;
+}
+
 static int
 Server_traverse(Server *self, visitproc visit, void *arg)
 {
     /* GUI and TIME ? */
+    int i;
     Py_VISIT(self->streams);
     Py_VISIT(self->jackAutoConnectInputPorts);
     Py_VISIT(self->jackAutoConnectOutputPorts);
+    for (i=0; i<self->events_count; i++) {
+        Py_VISIT(self->events[i]);
+    }
     return 0;
 }
 
@@ -1546,6 +3031,7 @@ Server_clear(Server *self)
     Py_CLEAR(self->streams);
     Py_CLEAR(self->jackAutoConnectInputPorts);
     Py_CLEAR(self->jackAutoConnectOutputPorts);
+    Server_events_clear(self);
     return 0;
 }
 
@@ -1558,6 +3044,15 @@ Server_dealloc(Server* self)
     free(self->input_buffer);
     free(self->output_buffer);
     free(self->serverName);
+    RingBuffer_free(self->callbacks);
+    RingQueue_free(self->midiinject);
+    free(self->events);
+    free(self->stream_index);
+    Server_flushDataPool(self);
+    free(self->datapool);
+    pthread_mutex_destroy(&self->dsp_mutex);
+    pthread_mutex_destroy(&self->callback_mutex);
+    pthread_cond_destroy(&self->callback_cond);
     my_server[self->thisServerID] = NULL;
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -1574,9 +3069,11 @@ Server_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     char *audioType = "portaudio";
     char *serverName = "pyo";
 
-    static char *kwlist[] = {"sr", "nchnls", "buffersize", "duplex", "audio", "jackname", "ichnls", NULL};
-    if (! PyArg_ParseTupleAndKeywords(args, kwds, "|diiissi", kwlist,
-            &samplingRate, &nchnls, &bufferSize, &duplex, &audioType, &serverName, &ichnls)) {
+    int  threads = 1;
+
+    static char *kwlist[] = {"sr", "nchnls", "buffersize", "duplex", "audio", "jackname", "ichnls", "threads", NULL};
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, "|diiissii", kwlist,
+            &samplingRate, &nchnls, &bufferSize, &duplex, &audioType, &serverName, &ichnls, &threads)) {
         Py_INCREF(Py_False);
         return Py_False;
     }
@@ -1621,6 +3118,12 @@ Server_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->output_offset = 0;
     self->midiin_count = 0;
     self->midiout_count = 0;
+    self->midi_count = 0;
+    self->midiqueue = NULL;
+    self->midiinject = RingQueue_new(256, sizeof(PyoMidiEvent));
+    self->midi_running = self->midi_quit = 0;
+    self->midi_clock = 0.0;
+    self->midi_clock_valid = 0;
     self->midi_input = -1;
     self->midi_output = -1;
     self->amp = self->resetAmp = 1.;
@@ -1631,8 +3134,39 @@ Server_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->recdur = -1;
     self->recformat = 0;
     self->rectype = 0;
+    self->recsync = SfWriterSyncNever;
+    self->recwriter = NULL;
+    self->recoverruns = 0;
     self->startoffset = 0.0;
+    self->rendering_offline = 0;
+    self->prefetch = 1.0;
     self->globalSeed = 0;
+    self->threads = 1;
+    self->pool = NULL;
+    self->stream_edits = 0;
+    self->sleep_silent = self->streams_asleep = 0;
+    self->stream_holes = 0;
+    self->stream_index = NULL;
+    self->stream_index_size = self->stream_index_count = 0;
+    self->processing = 0;
+    self->gilfree = self->gilfree_running = 0;
+    self->callbacks = NULL;
+    self->callbacks_dropped = 0;
+    self->callback_running = self->callback_quit = 0;
+    self->events = NULL;
+    self->events_count = self->events_size = 0;
+    self->events_order = 0;
+    self->in_event = self->event_offset = 0;
+    self->event_time = 0;
+    self->datapool = NULL;
+    self->datapool_count = self->datapool_bufsize = 0;
+    pthread_mutexattr_t attr;
+    pthread_mutexattr_init(&attr);
+    pthread_mutexattr_settype(&attr, PTHREAD_MUTEX_RECURSIVE);
+    pthread_mutex_init(&self->dsp_mutex, &attr);
+    pthread_mutexattr_destroy(&attr);
+    pthread_mutex_init(&self->callback_mutex, NULL);
+    pthread_cond_init(&self->callback_cond, NULL);
     self->thisServerID = serverID;
     Py_XDECREF(my_server[serverID]);
     my_server[serverID] = (Server *)self;
@@ -1642,14 +3176,16 @@ Server_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 static int
 Server_init(Server *self, PyObject *args, PyObject *kwds)
 {
-    static char *kwlist[] = {"sr", "nchnls", "buffersize", "duplex", "audio", "jackname", "ichnls", NULL};
+    static char *kwlist[] = {"sr", "nchnls", "buffersize", "duplex", "audio", "jackname", "ichnls", "threads", NULL};
 
     char *audioType = "portaudio";
     char *serverName = "pyo";
 
-    if (! PyArg_ParseTupleAndKeywords(args, kwds, "|diiissi", kwlist,
-            &self->samplingRate, &self->nchnls, &self->bufferSize, &self->duplex, &audioType, &serverName, &self->ichnls))
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, "|diiissii", kwlist,
+            &self->samplingRate, &self->nchnls, &self->bufferSize, &self->duplex, &audioType, &serverName, &self->ichnls, &self->threads))
         return -1;
+    if (self->threads < 1)
+        self->threads = 1;
     if (strcmp(audioType, "jack") == 0) {
         self->audio_be_type = PyoJack;
     }
@@ -1966,6 +3502,19 @@ Server_generateSeed(Server *self, int oid)
     return 0;
 }
 
+/* Returns 1 when the server computes faster than real time, soundfile readers can then wait for the disk. */
+int
+Server_isRenderingOffline(Server *self)
+{
+    return (self->audio_be_type == PyoOffline || self->audio_be_type == PyoOfflineNB || self->rendering_offline);
+}
+
+double
+Server_getPrefetch(Server *self)
+{
+    return self->prefetch;
+}
+
 static PyObject *
 Server_setAmp(Server *self, PyObject *arg)
 {
@@ -2047,6 +3596,42 @@ Server_setTimeCallable(Server *self, PyObject *arg)
     return Py_None;
 }
 
+static PyObject *
+Server_setGilFree(Server *self, PyObject *arg)
+{
+    if (self->server_booted) {
+        Server_warning(self, "Can't change the GIL-free mode of a booted server.\n");
+        Py_INCREF(Py_None);
+        return Py_None;
+    }
+    if (arg != NULL) {
+        self->gilfree = PyObject_IsTrue(arg);
+        if (self->gilfree == 1)
+            Server_protect_methods(self);
+    }
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject *
+Server_setSleepWhenSilent(Server *self, PyObject *arg)
+{
+    if (arg != NULL) {
+        self->sleep_silent = PyObject_IsTrue(arg);
+        if (self->sleep_silent == 1)
+            Server_protect_methods(self);
+        self->streams_asleep = 0;
+    }
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject *
+Server_getNumberOfSleepingStreams(Server *self)
+{
+    return PyInt_FromLong(self->streams_asleep);
+}
+
 static PyObject *
 Server_setVerbosity(Server *self, PyObject *arg)
 {
@@ -2062,6 +3647,23 @@ Server_setVerbosity(Server *self, PyObject *arg)
     return Py_None;
 }
 
+static PyObject *
+Server_setPrefetch(Server *self, PyObject *arg)
+{
+    if (arg != NULL) {
+        int check = PyNumber_Check(arg);
+
+        if (check) {
+            self->prefetch = PyFloat_AsDouble(PyNumber_Float(arg));
+            if (self->prefetch < 0.1)
+                self->prefetch = 0.1;
+        }
+    }
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
 static PyObject *
 Server_setStartOffset(Server *self, PyObject *arg)
 {
@@ -2102,6 +3704,8 @@ Server_pm_init(Server *self)
         int num_devices = Pm_CountDevices();
         Server_debug(self, "Portmidi number of devices: %d.\n", num_devices);
         if (num_devices > 0) {
+            /* The input timestamps come from the PortTime clock. */
+            Pt_Start(1, 0, 0);
             if (self->midi_input < num_devices) {
                 if (self->midi_input == -1)
                     self->midi_input = Pm_GetDefaultInputDeviceID();
@@ -2169,7 +3773,7 @@ Server_pm_init(Server *self)
                                      "Portmidi warning: could not open midi output %d (%s): %s\n",
                                      self->midi_output, outinfo->name, Pm_GetErrorText(pmerr));
                             self->withPortMidiOut = 0;
-                            if (Pt_Started())
+                            if (Pt_Started() && self->withPortMidi == 0)
                                 Pt_Stop();
                         }
                         else {
@@ -2205,7 +3809,7 @@ Server_pm_init(Server *self)
                     }
                 }
                 if (self->midiout_count == 0) {
-                    if (Pt_Started())
+                    if (Pt_Started() && self->withPortMidi == 0)
                         Pt_Stop();
                     self->withPortMidiOut = 0;
                 }
@@ -2216,6 +3820,8 @@ Server_pm_init(Server *self)
             }
 
             if (self->withPortMidi == 0 && self->withPortMidiOut == 0) {
+                if (Pt_Started())
+                    Pt_Stop();
                 Pm_Terminate();
                 Server_warning(self, "Portmidi closed.\n");
             }
@@ -2249,7 +3855,9 @@ Server_boot(Server *self, PyObject *arg)
     }
     self->server_started = 0;
     self->stream_count = 0;
+    Server_index_clear(self);
     self->elapsedSamples = 0;
+    RingQueue_clear(self->midiinject);
 
     int needNewBuffer = 0;
     if (arg != NULL && PyBool_Check(arg)) {
@@ -2324,6 +3932,8 @@ Server_boot(Server *self, PyObject *arg)
     }
     if (audioerr == 0) {
         self->server_booted = 1;
+        if (self->threads > 1)
+            self->pool = (void *)Server_pool_new(self, self->threads - 1);
     }
     else {
         self->server_booted = 0;
@@ -2350,33 +3960,49 @@ Server_start(Server *self)
         return Py_None;
     }
 
-    Server_debug(self, "Server_start: number of streams %d\n", self->stream_count);
+    Server_debug(self, "Server_start: number of streams %d\n", self->stream_count - self->stream_holes);
 
     /* Ensure Python is set up for threading */
     PyEval_InitThreads();
 
     self->server_stopped = 0;
     self->server_started = 1;
+    self->gilfree_running = 0;
     self->timeStep = (int)(0.01 * self->samplingRate);
 
     if (self->audio_be_type != PyoOffline && self->audio_be_type != PyoOfflineNB && self->audio_be_type != PyoEmbedded) {
         midierr = Server_pm_init(self);
         Server_debug(self, "PortMidi initialization return code : %d.\n", midierr);
+        if (self->withPortMidi == 1)
+            Server_start_midi_thread(self);
     }
 
     if (self->startoffset > 0.0) {
         Server_message(self,"Rendering %.2f seconds offline...\n", self->startoffset);
         int numBlocks = ceil(self->startoffset * self->samplingRate/self->bufferSize);
         self->lastAmp = 1.0; self->amp = 0.0;
+        self->rendering_offline = 1;
         while (numBlocks-- > 0) {
             offline_process_block((Server *) self);
         }
+        self->rendering_offline = 0;
         Server_message(self,"Offline rendering completed. Start realtime processing.\n");
         self->startoffset = 0.0;
     }
 
     self->amp = self->resetAmp;
 
+    if (self->gilfree == 1) {
+        /* The blocking offline and embedded backends process in a thread already holding the GIL. */
+        if (self->audio_be_type == PyoOffline || self->audio_be_type == PyoEmbedded) {
+            Server_warning(self, "GIL-free mode is not available with this audio backend.\n");
+        }
+        else {
+            Server_start_callback_thread(self);
+            self->gilfree_running = self->callback_running;
+        }
+    }
+
     switch (self->audio_be_type) {
         case PyoPortaudio:
             err = Server_pa_start(self);
@@ -2449,6 +4075,7 @@ Server_stop(Server *self)
     }
     else {
         self->server_stopped = 1;
+        Server_stop_midi_thread(self);
         if (self->withPortMidi == 1) {
             for (i=0; i<self->midiin_count; i++) {
                 Pm_Close(self->midiin[i]);
@@ -2474,9 +4101,9 @@ Server_stop(Server *self)
 static PyObject *
 Server_recordOptions(Server *self, PyObject *args, PyObject *kwds)
 {
-    static char *kwlist[] = {"dur", "filename", "fileformat", "sampletype", NULL};
+    static char *kwlist[] = {"dur", "filename", "fileformat", "sampletype", "sync", NULL};
 
-    if (! PyArg_ParseTupleAndKeywords(args, kwds, "d|sii", kwlist, &self->recdur, &self->recpath, &self->recformat, &self->rectype)) {
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, "d|siii", kwlist, &self->recdur, &self->recpath, &self->recformat, &self->rectype, &self->recsync)) {
         return PyInt_FromLong(-1);
     }
 
@@ -2494,6 +4121,8 @@ Server_start_rec(Server *self, PyObject *args, PyObject *kwds)
     if (! PyArg_ParseTupleAndKeywords(args, kwds, "|s", kwlist, &filename)) {
         return PyInt_FromLong(-1);
     }
+    if (self->record == 1)
+        Server_stop_rec(self, NULL);
     Server_start_rec_internal(self, filename);
 
     Py_INCREF(Py_None);
@@ -2503,6 +4132,9 @@ Server_start_rec(Server *self, PyObject *args, PyObject *kwds)
 static int
 Server_start_rec_internal(Server *self, char *filename)
 {
+    long size;
+    SNDFILE *recfile;
+
     /* Prepare sfinfo */
     self->recinfo.samplerate = (int)self->samplingRate;
     self->recinfo.channels = self->nchnls;
@@ -2566,30 +4198,133 @@ Server_start_rec_internal(Server *self, char *filename)
     /* Open the output file. */
     if (filename == NULL) {
         Server_debug(self, "recpath : %s\n", self->recpath);
-        if (! (self->recfile = sf_open(self->recpath, SFM_WRITE, &self->recinfo))) {
+        if (! (recfile = sf_open(self->recpath, SFM_WRITE, &self->recinfo))) {
             Server_error(self, "Not able to open output file %s.\n", self->recpath);
-            Server_debug(self, "%s\n", sf_strerror(self->recfile));
+            Server_debug(self, "%s\n", sf_strerror(recfile));
             return -1;
         }
     }
     else {
         Server_debug(self, "filename : %s\n", filename);
-        if (! (self->recfile = sf_open(filename, SFM_WRITE, &self->recinfo))) {
+        if (! (recfile = sf_open(filename, SFM_WRITE, &self->recinfo))) {
             Server_error(self, "Not able to open output file %s.\n", filename);
-            Server_debug(self, "%s\n", sf_strerror(self->recfile));
+            Server_debug(self, "%s\n", sf_strerror(recfile));
             return -1;
         }
     }
 
+    /* The frames are written by a background thread, the ring holds the prefetch duration. */
+    size = (long)(self->prefetch * self->samplingRate);
+    if (size < 16384)
+        size = 16384;
+    self->recwriter = SfWriter_new(recfile, self->nchnls, size, 1, self->recsync);
+    self->recoverruns = 0;
+    __sync_synchronize();
     self->record = 1;
     return 0;
 }
 
+/* Stops the recording and returns its writer. The audio thread must not be computing a buffer. */
+static SfWriter *
+Server_detach_rec(Server *self)
+{
+    SfWriter *writer = self->recwriter;
+
+    self->record = 0;
+    self->recwriter = NULL;
+    if (writer != NULL)
+        self->recoverruns = SfWriter_getOverruns(writer);
+    return writer;
+}
+
+static void
+Server_stop_rec_internal(Server *self)
+{
+    SfWriter_close(Server_detach_rec(self));
+}
+
 static PyObject *
 Server_stop_rec(Server *self, PyObject *args)
 {
-    self->record = 0;
-    sf_close(self->recfile);
+    SfWriter *writer;
+
+    Server_lockDsp(self);
+    writer = Server_detach_rec(self);
+    Server_unlockDsp(self);
+
+    /* Waits for the remaining frames to be written on the disk. */
+    Py_BEGIN_ALLOW_THREADS
+    SfWriter_close(writer);
+    Py_END_ALLOW_THREADS
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject *
+Server_getRecOverruns(Server *self)
+{
+    if (self->record == 1)
+        return PyInt_FromLong(SfWriter_getOverruns(self->recwriter));
+    return PyInt_FromLong(self->recoverruns);
+}
+
+/* Events called from an event are scheduled from its time, so that sequences don't drift. */
+static PyObject *
+Server_schedule(Server *self, PyObject *args)
+{
+    double delay;
+    PyObject *callable, *callargs;
+    ScheduledEvent *event;
+
+    if (! PyArg_ParseTuple(args, "dOO!", &delay, &callable, &PyTuple_Type, &callargs))
+        return PyInt_FromLong(-1);
+
+    if (self->server_booted == 0) {
+        Server_error(self, "The Server must be booted to schedule events!\n");
+        Py_INCREF(Py_None);
+        return Py_None;
+    }
+    if (PyType_Ready(&ScheduledEventType) < 0)
+        return NULL;
+
+    event = PyObject_GC_New(ScheduledEvent, &ScheduledEventType);
+    if (event == NULL)
+        return NULL;
+    Py_INCREF(self);
+    event->server = self;
+    Py_INCREF(callable);
+    event->callable = callable;
+    Py_INCREF(callargs);
+    event->args = callargs;
+    event->index = -1;
+    if (delay < 0.0)
+        delay = 0.0;
+
+    Server_lockDsp(self);
+    event->time = (self->in_event ? self->event_time : self->elapsedSamples) + (unsigned long)(delay * self->samplingRate + 0.5);
+    event->order = self->events_order++;
+    Server_events_push(self, event);
+    Server_unlockDsp(self);
+
+    PyObject_GC_Track(event);
+    return (PyObject *)event;
+}
+
+/* Injects a midi event, as if it was received from a midi input, at the time of the current event if any. */
+static PyObject *
+Server_addMidiEvent(Server *self, PyObject *args)
+{
+    int status, data1 = 0, data2 = 0;
+    PyoMidiEvent event;
+
+    if (! PyArg_ParseTuple(args, "i|ii", &status, &data1, &data2))
+        return PyInt_FromLong(-1);
+
+    event.event.message = Pm_Message(status, data1, data2);
+    event.event.timestamp = 0;
+    event.time = self->in_event ? self->event_time : self->elapsedSamples;
+    RingQueue_write(self->midiinject, &event, 1);
 
     Py_INCREF(Py_None);
     return Py_None;
@@ -2608,30 +4343,85 @@ Server_addStream(Server *self, PyObject *args)
         return PyInt_FromLong(-1);
     }
 
+    Server_lockDsp(self);
+    Server_maybe_compact_streams(self);
     PyList_Append(self->streams, tmp);
-
-    self->stream_count++;
+    Server_index_add(self, tmp, self->stream_count++);
+    self->stream_edits++;
+    Server_unlockDsp(self);
 
     Py_INCREF(Py_None);
     return Py_None;
 }
 
+/* Adds a new stream at the end of the processing list. */
+void
+Server_appendStream(Server *self, PyObject *stream)
+{
+    Server_lockDsp(self);
+    Server_maybe_compact_streams(self);
+    PyList_Append(self->streams, stream);
+    Server_index_add(self, stream, self->stream_count++);
+    self->stream_edits++;
+    Server_unlockDsp(self);
+}
+
+/* The pool keeps the data buffers of the deleted objects for the new ones. It only holds
+ * buffers of the current buffer size and is only used with the GIL. */
+#define PYO_DATAPOOL_MAX 4096
+
+MYFLT *
+Server_allocData(Server *self, int size)
+{
+    MYFLT *data;
+
+    if (self->datapool_count > 0 && size == self->datapool_bufsize) {
+        data = self->datapool[--self->datapool_count];
+        memset(data, 0, size * sizeof(MYFLT));
+        return data;
+    }
+    return (MYFLT *)calloc(size, sizeof(MYFLT));
+}
+
+void
+Server_freeData(Server *self, MYFLT *data, int size)
+{
+    if (data == NULL)
+        return;
+    if (size != self->datapool_bufsize) {
+        Server_flushDataPool(self);
+        self->datapool_bufsize = size;
+    }
+    if (self->datapool_count == PYO_DATAPOOL_MAX) {
+        free(data);
+        return;
+    }
+    if (self->datapool == NULL)
+        self->datapool = (MYFLT **)malloc(PYO_DATAPOOL_MAX * sizeof(MYFLT *));
+    self->datapool[self->datapool_count++] = data;
+}
+
 PyObject *
 Server_removeStream(Server *self, int id)
 {
-    int i, sid;
+    int entry, pos;
     Stream *stream_tmp;
 
-    for (i=0; i<self->stream_count; i++) {
-        stream_tmp = (Stream *)PyList_GET_ITEM(self->streams, i);
-        sid = Stream_getStreamId(stream_tmp);
-        if (sid == id) {
-            Server_debug(self, "Removed stream id %d\n", id);
-            PySequence_DelItem(self->streams, i);
-            self->stream_count--;
-            break;
-        }
+    Server_lockDsp(self);
+    entry = Server_index_find(self, id);
+    if (entry >= 0) {
+        stream_tmp = (Stream *)self->stream_index[entry].stream;
+        pos = stream_tmp->pos;
+        Server_debug(self, "Removed stream id %d\n", id);
+        Server_purge_deferred_calls(self, stream_tmp->streamobject);
+        Server_index_remove(self, entry);
+        Py_INCREF(Py_None);
+        PyList_SetItem(self->streams, pos, Py_None);
+        self->stream_holes++;
+        self->stream_edits++;
+        Server_maybe_compact_streams(self);
     }
+    Server_unlockDsp(self);
 
     Py_INCREF(Py_None);
     return Py_None;
@@ -2640,36 +4430,36 @@ Server_removeStream(Server *self, int id)
 PyObject *
 Server_changeStreamPosition(Server *self, PyObject *args)
 {
-    int i, rsid, csid, sid;
-    Stream *ref_stream_tmp, *cur_stream_tmp, *stream_tmp;
+    int i, rpos, cpos;
+    Stream *ref_stream_tmp, *cur_stream_tmp;
 
     if (! PyArg_ParseTuple(args, "OO", &ref_stream_tmp, &cur_stream_tmp))
         return PyInt_FromLong(-1);
 
-    rsid = Stream_getStreamId(ref_stream_tmp);
-    csid = Stream_getStreamId(cur_stream_tmp);
-
-    for (i=0; i<self->stream_count; i++) {
-        stream_tmp = (Stream *)PyList_GET_ITEM(self->streams, i);
-        sid = Stream_getStreamId(stream_tmp);
-        if (sid == csid) {
-            PySequence_DelItem(self->streams, i);
-            self->stream_count--;
-            break;
-        }
+    if (Server_index_find(self, Stream_getStreamId(cur_stream_tmp)) < 0) {
+        Py_INCREF(Py_None);
+        return Py_None;
     }
 
-    for (i=0; i<self->stream_count; i++) {
-        stream_tmp = (Stream *)PyList_GET_ITEM(self->streams, i);
-        sid = Stream_getStreamId(stream_tmp);
-        if (sid == rsid) {
-            break;
-        }
-    }
+    Server_lockDsp(self);
+    cpos = cur_stream_tmp->pos;
+    rpos = Server_index_find(self, Stream_getStreamId(ref_stream_tmp)) < 0 ? self->stream_count : ref_stream_tmp->pos;
 
-    Py_INCREF(cur_stream_tmp);
-    PyList_Insert(self->streams, i, (PyObject *)cur_stream_tmp);
-    self->stream_count++;
+    /* The streams between the old and the new positions are shifted by one. */
+    if (cpos > rpos) {
+        for (i=cpos; i>rpos; i--)
+            PyList_SET_ITEM(self->streams, i, PyList_GET_ITEM(self->streams, i-1));
+        PyList_SET_ITEM(self->streams, rpos, (PyObject *)cur_stream_tmp);
+        Server_index_range(self, rpos, cpos + 1);
+    }
+    else if (cpos < rpos - 1) {
+        for (i=cpos; i<rpos-1; i++)
+            PyList_SET_ITEM(self->streams, i, PyList_GET_ITEM(self->streams, i+1));
+        PyList_SET_ITEM(self->streams, rpos - 1, (PyObject *)cur_stream_tmp);
+        Server_index_range(self, cpos, rpos);
+    }
+    self->stream_edits++;
+    Server_unlockDsp(self);
 
     Py_INCREF(Py_None);
     return Py_None;
@@ -2893,8 +4683,27 @@ Server_getMidiActive(Server *self)
 static PyObject *
 Server_getStreams(Server *self)
 {
-    Py_INCREF(self->streams);
-    return self->streams;
+    int i;
+    PyObject *streams, *stream;
+
+    if (self->stream_holes > 0) {
+        Server_lockDsp(self);
+        Server_compact_streams(self);
+        Server_unlockDsp(self);
+    }
+    if (self->stream_holes == 0) {
+        Py_INCREF(self->streams);
+        return self->streams;
+    }
+
+    /* Called from the audio callback, the holes are left out of a copy of the list. */
+    streams = PyList_New(0);
+    for (i=0; i<self->stream_count; i++) {
+        stream = PyList_GET_ITEM(self->streams, i);
+        if (stream != Py_None)
+            PyList_Append(streams, stream);
+    }
+    return streams;
 }
 
 static PyObject *
@@ -2982,7 +4791,11 @@ static PyMethodDef Server_methods[] = {
     {"setAmpCallable", (PyCFunction)Server_setAmpCallable, METH_O, "Sets the Server's GUI callable object."},
     {"setTimeCallable", (PyCFunction)Server_setTimeCallable, METH_O, "Sets the Server's TIME callable object."},
     {"setVerbosity", (PyCFunction)Server_setVerbosity, METH_O, "Sets the verbosity."},
+    {"setGilFree", (PyCFunction)Server_setGilFree, METH_O, "Sets the audio callback to run without the GIL."},
+    {"setSleepWhenSilent", (PyCFunction)Server_setSleepWhenSilent, METH_O, "Lets the objects sleep while their inputs are silent."},
+    {"getNumberOfSleepingStreams", (PyCFunction)Server_getNumberOfSleepingStreams, METH_NOARGS, "Returns the number of streams skipped during the last buffer."},
     {"setStartOffset", (PyCFunction)Server_setStartOffset, METH_O, "Sets starting time offset."},
+    {"setPrefetch", (PyCFunction)Server_setPrefetch, METH_O, "Sets the duration read ahead from the disk by the soundfile players."},
     {"boot", (PyCFunction)Server_boot, METH_O, "Setup and boot the server."},
     {"shutdown", (PyCFunction)Server_shut_down, METH_NOARGS, "Shut down the server."},
     {"start", (PyCFunction)Server_start, METH_NOARGS, "Starts the server's callback loop."},
@@ -2990,6 +4803,9 @@ static PyMethodDef Server_methods[] = {
     {"recordOptions", (PyCFunction)Server_recordOptions, METH_VARARGS|METH_KEYWORDS, "Sets format settings for offline rendering and global recording."},
     {"recstart", (PyCFunction)Server_start_rec, METH_VARARGS|METH_KEYWORDS, "Start automatic output recording."},
     {"recstop", (PyCFunction)Server_stop_rec, METH_NOARGS, "Stop automatic output recording."},
+    {"getRecOverruns", (PyCFunction)Server_getRecOverruns, METH_NOARGS, "Returns the number of buffers not written in time by the recording."},
+    {"schedule", (PyCFunction)Server_schedule, METH_VARARGS, "Calls a function with arguments after a delay, with sample accuracy."},
+    {"addMidiEvent", (PyCFunction)Server_addMidiEvent, METH_VARARGS, "Adds a midi event to the input queue, as if it was received from a midi device."},
     {"addStream", (PyCFunction)Server_addStream, METH_VARARGS, "Adds an audio stream to the server. \
                                                                 This is for internal use and must never be called by the user."},
     {"removeStream", (PyCFunction)Server_removeStream, METH_VARARGS, "Adds an audio stream to the server. \
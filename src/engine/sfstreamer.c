@@ -0,0 +1,453 @@
+/**************************************************************************
+ * Copyright 2009-2015 Olivier Belanger                                   *
+ *                                                                        *
+ * This file is part of pyo, a python module to help digital signal       *
+ * processing script creation.                                            *
+ *                                                                        *
+ * pyo is free software: you can redistribute it and/or modify            *
+ * it under the terms of the GNU Lesser General Public License as         *
+ * published by the Free Software Foundation, either version 3 of the     *
+ * License, or (at your option) any later version.                        *
+ *                                                                        *
+ * pyo is distributed in the hope that it will be useful,                 *
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of         *
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the          *
+ * GNU Lesser General Public License for more details.                    *
+ *                                                                        *
+ * You should have received a copy of the GNU Lesser General Public       *
+ * License along with pyo.  If not, see <http://www.gnu.org/licenses/>.   *
+ *                                                                        *
+ * Disk streaming for the soundfile players. A single background thread   *
+ * reads the sound files ahead of the audio thread in a prefetch ring     *
+ * per file and keeps the loop points in memory, so the audio callback    *
+ * never touches the disk.                                                *
+ *                                                                        *
+ * The ring holds the frames [start, end) of the file. Only the disk      *
+ * thread moves the window. Growing it never touches frames the reader    *
+ * can see, shrinking it bumps a version number that the reader checks    *
+ * after each copy (seqlock), so the audio thread never waits on a lock.  *
+ *************************************************************************/
+
+#include <stdlib.h>
+#include <string.h>
+#include <sys/time.h>
+#include "sfstreamer.h"
+
+#define SF_BARRIER() __sync_synchronize()
+
+/* Maximum number of frames read from a file in one pass of the disk thread. */
+#define SFSTREAMER_CHUNK 8192
+
+static pthread_mutex_t streamer_mutex = PTHREAD_MUTEX_INITIALIZER;
+static pthread_cond_t streamer_cond = PTHREAD_COND_INITIALIZER;
+static SfStreamer *streamer_list = NULL;
+static int streamer_running = 0;
+
+/* Reads `frames` frames from the file, zero-padded past the end of the sound. */
+static void
+SfStreamer_readFile(SfStreamer *self, long position, MYFLT *buffer, long frames)
+{
+    long i, got = 0;
+
+    pthread_mutex_lock(&self->sf_mutex);
+    if (sf_seek(self->sf, position, SEEK_SET) >= 0)
+        got = (long)SF_READ(self->sf, buffer, frames * self->chnls);
+    pthread_mutex_unlock(&self->sf_mutex);
+    if (got < 0)
+        got = 0;
+    for (i=got; i<(frames * self->chnls); i++) {
+        buffer[i] = 0.0;
+    }
+}
+
+/* Disk thread only. Moves the window over frames that may already be in use by the reader. */
+static void
+SfStreamer_setWindow(SfStreamer *self, long start, long end)
+{
+    self->version++;
+    SF_BARRIER();
+    self->start = start;
+    self->end = end;
+    SF_BARRIER();
+    self->version++;
+}
+
+static void
+SfStreamer_fillCache(SfStreamer *self, SfStreamerCache *cache, long position, int direction)
+{
+    long first, frames = self->size / 2;
+
+    if (direction >= 0)
+        first = position;
+    else
+        first = position + 2 - frames;
+    if (first < 0)
+        first = 0;
+    if (first + frames > self->frames)
+        frames = self->frames - first;
+    if (frames < 0)
+        frames = 0;
+
+    cache->version++;
+    SF_BARRIER();
+    SfStreamer_readFile(self, first, cache->data, frames);
+    cache->start = first;
+    cache->frames = frames;
+    SF_BARRIER();
+    cache->version++;
+}
+
+/* Disk thread only. Returns 1 if some reading was done. */
+static int
+SfStreamer_service(SfStreamer *self)
+{
+    int i, busy = 0;
+    long position, start, end, limit, slot, n, margin = self->size / 8;
+    SfStreamerCache *cache;
+
+    /* Loop points first, they will be needed as soon as the reader wraps around. */
+    for (i=0; i<2; i++) {
+        cache = &self->cache[i];
+        if (cache->requested) {
+            cache->requested = 0;
+            SF_BARRIER();
+            SfStreamer_fillCache(self, cache, cache->request, cache->request_dir);
+            busy = 1;
+        }
+    }
+
+    position = self->position;
+    start = self->start;
+    end = self->end;
+
+    if (self->direction >= 0) {
+        limit = position - margin;
+        if (limit < 0)
+            limit = 0;
+        if (position < start || position > end) {
+            SfStreamer_setWindow(self, limit, limit);
+            start = end = limit;
+        }
+        else if (limit > start) {
+            SfStreamer_setWindow(self, limit, end);
+            start = limit;
+        }
+        n = self->size - (end - start);
+        if (n > self->frames - end)
+            n = self->frames - end;
+        if (n > SFSTREAMER_CHUNK)
+            n = SFSTREAMER_CHUNK;
+        if (n > 0) {
+            slot = end % self->size;
+            if (n > self->size - slot)
+                n = self->size - slot;
+            SfStreamer_readFile(self, end, self->ring + slot * self->chnls, n);
+            SF_BARRIER();
+            self->end = end + n;
+            busy = 1;
+        }
+    }
+    else {
+        limit = position + margin;
+        if (limit > self->frames)
+            limit = self->frames;
+        if (position < start || position > end) {
+            SfStreamer_setWindow(self, limit, limit);
+            start = end = limit;
+        }
+        else if (limit < end) {
+            SfStreamer_setWindow(self, start, limit);
+            end = limit;
+        }
+        n = self->size - (end - start);
+        if (n > start)
+            n = start;
+        if (n > SFSTREAMER_CHUNK)
+            n = SFSTREAMER_CHUNK;
+        if (n > 0) {
+            slot = start % self->size;
+            if (slot == 0)
+                slot = self->size;
+            if (n > slot)
+                n = slot;
+            SfStreamer_readFile(self, start - n, self->ring + (slot - n) * self->chnls, n);
+            SF_BARRIER();
+            self->start = start - n;
+            busy = 1;
+        }
+    }
+    return busy;
+}
+
+static void *
+SfStreamer_thread(void *arg)
+{
+    int busy;
+    SfStreamer *streamer;
+    struct timeval now;
+    struct timespec timeout;
+
+    pthread_mutex_lock(&streamer_mutex);
+    while (streamer_list != NULL) {
+        busy = 0;
+        for (streamer=streamer_list; streamer!=NULL; streamer=streamer->next) {
+            busy += SfStreamer_service(streamer);
+        }
+        if (busy == 0) {
+            gettimeofday(&now, NULL);
+            timeout.tv_sec = now.tv_sec;
+            timeout.tv_nsec = (now.tv_usec + 10000) * 1000;
+            if (timeout.tv_nsec >= 1000000000) {
+                timeout.tv_sec++;
+                timeout.tv_nsec -= 1000000000;
+            }
+            pthread_cond_timedwait(&streamer_cond, &streamer_mutex, &timeout);
+        }
+    }
+    streamer_running = 0;
+    pthread_mutex_unlock(&streamer_mutex);
+    return NULL;
+}
+
+/* Never blocks: if the disk thread is busy, it will see the new position on its next pass. */
+static void
+SfStreamer_wake()
+{
+    if (pthread_mutex_trylock(&streamer_mutex) == 0) {
+        pthread_cond_signal(&streamer_cond);
+        pthread_mutex_unlock(&streamer_mutex);
+    }
+}
+
+/* Copies frames from the ring, returns the number of frames copied from `position`. */
+static long
+SfStreamer_copyRing(SfStreamer *self, long position, MYFLT *buffer, long frames)
+{
+    long start, end, slot, first;
+    unsigned int version = self->version;
+
+    if (version & 1)
+        return 0;
+    SF_BARRIER();
+    start = self->start;
+    end = self->end;
+    if (position < start || position >= end)
+        return 0;
+    if (frames > end - position)
+        frames = end - position;
+
+    slot = position % self->size;
+    first = self->size - slot;
+    if (frames <= first)
+        memcpy(buffer, self->ring + slot * self->chnls, frames * self->chnls * sizeof(MYFLT));
+    else {
+        memcpy(buffer, self->ring + slot * self->chnls, first * self->chnls * sizeof(MYFLT));
+        memcpy(buffer + first * self->chnls, self->ring, (frames - first) * self->chnls * sizeof(MYFLT));
+    }
+    SF_BARRIER();
+    if (self->version != version)
+        return 0;
+    return frames;
+}
+
+static long
+SfStreamer_copyCache(SfStreamer *self, SfStreamerCache *cache, long position, MYFLT *buffer, long frames)
+{
+    long start, end;
+    unsigned int version = cache->version;
+
+    if (version & 1)
+        return 0;
+    SF_BARRIER();
+    start = cache->start;
+    end = start + cache->frames;
+    if (position < start || position >= end)
+        return 0;
+    if (frames > end - position)
+        frames = end - position;
+    memcpy(buffer, cache->data + (position - start) * self->chnls, frames * self->chnls * sizeof(MYFLT));
+    SF_BARRIER();
+    if (cache->version != version)
+        return 0;
+    return frames;
+}
+
+SfStreamer *
+SfStreamer_new(SNDFILE *sf, int chnls, long frames, long size, long position, int blocking)
+{
+    int i;
+    long n, slot;
+    pthread_t thread;
+    SfStreamer *self;
+
+    self = (SfStreamer *)malloc(sizeof(SfStreamer));
+    self->sf = sf;
+    self->chnls = chnls;
+    self->frames = frames;
+    self->blocking = blocking;
+    pthread_mutex_init(&self->sf_mutex, NULL);
+    self->size = size;
+    self->ring = (MYFLT *)calloc(size * chnls, sizeof(MYFLT));
+    self->version = 0;
+    self->direction = 1;
+    self->underruns = 0;
+    self->next_cache = 0;
+    for (i=0; i<2; i++) {
+        self->cache[i].data = (MYFLT *)calloc((size / 2) * chnls, sizeof(MYFLT));
+        self->cache[i].start = self->cache[i].frames = 0;
+        self->cache[i].request = -1;
+        self->cache[i].request_dir = 0;
+        self->cache[i].requested = 0;
+        self->cache[i].version = 0;
+    }
+
+    /* Prefill the ring before the audio thread can see the object. */
+    if (position < 0 || position >= frames)
+        position = 0;
+    n = frames - position;
+    if (n > size)
+        n = size;
+    slot = position % size;
+    if (n > size - slot) {
+        SfStreamer_readFile(self, position, self->ring + slot * chnls, size - slot);
+        SfStreamer_readFile(self, position + size - slot, self->ring, n - (size - slot));
+    }
+    else
+        SfStreamer_readFile(self, position, self->ring + slot * chnls, n);
+    self->position = self->start = position;
+    self->end = position + n;
+
+    pthread_mutex_lock(&streamer_mutex);
+    self->next = streamer_list;
+    streamer_list = self;
+    if (streamer_running == 0) {
+        if (pthread_create(&thread, NULL, SfStreamer_thread, NULL) == 0) {
+            pthread_detach(thread);
+            streamer_running = 1;
+        }
+    }
+    pthread_mutex_unlock(&streamer_mutex);
+
+    return self;
+}
+
+/* The caller keeps the ownership of the SNDFILE handle. */
+void
+SfStreamer_free(SfStreamer *self)
+{
+    int i;
+    SfStreamer **tmp;
+
+    if (self == NULL)
+        return;
+
+    pthread_mutex_lock(&streamer_mutex);
+    for (tmp=&streamer_list; *tmp!=NULL; tmp=&(*tmp)->next) {
+        if (*tmp == self) {
+            *tmp = self->next;
+            break;
+        }
+    }
+    pthread_mutex_unlock(&streamer_mutex);
+
+    pthread_mutex_destroy(&self->sf_mutex);
+    free(self->ring);
+    for (i=0; i<2; i++) {
+        free(self->cache[i].data);
+    }
+    free(self);
+}
+
+/* Audio thread. Fills `buffer` with `frames` interleaved frames starting at `position`.
+ * `direction` tells the disk thread where to read next (negative when reading backward).
+ * Frames outside of the sound are zeros. Returns the number of frames that were missing
+ * (underrun), always 0 in blocking mode where missing frames are read from the file.
+ * A NULL streamer (the sound could not be opened) has no channel and reads nothing. */
+int
+SfStreamer_read(SfStreamer *self, long position, MYFLT *buffer, int frames, int direction)
+{
+    int i;
+    long n, f, got, done = 0, missing = 0;
+
+    if (self == NULL)
+        return frames;
+
+    if (direction < 0) {
+        self->direction = -1;
+        self->position = position + frames;
+    }
+    else {
+        self->direction = 1;
+        self->position = position;
+    }
+
+    while (done < frames) {
+        f = position + done;
+        n = frames - done;
+        if (f < 0 || f >= self->frames) {
+            if (f < 0 && n > -f)
+                n = -f;
+            memset(buffer + done * self->chnls, 0, n * self->chnls * sizeof(MYFLT));
+        }
+        else {
+            if (n > self->frames - f)
+                n = self->frames - f;
+            got = SfStreamer_copyRing(self, f, buffer + done * self->chnls, n);
+            for (i=0; i<2 && got == 0; i++) {
+                got = SfStreamer_copyCache(self, &self->cache[i], f, buffer + done * self->chnls, n);
+            }
+            if (got > 0)
+                n = got;
+            else if (self->blocking)
+                SfStreamer_readFile(self, f, buffer + done * self->chnls, n);
+            else {
+                memset(buffer + done * self->chnls, 0, n * self->chnls * sizeof(MYFLT));
+                missing += n;
+            }
+        }
+        done += n;
+    }
+
+    if (missing > 0)
+        self->underruns++;
+    SfStreamer_wake();
+    return (int)missing;
+}
+
+/* Tells the disk thread where the next reads will happen (ie. when the playback restarts). */
+void
+SfStreamer_seek(SfStreamer *self, long position, int direction)
+{
+    self->direction = direction < 0 ? -1 : 1;
+    self->position = position;
+    SfStreamer_wake();
+}
+
+/* Keeps the frames around a loop point in memory. The last two loop points requested are kept,
+ * one for the current segment and one for the next. Must always be called from the same thread. */
+void
+SfStreamer_setLoopPoint(SfStreamer *self, long position, int direction)
+{
+    int i;
+    SfStreamerCache *cache;
+
+    direction = direction < 0 ? -1 : 1;
+    for (i=0; i<2; i++) {
+        if (self->cache[i].request == position && self->cache[i].request_dir == direction)
+            return;
+    }
+
+    cache = &self->cache[self->next_cache];
+    self->next_cache = (self->next_cache + 1) % 2;
+    cache->request = position;
+    cache->request_dir = direction;
+    SF_BARRIER();
+    cache->requested = 1;
+    SfStreamer_wake();
+}
+
+long
+SfStreamer_getUnderruns(SfStreamer *self)
+{
+    return self->underruns;
+}
@@ -0,0 +1,205 @@
+/**************************************************************************
+ * Copyright 2009-2015 Olivier Belanger                                   *
+ *                                                                        *
+ * This file is part of pyo, a python module to help digital signal       *
+ * processing script creation.                                            *
+ *                                                                        *
+ * pyo is free software: you can redistribute it and/or modify            *
+ * it under the terms of the GNU Lesser General Public License as         *
+ * published by the Free Software Foundation, either version 3 of the     *
+ * License, or (at your option) any later version.                        *
+ *                                                                        *
+ * pyo is distributed in the hope that it will be useful,                 *
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of         *
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the          *
+ * GNU Lesser General Public License for more details.                    *
+ *                                                                        *
+ * You should have received a copy of the GNU Lesser General Public       *
+ * License along with pyo.  If not, see <http://www.gnu.org/licenses/>.   *
+ *                                                                        *
+ * Disk writing for the recordings. The audio thread pushes its frames in *
+ * a lock-free ring per file and a single background thread writes them  *
+ * to the disk, so the audio callback never waits on the disk.            *
+ *                                                                        *
+ * The rings are only consumed with the list mutex held (by the writing   *
+ * thread, or by the audio thread when rendering offline) or after the    *
+ * writer has been removed from the list, so there is always a single     *
+ * consumer at a time.                                                    *
+ *************************************************************************/
+
+#include <stdlib.h>
+#include <string.h>
+#include <pthread.h>
+#include <sys/time.h>
+#include "sfwriter.h"
+
+/* Maximum number of frames written to a file in one pass of the writing thread. */
+#define SFWRITER_CHUNK 8192
+
+static pthread_mutex_t writer_mutex = PTHREAD_MUTEX_INITIALIZER;
+static pthread_cond_t writer_cond = PTHREAD_COND_INITIALIZER;
+static SfWriter *writer_list = NULL;
+static int writer_running = 0;
+
+/* Writes at most `limit` frames waiting in the ring (all of them if `limit` is negative).
+ * Returns the number of frames written. */
+static long
+SfWriter_flush(SfWriter *self, long limit)
+{
+    int n;
+    long done = 0;
+
+    while (limit < 0 || done < limit) {
+        n = SFWRITER_CHUNK;
+        if (limit >= 0 && n > limit - done)
+            n = (int)(limit - done);
+        n = RingBuffer_read(self->ring, self->chunk, n);
+        if (n == 0)
+            break;
+        if (self->single)
+            sf_write_float(self->sf, (float *)self->chunk, n * self->chnls);
+        else
+            SF_WRITE(self->sf, (MYFLT *)self->chunk, n * self->chnls);
+        done += n;
+    }
+    if (done > 0 && self->sync == SfWriterSyncAlways)
+        sf_write_sync(self->sf);
+    return done;
+}
+
+static void *
+SfWriter_thread(void *arg)
+{
+    long busy;
+    SfWriter *writer;
+    struct timeval now;
+    struct timespec timeout;
+
+    pthread_mutex_lock(&writer_mutex);
+    while (writer_list != NULL) {
+        busy = 0;
+        for (writer=writer_list; writer!=NULL; writer=writer->next) {
+            busy += SfWriter_flush(writer, SFWRITER_CHUNK);
+        }
+        if (busy == 0) {
+            gettimeofday(&now, NULL);
+            timeout.tv_sec = now.tv_sec;
+            timeout.tv_nsec = (now.tv_usec + 10000) * 1000;
+            if (timeout.tv_nsec >= 1000000000) {
+                timeout.tv_sec++;
+                timeout.tv_nsec -= 1000000000;
+            }
+            pthread_cond_timedwait(&writer_cond, &writer_mutex, &timeout);
+        }
+    }
+    writer_running = 0;
+    pthread_mutex_unlock(&writer_mutex);
+    return NULL;
+}
+
+/* Never blocks: if the writing thread is busy, it will see the new frames on its next pass. */
+static void
+SfWriter_wake()
+{
+    if (pthread_mutex_trylock(&writer_mutex) == 0) {
+        pthread_cond_signal(&writer_cond);
+        pthread_mutex_unlock(&writer_mutex);
+    }
+}
+
+/* Takes the ownership of the SNDFILE handle, it is closed by SfWriter_close.
+ * `size` is the capacity of the ring, in frames. */
+SfWriter *
+SfWriter_new(SNDFILE *sf, int chnls, long size, int single, int sync)
+{
+    int framesize;
+    pthread_t thread;
+    SfWriter *self;
+
+    framesize = chnls * (single ? sizeof(float) : sizeof(MYFLT));
+
+    self = (SfWriter *)malloc(sizeof(SfWriter));
+    self->sf = sf;
+    self->chnls = chnls;
+    self->single = single;
+    self->sync = sync;
+    self->ring = RingBuffer_new((int)size, framesize);
+    self->chunk = (char *)malloc(SFWRITER_CHUNK * framesize);
+    self->overruns = 0;
+
+    pthread_mutex_lock(&writer_mutex);
+    self->next = writer_list;
+    writer_list = self;
+    if (writer_running == 0) {
+        if (pthread_create(&thread, NULL, SfWriter_thread, NULL) == 0) {
+            pthread_detach(thread);
+            writer_running = 1;
+        }
+    }
+    pthread_mutex_unlock(&writer_mutex);
+
+    return self;
+}
+
+/* Writes the remaining frames, closes the file and frees the writer. Blocks until everything
+ * is on the disk. The audio thread must not push frames in this writer anymore. */
+void
+SfWriter_close(SfWriter *self)
+{
+    SfWriter **tmp;
+
+    if (self == NULL)
+        return;
+
+    pthread_mutex_lock(&writer_mutex);
+    for (tmp=&writer_list; *tmp!=NULL; tmp=&(*tmp)->next) {
+        if (*tmp == self) {
+            *tmp = self->next;
+            break;
+        }
+    }
+    pthread_mutex_unlock(&writer_mutex);
+
+    SfWriter_flush(self, -1);
+    if (self->sync == SfWriterSyncOnClose)
+        sf_write_sync(self->sf);
+    sf_close(self->sf);
+    RingBuffer_free(self->ring);
+    free(self->chunk);
+    free(self);
+}
+
+/* Audio thread. Pushes `count` interleaved frames (floats or MYFLTs, as given to SfWriter_new).
+ * If the ring is full, the frames that don't fit are dropped and the overrun is counted, unless
+ * `blocking` is true (offline rendering), then the ring is first emptied to the disk.
+ * Returns the number of frames dropped. */
+int
+SfWriter_write(SfWriter *self, const void *frames, int count, int blocking)
+{
+    int written;
+
+    if (self == NULL)
+        return count;
+
+    written = RingBuffer_write(self->ring, frames, count);
+    if (written < count && blocking) {
+        pthread_mutex_lock(&writer_mutex);
+        SfWriter_flush(self, -1);
+        pthread_mutex_unlock(&writer_mutex);
+        written += RingBuffer_write(self->ring, (const char *)frames + written * self->ring->itemsize, count - written);
+    }
+    if (written < count)
+        self->overruns++;
+
+    /* Otherwise the writing thread will find the frames on its next periodic pass. */
+    if (RingBuffer_readAvailable(self->ring) >= (int)(self->ring->size / 2))
+        SfWriter_wake();
+
+    return count - written;
+}
+
+long
+SfWriter_getOverruns(SfWriter *self)
+{
+    return self->overruns;
+}
@@ -109,9 +109,66 @@ void Stream_setFunctionPtr(Stream *self, void *ptr)
     self->funcptr = ptr;
 }
 
-void Stream_callFunction(Stream *self)
+void Stream_setResetFunctionPtr(Stream *self, void *ptr)
+{
+    self->resetfuncptr = ptr;
+}
+
+/* Called by the objects with a tail before they apply mul and add. The server reads and
+ * clears the flag, a ringing object does not sleep even if mul makes its output silent. */
+void Stream_measureRinging(Stream *self)
+{
+    int i;
+
+    for (i=0; i<self->bufsize; i++) {
+        if (self->data[i] > PYO_SILENCE || self->data[i] < -PYO_SILENCE) {
+            self->ringing = 1;
+            return;
+        }
+    }
+}
+
+/* Audio object, as declared with pyo_audio_HEAD. */
+typedef struct {
+    pyo_audio_HEAD
+} PyoAudioObject;
+
+/* At control rate, the object computes a single sample, as if the sampling rate was the
+   rate of the buffers. The buffer is filled with a linear ramp from the previous value. */
+static void
+Stream_callControlRate(Stream *self)
 {
+    int i, bufsize;
+    double sr;
+    MYFLT value, inc;
+    PyoAudioObject *obj = (PyoAudioObject *)self->streamobject;
+
+    bufsize = obj->bufsize;
+    sr = obj->sr;
+    obj->bufsize = 1;
+    obj->sr = sr / bufsize;
     (*self->funcptr)(self->streamobject);
+    obj->bufsize = bufsize;
+    obj->sr = sr;
+
+    value = self->data[0];
+    if (self->krate == 1) {
+        self->klast = value;
+        self->krate = 2;
+    }
+    inc = (value - self->klast) / bufsize;
+    for (i=0; i<bufsize; i++) {
+        self->data[i] = self->klast + inc * (i + 1);
+    }
+    self->klast = value;
+}
+
+void Stream_callFunction(Stream *self)
+{
+    if (self->krate != 0)
+        Stream_callControlRate(self);
+    else
+        (*self->funcptr)(self->streamobject);
 }
 
 void Stream_IncrementBufferCount(Stream *self)
@@ -142,6 +199,22 @@ Stream_getId(Stream *self) {
     return Py_BuildValue("i", self->sid);
 }
 
+static PyObject *
+Stream_setControlRate(Stream *self, PyObject *arg) {
+    if (self->kcapable == 0) {
+        Py_INCREF(Py_False);
+        return Py_False;
+    }
+    self->krate = PyObject_IsTrue(arg);
+    Py_INCREF(Py_True);
+    return Py_True;
+}
+
+static PyObject *
+Stream_getControlRate(Stream *self) {
+    return PyBool_FromLong(self->krate != 0);
+}
+
 PyObject *
 Stream_getStreamObject(Stream *self)
 {
@@ -178,6 +251,8 @@ Stream_isOutputting(Stream *self)
 static PyMethodDef Stream_methods[] = {
 {"getValue", (PyCFunction)Stream_getValue, METH_NOARGS, "Returns the first sample of the current buffer."},
 {"getId", (PyCFunction)Stream_getId, METH_NOARGS, "Returns the ID of assigned to this stream."},
+{"setControlRate", (PyCFunction)Stream_setControlRate, METH_O, "Computes the object at control rate. Returns False if the object can't."},
+{"getControlRate", (PyCFunction)Stream_getControlRate, METH_NOARGS, "Returns True if the object is computed at control rate."},
 {"getStreamObject", (PyCFunction)Stream_getStreamObject, METH_NOARGS, "Returns the object associated with this stream."},
 {"isPlaying", (PyCFunction)Stream_isPlaying, METH_NOARGS, "Returns True if the stream is playing, otherwise, returns False."},
 {"isOutputting", (PyCFunction)Stream_isOutputting, METH_NOARGS, "Returns True if the stream outputs to dac, otherwise, returns False."},
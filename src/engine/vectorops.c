@@ -0,0 +1,279 @@
+/**************************************************************************
+ * Copyright 2009-2015 Olivier Belanger                                   *
+ *                                                                        *
+ * This file is part of pyo, a python module to help digital signal       *
+ * processing script creation.                                            *
+ *                                                                        *
+ * pyo is free software: you can redistribute it and/or modify            *
+ * it under the terms of the GNU Lesser General Public License as         *
+ * published by the Free Software Foundation, either version 3 of the     *
+ * License, or (at your option) any later version.                        *
+ *                                                                        *
+ * pyo is distributed in the hope that it will be useful,                 *
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of         *
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the          *
+ * GNU Lesser General Public License for more details.                    *
+ *                                                                        *
+ * You should have received a copy of the GNU Lesser General Public       *
+ * License along with pyo.  If not, see <http://www.gnu.org/licenses/>.   *
+ *************************************************************************/
+
+#include "pyomodule.h"
+
+/* Instruction set, chosen at build time from the compiler target. */
+#if defined(__AVX__)
+#include <immintrin.h>
+#ifndef USE_DOUBLE
+#define VWIDTH 8
+#define VTYPE __m256
+#define VLOAD _mm256_loadu_ps
+#define VSTORE _mm256_storeu_ps
+#define VSET1 _mm256_set1_ps
+#define VADD _mm256_add_ps
+#define VSUB _mm256_sub_ps
+#define VMUL _mm256_mul_ps
+#define VDIV _mm256_div_ps
+#define VMIN _mm256_min_ps
+#define VMAX _mm256_max_ps
+#define VINSIDE(x, lo, hi) _mm256_and_ps(_mm256_cmp_ps(x, hi, _CMP_LT_OQ), _mm256_cmp_ps(x, lo, _CMP_GT_OQ))
+#define VSELECT(mask, a, b) _mm256_blendv_ps(b, a, mask)
+#else
+#define VWIDTH 4
+#define VTYPE __m256d
+#define VLOAD _mm256_loadu_pd
+#define VSTORE _mm256_storeu_pd
+#define VSET1 _mm256_set1_pd
+#define VADD _mm256_add_pd
+#define VSUB _mm256_sub_pd
+#define VMUL _mm256_mul_pd
+#define VDIV _mm256_div_pd
+#define VMIN _mm256_min_pd
+#define VMAX _mm256_max_pd
+#define VINSIDE(x, lo, hi) _mm256_and_pd(_mm256_cmp_pd(x, hi, _CMP_LT_OQ), _mm256_cmp_pd(x, lo, _CMP_GT_OQ))
+#define VSELECT(mask, a, b) _mm256_blendv_pd(b, a, mask)
+#endif
+
+#elif defined(__SSE2__) || defined(_M_X64) || (defined(_M_IX86_FP) && _M_IX86_FP >= 2)
+#include <emmintrin.h>
+#ifndef USE_DOUBLE
+#define VWIDTH 4
+#define VTYPE __m128
+#define VLOAD _mm_loadu_ps
+#define VSTORE _mm_storeu_ps
+#define VSET1 _mm_set1_ps
+#define VADD _mm_add_ps
+#define VSUB _mm_sub_ps
+#define VMUL _mm_mul_ps
+#define VDIV _mm_div_ps
+#define VMIN _mm_min_ps
+#define VMAX _mm_max_ps
+#define VINSIDE(x, lo, hi) _mm_and_ps(_mm_cmplt_ps(x, hi), _mm_cmpgt_ps(x, lo))
+#define VSELECT(mask, a, b) _mm_or_ps(_mm_and_ps(mask, a), _mm_andnot_ps(mask, b))
+#else
+#define VWIDTH 2
+#define VTYPE __m128d
+#define VLOAD _mm_loadu_pd
+#define VSTORE _mm_storeu_pd
+#define VSET1 _mm_set1_pd
+#define VADD _mm_add_pd
+#define VSUB _mm_sub_pd
+#define VMUL _mm_mul_pd
+#define VDIV _mm_div_pd
+#define VMIN _mm_min_pd
+#define VMAX _mm_max_pd
+#define VINSIDE(x, lo, hi) _mm_and_pd(_mm_cmplt_pd(x, hi), _mm_cmpgt_pd(x, lo))
+#define VSELECT(mask, a, b) _mm_or_pd(_mm_and_pd(mask, a), _mm_andnot_pd(mask, b))
+#endif
+
+#elif defined(__ARM_NEON) && defined(__aarch64__)
+#include <arm_neon.h>
+#ifndef USE_DOUBLE
+#define VWIDTH 4
+#define VTYPE float32x4_t
+#define VLOAD vld1q_f32
+#define VSTORE vst1q_f32
+#define VSET1 vdupq_n_f32
+#define VADD vaddq_f32
+#define VSUB vsubq_f32
+#define VMUL vmulq_f32
+#define VDIV vdivq_f32
+#define VMIN vminq_f32
+#define VMAX vmaxq_f32
+#define VINSIDE(x, lo, hi) vandq_u32(vcltq_f32(x, hi), vcgtq_f32(x, lo))
+#define VSELECT(mask, a, b) vbslq_f32(mask, a, b)
+#else
+#define VWIDTH 2
+#define VTYPE float64x2_t
+#define VLOAD vld1q_f64
+#define VSTORE vst1q_f64
+#define VSET1 vdupq_n_f64
+#define VADD vaddq_f64
+#define VSUB vsubq_f64
+#define VMUL vmulq_f64
+#define VDIV vdivq_f64
+#define VMIN vminq_f64
+#define VMAX vmaxq_f64
+#define VINSIDE(x, lo, hi) vandq_u64(vcltq_f64(x, hi), vcgtq_f64(x, lo))
+#define VSELECT(mask, a, b) vbslq_f64(mask, a, b)
+#endif
+
+#else
+#define VWIDTH 1
+#endif
+
+/* Divisors closer to 0 than this are replaced by it. */
+#define VECTOR_MIN_DIV 0.00001
+
+#if VWIDTH > 1
+/* Runs `vexpr` over the vectorizable part of the block, then `sexpr` on the remaining samples. */
+#define VECTOR_LOOP(vexpr, sexpr) \
+    int i = 0; \
+    for (; i<=(n-VWIDTH); i+=VWIDTH) { vexpr; } \
+    for (; i<n; i++) { sexpr; }
+#define VECTOR_DIV_GUARD(v) \
+    v = VSELECT(VINSIDE(v, vnmin, vmin), vmin, v)
+#else
+#define VECTOR_LOOP(vexpr, sexpr) \
+    int i; \
+    for (i=0; i<n; i++) { sexpr; }
+#endif
+
+/* Compared in MYFLT precision, like the vector code. */
+static inline MYFLT
+vector_div_guard(MYFLT div)
+{
+    if (div < (MYFLT)VECTOR_MIN_DIV && div > (MYFLT)-VECTOR_MIN_DIV)
+        div = VECTOR_MIN_DIV;
+    return div;
+}
+
+void
+vector_scale(MYFLT *data, MYFLT mul, int n)
+{
+#if VWIDTH > 1
+    VTYPE vmul = VSET1(mul);
+#endif
+    VECTOR_LOOP(VSTORE(data+i, VMUL(VLOAD(data+i), vmul)),
+                data[i] = data[i] * mul)
+}
+
+void
+vector_offset(MYFLT *data, MYFLT add, int n)
+{
+#if VWIDTH > 1
+    VTYPE vadd = VSET1(add);
+#endif
+    VECTOR_LOOP(VSTORE(data+i, VADD(VLOAD(data+i), vadd)),
+                data[i] = data[i] + add)
+}
+
+void
+vector_muladd_ii(MYFLT *data, MYFLT mul, MYFLT add, int n)
+{
+#if VWIDTH > 1
+    VTYPE vmul = VSET1(mul), vadd = VSET1(add);
+#endif
+    VECTOR_LOOP(VSTORE(data+i, VADD(VMUL(vmul, VLOAD(data+i)), vadd)),
+                data[i] = mul * data[i] + add)
+}
+
+void
+vector_muladd_ai(MYFLT *data, MYFLT *mul, MYFLT add, int n)
+{
+#if VWIDTH > 1
+    VTYPE vadd = VSET1(add);
+#endif
+    VECTOR_LOOP(VSTORE(data+i, VADD(VMUL(VLOAD(mul+i), VLOAD(data+i)), vadd)),
+                data[i] = mul[i] * data[i] + add)
+}
+
+void
+vector_muladd_ia(MYFLT *data, MYFLT mul, MYFLT *add, int n)
+{
+#if VWIDTH > 1
+    VTYPE vmul = VSET1(mul);
+#endif
+    VECTOR_LOOP(VSTORE(data+i, VADD(VMUL(vmul, VLOAD(data+i)), VLOAD(add+i))),
+                data[i] = mul * data[i] + add[i])
+}
+
+void
+vector_muladd_aa(MYFLT *data, MYFLT *mul, MYFLT *add, int n)
+{
+    VECTOR_LOOP(VSTORE(data+i, VADD(VMUL(VLOAD(mul+i), VLOAD(data+i)), VLOAD(add+i))),
+                data[i] = mul[i] * data[i] + add[i])
+}
+
+void
+vector_mulsub_ia(MYFLT *data, MYFLT mul, MYFLT *add, int n)
+{
+#if VWIDTH > 1
+    VTYPE vmul = VSET1(mul);
+#endif
+    VECTOR_LOOP(VSTORE(data+i, VSUB(VMUL(vmul, VLOAD(data+i)), VLOAD(add+i))),
+                data[i] = mul * data[i] - add[i])
+}
+
+void
+vector_mulsub_aa(MYFLT *data, MYFLT *mul, MYFLT *add, int n)
+{
+    VECTOR_LOOP(VSTORE(data+i, VSUB(VMUL(VLOAD(mul+i), VLOAD(data+i)), VLOAD(add+i))),
+                data[i] = mul[i] * data[i] - add[i])
+}
+
+void
+vector_divadd_ai(MYFLT *data, MYFLT *div, MYFLT add, int n)
+{
+#if VWIDTH > 1
+    VTYPE v, vadd = VSET1(add), vmin = VSET1(VECTOR_MIN_DIV), vnmin = VSET1(-VECTOR_MIN_DIV);
+#endif
+    VECTOR_LOOP(v = VLOAD(div+i); VECTOR_DIV_GUARD(v); VSTORE(data+i, VADD(VDIV(VLOAD(data+i), v), vadd)),
+                data[i] = data[i] / vector_div_guard(div[i]) + add)
+}
+
+void
+vector_divadd_aa(MYFLT *data, MYFLT *div, MYFLT *add, int n)
+{
+#if VWIDTH > 1
+    VTYPE v, vmin = VSET1(VECTOR_MIN_DIV), vnmin = VSET1(-VECTOR_MIN_DIV);
+#endif
+    VECTOR_LOOP(v = VLOAD(div+i); VECTOR_DIV_GUARD(v); VSTORE(data+i, VADD(VDIV(VLOAD(data+i), v), VLOAD(add+i))),
+                data[i] = data[i] / vector_div_guard(div[i]) + add[i])
+}
+
+void
+vector_divsub_aa(MYFLT *data, MYFLT *div, MYFLT *add, int n)
+{
+#if VWIDTH > 1
+    VTYPE v, vmin = VSET1(VECTOR_MIN_DIV), vnmin = VSET1(-VECTOR_MIN_DIV);
+#endif
+    VECTOR_LOOP(v = VLOAD(div+i); VECTOR_DIV_GUARD(v); VSTORE(data+i, VSUB(VDIV(VLOAD(data+i), v), VLOAD(add+i))),
+                data[i] = data[i] / vector_div_guard(div[i]) - add[i])
+}
+
+void
+vector_clip(MYFLT *data, MYFLT min, MYFLT max, int n)
+{
+#if VWIDTH > 1
+    VTYPE vlo = VSET1(min), vhi = VSET1(max);
+#endif
+    VECTOR_LOOP(VSTORE(data+i, VMIN(VMAX(VLOAD(data+i), vlo), vhi)),
+                if (data[i] < min) data[i] = min; else if (data[i] > max) data[i] = max)
+}
+
+void
+vector_mix(MYFLT *out, MYFLT *in, int n)
+{
+    VECTOR_LOOP(VSTORE(out+i, VADD(VLOAD(out+i), VLOAD(in+i))),
+                out[i] = out[i] + in[i])
+}
+
+void
+vector_mix_scaled(MYFLT *out, MYFLT *in, MYFLT gain, int n)
+{
+#if VWIDTH > 1
+    VTYPE vgain = VSET1(gain);
+#endif
+    VECTOR_LOOP(VSTORE(out+i, VADD(VLOAD(out+i), VMUL(VLOAD(in+i), vgain))),
+                out[i] = out[i] + in[i] * gain)
+}
@@ -24,6 +24,7 @@
 #include "streammodule.h"
 #include "servermodule.h"
 #include "dummymodule.h"
+#include "analysisbusmodule.h"
 #include "interpolation.h"
 #include "fft.h"
 #include "wind.h"
@@ -181,7 +182,6 @@ Follower_dealloc(Follower* self)
 static PyObject *
 Follower_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *multmp=NULL, *addtmp=NULL;
     Follower *self;
     self = (Follower *)type->tp_alloc(type, 0);
@@ -217,7 +217,7 @@ Follower_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -645,7 +645,6 @@ Follower2_dealloc(Follower2* self)
 static PyObject *
 Follower2_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *risetimetmp=NULL, *falltimetmp=NULL, *multmp=NULL, *addtmp=NULL;
     Follower2 *self;
     self = (Follower2 *)type->tp_alloc(type, 0);
@@ -688,7 +687,7 @@ Follower2_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -1012,7 +1011,6 @@ ZCross_dealloc(ZCross* self)
 static PyObject *
 ZCross_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *multmp=NULL, *addtmp=NULL;
     ZCross *self;
     self = (ZCross *)type->tp_alloc(type, 0);
@@ -1041,7 +1039,7 @@ ZCross_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -1228,11 +1226,20 @@ typedef struct {
     pyo_audio_HEAD
     PyObject *input;
     Stream *input_stream;
-    MYFLT *input_buffer;
+    MYFLT *input_buffer; /* circular buffer of the last winsize samples */
     MYFLT *yin_buffer;
+    MYFLT *frame; /* analysed window, zero padded to fftsize */
+    MYFLT *inframe;
+    MYFLT *outframe;
+    MYFLT *spectrum;
+    FFTPlan *plan;
     int winsize;
     int halfsize;
+    int fftsize;
+    int hopsize;
+    int method; /* 0 = fft, 1 = time-domain difference function */
     int input_count;
+    int write_pos;
     MYFLT tolerance;
     MYFLT pitch;
     MYFLT minfreq;
@@ -1244,10 +1251,97 @@ typedef struct {
     int modebuffer[2]; // need at least 2 slots for mul & add
 } Yin;
 
+/* Difference function of the window, d(tau) = e(0) + e(tau) - 2 r(tau), where r is the
+   autocorrelation of the first half of the window, computed in the frequency domain,
+   and e(tau) the energy of the half window starting at tau. */
+static void
+Yin_difference(Yin *self) {
+    int i, tau;
+    MYFLT ar, ai, xr, xi, e0, etau, d;
+    int n = self->fftsize;
+    int hn = n / 2;
+    MYFLT *x = self->frame;
+
+    for (i=0; i<n; i++)
+        self->inframe[i] = x[i];
+    realfft_plan(self->inframe, self->outframe, self->plan);
+
+    for (i=0; i<self->halfsize; i++)
+        self->inframe[i] = x[i];
+    for (i=self->halfsize; i<n; i++)
+        self->inframe[i] = 0.0;
+    realfft_plan(self->inframe, self->spectrum, self->plan);
+
+    /* Cross-spectrum of the half window and the whole window. */
+    self->inframe[0] = self->spectrum[0] * self->outframe[0];
+    self->inframe[hn] = self->spectrum[hn] * self->outframe[hn];
+    for (i=1; i<hn; i++) {
+        ar = self->spectrum[i];
+        ai = self->spectrum[n-i];
+        xr = self->outframe[i];
+        xi = self->outframe[n-i];
+        self->inframe[i] = ar * xr + ai * xi;
+        self->inframe[n-i] = ar * xi - ai * xr;
+    }
+    irealfft_plan(self->inframe, self->outframe, self->plan);
+
+    e0 = 0.0;
+    for (i=0; i<self->halfsize; i++)
+        e0 += x[i] * x[i];
+    etau = e0;
+    self->yin_buffer[0] = 0.0;
+    for (tau=1; tau<self->halfsize; tau++) {
+        etau += x[tau+self->halfsize-1] * x[tau+self->halfsize-1] - x[tau-1] * x[tau-1];
+        d = e0 + etau - 2.0 * n * self->outframe[tau];
+        self->yin_buffer[tau] = d > 0.0 ? d : 0.0;
+    }
+}
+
+/* Cumulative mean normalized difference function and search of the period. With the
+   time-domain method, the difference function is computed only up to the period found. */
+static void
+Yin_analyse(Yin *self) {
+    int j, period, tau = 0;
+    MYFLT candidate, tmp = 0.0, tmp2 = 0.0;
+    MYFLT *x = self->frame;
+
+    if (self->method == 0)
+        Yin_difference(self);
+
+    self->yin_buffer[0] = 1.0;
+    for (tau = 1; tau < self->halfsize; tau++) {
+        if (self->method == 1) {
+            self->yin_buffer[tau] = 0.0;
+            for (j = 0; j < self->halfsize; j++) {
+                tmp = x[j] - x[j+tau];
+                self->yin_buffer[tau] += tmp*tmp;
+            }
+        }
+        tmp2 += self->yin_buffer[tau];
+        if (tmp2 > 0.0)
+            self->yin_buffer[tau] *= tau / tmp2;
+        else
+            self->yin_buffer[tau] = 1.0;
+        period = tau - 3;
+        if (tau > 4 && (self->yin_buffer[period] < self->tolerance) &&
+            (self->yin_buffer[period] < self->yin_buffer[period+1])) {
+            candidate = quadraticInterpolation(self->yin_buffer, period, self->halfsize);
+            goto founded;
+        }
+    }
+    candidate = quadraticInterpolation(self->yin_buffer, min_elem_pos(self->yin_buffer, self->halfsize), self->halfsize);
+
+founded:
+
+    candidate = self->sr / candidate;
+    if (candidate > self->minfreq && candidate < self->maxfreq)
+        self->pitch = candidate;
+}
+
 static void
 Yin_process(Yin *self) {
-    int i, j, period, tau = 0;
-    MYFLT candidate, tmp = 0.0, tmp2 = 0.0, b = 0.0;
+    int i, first;
+    MYFLT b = 0.0;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
     if (self->cutoff != self->last_cutoff) {
@@ -1262,34 +1356,16 @@ Yin_process(Yin *self) {
 
     for (i=0; i<self->bufsize; i++) {
         self->y1 = in[i] + (self->y1 - in[i]) * self->c2;
-        self->input_buffer[self->input_count] = self->y1;
-        if (self->input_count++ == self->winsize) {
+        self->input_buffer[self->write_pos++] = self->y1;
+        if (self->write_pos == self->winsize)
+            self->write_pos = 0;
+        if (++self->input_count == self->hopsize) {
             self->input_count = 0;
-
-            self->yin_buffer[0] = 1.0;
-            for (tau = 1; tau < self->halfsize; tau++) {
-                self->yin_buffer[tau] = 0.0;
-                for (j = 0; j < self->halfsize; j++) {
-                    tmp = self->input_buffer[j] - self->input_buffer[j+tau];
-                    self->yin_buffer[tau] += tmp*tmp;
-                }
-                tmp2 += self->yin_buffer[tau];
-                self->yin_buffer[tau] *= tau / tmp2;
-                period = tau - 3;
-                if (tau > 4 && (self->yin_buffer[period] < self->tolerance) &&
-                    (self->yin_buffer[period] < self->yin_buffer[period+1])) {
-                    candidate = quadraticInterpolation(self->yin_buffer, period, self->halfsize);
-                    goto founded;
-                }
-            }
-            candidate = quadraticInterpolation(self->yin_buffer, min_elem_pos(self->yin_buffer, self->halfsize), self->halfsize);
-
-        founded:
-
-            candidate = self->sr / candidate;
-            if (candidate > self->minfreq && candidate < self->maxfreq)
-                self->pitch = candidate;
-
+            /* Last winsize samples, the oldest first. */
+            first = self->winsize - self->write_pos;
+            memcpy(self->frame, &self->input_buffer[self->write_pos], first * sizeof(MYFLT));
+            memcpy(&self->frame[first], self->input_buffer, self->write_pos * sizeof(MYFLT));
+            Yin_analyse(self);
         }
         self->data[i] = self->pitch;
     }
@@ -1375,6 +1451,11 @@ Yin_dealloc(Yin* self)
     pyo_DEALLOC
     free(self->input_buffer);
     free(self->yin_buffer);
+    free(self->frame);
+    free(self->inframe);
+    free(self->outframe);
+    free(self->spectrum);
+    fft_plan_release(self->plan);
     Yin_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -1389,7 +1470,10 @@ Yin_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     self->winsize = 1024;
     self->halfsize = 512;
+    self->hopsize = 0;
+    self->method = 0;
     self->input_count = 0;
+    self->write_pos = 0;
     self->pitch = 0.;
     self->tolerance = 0.15;
     self->minfreq = 40;
@@ -1404,9 +1488,9 @@ Yin_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Stream_setFunctionPtr(self->stream, Yin_compute_next_data_frame);
     self->mode_func_ptr = Yin_setProcMode;
 
-    static char *kwlist[] = {"input", "tolerance", "minfreq", "maxfreq", "cutoff", "winsize", "mul", "add", NULL};
+    static char *kwlist[] = {"input", "tolerance", "minfreq", "maxfreq", "cutoff", "winsize", "hopsize", "mul", "add", NULL};
 
-    if (! PyArg_ParseTupleAndKeywords(args, kwds, TYPE_O_FFFFIOO, kwlist, &inputtmp, &self->tolerance, &self->minfreq, &self->maxfreq, &self->cutoff, &self->winsize, &multmp, &addtmp))
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, TYPE_O_FFFFIIOO, kwlist, &inputtmp, &self->tolerance, &self->minfreq, &self->maxfreq, &self->cutoff, &self->winsize, &self->hopsize, &multmp, &addtmp))
         Py_RETURN_NONE;
 
     INIT_INPUT_STREAM
@@ -1419,11 +1503,16 @@ Yin_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
-    if (self->winsize % 2 == 1)
+    if (self->winsize < 16)
+        self->winsize = 16;
+    else if (self->winsize % 2 == 1)
         self->winsize += 1;
 
+    if (self->hopsize <= 0 || self->hopsize > self->winsize)
+        self->hopsize = self->winsize;
+
     self->input_buffer = (MYFLT *)realloc(self->input_buffer, self->winsize * sizeof(MYFLT));
     for (i=0; i<self->winsize; i++)
         self->input_buffer[i] = 0.0;
@@ -1433,6 +1522,20 @@ Yin_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     for (i=0; i<self->halfsize; i++)
         self->yin_buffer[i] = 0.0;
 
+    /* The correlation of the half window over the whole window doesn't wrap around with a
+       fft size greater than or equal to the window size, the smallest one the mixed-radix
+       fft can compute is used. */
+    self->fftsize = self->winsize < 16 ? 16 : self->winsize;
+    while (!fft_size_is_valid(self->fftsize))
+        self->fftsize++;
+    self->frame = (MYFLT *)realloc(self->frame, self->fftsize * sizeof(MYFLT));
+    self->inframe = (MYFLT *)realloc(self->inframe, self->fftsize * sizeof(MYFLT));
+    self->outframe = (MYFLT *)realloc(self->outframe, self->fftsize * sizeof(MYFLT));
+    self->spectrum = (MYFLT *)realloc(self->spectrum, self->fftsize * sizeof(MYFLT));
+    for (i=0; i<self->fftsize; i++)
+        self->frame[i] = self->inframe[i] = self->outframe[i] = self->spectrum[i] = 0.0;
+    self->plan = fft_plan_acquire(self->fftsize, -1);
+
     (*self->mode_func_ptr)(self);
 
     return (PyObject *)self;
@@ -1525,6 +1628,23 @@ Yin_setCutoff(Yin *self, PyObject *arg)
 	Py_RETURN_NONE;
 }
 
+static PyObject *
+Yin_setMethod(Yin *self, PyObject *arg)
+{
+	if (arg == NULL) {
+		Py_INCREF(Py_None);
+		return Py_None;
+	}
+
+	int isInt = PyInt_Check(arg);
+
+	if (isInt == 1) {
+		self->method = PyInt_AsLong(arg) == 1 ? 1 : 0;
+	}
+
+	Py_RETURN_NONE;
+}
+
 static PyMemberDef Yin_members[] = {
 {"server", T_OBJECT_EX, offsetof(Yin, server), 0, "Pyo server."},
 {"stream", T_OBJECT_EX, offsetof(Yin, stream), 0, "Stream object."},
@@ -1543,6 +1663,7 @@ static PyMethodDef Yin_methods[] = {
 {"setMinfreq", (PyCFunction)Yin_setMinfreq, METH_O, "Sets the minimum frequency in output."},
 {"setMaxfreq", (PyCFunction)Yin_setMaxfreq, METH_O, "Sets the maximum frequency in output."},
 {"setCutoff", (PyCFunction)Yin_setCutoff, METH_O, "Sets the input lowpass filter cutoff frequency."},
+{"setMethod", (PyCFunction)Yin_setMethod, METH_O, "Sets the computation of the difference function, 0 = fft, 1 = time-domain."},
 {"setMul", (PyCFunction)Yin_setMul, METH_O, "Sets oscillator mul factor."},
 {"setAdd", (PyCFunction)Yin_setAdd, METH_O, "Sets oscillator add factor."},
 {"setSub", (PyCFunction)Yin_setSub, METH_O, "Sets inverse add factor."},
@@ -1648,28 +1769,21 @@ typedef struct {
     MYFLT centroid;
     MYFLT *inframe;
     MYFLT *outframe;
-    MYFLT **twiddle;
+    FFTPlan *plan;
     MYFLT *input_buffer;
-    MYFLT *window;
     int modebuffer[2];
 } Centroid;
 
 static void
 Centroid_alloc_memories(Centroid *self) {
-    int i, n8;
+    int i;
     self->hsize = self->size / 2;
-    n8 = self->size >> 3;
     self->inframe = (MYFLT *)realloc(self->inframe, self->size * sizeof(MYFLT));
     self->outframe = (MYFLT *)realloc(self->outframe, self->size * sizeof(MYFLT));
     self->input_buffer = (MYFLT *)realloc(self->input_buffer, self->size * sizeof(MYFLT));
     for (i=0; i<self->size; i++)
         self->inframe[i] = self->outframe[i] = self->input_buffer[i] = 0.0;
-    self->twiddle = (MYFLT **)realloc(self->twiddle, 4 * sizeof(MYFLT *));
-    for(i=0; i<4; i++)
-        self->twiddle[i] = (MYFLT *)malloc(n8 * sizeof(MYFLT));
-    fft_compute_split_twiddle(self->twiddle, self->size);
-    self->window = (MYFLT *)realloc(self->window, self->size * sizeof(MYFLT));
-    gen_window(self->window, self->size, 2);
+    self->plan = fft_plan_acquire(self->size, 2);
 }
 
 static void
@@ -1687,9 +1801,9 @@ Centroid_process_i(Centroid *self) {
             self->incount = self->hsize;
 
             for (i=0; i<self->size; i++) {
-                self->inframe[i] = self->input_buffer[i] * self->window[i];
+                self->inframe[i] = self->input_buffer[i] * self->plan->window[i];
             }
-            realfft_split(self->inframe, self->outframe, self->size, self->twiddle);
+            realfft_plan(self->inframe, self->outframe, self->plan);
             sum1 = sum2 = 0.0;
             for (i=1; i<self->hsize; i++) {
                 re = self->outframe[i];
@@ -1785,16 +1899,11 @@ Centroid_clear(Centroid *self)
 static void
 Centroid_dealloc(Centroid* self)
 {
-    int i;
     pyo_DEALLOC
     free(self->inframe);
     free(self->outframe);
     free(self->input_buffer);
-    for(i=0; i<4; i++) {
-        free(self->twiddle[i]);
-    }
-    free(self->twiddle);
-    free(self->window);
+    fft_plan_release(self->plan);
     Centroid_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -1802,7 +1911,7 @@ Centroid_dealloc(Centroid* self)
 static PyObject *
 Centroid_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i, k;
+    int k;
     PyObject *inputtmp, *input_streamtmp, *multmp=NULL, *addtmp=NULL;
     Centroid *self;
     self = (Centroid *)type->tp_alloc(type, 0);
@@ -1838,7 +1947,7 @@ Centroid_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     Centroid_alloc_memories(self);
 
@@ -2173,7 +2282,7 @@ AttackDetector_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->memsize = (int)(0.055 * self->sr + 0.5);
     self->buffer = (MYFLT *)realloc(self->buffer, (self->memsize+1) * sizeof(MYFLT));
@@ -2445,6 +2554,8 @@ typedef struct {
     int pointer;
     MYFLT gain;
     MYFLT *buffer;
+    AnalysisBus *bus; /* receives the buffer each time it is full */
+    int buschnl;
 } Scope;
 
 static void
@@ -2456,6 +2567,8 @@ Scope_generate(Scope *self) {
             self->pointer = 0;
         self->buffer[self->pointer] = in[i];
         self->pointer++;
+        if (self->pointer == self->size && self->bus != NULL)
+            AnalysisBus_write(self->bus, self->buschnl, self->buffer, self->size);
     }
 }
 
@@ -2492,6 +2605,7 @@ static int
 Scope_traverse(Scope *self, visitproc visit, void *arg)
 {
     pyo_VISIT
+    Py_VISIT(self->bus);
     Py_VISIT(self->input);
     Py_VISIT(self->input_stream);
     return 0;
@@ -2501,6 +2615,7 @@ static int
 Scope_clear(Scope *self)
 {
     pyo_CLEAR
+    Py_CLEAR(self->bus);
     Py_CLEAR(self->input);
     Py_CLEAR(self->input_stream);
     return 0;
@@ -2518,7 +2633,7 @@ Scope_dealloc(Scope* self)
 static PyObject *
 Scope_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i, maxsize;
+    int maxsize;
     MYFLT length = 0.05;
     PyObject *inputtmp, *input_streamtmp;
     Scope *self;
@@ -2527,6 +2642,8 @@ Scope_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->gain = 1.0;
     self->width = 500;
     self->height = 400;
+    self->bus = NULL;
+    self->buschnl = 0;
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Scope_compute_next_data_frame);
@@ -2545,11 +2662,17 @@ Scope_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         self->size = maxsize;
     self->pointer = 0;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     return (PyObject *)self;
 }
 
+static PyObject *
+Scope_setBus(Scope *self, PyObject *args)
+{
+    return AnalysisBus_setTarget(&self->bus, &self->buschnl, args);
+}
+
 static PyObject * Scope_getServer(Scope* self) { GET_SERVER };
 static PyObject * Scope_getStream(Scope* self) { GET_STREAM };
 
@@ -2619,6 +2742,7 @@ static PyMethodDef Scope_methods[] = {
 {"setLength", (PyCFunction)Scope_setLength, METH_O, "Sets function's argument."},
 {"setGain", (PyCFunction)Scope_setGain, METH_O, "Sets gain compensation."},
 {"setWidth", (PyCFunction)Scope_setWidth, METH_O, "Sets the width of the display."},
+{"setBus", (PyCFunction)Scope_setBus, METH_VARARGS, "Sets the analysis bus receiving the buffers."},
 {"setHeight", (PyCFunction)Scope_setHeight, METH_O, "Sets the height of the display."},
 {NULL}  /* Sentinel */
 };
@@ -2674,6 +2798,8 @@ typedef struct {
     Stream *input_stream;
     int modebuffer[2]; // need at least 2 slots for mul & add
     MYFLT follow;
+    AnalysisBus *bus; /* receives the peak of each buffer */
+    int buschnl;
 } PeakAmp;
 
 static void
@@ -2693,6 +2819,8 @@ PeakAmp_filters_i(PeakAmp *self) {
         self->data[i] = self->follow;
     }
     self->follow = peak;
+    if (self->bus != NULL)
+        AnalysisBus_write(self->bus, self->buschnl, &self->follow, 1);
 }
 
 static void PeakAmp_postprocessing_ii(PeakAmp *self) { POST_PROCESSING_II };
@@ -2754,6 +2882,7 @@ static int
 PeakAmp_traverse(PeakAmp *self, visitproc visit, void *arg)
 {
     pyo_VISIT
+    Py_VISIT(self->bus);
     Py_VISIT(self->input);
     Py_VISIT(self->input_stream);
     return 0;
@@ -2763,6 +2892,7 @@ static int
 PeakAmp_clear(PeakAmp *self)
 {
     pyo_CLEAR
+    Py_CLEAR(self->bus);
     Py_CLEAR(self->input);
     Py_CLEAR(self->input_stream);
     return 0;
@@ -2779,12 +2909,13 @@ PeakAmp_dealloc(PeakAmp* self)
 static PyObject *
 PeakAmp_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *multmp=NULL, *addtmp=NULL;
     PeakAmp *self;
     self = (PeakAmp *)type->tp_alloc(type, 0);
 
     self->follow = 0.0;
+    self->bus = NULL;
+    self->buschnl = 0;
 	self->modebuffer[0] = 0;
 	self->modebuffer[1] = 0;
 
@@ -2807,13 +2938,19 @@ PeakAmp_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
     return (PyObject *)self;
 }
 
+static PyObject *
+PeakAmp_setBus(PeakAmp *self, PyObject *args)
+{
+    return AnalysisBus_setTarget(&self->bus, &self->buschnl, args);
+}
+
 static PyObject * PeakAmp_getServer(PeakAmp* self) { GET_SERVER };
 static PyObject * PeakAmp_getStream(PeakAmp* self) { GET_STREAM };
 static PyObject * PeakAmp_setMul(PeakAmp *self, PyObject *arg) { SET_MUL };
@@ -2854,6 +2991,7 @@ static PyMethodDef PeakAmp_methods[] = {
 {"play", (PyCFunction)PeakAmp_play, METH_VARARGS|METH_KEYWORDS, "Starts computing without sending sound to soundcard."},
 {"stop", (PyCFunction)PeakAmp_stop, METH_NOARGS, "Stops computing."},
 {"getValue", (PyCFunction)PeakAmp_getValue, METH_NOARGS, "Returns the current peaking value."},
+{"setBus", (PyCFunction)PeakAmp_setBus, METH_VARARGS, "Sets the analysis bus receiving the peaks."},
 {"setMul", (PyCFunction)PeakAmp_setMul, METH_O, "Sets oscillator mul factor."},
 {"setAdd", (PyCFunction)PeakAmp_setAdd, METH_O, "Sets oscillator add factor."},
 {"setSub", (PyCFunction)PeakAmp_setSub, METH_O, "Sets inverse add factor."},
@@ -131,7 +131,6 @@ M_Sin_dealloc(M_Sin* self)
 static PyObject *
 M_Sin_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *multmp=NULL, *addtmp=NULL;
     M_Sin *self;
     self = (M_Sin *)type->tp_alloc(type, 0);
@@ -158,7 +157,7 @@ M_Sin_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -396,7 +395,6 @@ M_Cos_dealloc(M_Cos* self)
 static PyObject *
 M_Cos_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *multmp=NULL, *addtmp=NULL;
     M_Cos *self;
     self = (M_Cos *)type->tp_alloc(type, 0);
@@ -423,7 +421,7 @@ M_Cos_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -661,7 +659,6 @@ M_Tan_dealloc(M_Tan* self)
 static PyObject *
 M_Tan_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *multmp=NULL, *addtmp=NULL;
     M_Tan *self;
     self = (M_Tan *)type->tp_alloc(type, 0);
@@ -688,7 +685,7 @@ M_Tan_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -931,7 +928,6 @@ M_Abs_dealloc(M_Abs* self)
 static PyObject *
 M_Abs_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *multmp=NULL, *addtmp=NULL;
     M_Abs *self;
     self = (M_Abs *)type->tp_alloc(type, 0);
@@ -958,7 +954,7 @@ M_Abs_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -1201,7 +1197,6 @@ M_Sqrt_dealloc(M_Sqrt* self)
 static PyObject *
 M_Sqrt_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *multmp=NULL, *addtmp=NULL;
     M_Sqrt *self;
     self = (M_Sqrt *)type->tp_alloc(type, 0);
@@ -1228,7 +1223,7 @@ M_Sqrt_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -1471,7 +1466,6 @@ M_Log_dealloc(M_Log* self)
 static PyObject *
 M_Log_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *multmp=NULL, *addtmp=NULL;
     M_Log *self;
     self = (M_Log *)type->tp_alloc(type, 0);
@@ -1498,7 +1492,7 @@ M_Log_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -1741,7 +1735,6 @@ M_Log10_dealloc(M_Log10* self)
 static PyObject *
 M_Log10_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *multmp=NULL, *addtmp=NULL;
     M_Log10 *self;
     self = (M_Log10 *)type->tp_alloc(type, 0);
@@ -1768,7 +1761,7 @@ M_Log10_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -2011,7 +2004,6 @@ M_Log2_dealloc(M_Log2* self)
 static PyObject *
 M_Log2_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *multmp=NULL, *addtmp=NULL;
     M_Log2 *self;
     self = (M_Log2 *)type->tp_alloc(type, 0);
@@ -2038,7 +2030,7 @@ M_Log2_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -2333,7 +2325,6 @@ M_Pow_dealloc(M_Pow* self)
 static PyObject *
 M_Pow_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *basetmp=NULL, *exponenttmp=NULL, *multmp=NULL, *addtmp=NULL;
     M_Pow *self;
     self = (M_Pow *)type->tp_alloc(type, 0);
@@ -2370,7 +2361,7 @@ M_Pow_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -2736,7 +2727,6 @@ M_Atan2_dealloc(M_Atan2* self)
 static PyObject *
 M_Atan2_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *btmp=NULL, *atmp=NULL, *multmp=NULL, *addtmp=NULL;
     M_Atan2 *self;
     self = (M_Atan2 *)type->tp_alloc(type, 0);
@@ -2773,7 +2763,7 @@ M_Atan2_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -3082,7 +3072,6 @@ M_Floor_dealloc(M_Floor* self)
 static PyObject *
 M_Floor_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *multmp=NULL, *addtmp=NULL;
     M_Floor *self;
     self = (M_Floor *)type->tp_alloc(type, 0);
@@ -3109,7 +3098,7 @@ M_Floor_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -3347,7 +3336,6 @@ M_Ceil_dealloc(M_Ceil* self)
 static PyObject *
 M_Ceil_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *multmp=NULL, *addtmp=NULL;
     M_Ceil *self;
     self = (M_Ceil *)type->tp_alloc(type, 0);
@@ -3374,7 +3362,7 @@ M_Ceil_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -3612,7 +3600,6 @@ M_Round_dealloc(M_Round* self)
 static PyObject *
 M_Round_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *multmp=NULL, *addtmp=NULL;
     M_Round *self;
     self = (M_Round *)type->tp_alloc(type, 0);
@@ -3639,7 +3626,7 @@ M_Round_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -3877,7 +3864,6 @@ M_Tanh_dealloc(M_Tanh* self)
 static PyObject *
 M_Tanh_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *multmp=NULL, *addtmp=NULL;
     M_Tanh *self;
     self = (M_Tanh *)type->tp_alloc(type, 0);
@@ -3904,7 +3890,7 @@ M_Tanh_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
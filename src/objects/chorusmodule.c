@@ -482,7 +482,7 @@ Chorus_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     for (i=0; i<8; i++) {
         self->size[i] = (long)(chorusParams[i][0] * srfac * 2 + 0.5);
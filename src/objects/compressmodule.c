@@ -315,7 +315,7 @@ Compress_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     self->proc_func_ptr = Compress_compress_soft;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -1306,7 +1306,7 @@ Gate_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         self->lh_buffer[i] = 0.;
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -1750,7 +1750,6 @@ Balance_dealloc(Balance* self)
 static PyObject *
 Balance_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *input2tmp, *input2_streamtmp, *freqtmp=NULL, *multmp=NULL, *addtmp=NULL;
     Balance *self;
     self = (Balance *)type->tp_alloc(type, 0);
@@ -1793,7 +1792,7 @@ Balance_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -25,6 +25,7 @@
 #include "servermodule.h"
 #include "dummymodule.h"
 #include "tablemodule.h"
+#include "fft.h"
 
 static MYFLT BLACKMAN2[257] = {0.0, 0.00001355457612407795, 0.00005422714831165853, 0.00012204424012042525, 0.00021705003118953348, 0.00033930631782219667, 0.0004888924578373699, 0.00066590529972627988, 0.00087045909615995898, 0.0011026854019042381, 0.0013627329562085205, 0.0016507675497451635, 0.001966971876186191, 0.0023115453685137038, 0.0026847040201710415, 0.0030866801911709624, 0.0035177223992877149, 0.0039780950964686118, 0.004468078430611172, 0.0049879679928611226, 0.0055380745505964057, 0.0061187237662708727, 0.0067302559023018349, 0.0073730255121936678, 0.0080474011180991928, 0.0087537648750297542, 0.0094925122219332442, 0.010264051519867853, 0.011068803677508544, 0.011907201764231275, 0.012779690611027246, 0.013686726399509554, 0.014628776239280425, 0.015606317733936455, 0.016619838535996113, 0.017669835891040944, 0.018756816171369962, 0.019881294399473233, 0.021043793761637002, 0.022244845112000651, 0.023484986467390646, 0.024764762493264474, 0.026084723981101995, 0.027445427317589366, 0.028847433945943753, 0.030291309819735913, 0.031777624849569003, 0.033306952342980187, 0.034879868437934558, 0.036496951530286398, 0.038158781695585731, 0.039865940105613923, 0.041619008440034494, 0.043418568293550078, 0.045265200578957936, 0.047159484926502321, 0.04910199907992175, 0.051093318289594611, 0.053134014703186641, 0.055224656754207603, 0.05736580854888524, 0.059558029251766974, 0.061801872470459936, 0.064097885639923663, 0.066446609406726198, 0.068848577013680551, 0.071304313685273069, 0.073814336014300028, 0.076379151350125907, 0.078999257188976796, 0.081675140566682625, 0.08440727745428013, 0.08719613215688693, 0.090042156716257177, 0.092945790317425406, 0.095907458699845349, 0.09892757357342627, 0.10200653203986923, 0.10514471601969966, 0.10834249168539431, 0.11160020890099166, 0.11491820066857752, 0.11829678258202875, 0.12173625228839696, 0.12523688895730928, 0.12879895275875847, 0.13242268434965018, 0.1361083043694708, 0.13985601294543293, 0.14366598920745235, 0.14753839081330203, 0.15147335348428598, 0.15547099055176727, 0.15953139251487919, 0.16365462660974361, 0.16784073639051059, 0.17208974132253127, 0.17640163638796383, 0.18077639170410914, 0.18521395215476394, 0.18971423703487098, 0.19427713970874003, 0.19890252728210264, 0.2035902402882592, 0.20834009238856521, 0.21315187008749686, 0.218025332462529, 0.22296021090904578, 0.22795620890049961, 0.23301300176402318, 0.2381302364716896, 0.24330753144760825, 0.24854447639103289, 0.25384063211565033, 0.25919553040520765, 0.26460867388562637, 0.27007953591374234, 0.27560756048280166, 0.28119216214482828, 0.28683272594997611, 0.29252860740296116, 0.29827913243666476, 0.30408359740298374, 0.30994126908099884, 0.31585138470251517, 0.3218131519950253, 0.32782574924213004, 0.33388832536144369, 0.33999999999999991, 0.34615986364716356, 0.35236697776504228, 0.35862037493638421, 0.36491905902993321, 0.37126200538320747, 0.37764816100265119, 0.38407644478110459, 0.39054574773252188, 0.39705493324385926, 0.40360283734404451, 0.41018826898992783, 0.41681001036910403, 0.42346681721948765, 0.43015741916550887, 0.43688052007079137, 0.44363479840716119, 0.45041890763982673, 0.45723147662855934, 0.46407111004469437, 0.47093638880376354, 0.47782587051356035, 0.4847380899374274, 0.49167155947254987, 0.49862476964302743, 0.50559618960748731, 0.51258426768099419, 0.51958743187100298, 0.526604090427091, 0.53363263240419834, 0.54067142823909731, 0.5477188303398014, 0.55477317368762102, 0.5618327764515586, 0.56889594061473336, 0.57596095261251634, 0.58302608398204925, 0.59008959202281352, 0.5971497204679086, 0.60420470016569239, 0.61125274977143074, 0.61829207644859363, 0.62532087657943414, 0.63233733648447599, 0.63933963315053088, 0.64632593496686574, 0.65329440246912585, 0.66024318909062385, 0.66717044192059383, 0.67407430246900757, 0.68095290743754511, 0.68780438949630818, 0.69462687806585954, 0.70141850010417084, 0.70817738089805216, 0.71490164485864349, 0.72158941632053231, 0.7282388203440715, 0.73484798352045921, 0.74141503477914861, 0.74793810619714429, 0.75441533380975301, 0.76084485842234006, 0.76722482642265344, 0.77355339059327366, 0.77982871092374229, 0.78604895542192688, 0.7922123009241796, 0.79831693390384428, 0.80436105127766677, 0.81034286120967125, 0.81626058391205358, 0.82211245244265874, 0.82789671349859684, 0.83361162820556423, 0.83925547290243352, 0.84482653992067935, 0.85032313835820861, 0.85574359484716933, 0.86108625431531149, 0.86634948074047979, 0.87153165789781828, 0.87663119009927604, 0.88164650292500113, 0.88657604394621592, 0.89141828343917606, 0.89617171508981341, 0.90083485668867092, 0.90540625081574555, 0.90988446551485458, 0.91426809495715211, 0.9185557600934271, 0.92274610929481327, 0.92683781898156326, 0.93082959423952683, 0.93472016942399416, 0.93850830875056723, 0.94219280687272511, 0.94577248944576608, 0.94924621367680617, 0.9526128688605292, 0.95587137690038915, 0.95902069281497004, 0.96205980522922363, 0.96498773685030803, 0.96780354492775944, 0.97050632169774165, 0.97309519481112294, 0.97556932774514038, 0.97792792019842123, 0.9801702084691396, 0.98229546581609617, 0.98430300280251803, 0.98619216762238726, 0.98796234640911229, 0.98961296352637218, 0.99114348184096723, 0.99255340297752515, 0.99384226755491845, 0.99500965540426034, 0.99605518576835683, 0.99697851748250432, 0.99777934913652766, 0.99845741921797138, 0.99901250623636195, 0.99944442882846996, 0.99975304584451585, 0.99993825641526857, 1.0};
 
@@ -40,8 +41,203 @@ typedef struct {
     MYFLT *input_tmp;
     int size;
     int count;
+    /* partitioned engine */
+    int partitioned; /* 0 = direct form, 1 = fft partitions after a direct head */
+    int psize; /* partition length */
+    int num_parts; /* number of fft partitions (impulse tail) */
+    int incount;
+    int fdl_pos;
+    int refresh_all;
+    MYFLT last_input;
+    MYFLT *inframe; /* previous and current input blocks */
+    MYFLT *tail_out; /* tail contribution for the current block */
+    MYFLT *fftin;
+    MYFLT *fftout;
+    MYFLT *accum;
+    MYFLT *impulse_copy; /* time domain tail, used to detect table changes */
+    MYFLT *impulse_spec; /* num_parts spectra of 2 * psize */
+    MYFLT *fdl; /* frequency domain delay line, num_parts spectra */
+    FFTPlan *plan;
 } Convolve;
 
+/* Impulses up to this length are convolved in direct form. */
+#define CONVOLVE_DIRECT_MAX 256
+
+static void
+Convolve_compute_partition(Convolve *self, int part, MYFLT *impulse, int tsize) {
+    int i, start, n2 = self->psize * 2;
+    MYFLT *copy = self->impulse_copy + part * self->psize;
+    MYFLT *spec = self->impulse_spec + part * n2;
+
+    /* partition 0 of the tail starts after the direct head */
+    start = (part + 1) * self->psize;
+    for (i=0; i<self->psize; i++) {
+        if ((start + i) < self->size && (start + i) < tsize)
+            copy[i] = self->fftin[i] = impulse[start + i];
+        else
+            copy[i] = self->fftin[i] = 0.0;
+    }
+    for (i=self->psize; i<n2; i++) {
+        self->fftin[i] = 0.0;
+    }
+    realfft_plan(self->fftin, self->fftout, self->plan);
+    /* realfft_plan scales by 1/n, keep the impulse spectra unscaled */
+    for (i=0; i<n2; i++) {
+        spec[i] = self->fftout[i] * n2;
+    }
+}
+
+static int
+Convolve_partition_changed(Convolve *self, int part, MYFLT *impulse, int tsize) {
+    int i, start;
+    MYFLT val;
+    MYFLT *copy = self->impulse_copy + part * self->psize;
+
+    start = (part + 1) * self->psize;
+    for (i=0; i<self->psize; i++) {
+        if ((start + i) < self->size && (start + i) < tsize)
+            val = impulse[start + i];
+        else
+            val = 0.0;
+        if (copy[i] != val)
+            return 1;
+    }
+    return 0;
+}
+
+static void
+Convolve_alloc_partitions(Convolve *self) {
+    int i, n2, tail;
+
+    /* head and partition costs are balanced around 2 * sqrt(size) */
+    self->psize = 64;
+    while (self->psize < 2048 && (self->psize * self->psize) < (self->size * 4))
+        self->psize *= 2;
+    n2 = self->psize * 2;
+    tail = self->size - self->psize;
+    self->num_parts = (tail + self->psize - 1) / self->psize;
+
+    self->inframe = (MYFLT *)realloc(self->inframe, n2 * sizeof(MYFLT));
+    self->tail_out = (MYFLT *)realloc(self->tail_out, self->psize * sizeof(MYFLT));
+    self->fftin = (MYFLT *)realloc(self->fftin, n2 * sizeof(MYFLT));
+    self->fftout = (MYFLT *)realloc(self->fftout, n2 * sizeof(MYFLT));
+    self->accum = (MYFLT *)realloc(self->accum, n2 * sizeof(MYFLT));
+    self->impulse_copy = (MYFLT *)realloc(self->impulse_copy, self->num_parts * self->psize * sizeof(MYFLT));
+    self->impulse_spec = (MYFLT *)realloc(self->impulse_spec, self->num_parts * n2 * sizeof(MYFLT));
+    self->fdl = (MYFLT *)realloc(self->fdl, self->num_parts * n2 * sizeof(MYFLT));
+    for (i=0; i<n2; i++) {
+        self->inframe[i] = 0.0;
+    }
+    for (i=0; i<self->psize; i++) {
+        self->tail_out[i] = 0.0;
+    }
+    for (i=0; i<(self->num_parts * n2); i++) {
+        self->fdl[i] = 0.0;
+    }
+    self->plan = fft_plan_acquire(n2, -1);
+    self->incount = self->fdl_pos = 0;
+    self->refresh_all = 1;
+    self->last_input = 0.0;
+}
+
+/* Sums the impulse partitions against the frequency domain delay line
+   (overlap-save) and writes the tail contribution of the next block. */
+static void
+Convolve_compute_tail(Convolve *self) {
+    int i, j, k, slot, n2 = self->psize * 2;
+    MYFLT re, im, *x, *h;
+
+    for (i=0; i<n2; i++) {
+        self->accum[i] = 0.0;
+    }
+    /* bins 0 and psize are real, bin i has its imaginary part at n2 - i */
+    slot = self->fdl_pos;
+    for (k=0; k<self->num_parts; k++) {
+        x = self->fdl + slot * n2;
+        h = self->impulse_spec + k * n2;
+        self->accum[0] += x[0] * h[0];
+        self->accum[self->psize] += x[self->psize] * h[self->psize];
+        for (i=1, j=n2-1; i<self->psize; i++, j--) {
+            re = x[i] * h[i] - x[j] * h[j];
+            im = x[i] * h[j] + x[j] * h[i];
+            self->accum[i] += re;
+            self->accum[j] += im;
+        }
+        slot--;
+        if (slot < 0)
+            slot += self->num_parts;
+    }
+    irealfft_plan(self->accum, self->fftout, self->plan);
+    for (i=0; i<self->psize; i++) {
+        self->tail_out[i] = self->fftout[i+self->psize];
+    }
+}
+
+static void
+Convolve_process_block(Convolve *self) {
+    int i, k, n2 = self->psize * 2;
+    MYFLT *impulse = TableStream_getData(self->table);
+    int tsize = TableStream_getSize(self->table);
+
+    /* follow changes of the table content */
+    for (k=0; k<self->num_parts; k++) {
+        if (Convolve_partition_changed(self, k, impulse, tsize))
+            Convolve_compute_partition(self, k, impulse, tsize);
+    }
+
+    self->fdl_pos++;
+    if (self->fdl_pos == self->num_parts)
+        self->fdl_pos = 0;
+    for (i=0; i<n2; i++) {
+        self->fftin[i] = self->inframe[i];
+    }
+    realfft_plan(self->fftin, self->fdl + self->fdl_pos * n2, self->plan);
+    Convolve_compute_tail(self);
+    for (i=0; i<self->psize; i++) {
+        self->inframe[i] = self->inframe[i+self->psize];
+    }
+}
+
+static void
+Convolve_filters_partitioned(Convolve *self) {
+    int i, j, pos;
+    MYFLT val, *x;
+    MYFLT *in = Stream_getData((Stream *)self->input_stream);
+    MYFLT *impulse = TableStream_getData(self->table);
+    int head = TableStream_getSize(self->table);
+
+    if (head > self->psize)
+        head = self->psize;
+
+    if (self->refresh_all) {
+        for (i=0; i<self->num_parts; i++)
+            Convolve_compute_partition(self, i, impulse, TableStream_getSize(self->table));
+        Convolve_compute_tail(self);
+        self->refresh_all = 0;
+    }
+
+    for (i=0; i<self->bufsize; i++) {
+        /* the direct form outputs the input delayed by one sample */
+        pos = self->psize + self->incount;
+        self->inframe[pos] = self->last_input;
+        self->last_input = in[i];
+
+        /* direct head over the first partition, no added latency */
+        val = self->tail_out[self->incount];
+        x = self->inframe + pos;
+        for (j=0; j<head; j++) {
+            val += x[-j] * impulse[j];
+        }
+        self->data[i] = val;
+
+        self->incount++;
+        if (self->incount == self->psize) {
+            Convolve_process_block(self);
+            self->incount = 0;
+        }
+    }
+}
+
 static void
 Convolve_filters(Convolve *self) {
     int i,j,tmp_count;
@@ -81,9 +277,12 @@ Convolve_setProcMode(Convolve *self)
     int muladdmode;
     muladdmode = self->modebuffer[0] + self->modebuffer[1] * 10;
 
-    self->proc_func_ptr = Convolve_filters;
+    if (self->partitioned)
+        self->proc_func_ptr = Convolve_filters_partitioned;
+    else
+        self->proc_func_ptr = Convolve_filters;
 
-	switch (muladdmode) {
+    switch (muladdmode) {
         case 0:
             self->muladd_func_ptr = Convolve_postprocessing_ii;
             break;
@@ -146,6 +345,17 @@ Convolve_dealloc(Convolve* self)
 {
     pyo_DEALLOC
     free(self->input_tmp);
+    if (self->partitioned) {
+        free(self->inframe);
+        free(self->tail_out);
+        free(self->fftin);
+        free(self->fftout);
+        free(self->accum);
+        free(self->impulse_copy);
+        free(self->impulse_spec);
+        free(self->fdl);
+        fft_plan_release(self->plan);
+    }
     Convolve_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -188,15 +398,22 @@ Convolve_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
-
-    (*self->mode_func_ptr)(self);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
-    self->input_tmp = (MYFLT *)realloc(self->input_tmp, self->size * sizeof(MYFLT));
-    for (i=0; i<self->size; i++) {
-        self->input_tmp[i] = 0.0;
+    if (self->size > CONVOLVE_DIRECT_MAX) {
+        self->partitioned = 1;
+        Convolve_alloc_partitions(self);
+    }
+    else {
+        self->partitioned = 0;
+        self->input_tmp = (MYFLT *)realloc(self->input_tmp, self->size * sizeof(MYFLT));
+        for (i=0; i<self->size; i++) {
+            self->input_tmp[i] = 0.0;
+        }
     }
 
+    (*self->mode_func_ptr)(self);
+
     return (PyObject *)self;
 }
 
@@ -240,6 +457,7 @@ Convolve_setTable(Convolve *self, PyObject *arg)
 	tmp = arg;
 	Py_DECREF(self->table);
     self->table = PyObject_CallMethod((PyObject *)tmp, "getTableStream", "");
+    self->refresh_all = 1;
 
 	Py_INCREF(Py_None);
 	return Py_None;
@@ -626,7 +844,6 @@ IRWinSinc_dealloc(IRWinSinc* self)
 static PyObject *
 IRWinSinc_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *bandwidthtmp=NULL, *multmp=NULL, *addtmp=NULL;
     IRWinSinc *self;
     self = (IRWinSinc *)type->tp_alloc(type, 0);
@@ -671,7 +888,7 @@ IRWinSinc_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     IRWinSinc_alloc_memory(self);
 
@@ -1043,7 +1260,6 @@ IRAverage_dealloc(IRAverage* self)
 static PyObject *
 IRAverage_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *multmp=NULL, *addtmp=NULL;
     IRAverage *self;
     self = (IRAverage *)type->tp_alloc(type, 0);
@@ -1072,7 +1288,7 @@ IRAverage_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     IRAverage_alloc_memory(self);
 
@@ -1499,7 +1715,6 @@ IRPulse_dealloc(IRPulse* self)
 static PyObject *
 IRPulse_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *bandwidthtmp=NULL, *multmp=NULL, *addtmp=NULL;
     IRPulse *self;
     self = (IRPulse *)type->tp_alloc(type, 0);
@@ -1544,7 +1759,7 @@ IRPulse_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     IRPulse_alloc_memory(self);
 
@@ -1991,7 +2206,6 @@ IRFM_dealloc(IRFM* self)
 static PyObject *
 IRFM_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *carriertmp=NULL, *ratiotmp=NULL, *indextmp=NULL, *multmp=NULL, *addtmp=NULL;
     IRFM *self;
     self = (IRFM *)type->tp_alloc(type, 0);
@@ -2041,7 +2255,7 @@ IRFM_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     IRFM_alloc_memory(self);
 
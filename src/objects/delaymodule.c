@@ -266,10 +266,21 @@ Delay_setProcMode(Delay *self)
     }
 }
 
+/* Called by the server when the stream falls asleep. */
+static void
+Delay_reset_memories(Delay *self)
+{
+    int i;
+    for (i=0; i<(self->size+1); i++) {
+        self->buffer[i] = 0.;
+    }
+}
+
 static void
 Delay_compute_next_data_frame(Delay *self)
 {
     (*self->proc_func_ptr)(self);
+    Stream_measureRinging(self->stream);
     (*self->muladd_func_ptr)(self);
 }
 
@@ -330,6 +341,7 @@ Delay_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->oneOverSr = 1.0 / self->sr;
 
     Stream_setFunctionPtr(self->stream, Delay_compute_next_data_frame);
+    Stream_setResetFunctionPtr(self->stream, Delay_reset_memories);
     self->mode_func_ptr = Delay_setProcMode;
 
     static char *kwlist[] = {"input", "delay", "feedback", "maxdelay", "mul", "add", NULL};
@@ -355,9 +367,10 @@ Delay_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->size = (long)(self->maxdelay * self->sr + 0.5);
+    Stream_setTail(self->stream, (int)self->size);
 
     self->buffer = (MYFLT *)realloc(self->buffer, (self->size+1) * sizeof(MYFLT));
     for (i=0; i<(self->size+1); i++) {
@@ -460,10 +473,7 @@ Delay_setFeedback(Delay *self, PyObject *arg)
 static PyObject *
 Delay_reset(Delay *self)
 {
-    int i;
-    for (i=0; i<(self->size+1); i++) {
-        self->buffer[i] = 0.;
-    }
+    Delay_reset_memories(self);
 	Py_INCREF(Py_None);
 	return Py_None;
 }
@@ -717,10 +727,21 @@ SDelay_setProcMode(SDelay *self)
     }
 }
 
+/* Called by the server when the stream falls asleep. */
+static void
+SDelay_reset_memories(SDelay *self)
+{
+    int i;
+    for (i=0; i<(self->size+1); i++) {
+        self->buffer[i] = 0.;
+    }
+}
+
 static void
 SDelay_compute_next_data_frame(SDelay *self)
 {
     (*self->proc_func_ptr)(self);
+    Stream_measureRinging(self->stream);
     (*self->muladd_func_ptr)(self);
 }
 
@@ -772,6 +793,7 @@ SDelay_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, SDelay_compute_next_data_frame);
+    Stream_setResetFunctionPtr(self->stream, SDelay_reset_memories);
     self->mode_func_ptr = SDelay_setProcMode;
 
     static char *kwlist[] = {"input", "delay", "maxdelay", "mul", "add", NULL};
@@ -793,9 +815,10 @@ SDelay_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->size = (long)(self->maxdelay * self->sr + 0.5);
+    Stream_setTail(self->stream, (int)self->size);
 
     self->buffer = (MYFLT *)realloc(self->buffer, (self->size+1) * sizeof(MYFLT));
     for (i=0; i<(self->size+1); i++) {
@@ -864,10 +887,7 @@ SDelay_setDelay(SDelay *self, PyObject *arg)
 static PyObject *
 SDelay_reset(SDelay *self)
 {
-    int i;
-    for (i=0; i<(self->size+1); i++) {
-        self->buffer[i] = 0.;
-    }
+    SDelay_reset_memories(self);
 	Py_INCREF(Py_None);
 	return Py_None;
 }
@@ -1499,7 +1519,7 @@ Waveguide_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->size = (long)(1.0 / self->minfreq * self->sr + 0.5);
 
@@ -2513,7 +2533,7 @@ AllpassWG_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->size = (long)(1.0 / self->minfreq * self->sr + 0.5);
     self->buffer = (MYFLT *)realloc(self->buffer, (self->size+1) * sizeof(MYFLT));
@@ -2875,7 +2895,6 @@ Delay1_dealloc(Delay1* self)
 static PyObject *
 Delay1_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *multmp=NULL, *addtmp=NULL;
     Delay1 *self;
     self = (Delay1 *)type->tp_alloc(type, 0);
@@ -2903,7 +2922,7 @@ Delay1_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -3412,10 +3431,21 @@ SmoothDelay_setProcMode(SmoothDelay *self)
     }
 }
 
+/* Called by the server when the stream falls asleep. */
+static void
+SmoothDelay_reset_memories(SmoothDelay *self)
+{
+    int i;
+    for (i=0; i<(self->size+1); i++) {
+        self->buffer[i] = 0.;
+    }
+}
+
 static void
 SmoothDelay_compute_next_data_frame(SmoothDelay *self)
 {
     (*self->proc_func_ptr)(self);
+    Stream_measureRinging(self->stream);
     (*self->muladd_func_ptr)(self);
 }
 
@@ -3482,6 +3512,7 @@ SmoothDelay_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->oneOverSr = self->sampdel1 = self->sampdel2 = 1.0 / self->sr;
 
     Stream_setFunctionPtr(self->stream, SmoothDelay_compute_next_data_frame);
+    Stream_setResetFunctionPtr(self->stream, SmoothDelay_reset_memories);
     self->mode_func_ptr = SmoothDelay_setProcMode;
 
     static char *kwlist[] = {"input", "delay", "feedback", "crossfade", "maxdelay", "mul", "add", NULL};
@@ -3507,9 +3538,10 @@ SmoothDelay_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->size = (long)(self->maxdelay * self->sr + 0.5);
+    Stream_setTail(self->stream, (int)self->size);
 
     self->buffer = (MYFLT *)realloc(self->buffer, (self->size+1) * sizeof(MYFLT));
     for (i=0; i<(self->size+1); i++) {
@@ -3629,10 +3661,7 @@ SmoothDelay_setCrossfade(SmoothDelay *self, PyObject *arg)
 static PyObject *
 SmoothDelay_reset(SmoothDelay *self)
 {
-    int i;
-    for (i=0; i<(self->size+1); i++) {
-        self->buffer[i] = 0.;
-    }
+    SmoothDelay_reset_memories(self);
 	Py_INCREF(Py_None);
 	return Py_None;
 }
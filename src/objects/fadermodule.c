@@ -50,7 +50,7 @@ static void Fader_internal_stop(Fader *self) {
 
 static void
 Fader_generate_auto(Fader *self) {
-    MYFLT val;
+    MYFLT val, sampleToSec = 1. / self->sr;
     int i;
 
     if (self->ended == 1) {
@@ -59,7 +59,9 @@ Fader_generate_auto(Fader *self) {
     }
 
     for (i=0; i<self->bufsize; i++) {
-        if (self->currentTime <= self->attack)
+        if (self->currentTime <= 0.0)
+            val = 0.;
+        else if (self->currentTime <= self->attack)
             val = self->currentTime / self->attack;
         else if (self->currentTime > self->duration) {
             val = 0.;
@@ -71,13 +73,13 @@ Fader_generate_auto(Fader *self) {
             val = 1.;
 
         self->data[i] = val;
-        self->currentTime += self->sampleToSec;
+        self->currentTime += sampleToSec;
     }
 }
 
 static void
 Fader_generate_wait(Fader *self) {
-    MYFLT val;
+    MYFLT val, sampleToSec = 1. / self->sr;
     int i;
 
     if (self->fademode == 1 && self->currentTime > self->release) {
@@ -88,7 +90,9 @@ Fader_generate_wait(Fader *self) {
     for (i=0; i<self->bufsize; i++) {
         if (self->fademode == 0) {
 
-            if (self->currentTime <= self->attack)
+            if (self->currentTime <= 0.0)
+                val = 0.;
+            else if (self->currentTime <= self->attack)
                 val = self->currentTime / self->attack;
             else
                 val = 1.;
@@ -101,7 +105,7 @@ Fader_generate_wait(Fader *self) {
                 val = 0.;
         }
         self->data[i] = val;
-        self->currentTime += self->sampleToSec;
+        self->currentTime += sampleToSec;
     }
 }
 
@@ -189,7 +193,6 @@ Fader_dealloc(Fader* self)
 static PyObject *
 Fader_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *multmp=NULL, *addtmp=NULL;
     Fader *self;
     self = (Fader *)type->tp_alloc(type, 0);
@@ -206,6 +209,7 @@ Fader_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Fader_compute_next_data_frame);
+    Stream_setControlRateCapable(self->stream, 1);
     self->mode_func_ptr = Fader_setProcMode;
 
     Stream_setStreamActive(self->stream, 0);
@@ -225,7 +229,7 @@ Fader_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -243,7 +247,8 @@ static PyObject * Fader_play(Fader *self, PyObject *args, PyObject *kwds)
 {
     self->fademode = 0;
     self->ended = 0;
-    self->currentTime = 0.0;
+    /* Called from an event scheduled on the server, starts at the event's position in the buffer. */
+    self->currentTime = -Server_getEventOffset((Server *)self->server) * self->sampleToSec;
     (*self->mode_func_ptr)(self);
     PLAY
 };
@@ -428,7 +433,7 @@ static void Adsr_internal_stop(Adsr *self) {
 
 static void
 Adsr_generate_auto(Adsr *self) {
-    MYFLT val, invatt, invdec, invrel;
+    MYFLT val, invatt, invdec, invrel, sampleToSec = 1. / self->sr;
     int i;
 
     invatt = 1.0 / self->attack;
@@ -436,7 +441,9 @@ Adsr_generate_auto(Adsr *self) {
     invrel = 1.0 / self->release;
 
     for (i=0; i<self->bufsize; i++) {
-        if (self->currentTime <= self->attack)
+        if (self->currentTime <= 0.0)
+            val = 0.;
+        else if (self->currentTime <= self->attack)
             val = self->currentTime * invatt;
         else if (self->currentTime <= (self->attack + self->decay))
             val = (self->decay - (self->currentTime - self->attack)) * invdec * (1. - self->sustain) + self->sustain;
@@ -450,13 +457,13 @@ Adsr_generate_auto(Adsr *self) {
             val = self->sustain;
 
         self->data[i] = val;
-        self->currentTime += self->sampleToSec;
+        self->currentTime += sampleToSec;
     }
 }
 
 static void
 Adsr_generate_wait(Adsr *self) {
-    MYFLT val, invatt, invdec, invrel;
+    MYFLT val, invatt, invdec, invrel, sampleToSec = 1. / self->sr;
     int i;
 
     if (self->fademode == 1 && self->currentTime > self->release)
@@ -469,7 +476,9 @@ Adsr_generate_wait(Adsr *self) {
     for (i=0; i<self->bufsize; i++) {
         if (self->fademode == 0) {
 
-            if (self->currentTime <= self->attack)
+            if (self->currentTime <= 0.0)
+                val = 0.;
+            else if (self->currentTime <= self->attack)
                 val = self->currentTime * invatt;
             else if (self->currentTime <= (self->attack + self->decay))
                 val = (self->decay - (self->currentTime - self->attack)) * invdec * (1. - self->sustain) + self->sustain;
@@ -485,7 +494,7 @@ Adsr_generate_wait(Adsr *self) {
                 val = 0.;
         }
         self->data[i] = val;
-        self->currentTime += self->sampleToSec;
+        self->currentTime += sampleToSec;
     }
 }
 
@@ -573,7 +582,6 @@ Adsr_dealloc(Adsr* self)
 static PyObject *
 Adsr_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *multmp=NULL, *addtmp=NULL;
     Adsr *self;
     self = (Adsr *)type->tp_alloc(type, 0);
@@ -591,6 +599,7 @@ Adsr_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Adsr_compute_next_data_frame);
+    Stream_setControlRateCapable(self->stream, 1);
     self->mode_func_ptr = Adsr_setProcMode;
 
     Stream_setStreamActive(self->stream, 0);
@@ -610,7 +619,7 @@ Adsr_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     if (self->attack < 0.000001)
         self->attack = 0.000001;
@@ -638,7 +647,8 @@ static PyObject * Adsr_setDiv(Adsr *self, PyObject *arg) { SET_DIV };
 static PyObject * Adsr_play(Adsr *self, PyObject *args, PyObject *kwds)
 {
     self->fademode = 0;
-    self->currentTime = 0.0;
+    /* Called from an event scheduled on the server, starts at the event's position in the buffer. */
+    self->currentTime = -Server_getEventOffset((Server *)self->server) * self->sampleToSec;
     (*self->mode_func_ptr)(self);
     PLAY
 };
@@ -1023,7 +1033,7 @@ Linseg_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     if (initToFirstVal) {
         for (i=0; i<self->bufsize; i++) {
@@ -1426,7 +1436,7 @@ Expseg_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     if (initToFirstVal) {
         for (i=0; i<self->bufsize; i++) {
@@ -25,6 +25,7 @@
 #include "streammodule.h"
 #include "servermodule.h"
 #include "dummymodule.h"
+#include "analysisbusmodule.h"
 #include "fft.h"
 #include "wind.h"
 #include "sndfile.h"
@@ -34,96 +35,92 @@ isPowerOfTwo(int x) {
     return (x != 0) && ((x & (x - 1)) == 0);
 }
 
+/* Analysis of one input with all its overlaps. The overlaps share the history of the
+   input and the fft plan, each one keeps the spectrum of its last frame. */
 typedef struct {
     pyo_audio_HEAD
     PyObject *input;
     Stream *input_stream;
     int size;
     int hsize;
-    int hopsize;
+    int overlaps;
     int wintype;
-    int incount;
+    int inpos; /* write position in the input history */
+    int *incount; /* position of each overlap in its frame */
+    MYFLT *history; /* last `size` samples of the input */
     MYFLT *inframe;
-    MYFLT *outframe;
-    MYFLT *window;
-    MYFLT **twiddle;
-    MYFLT *twiddle2;
-    MYFLT *buffer_streams;
+    MYFLT **outframe; /* spectrum of the last frame of each overlap */
+    FFTPlan *plan;
+    MYFLT *buffer_streams; /* real, imag and bin streams of each overlap */
 } FFTMain;
 
 static void
 FFTMain_realloc_memories(FFTMain *self) {
-    int i, n8;
+    int i, j;
+    FFTPlan *plan;
     self->hsize = self->size / 2;
-    n8 = self->size >> 3;
+    self->history = (MYFLT *)realloc(self->history, self->size * sizeof(MYFLT));
     self->inframe = (MYFLT *)realloc(self->inframe, self->size * sizeof(MYFLT));
-    self->outframe = (MYFLT *)realloc(self->outframe, self->size * sizeof(MYFLT));
     for (i=0; i<self->size; i++)
-        self->inframe[i] = self->outframe[i] = 0.0;
-    self->buffer_streams = (MYFLT *)realloc(self->buffer_streams, 3 * self->bufsize * sizeof(MYFLT));
-    for (i=0; i<(self->bufsize*3); i++)
+        self->history[i] = self->inframe[i] = 0.0;
+    for (j=0; j<self->overlaps; j++) {
+        self->outframe[j] = (MYFLT *)realloc(self->outframe[j], self->size * sizeof(MYFLT));
+        for (i=0; i<self->size; i++)
+            self->outframe[j][i] = 0.0;
+        self->incount[j] = -(self->size * j / self->overlaps);
+    }
+    for (i=0; i<(self->bufsize*3*self->overlaps); i++)
         self->buffer_streams[i] = 0.0;
-    self->twiddle = (MYFLT **)realloc(self->twiddle, 4 * sizeof(MYFLT *));
-    for(i=0; i<4; i++)
-        self->twiddle[i] = (MYFLT *)malloc(n8 * sizeof(MYFLT));
-    fft_compute_split_twiddle(self->twiddle, self->size);
-    self->twiddle2 = (MYFLT *)realloc(self->twiddle2, self->size * sizeof(MYFLT));
-    fft_compute_radix2_twiddle(self->twiddle2, self->size);
-    self->window = (MYFLT *)realloc(self->window, self->size * sizeof(MYFLT));
-    gen_window(self->window, self->size, self->wintype);
-    self->incount = -self->hopsize;
+    plan = fft_plan_acquire(self->size, self->wintype);
+    fft_plan_release(self->plan);
+    self->plan = plan;
+    self->inpos = 0;
 }
 
 static void
 FFTMain_filters(FFTMain *self) {
-    int i, incount;
+    int i, j, k, incount, first;
+    MYFLT *outframe, *buf;
+    MYFLT *window = self->plan->window;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
-    incount = self->incount;
-
     for (i=0; i<self->bufsize; i++) {
-        if (incount >= 0) {
-            self->inframe[incount] = in[i] * self->window[incount];
-            if (incount < self->hsize) {
-                self->buffer_streams[i] = self->outframe[incount];
-                if (incount)
-                    self->buffer_streams[i+self->bufsize] = self->outframe[self->size - incount];
+        self->history[self->inpos++] = in[i];
+        if (self->inpos == self->size)
+            self->inpos = 0;
+
+        for (j=0; j<self->overlaps; j++) {
+            incount = self->incount[j];
+            outframe = self->outframe[j];
+            buf = &self->buffer_streams[self->bufsize*3*j];
+            if (incount >= 0) {
+                if (incount < self->hsize) {
+                    buf[i] = outframe[incount];
+                    if (incount)
+                        buf[i+self->bufsize] = outframe[self->size - incount];
+                    else
+                        buf[i+self->bufsize] = 0.0;
+                }
+                else if (incount == self->hsize)
+                    buf[i] = outframe[incount];
                 else
-                    self->buffer_streams[i+self->bufsize] = 0.0;
+                    buf[i] = buf[i+self->bufsize] = 0.0;
+                buf[i+self->bufsize*2] = (MYFLT)incount;
             }
-            else if (incount == self->hsize)
-                self->buffer_streams[i] = self->outframe[incount];
-            else
-                self->buffer_streams[i] = self->buffer_streams[i+self->bufsize] = 0.0;
-            self->buffer_streams[i+self->bufsize*2] = (MYFLT)incount;
-        }
-        incount++;
-        if (incount >= self->size) {
-            incount -= self->size;
-            realfft_split(self->inframe, self->outframe, self->size, self->twiddle);
-        }
-    }
-
-    /*
-    for (i=0; i<self->bufsize; i++) {
-        if (incount >= 0) {
-            self->inframe[incount] = in[i] * self->window[incount];
-            if (incount < self->hsize) {
-                self->buffer_streams[i] = self->outframe[incount*2];
-                self->buffer_streams[i+self->bufsize] = self->outframe[incount*2+1];
+            incount++;
+            if (incount >= self->size) {
+                incount -= self->size;
+                /* The frame is the last `size` samples of the history, the oldest first. */
+                first = self->size - self->inpos;
+                for (k=0; k<first; k++)
+                    self->inframe[k] = self->history[self->inpos + k] * window[k];
+                for (k=first; k<self->size; k++)
+                    self->inframe[k] = self->history[k - first] * window[k];
+                realfft_plan(self->inframe, outframe, self->plan);
             }
-            else
-                self->buffer_streams[i] = self->buffer_streams[i+self->bufsize] = 0.0;
-            self->buffer_streams[i+self->bufsize*2] = (MYFLT)incount;
-        }
-        incount++;
-        if (incount >= self->size) {
-            incount -= self->size;
-            realfft_packed(self->inframe, self->outframe, self->size, self->twiddle2);
+            self->incount[j] = incount;
         }
     }
-    */
-    self->incount = incount;
 }
 
 MYFLT *
@@ -167,15 +164,15 @@ FFTMain_dealloc(FFTMain* self)
 {
     int i;
     pyo_DEALLOC
+    free(self->history);
     free(self->inframe);
+    for (i=0; i<self->overlaps; i++) {
+        free(self->outframe[i]);
+    }
     free(self->outframe);
-    free(self->window);
+    free(self->incount);
     free(self->buffer_streams);
-    for(i=0; i<4; i++) {
-        free(self->twiddle[i]);
-    }
-    free(self->twiddle);
-    free(self->twiddle2);
+    fft_plan_release(self->plan);
     FFTMain_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -183,25 +180,40 @@ FFTMain_dealloc(FFTMain* self)
 static PyObject *
 FFTMain_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
+    int k;
     PyObject *inputtmp, *input_streamtmp;
     FFTMain *self;
     self = (FFTMain *)type->tp_alloc(type, 0);
 
     self->size = 1024;
+    self->overlaps = 4;
     self->wintype = 2;
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, FFTMain_compute_next_data_frame);
     self->mode_func_ptr = FFTMain_setProcMode;
 
-    static char *kwlist[] = {"input", "size", "hopsize", "wintype", NULL};
+    static char *kwlist[] = {"input", "size", "overlaps", "wintype", NULL};
 
-    if (! PyArg_ParseTupleAndKeywords(args, kwds, "O|iii", kwlist, &inputtmp, &self->size, &self->hopsize, &self->wintype))
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, "O|iii", kwlist, &inputtmp, &self->size, &self->overlaps, &self->wintype))
         Py_RETURN_NONE;
 
     INIT_INPUT_STREAM
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
+
+    if (!fft_size_is_valid(self->size)) {
+        k = 4;
+        while (k < self->size)
+            k *= 2;
+        self->size = k;
+        printf("FFT size must be even with no prime factors other than 2, 3 and 5, using the next power-of-2 greater than size : %d\n", self->size);
+    }
+
+    if (self->overlaps < 1)
+        self->overlaps = 1;
+    self->incount = (int *)calloc(self->overlaps, sizeof(int));
+    self->outframe = (MYFLT **)calloc(self->overlaps, sizeof(MYFLT *));
+    self->buffer_streams = (MYFLT *)malloc(3 * self->overlaps * self->bufsize * sizeof(MYFLT));
 
     FFTMain_realloc_memories(self);
 
@@ -217,23 +229,19 @@ static PyObject * FFTMain_play(FFTMain *self, PyObject *args, PyObject *kwds) {
 static PyObject * FFTMain_stop(FFTMain *self) { STOP };
 
 static PyObject *
-FFTMain_setSize(FFTMain *self, PyObject *args, PyObject *kwds)
+FFTMain_setSize(FFTMain *self, PyObject *arg)
 {
-    int size, hopsize;
-
-    static char *kwlist[] = {"size", "hopsize", NULL};
-    if (! PyArg_ParseTupleAndKeywords(args, kwds, "ii", kwlist, &size, &hopsize)) {
-        Py_INCREF(Py_None);
-        return Py_None;
-    }
+    int size;
 
-    if (isPowerOfTwo(size)) {
-        self->size = size;
-        self->hopsize = hopsize;
-        FFTMain_realloc_memories(self);
+    if (PyLong_Check(arg) || PyInt_Check(arg)) {
+        size = PyInt_AsLong(arg);
+        if (fft_size_is_valid(size)) {
+            self->size = size;
+            FFTMain_realloc_memories(self);
+        }
+        else
+            printf("FFT size must be even with no prime factors other than 2, 3 and 5!\n");
     }
-    else
-        printf("FFT size must be a power of two!\n");
 
     Py_INCREF(Py_None);
     return Py_None;
@@ -242,9 +250,13 @@ FFTMain_setSize(FFTMain *self, PyObject *args, PyObject *kwds)
 static PyObject *
 FFTMain_setWinType(FFTMain *self, PyObject *arg)
 {
+    FFTPlan *plan;
+
     if (PyLong_Check(arg) || PyInt_Check(arg)) {
         self->wintype = PyLong_AsLong(arg);
-        gen_window(self->window, self->size, self->wintype);
+        plan = fft_plan_acquire(self->size, self->wintype);
+        fft_plan_release(self->plan);
+        self->plan = plan;
     }
 
     Py_INCREF(Py_None);
@@ -263,7 +275,7 @@ static PyMethodDef FFTMain_methods[] = {
 {"_getStream", (PyCFunction)FFTMain_getStream, METH_NOARGS, "Returns stream object."},
 {"play", (PyCFunction)FFTMain_play, METH_VARARGS|METH_KEYWORDS, "Starts computing without sending sound to soundcard."},
 {"stop", (PyCFunction)FFTMain_stop, METH_NOARGS, "Stops computing."},
-{"setSize", (PyCFunction)FFTMain_setSize, METH_VARARGS|METH_KEYWORDS, "Sets a new FFT size."},
+{"setSize", (PyCFunction)FFTMain_setSize, METH_O, "Sets a new FFT size."},
 {"setWinType", (PyCFunction)FFTMain_setWinType, METH_O, "Sets a new window."},
 {NULL}  /* Sentinel */
 };
@@ -317,7 +329,7 @@ typedef struct {
     pyo_audio_HEAD
     FFTMain *mainSplitter;
     int modebuffer[2];
-    int chnl; // 0 = real, 1 = imag, 2 = bin
+    int chnl; // overlap * 3 + (0 = real, 1 = imag, 2 = bin)
 } FFT;
 
 static void FFT_postprocessing_ii(FFT *self) { POST_PROCESSING_II };
@@ -407,7 +419,6 @@ FFT_dealloc(FFT* self)
 static PyObject *
 FFT_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL, *multmp=NULL, *addtmp=NULL;
     FFT *self;
     self = (FFT *)type->tp_alloc(type, 0);
@@ -428,6 +439,9 @@ FFT_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(maintmp);
     self->mainSplitter = (FFTMain *)maintmp;
 
+    if (self->chnl < 0 || self->chnl >= self->mainSplitter->overlaps * 3)
+        self->chnl = 0;
+
     if (multmp) {
         PyObject_CallMethod((PyObject *)self, "setMul", "O", multmp);
     }
@@ -436,7 +450,7 @@ FFT_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -579,29 +593,22 @@ typedef struct {
     int incount;
     MYFLT *inframe;
     MYFLT *outframe;
-    MYFLT *window;
-    MYFLT **twiddle;
-    MYFLT *twiddle2;
+    FFTPlan *plan; /* shared with the other overlaps */
     int modebuffer[2];
 } IFFT;
 
 static void
 IFFT_realloc_memories(IFFT *self) {
-    int i, n8;
+    int i;
+    FFTPlan *plan;
     self->hsize = self->size / 2;
-    n8 = self->size >> 3;
     self->inframe = (MYFLT *)realloc(self->inframe, self->size * sizeof(MYFLT));
     self->outframe = (MYFLT *)realloc(self->outframe, self->size * sizeof(MYFLT));
     for (i=0; i<self->size; i++)
         self->inframe[i] = self->outframe[i] = 0.0;
-    self->twiddle = (MYFLT **)realloc(self->twiddle, 4 * sizeof(MYFLT *));
-    for(i=0; i<4; i++)
-        self->twiddle[i] = (MYFLT *)malloc(n8 * sizeof(MYFLT));
-    fft_compute_split_twiddle(self->twiddle, self->size);
-    self->twiddle2 = (MYFLT *)realloc(self->twiddle2, self->size * sizeof(MYFLT));
-    fft_compute_radix2_twiddle(self->twiddle2, self->size);
-    self->window = (MYFLT *)realloc(self->window, self->size * sizeof(MYFLT));
-    gen_window(self->window, self->size, self->wintype);
+    plan = fft_plan_acquire(self->size, self->wintype);
+    fft_plan_release(self->plan);
+    self->plan = plan;
     self->incount = -self->hopsize;
 }
 
@@ -609,6 +616,7 @@ static void
 IFFT_filters(IFFT *self) {
     int i, incount;
     MYFLT data;
+    MYFLT *window = self->plan->window;
     MYFLT *inreal = Stream_getData((Stream *)self->inreal_stream);
     MYFLT *inimag = Stream_getData((Stream *)self->inimag_stream);
 
@@ -622,31 +630,15 @@ IFFT_filters(IFFT *self) {
             }
             else if (incount == self->hsize)
                 self->inframe[incount] = inreal[i];
-            data = self->outframe[incount] * self->window[incount];
+            data = self->outframe[incount] * window[incount];
             self->data[i] = data;
         }
         incount++;
         if (incount >= self->size) {
             incount -= self->size;
-            irealfft_split(self->inframe, self->outframe, self->size, self->twiddle);
+            irealfft_plan(self->inframe, self->outframe, self->plan);
         }
     }
-    /*
-    for (i=0; i<self->bufsize; i++) {
-        if (incount >= 0) {
-            if (incount < self->hsize) {
-                self->inframe[incount*2] = inreal[i];
-                self->inframe[incount*2+1] = inimag[i];
-            }
-            self->data[i] = self->outframe[incount] * self->window[incount];
-        }
-        incount++;
-        if (incount >= self->size) {
-            incount -= self->size;
-            irealfft_packed(self->inframe, self->outframe, self->size, self->twiddle2);
-        }
-    }
-    */
     self->incount = incount;
 }
 
@@ -731,16 +723,10 @@ IFFT_clear(IFFT *self)
 static void
 IFFT_dealloc(IFFT* self)
 {
-    int i;
     pyo_DEALLOC
     free(self->inframe);
     free(self->outframe);
-    free(self->window);
-    for(i=0; i<4; i++) {
-        free(self->twiddle[i]);
-    }
-    free(self->twiddle);
-    free(self->twiddle2);
+    fft_plan_release(self->plan);
     IFFT_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -748,7 +734,7 @@ IFFT_dealloc(IFFT* self)
 static PyObject *
 IFFT_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
+    int k;
     PyObject *inrealtmp, *inreal_streamtmp, *inimagtmp, *inimag_streamtmp, *multmp=NULL, *addtmp=NULL;
     IFFT *self;
     self = (IFFT *)type->tp_alloc(type, 0);
@@ -789,7 +775,15 @@ IFFT_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
+
+    if (!fft_size_is_valid(self->size)) {
+        k = 4;
+        while (k < self->size)
+            k *= 2;
+        self->size = k;
+        printf("IFFT size must be even with no prime factors other than 2, 3 and 5, using the next power-of-2 greater than size : %d\n", self->size);
+    }
 
     IFFT_realloc_memories(self);
 
@@ -829,13 +823,13 @@ IFFT_setSize(IFFT *self, PyObject *args, PyObject *kwds)
         return Py_None;
     }
 
-    if (isPowerOfTwo(size)) {
+    if (fft_size_is_valid(size)) {
         self->size = size;
         self->hopsize = hopsize;
         IFFT_realloc_memories(self);
     }
     else
-        printf("IFFT size must be a power of two!\n");
+        printf("IFFT size must be even with no prime factors other than 2, 3 and 5!\n");
 
     Py_INCREF(Py_None);
     return Py_None;
@@ -844,9 +838,13 @@ IFFT_setSize(IFFT *self, PyObject *args, PyObject *kwds)
 static PyObject *
 IFFT_setWinType(IFFT *self, PyObject *arg)
 {
+    FFTPlan *plan;
+
     if (PyLong_Check(arg) || PyInt_Check(arg)) {
         self->wintype = PyLong_AsLong(arg);
-        gen_window(self->window, self->size, self->wintype);
+        plan = fft_plan_acquire(self->size, self->wintype);
+        fft_plan_release(self->plan);
+        self->plan = plan;
     }
 
     Py_INCREF(Py_None);
@@ -1079,7 +1077,6 @@ CarToPol_dealloc(CarToPol* self)
 static PyObject *
 CarToPol_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *input2tmp, *input2_streamtmp, *multmp=NULL, *addtmp=NULL;
     CarToPol *self;
     self = (CarToPol *)type->tp_alloc(type, 0);
@@ -1113,7 +1110,7 @@ CarToPol_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -1362,7 +1359,6 @@ PolToCar_dealloc(PolToCar* self)
 static PyObject *
 PolToCar_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *input2tmp, *input2_streamtmp, *multmp=NULL, *addtmp=NULL;
     PolToCar *self;
     self = (PolToCar *)type->tp_alloc(type, 0);
@@ -1396,7 +1392,7 @@ PolToCar_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -1639,6 +1635,7 @@ FrameDeltaMain_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, FrameDeltaMain_compute_next_data_frame);
+    Stream_setSerial(self->stream, 2);
     self->mode_func_ptr = FrameDeltaMain_setProcMode;
 
     static char *kwlist[] = {"input", "frameSize", "overlaps", NULL};
@@ -1650,7 +1647,7 @@ FrameDeltaMain_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setInput", "O", inputtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->hopsize = self->frameSize / self->overlaps;
     self->frameBuffer = (MYFLT **)realloc(self->frameBuffer, self->overlaps * sizeof(MYFLT *));
@@ -1704,7 +1701,7 @@ FrameDeltaMain_setFrameSize(FrameDeltaMain *self, PyObject *arg)
 
     if (PyInt_Check(arg)) {
         tmp = PyLong_AsLong(arg);
-        if (isPowerOfTwo(tmp)) {
+        if (fft_size_is_valid(tmp)) {
             self->frameSize = tmp;
             self->hopsize = self->frameSize / self->overlaps;
 
@@ -1720,7 +1717,7 @@ FrameDeltaMain_setFrameSize(FrameDeltaMain *self, PyObject *arg)
         }
     }
     else
-        printf("frameSize must be a power of two!\n");
+        printf("frameSize must be even with no prime factors other than 2, 3 and 5!\n");
 
     Py_INCREF(Py_None);
     return Py_None;
@@ -1882,7 +1879,6 @@ FrameDelta_dealloc(FrameDelta* self)
 static PyObject *
 FrameDelta_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL, *multmp=NULL, *addtmp=NULL;
     FrameDelta *self;
     self = (FrameDelta *)type->tp_alloc(type, 0);
@@ -1911,7 +1907,7 @@ FrameDelta_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -2148,6 +2144,7 @@ FrameAccumMain_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, FrameAccumMain_compute_next_data_frame);
+    Stream_setSerial(self->stream, 2);
     self->mode_func_ptr = FrameAccumMain_setProcMode;
 
     static char *kwlist[] = {"input", "framesize", "overlaps", NULL};
@@ -2159,7 +2156,7 @@ FrameAccumMain_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setInput", "O", inputtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->hopsize = self->frameSize / self->overlaps;
     self->frameBuffer = (MYFLT **)realloc(self->frameBuffer, self->overlaps * sizeof(MYFLT *));
@@ -2213,7 +2210,7 @@ FrameAccumMain_setFrameSize(FrameAccumMain *self, PyObject *arg)
 
     if (PyInt_Check(arg)) {
         tmp = PyLong_AsLong(arg);
-        if (isPowerOfTwo(tmp)) {
+        if (fft_size_is_valid(tmp)) {
             self->frameSize = tmp;
             self->hopsize = self->frameSize / self->overlaps;
 
@@ -2229,7 +2226,7 @@ FrameAccumMain_setFrameSize(FrameAccumMain *self, PyObject *arg)
         }
     }
     else
-        printf("frameSize must be a power of two!\n");
+        printf("frameSize must be even with no prime factors other than 2, 3 and 5!\n");
 
     Py_INCREF(Py_None);
     return Py_None;
@@ -2391,7 +2388,6 @@ FrameAccum_dealloc(FrameAccum* self)
 static PyObject *
 FrameAccum_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL, *multmp=NULL, *addtmp=NULL;
     FrameAccum *self;
     self = (FrameAccum *)type->tp_alloc(type, 0);
@@ -2420,7 +2416,7 @@ FrameAccum_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -2723,6 +2719,7 @@ VectralMain_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, VectralMain_compute_next_data_frame);
+    Stream_setSerial(self->stream, 2);
     self->mode_func_ptr = VectralMain_setProcMode;
 
     static char *kwlist[] = {"input", "frameSize", "overlaps", "up", "down", "damp", NULL};
@@ -2746,7 +2743,7 @@ VectralMain_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setDamp", "O", damptmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->hopsize = self->frameSize / self->overlaps;
     self->frameBuffer = (MYFLT **)realloc(self->frameBuffer, self->overlaps * sizeof(MYFLT *));
@@ -2800,7 +2797,7 @@ VectralMain_setFrameSize(VectralMain *self, PyObject *arg)
 
     if (PyInt_Check(arg)) {
         tmp = PyLong_AsLong(arg);
-        if (isPowerOfTwo(tmp)) {
+        if (fft_size_is_valid(tmp)) {
             self->frameSize = tmp;
             self->hopsize = self->frameSize / self->overlaps;
 
@@ -2816,7 +2813,7 @@ VectralMain_setFrameSize(VectralMain *self, PyObject *arg)
         }
     }
     else
-        printf("frameSize must be a power of two!\n");
+        printf("frameSize must be even with no prime factors other than 2, 3 and 5!\n");
 
     Py_INCREF(Py_None);
     return Py_None;
@@ -3077,7 +3074,6 @@ Vectral_dealloc(Vectral* self)
 static PyObject *
 Vectral_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL, *multmp=NULL, *addtmp=NULL;
     Vectral *self;
     self = (Vectral *)type->tp_alloc(type, 0);
@@ -3106,7 +3102,7 @@ Vectral_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -3256,7 +3252,7 @@ typedef struct {
     MYFLT *inframe;
     MYFLT *outframe;
     MYFLT *last_half_frame;
-    MYFLT **twiddle;
+    FFTPlan *plan;
     MYFLT *input_buffer;
     MYFLT *output_buffer;
     MYFLT **impulse_real;
@@ -3270,10 +3266,9 @@ typedef struct {
 
 static void
 CvlVerb_alloc_memories(CvlVerb *self) {
-    int i, n8;
+    int i;
     self->hsize = self->size / 2;
     self->size2 = self->size * 2;
-    n8 = self->size2 >> 3;
     self->real = (MYFLT *)realloc(self->real, self->size * sizeof(MYFLT));
     self->imag = (MYFLT *)realloc(self->imag, self->size * sizeof(MYFLT));
     self->inframe = (MYFLT *)realloc(self->inframe, self->size2 * sizeof(MYFLT));
@@ -3285,10 +3280,7 @@ CvlVerb_alloc_memories(CvlVerb *self) {
         self->inframe[i] = self->outframe[i] = self->output_buffer[i] = 0.0;
     for (i=0; i<self->size; i++)
         self->last_half_frame[i] = self->input_buffer[i] = 0.0;
-    self->twiddle = (MYFLT **)realloc(self->twiddle, 4 * sizeof(MYFLT *));
-    for(i=0; i<4; i++)
-        self->twiddle[i] = (MYFLT *)malloc(n8 * sizeof(MYFLT));
-    fft_compute_split_twiddle(self->twiddle, self->size2);
+    self->plan = fft_plan_acquire(self->size2, -1);
 }
 
 static void
@@ -3355,7 +3347,7 @@ CvlVerb_analyse_impulse(CvlVerb *self) {
         for (i=self->size; i<self->size2; i++) {
             inframe[i] = 0.0;
         }
-        realfft_split(inframe, outframe, self->size2, self->twiddle);
+        realfft_plan(inframe, outframe, self->plan);
         self->impulse_real[j][0] = outframe[0];
         self->impulse_imag[j][0] = 0.0;
         for (i=1; i<self->size; i++) {
@@ -3398,7 +3390,7 @@ CvlVerb_process_i(CvlVerb *self) {
                 self->inframe[i] = self->last_half_frame[i];
                 self->inframe[i+self->size] = self->last_half_frame[i] = self->input_buffer[i];
             }
-            realfft_split(self->inframe, self->outframe, self->size2, self->twiddle);
+            realfft_plan(self->inframe, self->outframe, self->plan);
             self->real[0] = self->outframe[0];
             self->imag[0] = 0.0;
             for (i=1; i<self->size; i++) {
@@ -3420,7 +3412,7 @@ CvlVerb_process_i(CvlVerb *self) {
                 self->inframe[i] = self->accum_real[self->current_iter][i];
                 self->inframe[self->size2 - i] = self->accum_imag[self->current_iter][i];
             }
-            irealfft_split(self->inframe, self->outframe, self->size2, self->twiddle);
+            irealfft_plan(self->inframe, self->outframe, self->plan);
 
             for (i=0; i<self->size; i++) {
                 self->output_buffer[i] = self->outframe[i+self->size];
@@ -3462,7 +3454,7 @@ CvlVerb_process_a(CvlVerb *self) {
                 self->inframe[i] = self->last_half_frame[i];
                 self->inframe[i+self->size] = self->last_half_frame[i] = self->input_buffer[i];
             }
-            realfft_split(self->inframe, self->outframe, self->size2, self->twiddle);
+            realfft_plan(self->inframe, self->outframe, self->plan);
             self->real[0] = self->outframe[0];
             self->imag[0] = 0.0;
             for (i=1; i<self->size; i++) {
@@ -3484,7 +3476,7 @@ CvlVerb_process_a(CvlVerb *self) {
                 self->inframe[i] = self->accum_real[self->current_iter][i];
                 self->inframe[self->size2 - i] = self->accum_imag[self->current_iter][i];
             }
-            irealfft_split(self->inframe, self->outframe, self->size2, self->twiddle);
+            irealfft_plan(self->inframe, self->outframe, self->plan);
 
             for (i=0; i<self->size; i++) {
                 self->output_buffer[i] = self->outframe[i+self->size];
@@ -3593,10 +3585,7 @@ CvlVerb_dealloc(CvlVerb* self)
     free(self->input_buffer);
     free(self->output_buffer);
     free(self->last_half_frame);
-    for(i=0; i<4; i++) {
-        free(self->twiddle[i]);
-    }
-    free(self->twiddle);
+    fft_plan_release(self->plan);
     for(i=0; i<self->num_iter; i++) {
         free(self->impulse_real[i]);
         free(self->impulse_imag[i]);
@@ -3616,7 +3605,7 @@ CvlVerb_dealloc(CvlVerb* self)
 static PyObject *
 CvlVerb_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i, k;
+    int k;
     PyObject *inputtmp, *input_streamtmp, *baltmp=NULL, *multmp=NULL, *addtmp=NULL;
     CvlVerb *self;
     self = (CvlVerb *)type->tp_alloc(type, 0);
@@ -3659,7 +3648,7 @@ CvlVerb_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     CvlVerb_alloc_memories(self);
     CvlVerb_analyse_impulse(self);
@@ -3855,15 +3844,16 @@ typedef struct {
     MYFLT *magnitude;
     MYFLT *last_magnitude;
     MYFLT *tmpmag;
-    MYFLT *window;
-    MYFLT **twiddle;
+    FFTPlan *plan;
+    AnalysisBus *bus; /* receives the magnitudes of each analysis frame */
+    int buschnl;
 } Spectrum;
 
 static void
 Spectrum_realloc_memories(Spectrum *self) {
-    int i, n8;
+    int i;
+    FFTPlan *plan;
     self->hsize = self->size / 2;
-    n8 = self->size >> 3;
     self->input_buffer = (MYFLT *)realloc(self->input_buffer, self->size * sizeof(MYFLT));
     self->inframe = (MYFLT *)realloc(self->inframe, self->size * sizeof(MYFLT));
     self->outframe = (MYFLT *)realloc(self->outframe, self->size * sizeof(MYFLT));
@@ -3874,12 +3864,9 @@ Spectrum_realloc_memories(Spectrum *self) {
     self->tmpmag = (MYFLT *)realloc(self->tmpmag, (self->hsize+6) * sizeof(MYFLT));
     for (i=0; i<self->hsize; i++)
         self->magnitude[i] = self->last_magnitude[i] = self->tmpmag[i+3] = 0.0;
-    self->twiddle = (MYFLT **)realloc(self->twiddle, 4 * sizeof(MYFLT *));
-    for(i=0; i<4; i++)
-        self->twiddle[i] = (MYFLT *)malloc(n8 * sizeof(MYFLT));
-    fft_compute_split_twiddle(self->twiddle, self->size);
-    self->window = (MYFLT *)realloc(self->window, self->size * sizeof(MYFLT));
-    gen_window(self->window, self->size, self->wintype);
+    plan = fft_plan_acquire(self->size, self->wintype);
+    fft_plan_release(self->plan);
+    self->plan = plan;
     self->incount = self->hsize;
     self->freqPerBin = self->sr / self->size;
 }
@@ -3983,10 +3970,10 @@ Spectrum_filters(Spectrum *self) {
         self->incount++;
         if (self->incount == self->size) {
             for (j=0; j<self->size; j++) {
-                self->inframe[j] = self->input_buffer[j] * self->window[j];
+                self->inframe[j] = self->input_buffer[j] * self->plan->window[j];
             }
             self->incount = self->hsize;
-            realfft_split(self->inframe, self->outframe, self->size, self->twiddle);
+            realfft_plan(self->inframe, self->outframe, self->plan);
             self->tmpmag[0] = self->tmpmag[1] = self->tmpmag[2] = 0.0;
             self->tmpmag[self->hsize] = self->tmpmag[self->hsize+1] = self->tmpmag[self->hsize+2] = 0.0;
             self->tmpmag[3] = MYSQRT(self->outframe[0]*self->outframe[0]);
@@ -4003,6 +3990,8 @@ Spectrum_filters(Spectrum *self) {
                 self->magnitude[j] = tmp;
                 self->input_buffer[j] = self->input_buffer[j+self->hsize];
             }
+            if (self->bus != NULL)
+                AnalysisBus_write(self->bus, self->buschnl, self->magnitude, self->hsize);
         }
     }
 }
@@ -4023,6 +4012,7 @@ static int
 Spectrum_traverse(Spectrum *self, visitproc visit, void *arg)
 {
     pyo_VISIT
+    Py_VISIT(self->bus);
     Py_VISIT(self->input);
     Py_VISIT(self->input_stream);
     return 0;
@@ -4032,6 +4022,7 @@ static int
 Spectrum_clear(Spectrum *self)
 {
     pyo_CLEAR
+    Py_CLEAR(self->bus);
     Py_CLEAR(self->input);
     Py_CLEAR(self->input_stream);
     return 0;
@@ -4040,19 +4031,14 @@ Spectrum_clear(Spectrum *self)
 static void
 Spectrum_dealloc(Spectrum* self)
 {
-    int i;
     pyo_DEALLOC
     free(self->input_buffer);
     free(self->inframe);
     free(self->outframe);
-    free(self->window);
     free(self->magnitude);
     free(self->last_magnitude);
     free(self->tmpmag);
-    for(i=0; i<4; i++) {
-        free(self->twiddle[i]);
-    }
-    free(self->twiddle);
+    fft_plan_release(self->plan);
     Spectrum_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -4060,7 +4046,7 @@ Spectrum_dealloc(Spectrum* self)
 static PyObject *
 Spectrum_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i, k;
+    int k;
     PyObject *inputtmp, *input_streamtmp;
     Spectrum *self;
     self = (Spectrum *)type->tp_alloc(type, 0);
@@ -4078,6 +4064,8 @@ Spectrum_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->height = 400;
     self->fscaling = 0;
     self->mscaling = 1;
+    self->bus = NULL;
+    self->buschnl = 0;
 
     Stream_setFunctionPtr(self->stream, Spectrum_compute_next_data_frame);
     self->mode_func_ptr = Spectrum_setProcMode;
@@ -4089,7 +4077,7 @@ Spectrum_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_INPUT_STREAM
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     if (!isPowerOfTwo(self->size)) {
         k = 1;
@@ -4106,6 +4094,12 @@ Spectrum_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     return (PyObject *)self;
 }
 
+static PyObject *
+Spectrum_setBus(Spectrum *self, PyObject *args)
+{
+    return AnalysisBus_setTarget(&self->bus, &self->buschnl, args);
+}
+
 static PyObject * Spectrum_getServer(Spectrum* self) { GET_SERVER };
 static PyObject * Spectrum_getStream(Spectrum* self) { GET_STREAM };
 static PyObject * Spectrum_play(Spectrum *self, PyObject *args, PyObject *kwds) { PLAY };
@@ -4132,9 +4126,13 @@ Spectrum_setSize(Spectrum *self, PyObject *arg)
 static PyObject *
 Spectrum_setWinType(Spectrum *self, PyObject *arg)
 {
+    FFTPlan *plan;
+
     if (PyLong_Check(arg) || PyInt_Check(arg)) {
         self->wintype = PyLong_AsLong(arg);
-        gen_window(self->window, self->size, self->wintype);
+        plan = fft_plan_acquire(self->size, self->wintype);
+        fft_plan_release(self->plan);
+        self->plan = plan;
     }
 
     Py_INCREF(Py_None);
@@ -4254,6 +4252,7 @@ static PyMethodDef Spectrum_methods[] = {
 {"setLowbound", (PyCFunction)Spectrum_setLowbound, METH_O, "Sets the first frequency to display."},
 {"setHighbound", (PyCFunction)Spectrum_setHighbound, METH_O, "Sets the last frequency to display."},
 {"setWidth", (PyCFunction)Spectrum_setWidth, METH_O, "Sets the width of the display."},
+{"setBus", (PyCFunction)Spectrum_setBus, METH_VARARGS, "Sets the analysis bus receiving the magnitudes."},
 {"setHeight", (PyCFunction)Spectrum_setHeight, METH_O, "Sets the height of the display."},
 {"setFscaling", (PyCFunction)Spectrum_setFscaling, METH_O, "Sets the frequency scaling of the display."},
 {"setMscaling", (PyCFunction)Spectrum_setMscaling, METH_O, "Sets the magnitude scaling of the display."},
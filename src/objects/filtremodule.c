@@ -302,10 +302,18 @@ Biquad_setProcMode(Biquad *self)
     }
 }
 
+/* Called by the server when the stream falls asleep. */
+static void
+Biquad_reset_memories(Biquad *self)
+{
+    self->x1 = self->x2 = self->y1 = self->y2 = 0.0;
+}
+
 static void
 Biquad_compute_next_data_frame(Biquad *self)
 {
     (*self->proc_func_ptr)(self);
+    Stream_measureRinging(self->stream);
     (*self->muladd_func_ptr)(self);
 }
 
@@ -346,7 +354,6 @@ Biquad_dealloc(Biquad* self)
 static PyObject *
 Biquad_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *qtmp=NULL, *multmp=NULL, *addtmp=NULL;
     Biquad *self;
     self = (Biquad *)type->tp_alloc(type, 0);
@@ -365,6 +372,8 @@ Biquad_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->nyquist = (MYFLT)self->sr * 0.49;
 
     Stream_setFunctionPtr(self->stream, Biquad_compute_next_data_frame);
+    Stream_setResetFunctionPtr(self->stream, Biquad_reset_memories);
+    Stream_setTail(self->stream, 0);
     self->mode_func_ptr = Biquad_setProcMode;
 
     static char *kwlist[] = {"input", "freq", "q", "type", "mul", "add", NULL};
@@ -390,7 +399,7 @@ Biquad_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -926,10 +935,21 @@ Biquadx_setProcMode(Biquadx *self)
     }
 }
 
+/* Called by the server when the stream falls asleep. */
+static void
+Biquadx_reset_memories(Biquadx *self)
+{
+    int i;
+    for (i=0; i<self->stages; i++) {
+        self->x1[i] = self->x2[i] = self->y1[i] = self->y2[i] = 0.0;
+    }
+}
+
 static void
 Biquadx_compute_next_data_frame(Biquadx *self)
 {
     (*self->proc_func_ptr)(self);
+    Stream_measureRinging(self->stream);
     (*self->muladd_func_ptr)(self);
 }
 
@@ -974,7 +994,6 @@ Biquadx_dealloc(Biquadx* self)
 static PyObject *
 Biquadx_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *qtmp=NULL, *multmp=NULL, *addtmp=NULL;
     Biquadx *self;
     self = (Biquadx *)type->tp_alloc(type, 0);
@@ -994,6 +1013,8 @@ Biquadx_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->nyquist = (MYFLT)self->sr * 0.49;
 
     Stream_setFunctionPtr(self->stream, Biquadx_compute_next_data_frame);
+    Stream_setResetFunctionPtr(self->stream, Biquadx_reset_memories);
+    Stream_setTail(self->stream, 0);
     self->mode_func_ptr = Biquadx_setProcMode;
 
     static char *kwlist[] = {"input", "freq", "q", "type", "stages", "mul", "add", NULL};
@@ -1019,7 +1040,7 @@ Biquadx_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     Biquadx_allocate_memories(self);
 
@@ -1413,7 +1434,6 @@ Biquada_dealloc(Biquada* self)
 static PyObject *
 Biquada_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *b0tmp, *b1tmp, *b2tmp, *a0tmp, *a1tmp, *a2tmp, *multmp=NULL, *addtmp=NULL;
     Biquada *self;
     self = (Biquada *)type->tp_alloc(type, 0);
@@ -1451,7 +1471,7 @@ Biquada_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     if (addtmp)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -2117,7 +2137,6 @@ EQ_dealloc(EQ* self)
 static PyObject *
 EQ_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *qtmp=NULL, *boosttmp=NULL, *multmp=NULL, *addtmp=NULL;
     EQ *self;
     self = (EQ *)type->tp_alloc(type, 0);
@@ -2167,7 +2186,7 @@ EQ_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -2457,6 +2476,16 @@ direction(Port *self, MYFLT val)
     self->x1 = val;
 }
 
+/* Factor of the one-pole filter for a ramp time. At control rate, sr is the rate of the
+   buffers and a time shorter than two buffers would give a factor above 1, which makes
+   the filter unstable, so it is limited to 1 (the output reaches the input at once). */
+static MYFLT
+Port_factor(MYFLT time, double sr)
+{
+    MYFLT factor = 1. / ((time + 0.001) * sr);
+    return factor < 1.0 ? factor : 1.0;
+}
+
 static void
 Port_filters_ii(Port *self) {
     MYFLT val;
@@ -2464,8 +2493,8 @@ Port_filters_ii(Port *self) {
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT risetime = PyFloat_AS_DOUBLE(self->risetime);
     MYFLT falltime = PyFloat_AS_DOUBLE(self->falltime);
-    MYFLT risefactor = 1. / ((risetime + 0.001) * self->sr);
-    MYFLT fallfactor = 1. / ((falltime + 0.001) * self->sr);
+    MYFLT risefactor = Port_factor(risetime, self->sr);
+    MYFLT fallfactor = Port_factor(falltime, self->sr);
     MYFLT factors[2] = {fallfactor, risefactor};
 
     for (i=0; i<self->bufsize; i++) {
@@ -2483,11 +2512,13 @@ Port_filters_ai(Port *self) {
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT *risetime = Stream_getData((Stream *)self->risetime_stream);
     MYFLT falltime = PyFloat_AS_DOUBLE(self->falltime);
-    MYFLT fallfactor = 1. / ((falltime + 0.001) * self->sr);
+    MYFLT fallfactor = Port_factor(falltime, self->sr);
 
     for (i=0; i<self->bufsize; i++) {
         direction(self, in[i]);
         risefactor = (*risetime++ + 0.001) * self->sr;
+        if (risefactor < 1.0)
+            risefactor = 1.0;
         if (self->dir == 1)
             val = self->y1 + (*in++ - self->y1) / risefactor;
         else
@@ -2504,11 +2535,13 @@ Port_filters_ia(Port *self) {
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT *falltime = Stream_getData((Stream *)self->falltime_stream);
     MYFLT risetime = PyFloat_AS_DOUBLE(self->risetime);
-    MYFLT risefactor = 1. / ((risetime + 0.001) * self->sr);
+    MYFLT risefactor = Port_factor(risetime, self->sr);
 
     for (i=0; i<self->bufsize; i++) {
         direction(self, in[i]);
         fallfactor = (*falltime++ + 0.001) * self->sr;
+        if (fallfactor < 1.0)
+            fallfactor = 1.0;
         if (self->dir == 1)
             val = self->y1 + (*in++ - self->y1) * risefactor;
         else
@@ -2529,7 +2562,11 @@ Port_filters_aa(Port *self) {
     for (i=0; i<self->bufsize; i++) {
         direction(self, in[i]);
         risefactor = (*risetime++ + 0.001) * self->sr;
+        if (risefactor < 1.0)
+            risefactor = 1.0;
         fallfactor = (*falltime++ + 0.001) * self->sr;
+        if (fallfactor < 1.0)
+            fallfactor = 1.0;
         if (self->dir == 1)
             val = self->y1 + (*in++ - self->y1) / risefactor;
         else
@@ -2645,7 +2682,6 @@ Port_dealloc(Port* self)
 static PyObject *
 Port_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     MYFLT inittmp = 0.0;
     PyObject *inputtmp, *input_streamtmp, *risetimetmp=NULL, *falltimetmp=NULL, *multmp=NULL, *addtmp=NULL;
     Port *self;
@@ -2663,6 +2699,7 @@ Port_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Port_compute_next_data_frame);
+    Stream_setControlRateCapable(self->stream, 1);
     self->mode_func_ptr = Port_setProcMode;
 
     static char *kwlist[] = {"input", "risetime", "falltime", "init", "mul", "add", NULL};
@@ -2691,7 +2728,7 @@ Port_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     if (inittmp != 0.0)
         self->x1 = self->y1 = inittmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -3021,10 +3058,18 @@ Tone_setProcMode(Tone *self)
     }
 }
 
+/* Called by the server when the stream falls asleep. */
+static void
+Tone_reset_memories(Tone *self)
+{
+    self->y1 = 0.0;
+}
+
 static void
 Tone_compute_next_data_frame(Tone *self)
 {
     (*self->proc_func_ptr)(self);
+    Stream_measureRinging(self->stream);
     (*self->muladd_func_ptr)(self);
 }
 
@@ -3061,7 +3106,6 @@ Tone_dealloc(Tone* self)
 static PyObject *
 Tone_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *multmp=NULL, *addtmp=NULL;
     Tone *self;
     self = (Tone *)type->tp_alloc(type, 0);
@@ -3078,6 +3122,8 @@ Tone_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->nyquist = (MYFLT)self->sr * 0.49;
 
     Stream_setFunctionPtr(self->stream, Tone_compute_next_data_frame);
+    Stream_setResetFunctionPtr(self->stream, Tone_reset_memories);
+    Stream_setTail(self->stream, 0);
     self->mode_func_ptr = Tone_setProcMode;
 
     static char *kwlist[] = {"input", "freq", "mul", "add", NULL};
@@ -3099,7 +3145,7 @@ Tone_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -3391,10 +3437,18 @@ Atone_setProcMode(Atone *self)
     }
 }
 
+/* Called by the server when the stream falls asleep. */
+static void
+Atone_reset_memories(Atone *self)
+{
+    self->y1 = 0.0;
+}
+
 static void
 Atone_compute_next_data_frame(Atone *self)
 {
     (*self->proc_func_ptr)(self);
+    Stream_measureRinging(self->stream);
     (*self->muladd_func_ptr)(self);
 }
 
@@ -3431,7 +3485,6 @@ Atone_dealloc(Atone* self)
 static PyObject *
 Atone_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *multmp=NULL, *addtmp=NULL;
     Atone *self;
     self = (Atone *)type->tp_alloc(type, 0);
@@ -3448,6 +3501,8 @@ Atone_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->nyquist = (MYFLT)self->sr * 0.49;
 
     Stream_setFunctionPtr(self->stream, Atone_compute_next_data_frame);
+    Stream_setResetFunctionPtr(self->stream, Atone_reset_memories);
+    Stream_setTail(self->stream, 0);
     self->mode_func_ptr = Atone_setProcMode;
 
     static char *kwlist[] = {"input", "freq", "mul", "add", NULL};
@@ -3469,7 +3524,7 @@ Atone_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -3714,10 +3769,18 @@ DCBlock_setProcMode(DCBlock *self)
     }
 }
 
+/* Called by the server when the stream falls asleep. */
+static void
+DCBlock_reset_memories(DCBlock *self)
+{
+    self->x1 = self->y1 = 0.0;
+}
+
 static void
 DCBlock_compute_next_data_frame(DCBlock *self)
 {
     (*self->proc_func_ptr)(self);
+    Stream_measureRinging(self->stream);
     (*self->muladd_func_ptr)(self);
 }
 
@@ -3750,7 +3813,6 @@ DCBlock_dealloc(DCBlock* self)
 static PyObject *
 DCBlock_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *multmp=NULL, *addtmp=NULL;
     DCBlock *self;
     self = (DCBlock *)type->tp_alloc(type, 0);
@@ -3761,6 +3823,8 @@ DCBlock_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, DCBlock_compute_next_data_frame);
+    Stream_setResetFunctionPtr(self->stream, DCBlock_reset_memories);
+    Stream_setTail(self->stream, 0);
     self->mode_func_ptr = DCBlock_setProcMode;
 
     static char *kwlist[] = {"input", "mul", "add", NULL};
@@ -3778,7 +3842,7 @@ DCBlock_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -4230,7 +4294,7 @@ Allpass_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->size = self->maxDelay * self->sr + 0.5;
 
@@ -4673,7 +4737,6 @@ Allpass2_dealloc(Allpass2* self)
 static PyObject *
 Allpass2_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *bwtmp=NULL, *multmp=NULL, *addtmp=NULL;
     Allpass2 *self;
     self = (Allpass2 *)type->tp_alloc(type, 0);
@@ -4717,7 +4780,7 @@ Allpass2_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -5492,7 +5555,7 @@ Phaser_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -6670,7 +6733,6 @@ Vocoder_dealloc(Vocoder* self)
 static PyObject *
 Vocoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *input2tmp, *input2_streamtmp, *freqtmp=NULL, *spreadtmp=NULL, *qtmp=NULL, *slopetmp=NULL, *multmp=NULL, *addtmp=NULL;
     Vocoder *self;
     self = (Vocoder *)type->tp_alloc(type, 0);
@@ -6741,7 +6803,7 @@ Vocoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     Vocoder_allocate_memories(self);
 
@@ -7563,7 +7625,6 @@ SVF_dealloc(SVF* self)
 static PyObject *
 SVF_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *qtmp=NULL, *typetmp=NULL, *multmp=NULL, *addtmp=NULL;
     SVF *self;
     self = (SVF *)type->tp_alloc(type, 0);
@@ -7614,7 +7675,7 @@ SVF_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -8031,7 +8092,7 @@ Average_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->halfSize = (int)(self->size / 2);
     self->oneOnSize = 1.0 / (double)self->size;
@@ -8399,10 +8460,18 @@ Reson_setProcMode(Reson *self)
     }
 }
 
+/* Called by the server when the stream falls asleep. */
+static void
+Reson_reset_memories(Reson *self)
+{
+    self->x1 = self->x2 = self->y1 = self->y2 = 0.0;
+}
+
 static void
 Reson_compute_next_data_frame(Reson *self)
 {
     (*self->proc_func_ptr)(self);
+    Stream_measureRinging(self->stream);
     (*self->muladd_func_ptr)(self);
 }
 
@@ -8443,7 +8512,6 @@ Reson_dealloc(Reson* self)
 static PyObject *
 Reson_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *qtmp=NULL, *multmp=NULL, *addtmp=NULL;
     Reson *self;
     self = (Reson *)type->tp_alloc(type, 0);
@@ -8464,6 +8532,8 @@ Reson_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->twopiOverSr = TWOPI / (MYFLT)self->sr;
 
     Stream_setFunctionPtr(self->stream, Reson_compute_next_data_frame);
+    Stream_setResetFunctionPtr(self->stream, Reson_reset_memories);
+    Stream_setTail(self->stream, 0);
     self->mode_func_ptr = Reson_setProcMode;
 
     static char *kwlist[] = {"input", "freq", "q", "mul", "add", NULL};
@@ -8489,7 +8559,7 @@ Reson_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -8974,7 +9044,6 @@ Resonx_dealloc(Resonx* self)
 static PyObject *
 Resonx_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *qtmp=NULL, *multmp=NULL, *addtmp=NULL;
     Resonx *self;
     self = (Resonx *)type->tp_alloc(type, 0);
@@ -9020,7 +9089,7 @@ Resonx_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     Resonx_allocate_memories(self);
 
@@ -9391,10 +9460,18 @@ ButLP_setProcMode(ButLP *self)
     }
 }
 
+/* Called by the server when the stream falls asleep. */
+static void
+ButLP_reset_memories(ButLP *self)
+{
+    self->x1 = self->x2 = self->y1 = self->y2 = 0.0;
+}
+
 static void
 ButLP_compute_next_data_frame(ButLP *self)
 {
     (*self->proc_func_ptr)(self);
+    Stream_measureRinging(self->stream);
     (*self->muladd_func_ptr)(self);
 }
 
@@ -9431,7 +9508,6 @@ ButLP_dealloc(ButLP* self)
 static PyObject *
 ButLP_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *multmp=NULL, *addtmp=NULL;
     ButLP *self;
     self = (ButLP *)type->tp_alloc(type, 0);
@@ -9450,6 +9526,8 @@ ButLP_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->sqrt2 = MYSQRT(2.0);
 
     Stream_setFunctionPtr(self->stream, ButLP_compute_next_data_frame);
+    Stream_setResetFunctionPtr(self->stream, ButLP_reset_memories);
+    Stream_setTail(self->stream, 0);
     self->mode_func_ptr = ButLP_setProcMode;
 
     static char *kwlist[] = {"input", "freq", "mul", "add", NULL};
@@ -9471,7 +9549,7 @@ ButLP_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -9783,10 +9861,18 @@ ButHP_setProcMode(ButHP *self)
     }
 }
 
+/* Called by the server when the stream falls asleep. */
+static void
+ButHP_reset_memories(ButHP *self)
+{
+    self->x1 = self->x2 = self->y1 = self->y2 = 0.0;
+}
+
 static void
 ButHP_compute_next_data_frame(ButHP *self)
 {
     (*self->proc_func_ptr)(self);
+    Stream_measureRinging(self->stream);
     (*self->muladd_func_ptr)(self);
 }
 
@@ -9823,7 +9909,6 @@ ButHP_dealloc(ButHP* self)
 static PyObject *
 ButHP_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *multmp=NULL, *addtmp=NULL;
     ButHP *self;
     self = (ButHP *)type->tp_alloc(type, 0);
@@ -9842,6 +9927,8 @@ ButHP_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->sqrt2 = MYSQRT(2.0);
 
     Stream_setFunctionPtr(self->stream, ButHP_compute_next_data_frame);
+    Stream_setResetFunctionPtr(self->stream, ButHP_reset_memories);
+    Stream_setTail(self->stream, 0);
     self->mode_func_ptr = ButHP_setProcMode;
 
     static char *kwlist[] = {"input", "freq", "mul", "add", NULL};
@@ -9863,7 +9950,7 @@ ButHP_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -10237,10 +10324,18 @@ ButBP_setProcMode(ButBP *self)
     }
 }
 
+/* Called by the server when the stream falls asleep. */
+static void
+ButBP_reset_memories(ButBP *self)
+{
+    self->x1 = self->x2 = self->y1 = self->y2 = 0.0;
+}
+
 static void
 ButBP_compute_next_data_frame(ButBP *self)
 {
     (*self->proc_func_ptr)(self);
+    Stream_measureRinging(self->stream);
     (*self->muladd_func_ptr)(self);
 }
 
@@ -10281,7 +10376,6 @@ ButBP_dealloc(ButBP* self)
 static PyObject *
 ButBP_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *qtmp=NULL, *multmp=NULL, *addtmp=NULL;
     ButBP *self;
     self = (ButBP *)type->tp_alloc(type, 0);
@@ -10302,6 +10396,8 @@ ButBP_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->piOnSr = PI / (MYFLT)self->sr;
 
     Stream_setFunctionPtr(self->stream, ButBP_compute_next_data_frame);
+    Stream_setResetFunctionPtr(self->stream, ButBP_reset_memories);
+    Stream_setTail(self->stream, 0);
     self->mode_func_ptr = ButBP_setProcMode;
 
     static char *kwlist[] = {"input", "freq", "q", "mul", "add", NULL};
@@ -10327,7 +10423,7 @@ ButBP_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -10737,10 +10833,18 @@ ButBR_setProcMode(ButBR *self)
     }
 }
 
+/* Called by the server when the stream falls asleep. */
+static void
+ButBR_reset_memories(ButBR *self)
+{
+    self->x1 = self->x2 = self->y1 = self->y2 = 0.0;
+}
+
 static void
 ButBR_compute_next_data_frame(ButBR *self)
 {
     (*self->proc_func_ptr)(self);
+    Stream_measureRinging(self->stream);
     (*self->muladd_func_ptr)(self);
 }
 
@@ -10781,7 +10885,6 @@ ButBR_dealloc(ButBR* self)
 static PyObject *
 ButBR_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *qtmp=NULL, *multmp=NULL, *addtmp=NULL;
     ButBR *self;
     self = (ButBR *)type->tp_alloc(type, 0);
@@ -10802,6 +10905,8 @@ ButBR_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->piOnSr = PI / (MYFLT)self->sr;
 
     Stream_setFunctionPtr(self->stream, ButBR_compute_next_data_frame);
+    Stream_setResetFunctionPtr(self->stream, ButBR_reset_memories);
+    Stream_setTail(self->stream, 0);
     self->mode_func_ptr = ButBR_setProcMode;
 
     static char *kwlist[] = {"input", "freq", "q", "mul", "add", NULL};
@@ -10827,7 +10932,7 @@ ButBR_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -11287,7 +11392,6 @@ ComplexRes_dealloc(ComplexRes* self)
 static PyObject *
 ComplexRes_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *freqtmp=NULL, *decaytmp=NULL, *multmp=NULL, *addtmp=NULL;
     ComplexRes *self;
     self = (ComplexRes *)type->tp_alloc(type, 0);
@@ -11334,7 +11438,7 @@ ComplexRes_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -564,10 +564,29 @@ Freeverb_setProcMode(Freeverb *self)
     }
 }
 
+/* Called by the server when the stream falls asleep. */
+static void
+Freeverb_reset_memories(Freeverb *self)
+{
+    int i, j;
+    for (i=0; i<NUM_COMB; i++) {
+        self->comb_filterState[i] = 0.0;
+        for (j=0; j<self->comb_nSamples[i]; j++) {
+            self->comb_buf[i][j] = 0.0;
+        }
+    }
+    for (i=0; i<NUM_ALLPASS; i++) {
+        for (j=0; j<self->allpass_nSamples[i]; j++) {
+            self->allpass_buf[i][j] = 0.0;
+        }
+    }
+}
+
 static void
 Freeverb_compute_next_data_frame(Freeverb *self)
 {
     (*self->proc_func_ptr)(self);
+    Stream_measureRinging(self->stream);
     (*self->muladd_func_ptr)(self);
 }
 
@@ -638,6 +657,7 @@ Freeverb_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Freeverb_compute_next_data_frame);
+    Stream_setResetFunctionPtr(self->stream, Freeverb_reset_memories);
     self->mode_func_ptr = Freeverb_setProcMode;
 
     static char *kwlist[] = {"input", "size", "damp", "mix", "mul", "add", NULL};
@@ -667,7 +687,7 @@ Freeverb_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -678,6 +698,8 @@ Freeverb_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         nsamps = Freeverb_calc_nsamples((Freeverb *)self, comb_delays[i] + rndSamps);
         self->comb_buf[i] = (MYFLT *)realloc(self->comb_buf[i], (nsamps+1) * sizeof(MYFLT));
         self->comb_nSamples[i] = nsamps;
+        if (nsamps > self->stream->tail)
+            Stream_setTail(self->stream, (int)nsamps);
         self->comb_bufPos[i] = 0;
         self->comb_filterState[i] = 0.0;
         for(j=0; j<nsamps; j++) {
@@ -688,6 +710,7 @@ Freeverb_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
             nsamps = Freeverb_calc_nsamples((Freeverb *)self, allpass_delays[i] + rndSamps);
             self->allpass_buf[i] = (MYFLT *)realloc(self->allpass_buf[i], (nsamps+1) * sizeof(MYFLT));
             self->allpass_nSamples[i] = nsamps;
+            Stream_setTail(self->stream, self->stream->tail + (int)nsamps);
             self->allpass_bufPos[i] = 0;
             for(j=0; j<nsamps; j++) {
                 self->allpass_buf[i][j] = 0.0;
@@ -703,6 +703,7 @@ Granulator_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Granulator_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = Granulator_setProcMode;
 
     static char *kwlist[] = {"table", "env", "pitch", "pos", "dur", "grains", "basedur", "mul", "add", NULL};
@@ -744,7 +745,7 @@ Granulator_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->startPos = (MYFLT *)realloc(self->startPos, self->ngrains * sizeof(MYFLT));
     self->gsize = (MYFLT *)realloc(self->gsize, self->ngrains * sizeof(MYFLT));
@@ -1323,7 +1324,7 @@ Looper_transform_i(Looper *self) {
                             self->pointerPos[j] = 0.0;
                         else if (self->pointerPos[j] >= self->loopend[j]) {
                             self->active[j] = 0;
-                            PyObject_CallMethod((PyObject *)self, "stop", NULL);
+                            Server_deferStop((Server *)self->server, (PyObject *)self);
                         }
                         break;
                     case 1:
@@ -1494,7 +1495,7 @@ Looper_transform_a(Looper *self) {
                             self->pointerPos[j] = 0.0;
                         else if (self->pointerPos[j] >= self->loopend[j]) {
                             self->active[j] = 0;
-                            PyObject_CallMethod((PyObject *)self, "stop", NULL);
+                            Server_deferStop((Server *)self->server, (PyObject *)self);
                         }
                         break;
                     case 1:
@@ -1726,7 +1727,6 @@ Looper_dealloc(Looper* self)
 static PyObject *
 Looper_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *tabletmp, *pitchtmp=NULL, *starttmp=NULL, *durtmp=NULL, *xfadetmp=NULL, *multmp=NULL, *addtmp=NULL;
     Looper *self;
     self = (Looper *)type->tp_alloc(type, 0);
@@ -1754,6 +1754,7 @@ Looper_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Looper_compute_next_data_frame);
+    Stream_setSerial(self->stream, 3);
     self->mode_func_ptr = Looper_setProcMode;
 
     static char *kwlist[] = {"table", "pitch", "start", "dur", "xfade", "mode", "xfadeshape", "startfromloop", "interp", "autosmooth", "mul", "add", NULL};
@@ -1792,7 +1793,7 @@ Looper_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -2556,6 +2557,7 @@ Granule_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->srOnRandMax = self->sr / (MYFLT)RAND_MAX;
 
     Stream_setFunctionPtr(self->stream, Granule_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = Granule_setProcMode;
 
     static char *kwlist[] = {"table", "env", "dens", "pitch", "pos", "dur", "mul", "add", NULL};
@@ -2601,7 +2603,7 @@ Granule_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->gpos = (MYFLT *)realloc(self->gpos, Granule_MAX_GRAINS * sizeof(MYFLT));
     self->glen = (MYFLT *)realloc(self->glen, Granule_MAX_GRAINS * sizeof(MYFLT));
@@ -3585,6 +3587,7 @@ MainParticle_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->srOnRandMax = self->sr / (MYFLT)RAND_MAX;
 
     Stream_setFunctionPtr(self->stream, MainParticle_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = MainParticle_setProcMode;
 
     static char *kwlist[] = {"table", "env", "dens", "pitch", "pos", "dur", "dev", "pan", "chnls", NULL};
@@ -3631,7 +3634,7 @@ MainParticle_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setPan", "O", pantmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     if (self->chnls < 1)
         self->chnls = 1;
@@ -4082,7 +4085,6 @@ Particle_dealloc(Particle* self)
 static PyObject *
 Particle_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL, *multmp=NULL, *addtmp=NULL;
     Particle *self;
     self = (Particle *)type->tp_alloc(type, 0);
@@ -4111,7 +4113,7 @@ Particle_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
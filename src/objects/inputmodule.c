@@ -116,7 +116,6 @@ Input_dealloc(Input* self)
 static PyObject *
 Input_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *multmp=NULL, *addtmp=NULL;
     Input *self;
     self = (Input *)type->tp_alloc(type, 0);
@@ -142,7 +141,7 @@ Input_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -35,8 +35,6 @@ typedef struct {
     int modebuffer[4]; // need at least 2 slots for mul & add
     int wavetype;
     MYFLT oneOverPiOverTwo;
-    MYFLT srOverFour;
-    MYFLT srOverEight;
     MYFLT pointerPos;
     MYFLT sahPointerPos;
     MYFLT sahCurrentValue;
@@ -49,6 +47,8 @@ LFO_generates_ii(LFO *self) {
     MYFLT val, inc, freq, sharp, pointer, numh;
     MYFLT v1, v2, inc2, fade;
     int i, maxHarms;
+    MYFLT srOverFour = (MYFLT)self->sr * 0.25;
+    MYFLT srOverEight = (MYFLT)self->sr * 0.125;
 
     freq = PyFloat_AS_DOUBLE(self->freq);
     if (freq <= 0) {
@@ -63,10 +63,12 @@ LFO_generates_ii(LFO *self) {
 
     switch (self->wavetype) {
         case 0: /* Saw up */
-            maxHarms = (int)(self->srOverFour/freq);
+            maxHarms = (int)(srOverFour/freq);
             numh = sharp * 46.0 + 4.0;
             if (numh > maxHarms)
                 numh = maxHarms;
+            if (numh < 1.0)
+                numh = 1.0;
                 for (i=0; i<self->bufsize; i++) {
                     pointer = self->pointerPos * 2.0 - 1.0;
                     val = pointer - MYTANH(numh * pointer) / MYTANH(numh);
@@ -79,10 +81,12 @@ LFO_generates_ii(LFO *self) {
                 }
             break;
         case 1: /* Saw down */
-            maxHarms = (int)(self->srOverFour/freq);
+            maxHarms = (int)(srOverFour/freq);
             numh = sharp * 46.0 + 4.0;
             if (numh > maxHarms)
                 numh = maxHarms;
+            if (numh < 1.0)
+                numh = 1.0;
                 for (i=0; i<self->bufsize; i++) {
                     pointer = self->pointerPos * 2.0 - 1.0;
                     val = -(pointer - MYTANH(numh * pointer) / MYTANH(numh));
@@ -95,7 +99,7 @@ LFO_generates_ii(LFO *self) {
                 }
             break;
         case 2: /* Square */
-            maxHarms = (int)(self->srOverEight/freq);
+            maxHarms = (int)(srOverEight/freq);
             numh = sharp * 46.0 + 4.0;
             if (numh > maxHarms)
                 numh = maxHarms;
@@ -110,7 +114,7 @@ LFO_generates_ii(LFO *self) {
                 }
             break;
         case 3: /* Triangle */
-            maxHarms = (int)(self->srOverFour/freq);
+            maxHarms = (int)(srOverFour/freq);
             if ((sharp * 36.0) > maxHarms)
                 numh = (MYFLT)(maxHarms / 36.0);
             else
@@ -131,7 +135,7 @@ LFO_generates_ii(LFO *self) {
             }
             break;
         case 4: /* Pulse */
-            maxHarms = (int)(self->srOverEight/freq);
+            maxHarms = (int)(srOverEight/freq);
             numh = MYFLOOR(sharp * 46.0 + 4.0);
             if (numh > maxHarms)
                 numh = maxHarms;
@@ -148,7 +152,7 @@ LFO_generates_ii(LFO *self) {
             }
             break;
         case 5: /* Bi-Pulse */
-            maxHarms = (int)(self->srOverEight/freq);
+            maxHarms = (int)(srOverEight/freq);
             numh = MYFLOOR(sharp * 46.0 + 4.0);
             if (numh > maxHarms)
                 numh = maxHarms;
@@ -215,6 +219,8 @@ LFO_generates_ai(LFO *self) {
     MYFLT val, inc, freq, sharp, pointer, numh;
     MYFLT v1, v2, inc2, fade;
     int i, maxHarms;
+    MYFLT srOverFour = (MYFLT)self->sr * 0.25;
+    MYFLT srOverEight = (MYFLT)self->sr * 0.125;
 
     MYFLT *fr = Stream_getData((Stream *)self->freq_stream);
     if (fr[0] <= 0) {
@@ -231,10 +237,12 @@ LFO_generates_ai(LFO *self) {
             for (i=0; i<self->bufsize; i++) {
                 freq = fr[i];
                 inc = freq / self->sr;
-                maxHarms = (int)(self->srOverFour/freq);
+                maxHarms = (int)(srOverFour/freq);
                 numh = sharp * 46.0 + 4.0;
                 if (numh > maxHarms)
                     numh = maxHarms;
+                if (numh < 1.0)
+                    numh = 1.0;
                 pointer = self->pointerPos * 2.0 - 1.0;
                 val = pointer - MYTANH(numh * pointer) / MYTANH(numh);
                 self->data[i] = val;
@@ -249,10 +257,12 @@ LFO_generates_ai(LFO *self) {
             for (i=0; i<self->bufsize; i++) {
                 freq = fr[i];
                 inc = freq / self->sr;
-                maxHarms = (int)(self->srOverFour/freq);
+                maxHarms = (int)(srOverFour/freq);
                 numh = sharp * 46.0 + 4.0;
                 if (numh > maxHarms)
                     numh = maxHarms;
+                if (numh < 1.0)
+                    numh = 1.0;
                 pointer = self->pointerPos * 2.0 - 1.0;
                 val = -(pointer - MYTANH(numh * pointer) / MYTANH(numh));
                 self->data[i] = val;
@@ -267,7 +277,7 @@ LFO_generates_ai(LFO *self) {
             for (i=0; i<self->bufsize; i++) {
                 freq = fr[i];
                 inc = freq / self->sr;
-                maxHarms = (int)(self->srOverEight/freq);
+                maxHarms = (int)(srOverEight/freq);
                 numh = sharp * 46.0 + 4.0;
                 if (numh > maxHarms)
                     numh = maxHarms;
@@ -284,7 +294,7 @@ LFO_generates_ai(LFO *self) {
             for (i=0; i<self->bufsize; i++) {
                 freq = fr[i];
                 inc = freq / self->sr;
-                maxHarms = (int)(self->srOverFour/freq);
+                maxHarms = (int)(srOverFour/freq);
                 if ((sharp * 36.0) > maxHarms)
                     numh = (MYFLT)(maxHarms / 36.0);
                 else
@@ -307,7 +317,7 @@ LFO_generates_ai(LFO *self) {
             for (i=0; i<self->bufsize; i++) {
                 freq = fr[i];
                 inc = freq / self->sr;
-                maxHarms = (int)(self->srOverEight/freq);
+                maxHarms = (int)(srOverEight/freq);
                 numh = MYFLOOR(sharp * 46.0 + 4.0);
                 if (numh > maxHarms)
                     numh = maxHarms;
@@ -326,7 +336,7 @@ LFO_generates_ai(LFO *self) {
             for (i=0; i<self->bufsize; i++) {
                 freq = fr[i];
                 inc = freq / self->sr;
-                maxHarms = (int)(self->srOverEight/freq);
+                maxHarms = (int)(srOverEight/freq);
                 numh = MYFLOOR(sharp * 46.0 + 4.0);
                 if (numh > maxHarms)
                     numh = maxHarms;
@@ -396,6 +406,8 @@ LFO_generates_ia(LFO *self) {
     MYFLT val, inc, freq, sharp, pointer, numh;
     MYFLT v1, v2, inc2, fade;
     int i, maxHarms;
+    MYFLT srOverFour = (MYFLT)self->sr * 0.25;
+    MYFLT srOverEight = (MYFLT)self->sr * 0.125;
 
     freq = PyFloat_AS_DOUBLE(self->freq);
     if (freq <= 0) {
@@ -406,7 +418,7 @@ LFO_generates_ia(LFO *self) {
 
     switch (self->wavetype) {
         case 0: /* Saw up */
-            maxHarms = (int)(self->srOverFour/freq);
+            maxHarms = (int)(srOverFour/freq);
             for (i=0; i<self->bufsize; i++) {
                 sharp = sh[i];
                 if (sharp < 0.0)
@@ -416,6 +428,8 @@ LFO_generates_ia(LFO *self) {
                 numh = sharp * 46.0 + 4.0;
                 if (numh > maxHarms)
                     numh = maxHarms;
+                if (numh < 1.0)
+                    numh = 1.0;
                 pointer = self->pointerPos * 2.0 - 1.0;
                 val = pointer - MYTANH(numh * pointer) / MYTANH(numh);
                 self->data[i] = val;
@@ -427,7 +441,7 @@ LFO_generates_ia(LFO *self) {
             }
             break;
         case 1: /* Saw down */
-            maxHarms = (int)(self->srOverFour/freq);
+            maxHarms = (int)(srOverFour/freq);
             for (i=0; i<self->bufsize; i++) {
                 sharp = sh[i];
                 if (sharp < 0.0)
@@ -437,6 +451,8 @@ LFO_generates_ia(LFO *self) {
                 numh = sharp * 46.0 + 4.0;
                 if (numh > maxHarms)
                     numh = maxHarms;
+                if (numh < 1.0)
+                    numh = 1.0;
                 pointer = self->pointerPos * 2.0 - 1.0;
                 val = -(pointer - MYTANH(numh * pointer) / MYTANH(numh));
                 self->data[i] = val;
@@ -448,7 +464,7 @@ LFO_generates_ia(LFO *self) {
             }
             break;
         case 2: /* Square */
-            maxHarms = (int)(self->srOverEight/freq);
+            maxHarms = (int)(srOverEight/freq);
             for (i=0; i<self->bufsize; i++) {
                 sharp = sh[i];
                 if (sharp < 0.0)
@@ -468,7 +484,7 @@ LFO_generates_ia(LFO *self) {
             }
             break;
         case 3: /* Triangle */
-            maxHarms = (int)(self->srOverFour/freq);
+            maxHarms = (int)(srOverFour/freq);
             for (i=0; i<self->bufsize; i++) {
                 sharp = sh[i];
                 if (sharp < 0.0)
@@ -494,7 +510,7 @@ LFO_generates_ia(LFO *self) {
             }
             break;
         case 4: /* Pulse */
-            maxHarms = (int)(self->srOverEight/freq);
+            maxHarms = (int)(srOverEight/freq);
             for (i=0; i<self->bufsize; i++) {
                 sharp = sh[i];
                 if (sharp < 0.0)
@@ -516,7 +532,7 @@ LFO_generates_ia(LFO *self) {
             }
             break;
         case 5: /* Bi-Pulse */
-            maxHarms = (int)(self->srOverEight/freq);
+            maxHarms = (int)(srOverEight/freq);
             for (i=0; i<self->bufsize; i++) {
                 sharp = sh[i];
                 if (sharp < 0.0)
@@ -598,6 +614,8 @@ LFO_generates_aa(LFO *self) {
     MYFLT val, inc, freq, sharp, pointer, numh;
     MYFLT v1, v2, inc2, fade;
     int i, maxHarms;
+    MYFLT srOverFour = (MYFLT)self->sr * 0.25;
+    MYFLT srOverEight = (MYFLT)self->sr * 0.125;
 
     MYFLT *fr = Stream_getData((Stream *)self->freq_stream);
     if (fr[0] <= 0) {
@@ -615,10 +633,12 @@ LFO_generates_aa(LFO *self) {
                     sharp = 1.0;
                 freq = fr[i];
                 inc = freq / self->sr;
-                maxHarms = (int)(self->srOverFour/freq);
+                maxHarms = (int)(srOverFour/freq);
                 numh = sharp * 46.0 + 4.0;
                 if (numh > maxHarms)
                     numh = maxHarms;
+                if (numh < 1.0)
+                    numh = 1.0;
                 pointer = self->pointerPos * 2.0 - 1.0;
                 val = pointer - MYTANH(numh * pointer) / MYTANH(numh);
                 self->data[i] = val;
@@ -638,10 +658,12 @@ LFO_generates_aa(LFO *self) {
                     sharp = 1.0;
                 freq = fr[i];
                 inc = freq / self->sr;
-                maxHarms = (int)(self->srOverFour/freq);
+                maxHarms = (int)(srOverFour/freq);
                 numh = sharp * 46.0 + 4.0;
                 if (numh > maxHarms)
                     numh = maxHarms;
+                if (numh < 1.0)
+                    numh = 1.0;
                 pointer = self->pointerPos * 2.0 - 1.0;
                 val = -(pointer - MYTANH(numh * pointer) / MYTANH(numh));
                 self->data[i] = val;
@@ -661,7 +683,7 @@ LFO_generates_aa(LFO *self) {
                     sharp = 1.0;
                 freq = fr[i];
                 inc = freq / self->sr;
-                maxHarms = (int)(self->srOverEight/freq);
+                maxHarms = (int)(srOverEight/freq);
                 numh = sharp * 46.0 + 4.0;
                 if (numh > maxHarms)
                     numh = maxHarms;
@@ -683,7 +705,7 @@ LFO_generates_aa(LFO *self) {
                     sharp = 1.0;
                 freq = fr[i];
                 inc = freq / self->sr;
-                maxHarms = (int)(self->srOverFour/freq);
+                maxHarms = (int)(srOverFour/freq);
                 if ((sharp * 36.0) > maxHarms)
                     numh = (MYFLT)(maxHarms / 36.0);
                 else
@@ -711,7 +733,7 @@ LFO_generates_aa(LFO *self) {
                     sharp = 1.0;
                 freq = fr[i];
                 inc = freq / self->sr;
-                maxHarms = (int)(self->srOverEight/freq);
+                maxHarms = (int)(srOverEight/freq);
                 numh = MYFLOOR(sharp * 46.0 + 4.0);
                 if (numh > maxHarms)
                     numh = maxHarms;
@@ -735,7 +757,7 @@ LFO_generates_aa(LFO *self) {
                     sharp = 1.0;
                 freq = fr[i];
                 inc = freq / self->sr;
-                maxHarms = (int)(self->srOverEight/freq);
+                maxHarms = (int)(srOverEight/freq);
                 numh = MYFLOOR(sharp * 46.0 + 4.0);
                 if (numh > maxHarms)
                     numh = maxHarms;
@@ -912,7 +934,6 @@ LFO_dealloc(LFO* self)
 static PyObject *
 LFO_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *freqtmp=NULL, *sharptmp=NULL, *multmp=NULL, *addtmp=NULL;
     LFO *self;
     self = (LFO *)type->tp_alloc(type, 0);
@@ -931,9 +952,9 @@ LFO_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
 
-    self->srOverFour = (MYFLT)self->sr * 0.25;
-    self->srOverEight = (MYFLT)self->sr * 0.125;
     Stream_setFunctionPtr(self->stream, LFO_compute_next_data_frame);
+    Stream_setControlRateCapable(self->stream, 1);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = LFO_setProcMode;
 
     static char *kwlist[] = {"freq", "sharp", "type", "mul", "add", NULL};
@@ -957,7 +978,7 @@ LFO_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     Server_generateSeed((Server *)self->server, LFO_ID);
 
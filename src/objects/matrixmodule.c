@@ -121,6 +121,39 @@ MatrixStream_setHeight(MatrixStream *self, int size)
     self->height = size;
 }
 
+/* Buffer protocol, exposes the samples as a (height, width) array without
+   copy. Rows are padded by the guard point, so strides are required. */
+static int
+MatrixStream_getBuffer(MatrixStream *self, Py_buffer *view, int flags)
+{
+    if ((flags & PyBUF_STRIDES) != PyBUF_STRIDES) {
+        PyErr_SetString(PyExc_BufferError, "MatrixStream rows are not contiguous, a strided buffer is required.");
+        return -1;
+    }
+    if (PyBuffer_FillInfo(view, (PyObject *)self, (void *)self->data[0], (Py_ssize_t)self->width * self->height * sizeof(MYFLT), 0, flags) < 0)
+        return -1;
+    view->itemsize = sizeof(MYFLT);
+    if ((flags & PyBUF_FORMAT) == PyBUF_FORMAT)
+        view->format = sizeof(MYFLT) == sizeof(float) ? "f" : "d";
+    self->view_shape[0] = self->height;
+    self->view_shape[1] = self->width;
+    self->view_strides[0] = (self->width + 1) * sizeof(MYFLT);
+    self->view_strides[1] = sizeof(MYFLT);
+    view->ndim = 2;
+    view->shape = self->view_shape;
+    view->strides = self->view_strides;
+    return 0;
+}
+
+static PyBufferProcs MatrixStream_as_buffer = {
+0, /*bf_getreadbuffer*/
+0, /*bf_getwritebuffer*/
+0, /*bf_getsegcount*/
+0, /*bf_getcharbuffer*/
+(getbufferproc)MatrixStream_getBuffer, /*bf_getbuffer*/
+0, /*bf_releasebuffer*/
+};
+
 PyTypeObject MatrixStreamType = {
 PyObject_HEAD_INIT(NULL)
 0, /*ob_size*/
@@ -141,8 +174,8 @@ sizeof(MatrixStream), /*tp_basicsize*/
 0, /*tp_str*/
 0, /*tp_getattro*/
 0, /*tp_setattro*/
-0, /*tp_as_buffer*/
-Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE, /*tp_flags*/
+&MatrixStream_as_buffer, /*tp_as_buffer*/
+Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
 "MatrixStream objects. For internal use only. Must never be instantiated by the user.", /* tp_doc */
 0, /* tp_traverse */
 0, /* tp_clear */
@@ -214,10 +247,8 @@ NewMatrix_clear(NewMatrix *self)
 static void
 NewMatrix_dealloc(NewMatrix* self)
 {
-    int i;
-    for (i=0; i<(self->height+1); i++) {
-        free(self->data[i]);
-    }
+    if (self->data != NULL)
+        free(self->data[0]);
     free(self->data);
     NewMatrix_clear(self);
     self->ob_type->tp_free((PyObject*)self);
@@ -244,9 +275,9 @@ NewMatrix_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         Py_RETURN_NONE;
 
     self->data = (MYFLT **)realloc(self->data, (self->height + 1) * sizeof(MYFLT *));
-
-    for (i=0; i<(self->height+1); i++) {
-        self->data[i] = (MYFLT *)malloc((self->width + 1) * sizeof(MYFLT));
+    self->data[0] = (MYFLT *)malloc((self->height + 1) * (self->width + 1) * sizeof(MYFLT));
+    for (i=1; i<(self->height+1); i++) {
+        self->data[i] = self->data[0] + i * (self->width + 1);
     }
 
     for(i=0; i<(self->height+1); i++) {
@@ -297,7 +328,7 @@ NewMatrix_getHeight(NewMatrix *self)
 static PyObject *
 NewMatrix_getRate(NewMatrix *self)
 {
-    MYFLT sr = PyFloat_AsDouble(PyObject_CallMethod(self->server, "getSamplingRate", NULL)); \
+    MYFLT sr = ((Server *)self->server)->samplingRate; \
     return PyFloat_FromDouble(sr / self->width);
 };
 
@@ -598,7 +629,7 @@ MatrixRec_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(matrixtmp);
     self->matrix = (NewMatrix *)matrixtmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->trigsBuffer = (MYFLT *)realloc(self->trigsBuffer, self->bufsize * sizeof(MYFLT));
 
@@ -805,7 +836,7 @@ MatrixRecLoop_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(matrixtmp);
     self->matrix = (NewMatrix *)matrixtmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->trigsBuffer = (MYFLT *)realloc(self->trigsBuffer, self->bufsize * sizeof(MYFLT));
 
@@ -997,7 +1028,6 @@ MatrixMorph_dealloc(MatrixMorph* self)
 static PyObject *
 MatrixMorph_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     long width, height, numsamps;
     PyObject *inputtmp, *input_streamtmp, *matrixtmp, *sourcestmp;
     MatrixMorph *self;
@@ -1006,6 +1036,7 @@ MatrixMorph_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     INIT_OBJECT_COMMON
 
     Stream_setFunctionPtr(self->stream, MatrixMorph_compute_next_data_frame);
+    Stream_setSerial(self->stream, 2);
 
     static char *kwlist[] = {"input", "matrix", "sources", NULL};
 
@@ -1027,7 +1058,7 @@ MatrixMorph_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(sourcestmp);
     self->sources = (PyObject *)sourcestmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     return (PyObject *)self;
 }
@@ -186,7 +186,6 @@ Metro_dealloc(Metro* self)
 static PyObject *
 Metro_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *timetmp=NULL;
     Metro *self;
     self = (Metro *)type->tp_alloc(type, 0);
@@ -215,7 +214,7 @@ Metro_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setTime", "O", timetmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -550,7 +549,6 @@ Seqer_dealloc(Seqer* self)
 static PyObject *
 Seqer_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *timetmp=NULL, *seqtmp=NULL;
     Seqer *self;
     self = (Seqer *)type->tp_alloc(type, 0);
@@ -590,7 +588,7 @@ Seqer_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setSeq", "O", seqtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->buffer_streams = (MYFLT *)realloc(self->buffer_streams, self->poly * self->bufsize * sizeof(MYFLT));
 
@@ -818,7 +816,6 @@ Seq_dealloc(Seq* self)
 static PyObject *
 Seq_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL;
     Seq *self;
     self = (Seq *)type->tp_alloc(type, 0);
@@ -840,7 +837,7 @@ Seq_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(maintmp);
     self->mainPlayer = (Seqer *)maintmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -1094,7 +1091,6 @@ Clouder_dealloc(Clouder* self)
 static PyObject *
 Clouder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *densitytmp=NULL;
     Clouder *self;
     self = (Clouder *)type->tp_alloc(type, 0);
@@ -1106,6 +1102,7 @@ Clouder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Clouder_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = Clouder_setProcMode;
 
     Stream_setStreamActive(self->stream, 0);
@@ -1119,7 +1116,7 @@ Clouder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setDensity", "O", densitytmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -1324,7 +1321,6 @@ Cloud_dealloc(Cloud* self)
 static PyObject *
 Cloud_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL;
     Cloud *self;
     self = (Cloud *)type->tp_alloc(type, 0);
@@ -1346,7 +1342,7 @@ Cloud_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(maintmp);
     self->mainPlayer = (Clouder *)maintmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -1484,6 +1480,7 @@ Cloud_new,                 /* tp_new */
 typedef struct {
     pyo_audio_HEAD
     int flag;
+    int offset; /* position of the trigger in the buffer */
     int modebuffer[2];
 } Trig;
 
@@ -1537,12 +1534,15 @@ Trig_setProcMode(Trig *self)
 static void
 Trig_compute_next_data_frame(Trig *self)
 {
+    int i;
+
+    for (i=0; i<self->bufsize; i++) {
+        self->data[i] = 0.0;
+    }
     if (self->flag == 1) {
-        self->data[0] = 1.0;
+        self->data[self->offset] = 1.0;
         self->flag = 0;
     }
-    else
-        self->data[0] = 0.0;
     (*self->muladd_func_ptr)(self);
 }
 
@@ -1571,7 +1571,6 @@ Trig_dealloc(Trig* self)
 static PyObject *
 Trig_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     Trig *self;
     self = (Trig *)type->tp_alloc(type, 0);
 
@@ -1582,13 +1581,14 @@ Trig_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Trig_compute_next_data_frame);
     self->mode_func_ptr = Trig_setProcMode;
+    self->offset = Server_getEventOffset((Server *)self->server);
 
     static char *kwlist[] = {NULL};
 
     if (! PyArg_ParseTupleAndKeywords(args, kwds, "", kwlist))
         Py_RETURN_NONE;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -1605,6 +1605,8 @@ static PyObject * Trig_setDiv(Trig *self, PyObject *arg) { SET_DIV };
 static PyObject * Trig_play(Trig *self, PyObject *args, PyObject *kwds)
 {
     self->flag = 1;
+    /* Called from an event scheduled on the server, triggers at the event's position in the buffer. */
+    self->offset = Server_getEventOffset((Server *)self->server);
     PLAY
 };
 
@@ -2216,6 +2218,7 @@ Beater_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Beater_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = Beater_setProcMode;
 
     self->sampleToSec = 1. / self->sr;
@@ -2232,7 +2235,7 @@ Beater_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setTime", "O", timetmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -2602,7 +2605,6 @@ Beat_dealloc(Beat* self)
 static PyObject *
 Beat_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL;
     Beat *self;
     self = (Beat *)type->tp_alloc(type, 0);
@@ -2624,7 +2626,7 @@ Beat_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(maintmp);
     self->mainPlayer = (Beater *)maintmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -2852,7 +2854,6 @@ BeatTapStream_dealloc(BeatTapStream* self)
 static PyObject *
 BeatTapStream_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL;
     BeatTapStream *self;
     self = (BeatTapStream *)type->tp_alloc(type, 0);
@@ -2874,7 +2875,7 @@ BeatTapStream_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(maintmp);
     self->mainPlayer = (Beater *)maintmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -3102,7 +3103,6 @@ BeatAmpStream_dealloc(BeatAmpStream* self)
 static PyObject *
 BeatAmpStream_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL;
     BeatAmpStream *self;
     self = (BeatAmpStream *)type->tp_alloc(type, 0);
@@ -3124,7 +3124,7 @@ BeatAmpStream_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(maintmp);
     self->mainPlayer = (Beater *)maintmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -3352,7 +3352,6 @@ BeatDurStream_dealloc(BeatDurStream* self)
 static PyObject *
 BeatDurStream_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL;
     BeatDurStream *self;
     self = (BeatDurStream *)type->tp_alloc(type, 0);
@@ -3374,7 +3373,7 @@ BeatDurStream_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(maintmp);
     self->mainPlayer = (Beater *)maintmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -3602,7 +3601,6 @@ BeatEndStream_dealloc(BeatEndStream* self)
 static PyObject *
 BeatEndStream_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL;
     BeatEndStream *self;
     self = (BeatEndStream *)type->tp_alloc(type, 0);
@@ -3624,7 +3622,7 @@ BeatEndStream_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(maintmp);
     self->mainPlayer = (Beater *)maintmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -3946,7 +3944,7 @@ TrigBurster_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_INPUT_STREAM
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -4181,7 +4179,6 @@ TrigBurst_dealloc(TrigBurst* self)
 static PyObject *
 TrigBurst_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL;
     TrigBurst *self;
     self = (TrigBurst *)type->tp_alloc(type, 0);
@@ -4203,7 +4200,7 @@ TrigBurst_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(maintmp);
     self->mainPlayer = (TrigBurster *)maintmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -4431,7 +4428,6 @@ TrigBurstTapStream_dealloc(TrigBurstTapStream* self)
 static PyObject *
 TrigBurstTapStream_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL;
     TrigBurstTapStream *self;
     self = (TrigBurstTapStream *)type->tp_alloc(type, 0);
@@ -4453,7 +4449,7 @@ TrigBurstTapStream_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(maintmp);
     self->mainPlayer = (TrigBurster *)maintmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -4681,7 +4677,6 @@ TrigBurstAmpStream_dealloc(TrigBurstAmpStream* self)
 static PyObject *
 TrigBurstAmpStream_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL;
     TrigBurstAmpStream *self;
     self = (TrigBurstAmpStream *)type->tp_alloc(type, 0);
@@ -4703,7 +4698,7 @@ TrigBurstAmpStream_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(maintmp);
     self->mainPlayer = (TrigBurster *)maintmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -4931,7 +4926,6 @@ TrigBurstDurStream_dealloc(TrigBurstDurStream* self)
 static PyObject *
 TrigBurstDurStream_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL;
     TrigBurstDurStream *self;
     self = (TrigBurstDurStream *)type->tp_alloc(type, 0);
@@ -4953,7 +4947,7 @@ TrigBurstDurStream_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(maintmp);
     self->mainPlayer = (TrigBurster *)maintmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -5181,7 +5175,6 @@ TrigBurstEndStream_dealloc(TrigBurstEndStream* self)
 static PyObject *
 TrigBurstEndStream_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL;
     TrigBurstEndStream *self;
     self = (TrigBurstEndStream *)type->tp_alloc(type, 0);
@@ -5203,7 +5196,7 @@ TrigBurstEndStream_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(maintmp);
     self->mainPlayer = (TrigBurster *)maintmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
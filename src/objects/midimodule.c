@@ -37,18 +37,28 @@ typedef struct {
 static void
 CtlScan_setProcMode(CtlScan *self) {}
 
+static void
+CtlScan_call(CtlScan *self, MYFLT *args)
+{
+    PyObject *tup;
+
+    tup = PyTuple_New(1);
+    PyTuple_SetItem(tup, 0, PyInt_FromLong((long)args[0]));
+    PyObject_Call((PyObject *)self->callable, tup, NULL);
+}
+
 static void
 CtlScan_compute_next_data_frame(CtlScan *self)
 {
     PmEvent *buffer;
     int i, count;
+    MYFLT args[1];
 
     buffer = Server_getMidiEventBuffer((Server *)self->server);
     count = Server_getMidiEventCount((Server *)self->server);
 
     if (count > 0) {
-        PyObject *tup;
-        for (i=count-1; i>=0; i--) {
+        for (i=0; i<count; i++) {
             int status = Pm_MessageStatus(buffer[i].message);	// Temp note event holders
             int number = Pm_MessageData1(buffer[i].message);
             int value = Pm_MessageData2(buffer[i].message);
@@ -56,9 +66,8 @@ CtlScan_compute_next_data_frame(CtlScan *self)
             if ((status & 0xF0) == 0xB0) {
                 if (number != self->ctlnumber) {
                     self->ctlnumber = number;
-                    tup = PyTuple_New(1);
-                    PyTuple_SetItem(tup, 0, PyInt_FromLong(self->ctlnumber));
-                    PyObject_Call((PyObject *)self->callable, tup, NULL);
+                    args[0] = self->ctlnumber;
+                    Server_deferCall((Server *)self->server, (PyObject *)self, (void (*)(PyObject *, MYFLT *))CtlScan_call, args, 1);
                 }
                 if (self->toprint == 1)
                     printf("ctl number : %i, ctl value : %i, midi channel : %i\n", self->ctlnumber, value, status - 0xB0 + 1);
@@ -94,7 +103,6 @@ CtlScan_dealloc(CtlScan* self)
 static PyObject *
 CtlScan_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *calltmp=NULL;
     CtlScan *self;
     self = (CtlScan *)type->tp_alloc(type, 0);
@@ -104,6 +112,7 @@ CtlScan_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, CtlScan_compute_next_data_frame);
+    Stream_setSerial(self->stream, 3);
     self->mode_func_ptr = CtlScan_setProcMode;
 
     static char *kwlist[] = {"callable", "toprint", NULL};
@@ -115,7 +124,7 @@ CtlScan_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setFunction", "O", calltmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     return (PyObject *)self;
 }
@@ -235,18 +244,29 @@ typedef struct {
 static void
 CtlScan2_setProcMode(CtlScan2 *self) {}
 
+static void
+CtlScan2_call(CtlScan2 *self, MYFLT *args)
+{
+    PyObject *tup;
+
+    tup = PyTuple_New(2);
+    PyTuple_SetItem(tup, 0, PyInt_FromLong((long)args[0]));
+    PyTuple_SetItem(tup, 1, PyInt_FromLong((long)args[1]));
+    PyObject_Call((PyObject *)self->callable, tup, NULL);
+}
+
 static void
 CtlScan2_compute_next_data_frame(CtlScan2 *self)
 {
     PmEvent *buffer;
     int i, count, midichnl;
+    MYFLT args[2];
 
     buffer = Server_getMidiEventBuffer((Server *)self->server);
     count = Server_getMidiEventCount((Server *)self->server);
 
     if (count > 0) {
-        PyObject *tup;
-        for (i=count-1; i>=0; i--) {
+        for (i=0; i<count; i++) {
             int status = Pm_MessageStatus(buffer[i].message);	// Temp note event holders
             int number = Pm_MessageData1(buffer[i].message);
             int value = Pm_MessageData2(buffer[i].message);
@@ -256,10 +276,9 @@ CtlScan2_compute_next_data_frame(CtlScan2 *self)
                 if (number != self->ctlnumber || midichnl != self->midichnl) {
                     self->ctlnumber = number;
                     self->midichnl = midichnl;
-                    tup = PyTuple_New(2);
-                    PyTuple_SetItem(tup, 0, PyInt_FromLong(self->ctlnumber));
-                    PyTuple_SetItem(tup, 1, PyInt_FromLong(self->midichnl));
-                    PyObject_Call((PyObject *)self->callable, tup, NULL);
+                    args[0] = self->ctlnumber;
+                    args[1] = self->midichnl;
+                    Server_deferCall((Server *)self->server, (PyObject *)self, (void (*)(PyObject *, MYFLT *))CtlScan2_call, args, 2);
                 }
                 if (self->toprint == 1)
                     printf("ctl number : %i, ctl value : %i, midi channel : %i\n", self->ctlnumber, value, midichnl);
@@ -295,7 +314,6 @@ CtlScan2_dealloc(CtlScan2* self)
 static PyObject *
 CtlScan2_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *calltmp=NULL;
     CtlScan2 *self;
     self = (CtlScan2 *)type->tp_alloc(type, 0);
@@ -305,6 +323,7 @@ CtlScan2_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, CtlScan2_compute_next_data_frame);
+    Stream_setSerial(self->stream, 3);
     self->mode_func_ptr = CtlScan2_setProcMode;
 
     static char *kwlist[] = {"callable", "toprint", NULL};
@@ -316,7 +335,7 @@ CtlScan2_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setFunction", "O", calltmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     return (PyObject *)self;
 }
@@ -435,6 +454,7 @@ typedef struct {
     MYFLT maxscale;
     MYFLT value;
     MYFLT oldValue;
+    int ramp; /* samples since the last change, the interpolation lasts one buffer */
     MYFLT sampleToSec;
     int modebuffer[2];
 } Midictl;
@@ -486,60 +506,76 @@ Midictl_setProcMode(Midictl *self)
     }
 }
 
-// Take MIDI events and translate them...
-void translateMidi(Midictl *self, PmEvent *buffer, int count)
+// Take a MIDI event and translate it...
+void translateMidi(Midictl *self, PmEvent *event)
 {
-    int i, ok;
-    for (i=count-1; i>=0; i--) {
-        int status = Pm_MessageStatus(buffer[i].message);	// Temp note event holders
-        int number = Pm_MessageData1(buffer[i].message);
-        int value = Pm_MessageData2(buffer[i].message);
-
-        if (self->channel == 0) {
-            if ((status & 0xF0) == 0xB0)
-                ok = 1;
-            else
-                ok = 0;
-        }
-        else {
-            if (status == (0xB0 | (self->channel - 1)))
-                ok = 1;
-            else
-                ok = 0;
-        }
+    int ok;
+    int status = Pm_MessageStatus(event->message);	// Temp note event holders
+    int number = Pm_MessageData1(event->message);
+    int value = Pm_MessageData2(event->message);
+
+    if (self->channel == 0) {
+        if ((status & 0xF0) == 0xB0)
+            ok = 1;
+        else
+            ok = 0;
+    }
+    else {
+        if (status == (0xB0 | (self->channel - 1)))
+            ok = 1;
+        else
+            ok = 0;
+    }
 
-        if (ok == 1 && number == self->ctlnumber) {
+    if (ok == 1 && number == self->ctlnumber) {
+        /* A new ramp starts from the current value. */
+        if (self->interp == 1 && self->ramp < self->bufsize)
+            self->oldValue += (self->value - self->oldValue) * self->ramp / self->bufsize;
+        else
             self->oldValue = self->value;
-            self->value = (value / 127.) * (self->maxscale - self->minscale) + self->minscale;
-            break;
-        }
+        self->value = (value / 127.) * (self->maxscale - self->minscale) + self->minscale;
+        self->ramp = 0;
     }
 }
 
 static void
-Midictl_compute_next_data_frame(Midictl *self)
+Midictl_fill(Midictl *self, int start, int end)
 {
-    PmEvent *tmp;
-    int i, count;
+    int i;
     MYFLT step;
 
-    tmp = Server_getMidiEventBuffer((Server *)self->server);
-    count = Server_getMidiEventCount((Server *)self->server);
-
-    if (count > 0)
-        translateMidi((Midictl *)self, tmp, count);
-
-    if (self->interp == 0) {
-        for (i=0; i<self->bufsize; i++) {
+    if (self->interp == 0 || self->ramp >= self->bufsize) {
+        for (i=start; i<end; i++) {
             self->data[i] = self->value;
         }
     }
     else {
         step = (self->value - self->oldValue) / self->bufsize;
-        for (i=0; i<self->bufsize; i++) {
-            self->data[i] = self->oldValue + step;
+        for (i=start; i<end; i++) {
+            if (self->ramp < self->bufsize)
+                self->ramp++;
+            self->data[i] = self->oldValue + step * self->ramp;
         }
     }
+}
+
+static void
+Midictl_compute_next_data_frame(Midictl *self)
+{
+    PmEvent *tmp;
+    int i, count, pos = 0;
+
+    tmp = Server_getMidiEventBuffer((Server *)self->server);
+    count = Server_getMidiEventCount((Server *)self->server);
+
+    /* The events are sorted by time, their timestamp is the position in the buffer. */
+    for (i=0; i<count; i++) {
+        Midictl_fill(self, pos, tmp[i].timestamp);
+        if (tmp[i].timestamp > pos)
+            pos = tmp[i].timestamp;
+        translateMidi((Midictl *)self, &tmp[i]);
+    }
+    Midictl_fill(self, pos, self->bufsize);
     (*self->muladd_func_ptr)(self);
 }
 
@@ -568,7 +604,6 @@ Midictl_dealloc(Midictl* self)
 static PyObject *
 Midictl_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *multmp=NULL, *addtmp=NULL;
     Midictl *self;
     self = (Midictl *)type->tp_alloc(type, 0);
@@ -585,6 +620,7 @@ Midictl_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Midictl_compute_next_data_frame);
     self->mode_func_ptr = Midictl_setProcMode;
+    self->ramp = self->bufsize;
 
     static char *kwlist[] = {"ctlnumber", "minscale", "maxscale", "init", "channel", "mul", "add", NULL};
 
@@ -599,7 +635,7 @@ Midictl_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->value = self->oldValue;
 
@@ -666,6 +702,7 @@ Midictl_setValue(Midictl *self, PyObject *arg)
 	if (isNum == 1) {
 		tmp = PyFloat_AsDouble(PyNumber_Float(arg));
         self->oldValue = self->value = tmp;
+        self->ramp = self->bufsize;
 	}
 
 	Py_INCREF(Py_None);
@@ -874,7 +911,6 @@ typedef struct {
     int scale; /* 0 = midi, 1 = transpo */
     MYFLT range;
     MYFLT value;
-    MYFLT oldValue;
     MYFLT sampleToSec;
     int modebuffer[2];
 } Bendin;
@@ -926,38 +962,34 @@ Bendin_setProcMode(Bendin *self)
     }
 }
 
-// Take MIDI events and translate them...
-void Bendin_translateMidi(Bendin *self, PmEvent *buffer, int count)
+// Take a MIDI event and translate it...
+void Bendin_translateMidi(Bendin *self, PmEvent *event)
 {
-    int i, ok;
+    int ok;
     MYFLT val;
-    for (i=count-1; i>=0; i--) {
-        int status = Pm_MessageStatus(buffer[i].message);	// Temp note event holders
-        int number = Pm_MessageData1(buffer[i].message);
-        int value = Pm_MessageData2(buffer[i].message);
+    int status = Pm_MessageStatus(event->message);	// Temp note event holders
+    int number = Pm_MessageData1(event->message);
+    int value = Pm_MessageData2(event->message);
 
-        if (self->channel == 0) {
-            if ((status & 0xF0) == 0xe0)
-                ok = 1;
-            else
-                ok = 0;
-        }
-        else {
-            if (status == (0xe0 | (self->channel - 1)))
-                ok = 1;
-            else
-                ok = 0;
-        }
+    if (self->channel == 0) {
+        if ((status & 0xF0) == 0xe0)
+            ok = 1;
+        else
+            ok = 0;
+    }
+    else {
+        if (status == (0xe0 | (self->channel - 1)))
+            ok = 1;
+        else
+            ok = 0;
+    }
 
-        if (ok == 1) {
-            self->oldValue = self->value;
-            val = (number + (value << 7) - 8192) / 8192.0 * self->range;
-            if (self->scale == 0)
-                self->value = val;
-            else
-                self->value = MYPOW(1.0594630943593, val);
-            break;
-        }
+    if (ok == 1) {
+        val = (number + (value << 7) - 8192) / 8192.0 * self->range;
+        if (self->scale == 0)
+            self->value = val;
+        else
+            self->value = MYPOW(1.0594630943593, val);
     }
 }
 
@@ -965,17 +997,20 @@ static void
 Bendin_compute_next_data_frame(Bendin *self)
 {
     PmEvent *tmp;
-    int i, count;
+    int i, j, count;
 
     tmp = Server_getMidiEventBuffer((Server *)self->server);
     count = Server_getMidiEventCount((Server *)self->server);
 
-    if (count > 0)
-        Bendin_translateMidi((Bendin *)self, tmp, count);
-    MYFLT step = (self->value - self->oldValue) / self->bufsize;
-
-    for (i=0; i<self->bufsize; i++) {
-        self->data[i] = self->oldValue + step;
+    /* The events are sorted by time, their timestamp is the position in the buffer. */
+    for (i=0, j=0; j<count; j++) {
+        for (; i<tmp[j].timestamp; i++) {
+            self->data[i] = self->value;
+        }
+        Bendin_translateMidi((Bendin *)self, &tmp[j]);
+    }
+    for (; i<self->bufsize; i++) {
+        self->data[i] = self->value;
     }
 
     (*self->muladd_func_ptr)(self);
@@ -1006,7 +1041,6 @@ Bendin_dealloc(Bendin* self)
 static PyObject *
 Bendin_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *multmp=NULL, *addtmp=NULL;
     Bendin *self;
     self = (Bendin *)type->tp_alloc(type, 0);
@@ -1014,7 +1048,6 @@ Bendin_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->channel = 0;
     self->scale = 0;
     self->value = 0.;
-    self->oldValue = 0.;
     self->range = 2.;
 	self->modebuffer[0] = 0;
 	self->modebuffer[1] = 0;
@@ -1036,12 +1069,12 @@ Bendin_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     if (self->scale == 0)
-        self->oldValue = self->value = 0.;
+        self->value = 0.;
     else
-        self->oldValue = self->value = 1.;
+        self->value = 1.;
 
     (*self->mode_func_ptr)(self);
 
@@ -1249,7 +1282,6 @@ typedef struct {
     MYFLT minscale;
     MYFLT maxscale;
     MYFLT value;
-    MYFLT oldValue;
     MYFLT sampleToSec;
     int modebuffer[2];
 } Touchin;
@@ -1301,51 +1333,49 @@ Touchin_setProcMode(Touchin *self)
     }
 }
 
-// Take MIDI events and translate them...
-void Touchin_translateMidi(Touchin *self, PmEvent *buffer, int count)
+// Take a MIDI event and translate it...
+void Touchin_translateMidi(Touchin *self, PmEvent *event)
 {
-    int i, ok;
-    for (i=count-1; i>=0; i--) {
-        int status = Pm_MessageStatus(buffer[i].message);	// Temp note event holders
-        int number = Pm_MessageData1(buffer[i].message);
-        /* int value = Pm_MessageData2(buffer[i].message); */
-
-        if (self->channel == 0) {
-            if ((status & 0xF0) == 0xd0)
-                ok = 1;
-            else
-                ok = 0;
-        }
-        else {
-            if (status == (0xd0 | (self->channel - 1)))
-                ok = 1;
-            else
-                ok = 0;
-        }
-
-        if (ok == 1) {
-            self->oldValue = self->value;
-            self->value = (number / 127.) * (self->maxscale - self->minscale) + self->minscale;
-            break;
-        }
+    int ok;
+    int status = Pm_MessageStatus(event->message);	// Temp note event holders
+    int number = Pm_MessageData1(event->message);
+    /* int value = Pm_MessageData2(event->message); */
+
+    if (self->channel == 0) {
+        if ((status & 0xF0) == 0xd0)
+            ok = 1;
+        else
+            ok = 0;
+    }
+    else {
+        if (status == (0xd0 | (self->channel - 1)))
+            ok = 1;
+        else
+            ok = 0;
     }
+
+    if (ok == 1)
+        self->value = (number / 127.) * (self->maxscale - self->minscale) + self->minscale;
 }
 
 static void
 Touchin_compute_next_data_frame(Touchin *self)
 {
     PmEvent *tmp;
-    int i, count;
+    int i, j, count;
 
     tmp = Server_getMidiEventBuffer((Server *)self->server);
     count = Server_getMidiEventCount((Server *)self->server);
 
-    if (count > 0)
-        Touchin_translateMidi((Touchin *)self, tmp, count);
-    MYFLT step = (self->value - self->oldValue) / self->bufsize;
-
-    for (i=0; i<self->bufsize; i++) {
-        self->data[i] = self->oldValue + step;
+    /* The events are sorted by time, their timestamp is the position in the buffer. */
+    for (i=0, j=0; j<count; j++) {
+        for (; i<tmp[j].timestamp; i++) {
+            self->data[i] = self->value;
+        }
+        Touchin_translateMidi((Touchin *)self, &tmp[j]);
+    }
+    for (; i<self->bufsize; i++) {
+        self->data[i] = self->value;
     }
 
     (*self->muladd_func_ptr)(self);
@@ -1376,14 +1406,12 @@ Touchin_dealloc(Touchin* self)
 static PyObject *
 Touchin_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *multmp=NULL, *addtmp=NULL;
     Touchin *self;
     self = (Touchin *)type->tp_alloc(type, 0);
 
     self->channel = 0;
     self->value = 0.;
-    self->oldValue = 0.;
     self->minscale = 0.;
     self->maxscale = 1.;
 	self->modebuffer[0] = 0;
@@ -1395,7 +1423,7 @@ Touchin_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     static char *kwlist[] = {"minscale", "maxscale", "init", "channel", "mul", "add", NULL};
 
-    if (! PyArg_ParseTupleAndKeywords(args, kwds, TYPE__FFFIOO, kwlist, &self->minscale, &self->maxscale, &self->oldValue, &self->channel, &multmp, &addtmp))
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, TYPE__FFFIOO, kwlist, &self->minscale, &self->maxscale, &self->value, &self->channel, &multmp, &addtmp))
         Py_RETURN_NONE;
 
     if (multmp) {
@@ -1406,9 +1434,7 @@ Touchin_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
-
-    self->value = self->oldValue;
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -1659,48 +1685,47 @@ Programin_setProcMode(Programin *self)
     }
 }
 
-// Take MIDI events and translate them...
-void Programin_translateMidi(Programin *self, PmEvent *buffer, int count)
+// Take a MIDI event and translate it...
+void Programin_translateMidi(Programin *self, PmEvent *event)
 {
-    int i, ok;
-
-    for (i=count-1; i>=0; i--) {
-        int status = Pm_MessageStatus(buffer[i].message);	// Temp note event holders
-        int number = Pm_MessageData1(buffer[i].message);
-
-        if (self->channel == 0) {
-            if ((status & 0xF0) == 0xc0)
-                ok = 1;
-            else
-                ok = 0;
-        }
-        else {
-            if (status == (0xc0 | (self->channel - 1)))
-                ok = 1;
-            else
-                ok = 0;
-        }
+    int ok;
+    int status = Pm_MessageStatus(event->message);	// Temp note event holders
+    int number = Pm_MessageData1(event->message);
 
-        if (ok == 1) {
-            self->value = (MYFLT)number;
-            break;
-        }
+    if (self->channel == 0) {
+        if ((status & 0xF0) == 0xc0)
+            ok = 1;
+        else
+            ok = 0;
     }
+    else {
+        if (status == (0xc0 | (self->channel - 1)))
+            ok = 1;
+        else
+            ok = 0;
+    }
+
+    if (ok == 1)
+        self->value = (MYFLT)number;
 }
 
 static void
 Programin_compute_next_data_frame(Programin *self)
 {
     PmEvent *tmp;
-    int i, count;
+    int i, j, count;
 
     tmp = Server_getMidiEventBuffer((Server *)self->server);
     count = Server_getMidiEventCount((Server *)self->server);
 
-    if (count > 0)
-        Programin_translateMidi((Programin *)self, tmp, count);
-
-    for (i=0; i<self->bufsize; i++) {
+    /* The events are sorted by time, their timestamp is the position in the buffer. */
+    for (i=0, j=0; j<count; j++) {
+        for (; i<tmp[j].timestamp; i++) {
+            self->data[i] = self->value;
+        }
+        Programin_translateMidi((Programin *)self, &tmp[j]);
+    }
+    for (; i<self->bufsize; i++) {
         self->data[i] = self->value;
     }
 
@@ -1732,7 +1757,6 @@ Programin_dealloc(Programin* self)
 static PyObject *
 Programin_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *multmp=NULL, *addtmp=NULL;
     Programin *self;
     self = (Programin *)type->tp_alloc(type, 0);
@@ -1759,7 +1783,7 @@ Programin_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -1924,6 +1948,9 @@ typedef struct {
     int channel;
     int stealing;
     MYFLT *trigger_streams;
+    int *notestart; /* notebuf at the beginning of the buffer */
+    int *changes; /* position in the buffer, voice, pitch and velocity of each note change */
+    int nchanges;
 } MidiNote;
 
 static void
@@ -1980,12 +2007,24 @@ int whichVoice(int *buf, int pitch, int len) {
     return voice;
 }
 
+static void
+MidiNote_addChange(MidiNote *self, int offset, int voice)
+{
+    int *change = &self->changes[self->nchanges*4];
+    change[0] = offset;
+    change[1] = voice;
+    change[2] = self->notebuf[voice*2];
+    change[3] = self->notebuf[voice*2+1];
+    self->nchanges++;
+}
+
 // Take MIDI events and keep track of notes
 void grabMidiNotes(MidiNote *self, PmEvent *buffer, int count)
 {
-    int i, ok, voice, kind;
+    int i, ok, voice, kind, offset;
 
     for (i=0; i<count; i++) {
+        offset = buffer[i].timestamp;
         int status = Pm_MessageStatus(buffer[i].message);	// Temp note event holders
         int pitch = Pm_MessageData1(buffer[i].message);
         int velocity = Pm_MessageData2(buffer[i].message);
@@ -2019,14 +2058,16 @@ void grabMidiNotes(MidiNote *self, PmEvent *buffer, int count)
                         self->vcount = voice;
                         self->notebuf[voice*2] = pitch;
                         self->notebuf[voice*2+1] = velocity;
-                        self->trigger_streams[self->bufsize*(self->vcount*2)] = 1.0;
+                        self->trigger_streams[self->bufsize*(self->vcount*2)+offset] = 1.0;
+                        MidiNote_addChange(self, offset, voice);
                     }
                 }
                 else {
                     self->vcount = (self->vcount + 1) % self->voices;
                     self->notebuf[self->vcount*2] = pitch;
                     self->notebuf[self->vcount*2+1] = velocity;
-                    self->trigger_streams[self->bufsize*(self->vcount*2)] = 1.0;
+                    self->trigger_streams[self->bufsize*(self->vcount*2)+offset] = 1.0;
+                    MidiNote_addChange(self, offset, self->vcount);
                 }
             }
             else if (pitchIsIn(self->notebuf, pitch, self->voices) == 1 && kind == 0 && pitch >= self->first && pitch <= self->last) {
@@ -2034,7 +2075,8 @@ void grabMidiNotes(MidiNote *self, PmEvent *buffer, int count)
                 voice = whichVoice(self->notebuf, pitch, self->voices);
                 self->notebuf[voice*2] = -1;
                 self->notebuf[voice*2+1] = 0.;
-                self->trigger_streams[self->bufsize*(voice*2+1)] = 1.0;
+                self->trigger_streams[self->bufsize*(voice*2+1)+offset] = 1.0;
+                MidiNote_addChange(self, offset, voice);
             }
         }
     }
@@ -2049,6 +2091,8 @@ MidiNote_compute_next_data_frame(MidiNote *self)
     for (i=0; i<self->bufsize*self->voices*2; i++) {
         self->trigger_streams[i] = 0.0;
     }
+    memcpy(self->notestart, self->notebuf, self->voices * 2 * sizeof(int));
+    self->nchanges = 0;
 
     tmp = Server_getMidiEventBuffer((Server *)self->server);
     count = Server_getMidiEventCount((Server *)self->server);
@@ -2075,6 +2119,8 @@ MidiNote_dealloc(MidiNote* self)
 {
     pyo_DEALLOC
     free(self->notebuf);
+    free(self->notestart);
+    free(self->changes);
     free(self->trigger_streams);
     MidiNote_clear(self);
     self->ob_type->tp_free((PyObject*)self);
@@ -2111,9 +2157,12 @@ MidiNote_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     if (! PyArg_ParseTupleAndKeywords(args, kwds, "|iiiii", kwlist, &self->voices, &self->scale, &self->first, &self->last, &self->channel))
         Py_RETURN_NONE;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->notebuf = (int *)realloc(self->notebuf, self->voices * 2 * sizeof(int));
+    self->notestart = (int *)realloc(self->notestart, self->voices * 2 * sizeof(int));
+    self->changes = (int *)realloc(self->changes, PYO_MIDI_EVENTS * 4 * sizeof(int));
+    self->nchanges = 0;
     self->trigger_streams = (MYFLT *)realloc(self->trigger_streams, self->bufsize * self->voices * 2 * sizeof(MYFLT));
 
     for (i=0; i<self->bufsize*self->voices*2; i++) {
@@ -2121,8 +2170,8 @@ MidiNote_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     }
 
     for (i=0; i<self->voices; i++) {
-        self->notebuf[i*2] = -1;
-        self->notebuf[i*2+1] = 0;
+        self->notebuf[i*2] = self->notestart[i*2] = -1;
+        self->notebuf[i*2+1] = self->notestart[i*2+1] = 0;
     }
 
     self->centralkey = (self->first + self->last) / 2;
@@ -2132,10 +2181,10 @@ MidiNote_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     return (PyObject *)self;
 }
 
-MYFLT MidiNote_getValue(MidiNote *self, int voice, int which)
+static MYFLT
+MidiNote_convert(MidiNote *self, int midival, int which)
 {
     MYFLT val = -1.0;
-    int midival = self->notebuf[voice*2+which];
     if (which == 0 && midival != -1) {
         if (self->scale == 0)
             val = midival;
@@ -2151,6 +2200,33 @@ MYFLT MidiNote_getValue(MidiNote *self, int voice, int which)
     return val;
 }
 
+/* Writes the pitch (which = 0) or the velocity (which = 1) of a voice, changing at the exact
+   position of the notes in the buffer. Without a note, the pitch keeps its last value. */
+void MidiNote_fillValues(MidiNote *self, int voice, int which, MYFLT *data)
+{
+    int i, j, end, pos = 0;
+    int midival = self->notestart[voice*2+which];
+    MYFLT val = data[self->bufsize-1];
+
+    for (j=0; j<=self->nchanges; j++) {
+        if (j < self->nchanges) {
+            if (self->changes[j*4+1] != voice)
+                continue;
+            end = self->changes[j*4];
+        }
+        else
+            end = self->bufsize;
+        if (which == 1 || midival != -1)
+            val = MidiNote_convert(self, midival, which);
+        for (i=pos; i<end; i++) {
+            data[i] = val;
+        }
+        pos = end;
+        if (j < self->nchanges)
+            midival = self->changes[j*4+2+which];
+    }
+}
+
 static PyObject * MidiNote_getServer(MidiNote* self) { GET_SERVER };
 static PyObject * MidiNote_getStream(MidiNote* self) { GET_STREAM };
 
@@ -2337,20 +2413,9 @@ Notein_setProcMode(Notein *self)
 static void
 Notein_compute_next_data_frame(Notein *self)
 {
-    int i;
-    MYFLT tmp = MidiNote_getValue(self->handler, self->voice, self->mode);
-
-    if (self->mode == 0 && tmp != -1) {
-        for (i=0; i<self->bufsize; i++) {
-            self->data[i] = tmp;
-        }
-    }
-    else if (self->mode == 1) {
-        for (i=0; i<self->bufsize; i++) {
-            self->data[i] = tmp;
-        }
+    MidiNote_fillValues(self->handler, self->voice, self->mode, self->data);
+    if (self->mode == 1)
         (*self->muladd_func_ptr)(self);
-    }
 }
 
 static int
@@ -2380,7 +2445,6 @@ Notein_dealloc(Notein* self)
 static PyObject *
 Notein_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *handlertmp=NULL, *multmp=NULL, *addtmp=NULL;
     Notein *self;
     self = (Notein *)type->tp_alloc(type, 0);
@@ -2411,7 +2475,7 @@ Notein_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -2636,7 +2700,6 @@ NoteinTrig_dealloc(NoteinTrig* self)
 static PyObject *
 NoteinTrig_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *handlertmp=NULL, *multmp=NULL, *addtmp=NULL;
     NoteinTrig *self;
     self = (NoteinTrig *)type->tp_alloc(type, 0);
@@ -2667,7 +2730,7 @@ NoteinTrig_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -2953,7 +3016,6 @@ MidiAdsr_dealloc(MidiAdsr* self)
 static PyObject *
 MidiAdsr_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *multmp=NULL, *addtmp=NULL;
     MidiAdsr *self;
     self = (MidiAdsr *)type->tp_alloc(type, 0);
@@ -2990,7 +3052,7 @@ MidiAdsr_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     if (self->attack < 0.000001)
         self->attack = 0.000001;
@@ -3344,7 +3406,6 @@ MidiDelAdsr_dealloc(MidiDelAdsr* self)
 static PyObject *
 MidiDelAdsr_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *multmp=NULL, *addtmp=NULL;
     MidiDelAdsr *self;
     self = (MidiDelAdsr *)type->tp_alloc(type, 0);
@@ -3382,7 +3443,7 @@ MidiDelAdsr_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     if (self->attack < 0.000001)
         self->attack = 0.000001;
@@ -3586,3 +3647,1005 @@ PyTypeObject MidiDelAdsrType = {
     0,                         /* tp_alloc */
     MidiDelAdsr_new,                 /* tp_new */
 };
+
+/****************************************************/
+/* VoicePool, preallocated voices with automatic    */
+/* activation and stealing. Only the streams of the */
+/* sounding voices are computed.                    */
+/****************************************************/
+
+#define VOICE_FREE 0
+#define VOICE_HELD 1
+#define VOICE_RELEASED 2
+
+/* Peak amplitude under which a released voice is considered finished. */
+#define PYO_VOICE_SILENCE 0.0001
+
+typedef struct {
+    pyo_audio_HEAD
+    PyObject *voicestreams; /* for each voice, the list of the streams activated with the voice */
+    PyObject *envstreams; /* for each voice, the streams watched to know when the voice is finished */
+    int poly;
+    int steal; /* 0 = no stealing, 1 = oldest, 2 = quietest */
+    int scale; /* 0 = midi, 1 = hertz */
+    int channel;
+    int *state;
+    int *pitch;
+    int *velocity;
+    int *retrig; /* 1 if a held voice has been stolen during this buffer */
+    unsigned long *order; /* when the voice was started */
+    unsigned long count;
+    MYFLT *peak; /* peak amplitude of the previous buffer */
+    int *queue; /* pitch and velocity of the notes received from python */
+    int nqueue;
+    int sounding;
+} VoicePool;
+
+static void
+VoicePool_setProcMode(VoicePool *self) {};
+
+/* Activates or deactivates the streams of a voice, the data of a deactivated voice is cleared. */
+static void
+VoicePool_activate(VoicePool *self, int voice, int active)
+{
+    int i;
+    Stream *stream;
+    PyObject *streams = PyList_GET_ITEM(self->voicestreams, voice);
+
+    for (i=0; i<PyList_GET_SIZE(streams); i++) {
+        stream = (Stream *)PyList_GET_ITEM(streams, i);
+        Stream_setStreamActive(stream, active);
+        if (active == 0)
+            memset(Stream_getData(stream), 0, self->bufsize * sizeof(MYFLT));
+    }
+    self->peak[voice] = 0.0;
+    Server_streamsChanged((Server *)self->server);
+}
+
+/* Returns a free voice or, if stealing is allowed, the voice to steal. Released voices are
+   stolen before held ones. Returns -1 if no voice is available. */
+static int
+VoicePool_findVoice(VoicePool *self)
+{
+    int i, which, best = -1;
+
+    for (i=0; i<self->poly; i++) {
+        if (self->state[i] == VOICE_FREE)
+            return i;
+    }
+    if (self->steal == 0)
+        return -1;
+
+    for (which=VOICE_RELEASED; which>=VOICE_HELD && best == -1; which--) {
+        for (i=0; i<self->poly; i++) {
+            if (self->state[i] != which)
+                continue;
+            if (best == -1)
+                best = i;
+            else if (self->steal == 2 && self->peak[i] != self->peak[best]) {
+                if (self->peak[i] < self->peak[best])
+                    best = i;
+            }
+            else if (self->order[i] < self->order[best])
+                best = i;
+        }
+    }
+    return best;
+}
+
+static void
+VoicePool_noteOff(VoicePool *self, int pitch)
+{
+    int i;
+
+    for (i=0; i<self->poly; i++) {
+        if (self->state[i] == VOICE_HELD && self->pitch[i] == pitch)
+            self->state[i] = VOICE_RELEASED;
+    }
+}
+
+static void
+VoicePool_noteOn(VoicePool *self, int pitch, int velocity)
+{
+    int i, voice = -1;
+
+    if (velocity == 0) {
+        VoicePool_noteOff(self, pitch);
+        return;
+    }
+
+    /* The same note played again restarts its voice. */
+    for (i=0; i<self->poly; i++) {
+        if (self->state[i] == VOICE_HELD && self->pitch[i] == pitch) {
+            voice = i;
+            break;
+        }
+    }
+    if (voice == -1)
+        voice = VoicePool_findVoice(self);
+    if (voice == -1)
+        return;
+
+    if (self->state[voice] == VOICE_FREE) {
+        VoicePool_activate(self, voice, 1);
+        self->sounding++;
+    }
+    else if (self->state[voice] == VOICE_HELD)
+        self->retrig[voice] = 1;
+    self->state[voice] = VOICE_HELD;
+    self->pitch[voice] = pitch;
+    self->velocity[voice] = velocity;
+    self->order[voice] = ++self->count;
+}
+
+/* Peak amplitude of the previous buffer of the streams watched for a voice. */
+static MYFLT
+VoicePool_measure(VoicePool *self, int voice)
+{
+    int i, j;
+    MYFLT absin, peak = 0.0;
+    MYFLT *in;
+    PyObject *streams = PyList_GET_ITEM(self->envstreams, voice);
+
+    for (i=0; i<PyList_GET_SIZE(streams); i++) {
+        in = Stream_getData((Stream *)PyList_GET_ITEM(streams, i));
+        for (j=0; j<self->bufsize; j++) {
+            absin = in[j] < 0.0 ? -in[j] : in[j];
+            if (absin > peak)
+                peak = absin;
+        }
+    }
+    return peak;
+}
+
+static void
+VoicePool_compute_next_data_frame(VoicePool *self)
+{
+    PmEvent *buffer;
+    int i, count, status, pitch, velocity;
+
+    /* A released voice is finished when its envelope has been silent for a whole buffer. */
+    for (i=0; i<self->poly; i++) {
+        self->retrig[i] = 0;
+        if (self->state[i] == VOICE_FREE)
+            continue;
+        self->peak[i] = VoicePool_measure(self, i);
+        if (self->state[i] == VOICE_RELEASED && self->peak[i] < PYO_VOICE_SILENCE) {
+            self->state[i] = VOICE_FREE;
+            VoicePool_activate(self, i, 0);
+            self->sounding--;
+        }
+    }
+
+    for (i=0; i<self->nqueue; i++) {
+        VoicePool_noteOn(self, self->queue[i*2], self->queue[i*2+1]);
+    }
+    self->nqueue = 0;
+
+    buffer = Server_getMidiEventBuffer((Server *)self->server);
+    count = Server_getMidiEventCount((Server *)self->server);
+    for (i=0; i<count; i++) {
+        status = Pm_MessageStatus(buffer[i].message);
+        if ((status & 0xF0) != 0x90 && (status & 0xF0) != 0x80)
+            continue;
+        if (self->channel != 0 && (status & 0x0F) != (self->channel - 1))
+            continue;
+        pitch = Pm_MessageData1(buffer[i].message);
+        velocity = Pm_MessageData2(buffer[i].message);
+        if ((status & 0xF0) == 0x80)
+            velocity = 0;
+        VoicePool_noteOn(self, pitch, velocity);
+    }
+}
+
+static int
+VoicePool_traverse(VoicePool *self, visitproc visit, void *arg)
+{
+    pyo_VISIT
+    Py_VISIT(self->voicestreams);
+    Py_VISIT(self->envstreams);
+    return 0;
+}
+
+static int
+VoicePool_clear(VoicePool *self)
+{
+    pyo_CLEAR
+    Py_CLEAR(self->voicestreams);
+    Py_CLEAR(self->envstreams);
+    return 0;
+}
+
+static void
+VoicePool_dealloc(VoicePool* self)
+{
+    pyo_DEALLOC
+    free(self->state);
+    free(self->pitch);
+    free(self->velocity);
+    free(self->retrig);
+    free(self->order);
+    free(self->peak);
+    free(self->queue);
+    VoicePool_clear(self);
+    self->ob_type->tp_free((PyObject*)self);
+}
+
+static PyObject *
+VoicePool_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    int i;
+    VoicePool *self;
+    self = (VoicePool *)type->tp_alloc(type, 0);
+
+    self->poly = 16;
+    self->steal = 1;
+    self->scale = 1;
+    self->channel = 0;
+    self->count = 0;
+    self->nqueue = 0;
+    self->sounding = 0;
+
+    INIT_OBJECT_COMMON
+    Stream_setFunctionPtr(self->stream, VoicePool_compute_next_data_frame);
+    self->mode_func_ptr = VoicePool_setProcMode;
+
+    static char *kwlist[] = {"poly", "steal", "scale", "channel", NULL};
+
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, "|iiii", kwlist, &self->poly, &self->steal, &self->scale, &self->channel))
+        Py_RETURN_NONE;
+
+    if (self->poly < 1)
+        self->poly = 1;
+
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
+
+    self->state = (int *)calloc(self->poly, sizeof(int));
+    self->pitch = (int *)calloc(self->poly, sizeof(int));
+    self->velocity = (int *)calloc(self->poly, sizeof(int));
+    self->retrig = (int *)calloc(self->poly, sizeof(int));
+    self->order = (unsigned long *)calloc(self->poly, sizeof(unsigned long));
+    self->peak = (MYFLT *)calloc(self->poly, sizeof(MYFLT));
+    self->queue = (int *)malloc(PYO_MIDI_EVENTS * 2 * sizeof(int));
+
+    self->voicestreams = PyList_New(self->poly);
+    self->envstreams = PyList_New(self->poly);
+    for (i=0; i<self->poly; i++) {
+        PyList_SET_ITEM(self->voicestreams, i, PyList_New(0));
+        PyList_SET_ITEM(self->envstreams, i, PyList_New(0));
+    }
+
+    (*self->mode_func_ptr)(self);
+
+    return (PyObject *)self;
+}
+
+static MYFLT
+VoicePool_getValue(VoicePool *self, int voice, int which)
+{
+    if (which == 0) {
+        if (self->scale == 1)
+            return 8.1757989156437 * MYPOW(1.0594630943593, self->pitch[voice]);
+        return (MYFLT)self->pitch[voice];
+    }
+    if (self->state[voice] == VOICE_HELD)
+        return (MYFLT)self->velocity[voice] / 127.;
+    return 0.0;
+}
+
+static PyObject * VoicePool_getServer(VoicePool* self) { GET_SERVER };
+static PyObject * VoicePool_getStream(VoicePool* self) { GET_STREAM };
+
+static PyObject * VoicePool_play(VoicePool *self, PyObject *args, PyObject *kwds) { PLAY };
+static PyObject * VoicePool_stop(VoicePool *self) { STOP };
+
+/* Gives the streams of a voice. The streams not active at this time are left untouched. */
+static PyObject *
+VoicePool_setVoice(VoicePool *self, PyObject *args)
+{
+    int i, voice;
+    PyObject *streams, *envs, *stream, *active;
+
+    if (! PyArg_ParseTuple(args, "iOO", &voice, &streams, &envs))
+        return NULL;
+
+    if (voice < 0 || voice >= self->poly || !PyList_Check(streams) || !PyList_Check(envs)) {
+        PyErr_SetString(PyExc_ValueError, "VoicePool: invalid voice.");
+        return NULL;
+    }
+
+    if (self->state[voice] != VOICE_FREE) {
+        VoicePool_activate(self, voice, 0);
+        self->state[voice] = VOICE_FREE;
+        self->sounding--;
+    }
+
+    active = PyList_New(0);
+    for (i=0; i<PyList_GET_SIZE(streams); i++) {
+        stream = PyList_GET_ITEM(streams, i);
+        if (PyObject_TypeCheck(stream, &StreamType) && Stream_getStreamActive((Stream *)stream) == 1)
+            PyList_Append(active, stream);
+    }
+    PyList_SetItem(self->voicestreams, voice, active);
+    Py_INCREF(envs);
+    PyList_SetItem(self->envstreams, voice, envs);
+
+    /* The voice is silent until it receives a note. */
+    VoicePool_activate(self, voice, 0);
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+VoicePool_noteOnPy(VoicePool *self, PyObject *args)
+{
+    int pitch, velocity = 127;
+
+    if (! PyArg_ParseTuple(args, "i|i", &pitch, &velocity))
+        return NULL;
+
+    if (self->nqueue < PYO_MIDI_EVENTS) {
+        self->queue[self->nqueue*2] = pitch;
+        self->queue[self->nqueue*2+1] = velocity < 0 ? 0 : velocity > 127 ? 127 : velocity;
+        self->nqueue++;
+    }
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+VoicePool_noteOffPy(VoicePool *self, PyObject *arg)
+{
+    if (PyInt_Check(arg) && self->nqueue < PYO_MIDI_EVENTS) {
+        self->queue[self->nqueue*2] = PyInt_AsLong(arg);
+        self->queue[self->nqueue*2+1] = 0;
+        self->nqueue++;
+    }
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+VoicePool_setSteal(VoicePool *self, PyObject *arg)
+{
+    int tmp;
+
+    if (PyInt_Check(arg)) {
+        tmp = PyInt_AsLong(arg);
+        if (tmp >= 0 && tmp <= 2)
+            self->steal = tmp;
+    }
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+VoicePool_setChannel(VoicePool *self, PyObject *arg)
+{
+    int tmp;
+
+    if (PyInt_Check(arg)) {
+        tmp = PyInt_AsLong(arg);
+        if (tmp >= 0 && tmp < 128)
+            self->channel = tmp;
+    }
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+VoicePool_getActiveVoices(VoicePool *self)
+{
+    return PyInt_FromLong(self->sounding);
+}
+
+static PyMemberDef VoicePool_members[] = {
+{"server", T_OBJECT_EX, offsetof(VoicePool, server), 0, "Pyo server."},
+{"stream", T_OBJECT_EX, offsetof(VoicePool, stream), 0, "Stream object."},
+{NULL}  /* Sentinel */
+};
+
+static PyMethodDef VoicePool_methods[] = {
+{"getServer", (PyCFunction)VoicePool_getServer, METH_NOARGS, "Returns server object."},
+{"_getStream", (PyCFunction)VoicePool_getStream, METH_NOARGS, "Returns stream object."},
+{"play", (PyCFunction)VoicePool_play, METH_VARARGS|METH_KEYWORDS, "Starts computing without sending sound to soundcard."},
+{"stop", (PyCFunction)VoicePool_stop, METH_NOARGS, "Stops computing."},
+{"setVoice", (PyCFunction)VoicePool_setVoice, METH_VARARGS, "Sets the streams of a voice and the streams watched to know when it is finished."},
+{"noteOn", (PyCFunction)VoicePool_noteOnPy, METH_VARARGS, "Starts a note."},
+{"noteOff", (PyCFunction)VoicePool_noteOffPy, METH_O, "Releases a note."},
+{"setSteal", (PyCFunction)VoicePool_setSteal, METH_O, "Sets the stealing policy."},
+{"setChannel", (PyCFunction)VoicePool_setChannel, METH_O, "Sets the midi channel."},
+{"getActiveVoices", (PyCFunction)VoicePool_getActiveVoices, METH_NOARGS, "Returns the number of voices currently computed."},
+{NULL}  /* Sentinel */
+};
+
+PyTypeObject VoicePoolType = {
+PyObject_HEAD_INIT(NULL)
+0,                         /*ob_size*/
+"_pyo.VoicePool_base",         /*tp_name*/
+sizeof(VoicePool),         /*tp_basicsize*/
+0,                         /*tp_itemsize*/
+(destructor)VoicePool_dealloc, /*tp_dealloc*/
+0,                         /*tp_print*/
+0,                         /*tp_getattr*/
+0,                         /*tp_setattr*/
+0,                         /*tp_compare*/
+0,                         /*tp_repr*/
+0,             /*tp_as_number*/
+0,                         /*tp_as_sequence*/
+0,                         /*tp_as_mapping*/
+0,                         /*tp_hash */
+0,                         /*tp_call*/
+0,                         /*tp_str*/
+0,                         /*tp_getattro*/
+0,                         /*tp_setattro*/
+0,                         /*tp_as_buffer*/
+Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_CHECKTYPES, /*tp_flags*/
+"VoicePool objects. Activates the voices of a polyphonic instrument.",           /* tp_doc */
+(traverseproc)VoicePool_traverse,   /* tp_traverse */
+(inquiry)VoicePool_clear,           /* tp_clear */
+0,		               /* tp_richcompare */
+0,		               /* tp_weaklistoffset */
+0,		               /* tp_iter */
+0,		               /* tp_iternext */
+VoicePool_methods,             /* tp_methods */
+VoicePool_members,             /* tp_members */
+0,                      /* tp_getset */
+0,                         /* tp_base */
+0,                         /* tp_dict */
+0,                         /* tp_descr_get */
+0,                         /* tp_descr_set */
+0,                         /* tp_dictoffset */
+0,      /* tp_init */
+0,                         /* tp_alloc */
+VoicePool_new,                 /* tp_new */
+};
+
+/* VoicePoolNote streamer */
+typedef struct {
+    pyo_audio_HEAD
+    VoicePool *handler;
+    int modebuffer[2];
+    int voice;
+    int mode; /* 0 = pitch, 1 = velocity */
+} VoicePoolNote;
+
+static void VoicePoolNote_postprocessing_ii(VoicePoolNote *self) { POST_PROCESSING_II };
+static void VoicePoolNote_postprocessing_ai(VoicePoolNote *self) { POST_PROCESSING_AI };
+static void VoicePoolNote_postprocessing_ia(VoicePoolNote *self) { POST_PROCESSING_IA };
+static void VoicePoolNote_postprocessing_aa(VoicePoolNote *self) { POST_PROCESSING_AA };
+static void VoicePoolNote_postprocessing_ireva(VoicePoolNote *self) { POST_PROCESSING_IREVA };
+static void VoicePoolNote_postprocessing_areva(VoicePoolNote *self) { POST_PROCESSING_AREVA };
+static void VoicePoolNote_postprocessing_revai(VoicePoolNote *self) { POST_PROCESSING_REVAI };
+static void VoicePoolNote_postprocessing_revaa(VoicePoolNote *self) { POST_PROCESSING_REVAA };
+static void VoicePoolNote_postprocessing_revareva(VoicePoolNote *self) { POST_PROCESSING_REVAREVA };
+
+static void
+VoicePoolNote_setProcMode(VoicePoolNote *self)
+{
+    int muladdmode;
+    muladdmode = self->modebuffer[0] + self->modebuffer[1] * 10;
+
+	switch (muladdmode) {
+        case 0:
+            self->muladd_func_ptr = VoicePoolNote_postprocessing_ii;
+            break;
+        case 1:
+            self->muladd_func_ptr = VoicePoolNote_postprocessing_ai;
+            break;
+        case 2:
+            self->muladd_func_ptr = VoicePoolNote_postprocessing_revai;
+            break;
+        case 10:
+            self->muladd_func_ptr = VoicePoolNote_postprocessing_ia;
+            break;
+        case 11:
+            self->muladd_func_ptr = VoicePoolNote_postprocessing_aa;
+            break;
+        case 12:
+            self->muladd_func_ptr = VoicePoolNote_postprocessing_revaa;
+            break;
+        case 20:
+            self->muladd_func_ptr = VoicePoolNote_postprocessing_ireva;
+            break;
+        case 21:
+            self->muladd_func_ptr = VoicePoolNote_postprocessing_areva;
+            break;
+        case 22:
+            self->muladd_func_ptr = VoicePoolNote_postprocessing_revareva;
+            break;
+    }
+}
+
+static void
+VoicePoolNote_compute_next_data_frame(VoicePoolNote *self)
+{
+    int i;
+    MYFLT val = VoicePool_getValue(self->handler, self->voice, self->mode);
+
+    for (i=0; i<self->bufsize; i++) {
+        self->data[i] = val;
+    }
+    /* A stolen voice goes through zero to restart its envelope. */
+    if (self->mode == 1 && self->handler->retrig[self->voice] == 1)
+        self->data[0] = 0.0;
+    (*self->muladd_func_ptr)(self);
+}
+
+static int
+VoicePoolNote_traverse(VoicePoolNote *self, visitproc visit, void *arg)
+{
+    pyo_VISIT
+    Py_VISIT(self->handler);
+    return 0;
+}
+
+static int
+VoicePoolNote_clear(VoicePoolNote *self)
+{
+    pyo_CLEAR
+    Py_CLEAR(self->handler);
+    return 0;
+}
+
+static void
+VoicePoolNote_dealloc(VoicePoolNote* self)
+{
+    pyo_DEALLOC
+    VoicePoolNote_clear(self);
+    self->ob_type->tp_free((PyObject*)self);
+}
+
+static PyObject *
+VoicePoolNote_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    int i;
+    PyObject *handlertmp=NULL, *multmp=NULL, *addtmp=NULL;
+    VoicePoolNote *self;
+    self = (VoicePoolNote *)type->tp_alloc(type, 0);
+
+    self->voice = 0;
+    self->mode = 0;
+    self->modebuffer[0] = 0;
+    self->modebuffer[1] = 0;
+
+    INIT_OBJECT_COMMON
+    Stream_setFunctionPtr(self->stream, VoicePoolNote_compute_next_data_frame);
+    self->mode_func_ptr = VoicePoolNote_setProcMode;
+
+    static char *kwlist[] = {"handler", "voice", "mode", "mul", "add", NULL};
+
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, "O|iiOO", kwlist, &handlertmp, &self->voice, &self->mode, &multmp, &addtmp))
+        Py_RETURN_NONE;
+
+    Py_XDECREF(self->handler);
+    Py_INCREF(handlertmp);
+    self->handler = (VoicePool *)handlertmp;
+
+    if (self->voice < 0 || self->voice >= self->handler->poly)
+        self->voice = 0;
+
+    if (multmp) {
+        PyObject_CallMethod((PyObject *)self, "setMul", "O", multmp);
+    }
+
+    if (addtmp) {
+        PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
+    }
+
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
+
+    for (i=0; i<self->bufsize; i++) {
+        self->data[i] = VoicePool_getValue(self->handler, self->voice, self->mode);
+    }
+
+    (*self->mode_func_ptr)(self);
+
+    return (PyObject *)self;
+}
+
+static PyObject * VoicePoolNote_getServer(VoicePoolNote* self) { GET_SERVER };
+static PyObject * VoicePoolNote_getStream(VoicePoolNote* self) { GET_STREAM };
+static PyObject * VoicePoolNote_setMul(VoicePoolNote *self, PyObject *arg) { SET_MUL };
+static PyObject * VoicePoolNote_setAdd(VoicePoolNote *self, PyObject *arg) { SET_ADD };
+static PyObject * VoicePoolNote_setSub(VoicePoolNote *self, PyObject *arg) { SET_SUB };
+static PyObject * VoicePoolNote_setDiv(VoicePoolNote *self, PyObject *arg) { SET_DIV };
+
+static PyObject * VoicePoolNote_play(VoicePoolNote *self, PyObject *args, PyObject *kwds) { PLAY };
+static PyObject * VoicePoolNote_out(VoicePoolNote *self, PyObject *args, PyObject *kwds) { OUT };
+static PyObject * VoicePoolNote_stop(VoicePoolNote *self) { STOP };
+
+static PyObject * VoicePoolNote_multiply(VoicePoolNote *self, PyObject *arg) { MULTIPLY };
+static PyObject * VoicePoolNote_inplace_multiply(VoicePoolNote *self, PyObject *arg) { INPLACE_MULTIPLY };
+static PyObject * VoicePoolNote_add(VoicePoolNote *self, PyObject *arg) { ADD };
+static PyObject * VoicePoolNote_inplace_add(VoicePoolNote *self, PyObject *arg) { INPLACE_ADD };
+static PyObject * VoicePoolNote_sub(VoicePoolNote *self, PyObject *arg) { SUB };
+static PyObject * VoicePoolNote_inplace_sub(VoicePoolNote *self, PyObject *arg) { INPLACE_SUB };
+static PyObject * VoicePoolNote_div(VoicePoolNote *self, PyObject *arg) { DIV };
+static PyObject * VoicePoolNote_inplace_div(VoicePoolNote *self, PyObject *arg) { INPLACE_DIV };
+
+static PyMemberDef VoicePoolNote_members[] = {
+{"server", T_OBJECT_EX, offsetof(VoicePoolNote, server), 0, "Pyo server."},
+{"stream", T_OBJECT_EX, offsetof(VoicePoolNote, stream), 0, "Stream object."},
+{"mul", T_OBJECT_EX, offsetof(VoicePoolNote, mul), 0, "Mul factor."},
+{"add", T_OBJECT_EX, offsetof(VoicePoolNote, add), 0, "Add factor."},
+{NULL}  /* Sentinel */
+};
+
+static PyMethodDef VoicePoolNote_methods[] = {
+{"getServer", (PyCFunction)VoicePoolNote_getServer, METH_NOARGS, "Returns server object."},
+{"_getStream", (PyCFunction)VoicePoolNote_getStream, METH_NOARGS, "Returns stream object."},
+{"play", (PyCFunction)VoicePoolNote_play, METH_VARARGS|METH_KEYWORDS, "Starts computing without sending sound to soundcard."},
+{"out", (PyCFunction)VoicePoolNote_out, METH_VARARGS|METH_KEYWORDS, "Starts computing and sends sound to soundcard channel speficied by argument."},
+{"stop", (PyCFunction)VoicePoolNote_stop, METH_NOARGS, "Stops computing."},
+{"setMul", (PyCFunction)VoicePoolNote_setMul, METH_O, "Sets VoicePoolNote mul factor."},
+{"setAdd", (PyCFunction)VoicePoolNote_setAdd, METH_O, "Sets VoicePoolNote add factor."},
+{"setSub", (PyCFunction)VoicePoolNote_setSub, METH_O, "Sets inverse add factor."},
+{"setDiv", (PyCFunction)VoicePoolNote_setDiv, METH_O, "Sets inverse mul factor."},
+{NULL}  /* Sentinel */
+};
+
+static PyNumberMethods VoicePoolNote_as_number = {
+(binaryfunc)VoicePoolNote_add,                      /*nb_add*/
+(binaryfunc)VoicePoolNote_sub,                 /*nb_subtract*/
+(binaryfunc)VoicePoolNote_multiply,                 /*nb_multiply*/
+(binaryfunc)VoicePoolNote_div,                   /*nb_divide*/
+0,                /*nb_remainder*/
+0,                   /*nb_divmod*/
+0,                   /*nb_power*/
+0,                  /*nb_neg*/
+0,                /*nb_pos*/
+0,                  /*(unaryfunc)array_abs,*/
+0,                    /*nb_nonzero*/
+0,                    /*nb_invert*/
+0,               /*nb_lshift*/
+0,              /*nb_rshift*/
+0,              /*nb_and*/
+0,              /*nb_xor*/
+0,               /*nb_or*/
+0,                                          /*nb_coerce*/
+0,                       /*nb_int*/
+0,                      /*nb_long*/
+0,                     /*nb_float*/
+0,                       /*nb_oct*/
+0,                       /*nb_hex*/
+(binaryfunc)VoicePoolNote_inplace_add,              /*inplace_add*/
+(binaryfunc)VoicePoolNote_inplace_sub,         /*inplace_subtract*/
+(binaryfunc)VoicePoolNote_inplace_multiply,         /*inplace_multiply*/
+(binaryfunc)VoicePoolNote_inplace_div,           /*inplace_divide*/
+0,        /*inplace_remainder*/
+0,           /*inplace_power*/
+0,       /*inplace_lshift*/
+0,      /*inplace_rshift*/
+0,      /*inplace_and*/
+0,      /*inplace_xor*/
+0,       /*inplace_or*/
+0,             /*nb_floor_divide*/
+0,              /*nb_true_divide*/
+0,     /*nb_inplace_floor_divide*/
+0,      /*nb_inplace_true_divide*/
+0,                     /* nb_index */
+};
+
+PyTypeObject VoicePoolNoteType = {
+PyObject_HEAD_INIT(NULL)
+0,                         /*ob_size*/
+"_pyo.VoicePoolNote_base",         /*tp_name*/
+sizeof(VoicePoolNote),         /*tp_basicsize*/
+0,                         /*tp_itemsize*/
+(destructor)VoicePoolNote_dealloc, /*tp_dealloc*/
+0,                         /*tp_print*/
+0,                         /*tp_getattr*/
+0,                         /*tp_setattr*/
+0,                         /*tp_compare*/
+0,                         /*tp_repr*/
+&VoicePoolNote_as_number,             /*tp_as_number*/
+0,                         /*tp_as_sequence*/
+0,                         /*tp_as_mapping*/
+0,                         /*tp_hash */
+0,                         /*tp_call*/
+0,                         /*tp_str*/
+0,                         /*tp_getattro*/
+0,                         /*tp_setattro*/
+0,                         /*tp_as_buffer*/
+Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_CHECKTYPES,  /*tp_flags*/
+"VoicePoolNote objects. Stream pitch or velocity from a VoicePool voice.",           /* tp_doc */
+(traverseproc)VoicePoolNote_traverse,   /* tp_traverse */
+(inquiry)VoicePoolNote_clear,           /* tp_clear */
+0,		               /* tp_richcompare */
+0,		               /* tp_weaklistoffset */
+0,		               /* tp_iter */
+0,		               /* tp_iternext */
+VoicePoolNote_methods,             /* tp_methods */
+VoicePoolNote_members,             /* tp_members */
+0,                      /* tp_getset */
+0,                         /* tp_base */
+0,                         /* tp_dict */
+0,                         /* tp_descr_get */
+0,                         /* tp_descr_set */
+0,                         /* tp_dictoffset */
+0,      /* tp_init */
+0,                         /* tp_alloc */
+VoicePoolNote_new,                 /* tp_new */
+};
+
+/* VoicePoolMix, sums the output of the sounding voices */
+typedef struct {
+    pyo_audio_HEAD
+    VoicePool *handler;
+    PyObject *streams; /* output stream of each voice */
+    int modebuffer[2];
+} VoicePoolMix;
+
+static void VoicePoolMix_postprocessing_ii(VoicePoolMix *self) { POST_PROCESSING_II };
+static void VoicePoolMix_postprocessing_ai(VoicePoolMix *self) { POST_PROCESSING_AI };
+static void VoicePoolMix_postprocessing_ia(VoicePoolMix *self) { POST_PROCESSING_IA };
+static void VoicePoolMix_postprocessing_aa(VoicePoolMix *self) { POST_PROCESSING_AA };
+static void VoicePoolMix_postprocessing_ireva(VoicePoolMix *self) { POST_PROCESSING_IREVA };
+static void VoicePoolMix_postprocessing_areva(VoicePoolMix *self) { POST_PROCESSING_AREVA };
+static void VoicePoolMix_postprocessing_revai(VoicePoolMix *self) { POST_PROCESSING_REVAI };
+static void VoicePoolMix_postprocessing_revaa(VoicePoolMix *self) { POST_PROCESSING_REVAA };
+static void VoicePoolMix_postprocessing_revareva(VoicePoolMix *self) { POST_PROCESSING_REVAREVA };
+
+static void
+VoicePoolMix_setProcMode(VoicePoolMix *self)
+{
+    int muladdmode;
+    muladdmode = self->modebuffer[0] + self->modebuffer[1] * 10;
+
+	switch (muladdmode) {
+        case 0:
+            self->muladd_func_ptr = VoicePoolMix_postprocessing_ii;
+            break;
+        case 1:
+            self->muladd_func_ptr = VoicePoolMix_postprocessing_ai;
+            break;
+        case 2:
+            self->muladd_func_ptr = VoicePoolMix_postprocessing_revai;
+            break;
+        case 10:
+            self->muladd_func_ptr = VoicePoolMix_postprocessing_ia;
+            break;
+        case 11:
+            self->muladd_func_ptr = VoicePoolMix_postprocessing_aa;
+            break;
+        case 12:
+            self->muladd_func_ptr = VoicePoolMix_postprocessing_revaa;
+            break;
+        case 20:
+            self->muladd_func_ptr = VoicePoolMix_postprocessing_ireva;
+            break;
+        case 21:
+            self->muladd_func_ptr = VoicePoolMix_postprocessing_areva;
+            break;
+        case 22:
+            self->muladd_func_ptr = VoicePoolMix_postprocessing_revareva;
+            break;
+    }
+}
+
+static void
+VoicePoolMix_compute_next_data_frame(VoicePoolMix *self)
+{
+    int i, j, nvoices;
+    MYFLT *in;
+
+    memset(self->data, 0, self->bufsize * sizeof(MYFLT));
+    nvoices = PyList_GET_SIZE(self->streams);
+    if (nvoices > self->handler->poly)
+        nvoices = self->handler->poly;
+    for (i=0; i<nvoices; i++) {
+        if (self->handler->state[i] == VOICE_FREE)
+            continue;
+        in = Stream_getData((Stream *)PyList_GET_ITEM(self->streams, i));
+        for (j=0; j<self->bufsize; j++) {
+            self->data[j] += in[j];
+        }
+    }
+    (*self->muladd_func_ptr)(self);
+}
+
+static int
+VoicePoolMix_traverse(VoicePoolMix *self, visitproc visit, void *arg)
+{
+    pyo_VISIT
+    Py_VISIT(self->handler);
+    Py_VISIT(self->streams);
+    return 0;
+}
+
+static int
+VoicePoolMix_clear(VoicePoolMix *self)
+{
+    pyo_CLEAR
+    Py_CLEAR(self->handler);
+    Py_CLEAR(self->streams);
+    return 0;
+}
+
+static void
+VoicePoolMix_dealloc(VoicePoolMix* self)
+{
+    pyo_DEALLOC
+    VoicePoolMix_clear(self);
+    self->ob_type->tp_free((PyObject*)self);
+}
+
+static PyObject *
+VoicePoolMix_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    int i;
+    PyObject *handlertmp=NULL, *streamstmp=NULL, *multmp=NULL, *addtmp=NULL;
+    VoicePoolMix *self;
+    self = (VoicePoolMix *)type->tp_alloc(type, 0);
+
+    self->modebuffer[0] = 0;
+    self->modebuffer[1] = 0;
+
+    INIT_OBJECT_COMMON
+    Stream_setFunctionPtr(self->stream, VoicePoolMix_compute_next_data_frame);
+    self->mode_func_ptr = VoicePoolMix_setProcMode;
+
+    static char *kwlist[] = {"handler", "streams", "mul", "add", NULL};
+
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, "OO|OO", kwlist, &handlertmp, &streamstmp, &multmp, &addtmp))
+        Py_RETURN_NONE;
+
+    if (!PyList_Check(streamstmp)) {
+        PyErr_SetString(PyExc_TypeError, "VoicePoolMix: streams argument must be a list of streams.");
+        Py_RETURN_NONE;
+    }
+    for (i=0; i<PyList_GET_SIZE(streamstmp); i++) {
+        if (!PyObject_TypeCheck(PyList_GET_ITEM(streamstmp, i), &StreamType)) {
+            PyErr_SetString(PyExc_TypeError, "VoicePoolMix: streams argument must be a list of streams.");
+            Py_RETURN_NONE;
+        }
+    }
+
+    Py_XDECREF(self->handler);
+    Py_INCREF(handlertmp);
+    self->handler = (VoicePool *)handlertmp;
+
+    Py_XDECREF(self->streams);
+    Py_INCREF(streamstmp);
+    self->streams = streamstmp;
+
+    if (multmp) {
+        PyObject_CallMethod((PyObject *)self, "setMul", "O", multmp);
+    }
+
+    if (addtmp) {
+        PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
+    }
+
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
+
+    (*self->mode_func_ptr)(self);
+
+    return (PyObject *)self;
+}
+
+static PyObject * VoicePoolMix_getServer(VoicePoolMix* self) { GET_SERVER };
+static PyObject * VoicePoolMix_getStream(VoicePoolMix* self) { GET_STREAM };
+static PyObject * VoicePoolMix_setMul(VoicePoolMix *self, PyObject *arg) { SET_MUL };
+static PyObject * VoicePoolMix_setAdd(VoicePoolMix *self, PyObject *arg) { SET_ADD };
+static PyObject * VoicePoolMix_setSub(VoicePoolMix *self, PyObject *arg) { SET_SUB };
+static PyObject * VoicePoolMix_setDiv(VoicePoolMix *self, PyObject *arg) { SET_DIV };
+
+static PyObject * VoicePoolMix_play(VoicePoolMix *self, PyObject *args, PyObject *kwds) { PLAY };
+static PyObject * VoicePoolMix_out(VoicePoolMix *self, PyObject *args, PyObject *kwds) { OUT };
+static PyObject * VoicePoolMix_stop(VoicePoolMix *self) { STOP };
+
+static PyObject * VoicePoolMix_multiply(VoicePoolMix *self, PyObject *arg) { MULTIPLY };
+static PyObject * VoicePoolMix_inplace_multiply(VoicePoolMix *self, PyObject *arg) { INPLACE_MULTIPLY };
+static PyObject * VoicePoolMix_add(VoicePoolMix *self, PyObject *arg) { ADD };
+static PyObject * VoicePoolMix_inplace_add(VoicePoolMix *self, PyObject *arg) { INPLACE_ADD };
+static PyObject * VoicePoolMix_sub(VoicePoolMix *self, PyObject *arg) { SUB };
+static PyObject * VoicePoolMix_inplace_sub(VoicePoolMix *self, PyObject *arg) { INPLACE_SUB };
+static PyObject * VoicePoolMix_div(VoicePoolMix *self, PyObject *arg) { DIV };
+static PyObject * VoicePoolMix_inplace_div(VoicePoolMix *self, PyObject *arg) { INPLACE_DIV };
+
+static PyMemberDef VoicePoolMix_members[] = {
+{"server", T_OBJECT_EX, offsetof(VoicePoolMix, server), 0, "Pyo server."},
+{"stream", T_OBJECT_EX, offsetof(VoicePoolMix, stream), 0, "Stream object."},
+{"mul", T_OBJECT_EX, offsetof(VoicePoolMix, mul), 0, "Mul factor."},
+{"add", T_OBJECT_EX, offsetof(VoicePoolMix, add), 0, "Add factor."},
+{NULL}  /* Sentinel */
+};
+
+static PyMethodDef VoicePoolMix_methods[] = {
+{"getServer", (PyCFunction)VoicePoolMix_getServer, METH_NOARGS, "Returns server object."},
+{"_getStream", (PyCFunction)VoicePoolMix_getStream, METH_NOARGS, "Returns stream object."},
+{"play", (PyCFunction)VoicePoolMix_play, METH_VARARGS|METH_KEYWORDS, "Starts computing without sending sound to soundcard."},
+{"out", (PyCFunction)VoicePoolMix_out, METH_VARARGS|METH_KEYWORDS, "Starts computing and sends sound to soundcard channel speficied by argument."},
+{"stop", (PyCFunction)VoicePoolMix_stop, METH_NOARGS, "Stops computing."},
+{"setMul", (PyCFunction)VoicePoolMix_setMul, METH_O, "Sets VoicePoolMix mul factor."},
+{"setAdd", (PyCFunction)VoicePoolMix_setAdd, METH_O, "Sets VoicePoolMix add factor."},
+{"setSub", (PyCFunction)VoicePoolMix_setSub, METH_O, "Sets inverse add factor."},
+{"setDiv", (PyCFunction)VoicePoolMix_setDiv, METH_O, "Sets inverse mul factor."},
+{NULL}  /* Sentinel */
+};
+
+static PyNumberMethods VoicePoolMix_as_number = {
+(binaryfunc)VoicePoolMix_add,                      /*nb_add*/
+(binaryfunc)VoicePoolMix_sub,                 /*nb_subtract*/
+(binaryfunc)VoicePoolMix_multiply,                 /*nb_multiply*/
+(binaryfunc)VoicePoolMix_div,                   /*nb_divide*/
+0,                /*nb_remainder*/
+0,                   /*nb_divmod*/
+0,                   /*nb_power*/
+0,                  /*nb_neg*/
+0,                /*nb_pos*/
+0,                  /*(unaryfunc)array_abs,*/
+0,                    /*nb_nonzero*/
+0,                    /*nb_invert*/
+0,               /*nb_lshift*/
+0,              /*nb_rshift*/
+0,              /*nb_and*/
+0,              /*nb_xor*/
+0,               /*nb_or*/
+0,                                          /*nb_coerce*/
+0,                       /*nb_int*/
+0,                      /*nb_long*/
+0,                     /*nb_float*/
+0,                       /*nb_oct*/
+0,                       /*nb_hex*/
+(binaryfunc)VoicePoolMix_inplace_add,              /*inplace_add*/
+(binaryfunc)VoicePoolMix_inplace_sub,         /*inplace_subtract*/
+(binaryfunc)VoicePoolMix_inplace_multiply,         /*inplace_multiply*/
+(binaryfunc)VoicePoolMix_inplace_div,           /*inplace_divide*/
+0,        /*inplace_remainder*/
+0,           /*inplace_power*/
+0,       /*inplace_lshift*/
+0,      /*inplace_rshift*/
+0,      /*inplace_and*/
+0,      /*inplace_xor*/
+0,       /*inplace_or*/
+0,             /*nb_floor_divide*/
+0,              /*nb_true_divide*/
+0,     /*nb_inplace_floor_divide*/
+0,      /*nb_inplace_true_divide*/
+0,                     /* nb_index */
+};
+
+PyTypeObject VoicePoolMixType = {
+PyObject_HEAD_INIT(NULL)
+0,                         /*ob_size*/
+"_pyo.VoicePoolMix_base",         /*tp_name*/
+sizeof(VoicePoolMix),         /*tp_basicsize*/
+0,                         /*tp_itemsize*/
+(destructor)VoicePoolMix_dealloc, /*tp_dealloc*/
+0,                         /*tp_print*/
+0,                         /*tp_getattr*/
+0,                         /*tp_setattr*/
+0,                         /*tp_compare*/
+0,                         /*tp_repr*/
+&VoicePoolMix_as_number,             /*tp_as_number*/
+0,                         /*tp_as_sequence*/
+0,                         /*tp_as_mapping*/
+0,                         /*tp_hash */
+0,                         /*tp_call*/
+0,                         /*tp_str*/
+0,                         /*tp_getattro*/
+0,                         /*tp_setattro*/
+0,                         /*tp_as_buffer*/
+Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_CHECKTYPES,  /*tp_flags*/
+"VoicePoolMix objects. Sums the output of the voices of a VoicePool.",           /* tp_doc */
+(traverseproc)VoicePoolMix_traverse,   /* tp_traverse */
+(inquiry)VoicePoolMix_clear,           /* tp_clear */
+0,		               /* tp_richcompare */
+0,		               /* tp_weaklistoffset */
+0,		               /* tp_iter */
+0,		               /* tp_iternext */
+VoicePoolMix_methods,             /* tp_methods */
+VoicePoolMix_members,             /* tp_members */
+0,                      /* tp_getset */
+0,                         /* tp_base */
+0,                         /* tp_dict */
+0,                         /* tp_descr_get */
+0,                         /* tp_descr_set */
+0,                         /* tp_dictoffset */
+0,      /* tp_init */
+0,                         /* tp_alloc */
+VoicePoolMix_new,                 /* tp_new */
+};
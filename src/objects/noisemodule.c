@@ -138,7 +138,6 @@ Noise_dealloc(Noise* self)
 static PyObject *
 Noise_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *multmp=NULL, *addtmp=NULL;
     Noise *self;
     self = (Noise *)type->tp_alloc(type, 0);
@@ -149,6 +148,7 @@ Noise_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Noise_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = Noise_setProcMode;
 
     static char *kwlist[] = {"mul", "add", NULL};
@@ -164,7 +164,7 @@ Noise_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     Server_generateSeed((Server *)self->server, NOISE_ID);
 
@@ -430,7 +430,6 @@ PinkNoise_dealloc(PinkNoise* self)
 static PyObject *
 PinkNoise_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *multmp=NULL, *addtmp=NULL;
     PinkNoise *self;
     self = (PinkNoise *)type->tp_alloc(type, 0);
@@ -441,6 +440,7 @@ PinkNoise_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, PinkNoise_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = PinkNoise_setProcMode;
 
     static char *kwlist[] = {"mul", "add", NULL};
@@ -456,7 +456,7 @@ PinkNoise_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -690,7 +690,6 @@ BrownNoise_dealloc(BrownNoise* self)
 static PyObject *
 BrownNoise_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     MYFLT b;
     PyObject *multmp=NULL, *addtmp=NULL;
     BrownNoise *self;
@@ -702,6 +701,7 @@ BrownNoise_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, BrownNoise_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = BrownNoise_setProcMode;
 
     static char *kwlist[] = {"mul", "add", NULL};
@@ -717,7 +717,7 @@ BrownNoise_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     b = 2.0 - MYCOS(TWOPI * 20.0 / self->sr);
     self->c2 = (b - MYSQRT(b * b - 1.0));
@@ -259,7 +259,6 @@ Sine_dealloc(Sine* self)
 static PyObject *
 Sine_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *freqtmp=NULL, *phasetmp=NULL, *multmp=NULL, *addtmp=NULL;
 
     Sine *self;
@@ -298,7 +297,7 @@ Sine_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -708,7 +707,6 @@ SineLoop_dealloc(SineLoop* self)
 static PyObject *
 SineLoop_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *freqtmp=NULL, *feedbacktmp=NULL, *multmp=NULL, *addtmp=NULL;
     SineLoop *self;
     self = (SineLoop *)type->tp_alloc(type, 0);
@@ -746,7 +744,7 @@ SineLoop_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -984,6 +982,7 @@ Osc_readframes_ii(Osc *self) {
     int i, ipart;
     MYFLT *tablelist = TableStream_getData(self->table);
     int size = TableStream_getSize(self->table);
+    int mipmap = TableStream_hasMipmap(self->table);
 
     fr = PyFloat_AS_DOUBLE(self->freq);
     ph = PyFloat_AS_DOUBLE(self->phase);
@@ -998,7 +997,10 @@ Osc_readframes_ii(Osc *self) {
             pos -= size;
         ipart = (int)pos;
         fpart = pos - ipart;
-        self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
+        if (mipmap)
+            self->data[i] = TableStream_readMipmap(self->table, self->interp_func_ptr, ipart, fpart, inc);
+        else
+            self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
     }
 }
 
@@ -1009,6 +1011,7 @@ Osc_readframes_ai(Osc *self) {
     int i, ipart;
     MYFLT *tablelist = TableStream_getData(self->table);
     int size = TableStream_getSize(self->table);
+    int mipmap = TableStream_hasMipmap(self->table);
 
     MYFLT *fr = Stream_getData((Stream *)self->freq_stream);
     ph = PyFloat_AS_DOUBLE(self->phase);
@@ -1024,7 +1027,10 @@ Osc_readframes_ai(Osc *self) {
             pos -= size;
         ipart = (int)pos;
         fpart = pos - ipart;
-        self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
+        if (mipmap)
+            self->data[i] = TableStream_readMipmap(self->table, self->interp_func_ptr, ipart, fpart, inc);
+        else
+            self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
     }
 }
 
@@ -1035,6 +1041,7 @@ Osc_readframes_ia(Osc *self) {
     int i, ipart;
     MYFLT *tablelist = TableStream_getData(self->table);
     int size = TableStream_getSize(self->table);
+    int mipmap = TableStream_hasMipmap(self->table);
 
     fr = PyFloat_AS_DOUBLE(self->freq);
     MYFLT *ph = Stream_getData((Stream *)self->phase_stream);
@@ -1049,7 +1056,10 @@ Osc_readframes_ia(Osc *self) {
             pos -= size;
         ipart = (int)pos;
         fpart = pos - ipart;
-        self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
+        if (mipmap)
+            self->data[i] = TableStream_readMipmap(self->table, self->interp_func_ptr, ipart, fpart, inc);
+        else
+            self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
     }
 }
 
@@ -1060,6 +1070,7 @@ Osc_readframes_aa(Osc *self) {
     int i, ipart;
     MYFLT *tablelist = TableStream_getData(self->table);
     int size = TableStream_getSize(self->table);
+    int mipmap = TableStream_hasMipmap(self->table);
 
     MYFLT *fr = Stream_getData((Stream *)self->freq_stream);
     MYFLT *ph = Stream_getData((Stream *)self->phase_stream);
@@ -1075,7 +1086,10 @@ Osc_readframes_aa(Osc *self) {
             pos -= size;
         ipart = (int)pos;
         fpart = pos - ipart;
-        self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
+        if (mipmap)
+            self->data[i] = TableStream_readMipmap(self->table, self->interp_func_ptr, ipart, fpart, inc);
+        else
+            self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
     }
 }
 
@@ -1183,7 +1197,6 @@ Osc_dealloc(Osc* self)
 static PyObject *
 Osc_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *tabletmp, *freqtmp=NULL, *phasetmp=NULL, *multmp=NULL, *addtmp=NULL;
     Osc *self;
     self = (Osc *)type->tp_alloc(type, 0);
@@ -1229,7 +1242,7 @@ Osc_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -1514,6 +1527,7 @@ OscLoop_readframes_ii(OscLoop *self) {
     int i, ipart;
     MYFLT *tablelist = TableStream_getData(self->table);
     int size = TableStream_getSize(self->table);
+    int mipmap = TableStream_hasMipmap(self->table);
 
     fr = PyFloat_AS_DOUBLE(self->freq);
     feed = _clip(PyFloat_AS_DOUBLE(self->feedback)) * size;
@@ -1529,7 +1543,10 @@ OscLoop_readframes_ii(OscLoop *self) {
             pos += size;
         ipart = (int)pos;
         fpart = pos - ipart;
-        self->data[i] = self->lastValue = tablelist[ipart] * (1.0 - fpart) + tablelist[ipart+1] * fpart;
+        if (mipmap)
+            self->data[i] = self->lastValue = TableStream_readMipmap(self->table, linear, ipart, fpart, inc);
+        else
+            self->data[i] = self->lastValue = tablelist[ipart] * (1.0 - fpart) + tablelist[ipart+1] * fpart;
     }
 }
 
@@ -1539,6 +1556,7 @@ OscLoop_readframes_ai(OscLoop *self) {
     int i, ipart;
     MYFLT *tablelist = TableStream_getData(self->table);
     int size = TableStream_getSize(self->table);
+    int mipmap = TableStream_hasMipmap(self->table);
 
     MYFLT *fr = Stream_getData((Stream *)self->freq_stream);
     feed = _clip(PyFloat_AS_DOUBLE(self->feedback)) * size;
@@ -1555,7 +1573,10 @@ OscLoop_readframes_ai(OscLoop *self) {
             pos += size;
         ipart = (int)pos;
         fpart = pos - ipart;
-        self->data[i] = self->lastValue = tablelist[ipart] * (1.0 - fpart) + tablelist[ipart+1] * fpart;
+        if (mipmap)
+            self->data[i] = self->lastValue = TableStream_readMipmap(self->table, linear, ipart, fpart, inc);
+        else
+            self->data[i] = self->lastValue = tablelist[ipart] * (1.0 - fpart) + tablelist[ipart+1] * fpart;
     }
 }
 
@@ -1565,6 +1586,7 @@ OscLoop_readframes_ia(OscLoop *self) {
     int i, ipart;
     MYFLT *tablelist = TableStream_getData(self->table);
     int size = TableStream_getSize(self->table);
+    int mipmap = TableStream_hasMipmap(self->table);
 
     fr = PyFloat_AS_DOUBLE(self->freq);
     MYFLT *fd = Stream_getData((Stream *)self->feedback_stream);
@@ -1581,7 +1603,10 @@ OscLoop_readframes_ia(OscLoop *self) {
             pos += size;
         ipart = (int)pos;
         fpart = pos - ipart;
-        self->data[i] = self->lastValue = tablelist[ipart] * (1.0 - fpart) + tablelist[ipart+1] * fpart;
+        if (mipmap)
+            self->data[i] = self->lastValue = TableStream_readMipmap(self->table, linear, ipart, fpart, inc);
+        else
+            self->data[i] = self->lastValue = tablelist[ipart] * (1.0 - fpart) + tablelist[ipart+1] * fpart;
     }
 }
 
@@ -1591,6 +1616,7 @@ OscLoop_readframes_aa(OscLoop *self) {
     int i, ipart;
     MYFLT *tablelist = TableStream_getData(self->table);
     int size = TableStream_getSize(self->table);
+    int mipmap = TableStream_hasMipmap(self->table);
 
     MYFLT *fr = Stream_getData((Stream *)self->freq_stream);
     MYFLT *fd = Stream_getData((Stream *)self->feedback_stream);
@@ -1608,7 +1634,10 @@ OscLoop_readframes_aa(OscLoop *self) {
             pos += size;
         ipart = (int)pos;
         fpart = pos - ipart;
-        self->data[i] = self->lastValue = tablelist[ipart] * (1.0 - fpart) + tablelist[ipart+1] * fpart;
+        if (mipmap)
+            self->data[i] = self->lastValue = TableStream_readMipmap(self->table, linear, ipart, fpart, inc);
+        else
+            self->data[i] = self->lastValue = tablelist[ipart] * (1.0 - fpart) + tablelist[ipart+1] * fpart;
     }
 }
 
@@ -1716,7 +1745,6 @@ OscLoop_dealloc(OscLoop* self)
 static PyObject *
 OscLoop_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *tabletmp, *freqtmp=NULL, *feedbacktmp=NULL, *multmp=NULL, *addtmp=NULL;
     OscLoop *self;
     self = (OscLoop *)type->tp_alloc(type, 0);
@@ -1761,7 +1789,7 @@ OscLoop_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -2238,7 +2266,6 @@ OscTrig_dealloc(OscTrig* self)
 static PyObject *
 OscTrig_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *tabletmp, *trigtmp, *freqtmp=NULL, *phasetmp=NULL, *multmp=NULL, *addtmp=NULL;
     OscTrig *self;
     self = (OscTrig *)type->tp_alloc(type, 0);
@@ -2288,7 +2315,7 @@ OscTrig_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -2804,7 +2831,6 @@ Phasor_dealloc(Phasor* self)
 static PyObject *
 Phasor_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *freqtmp=NULL, *phasetmp=NULL, *multmp=NULL, *addtmp=NULL;
     Phasor *self;
     self = (Phasor *)type->tp_alloc(type, 0);
@@ -2842,7 +2868,7 @@ Phasor_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -3064,15 +3090,17 @@ typedef struct {
     PyObject *index;
     Stream *index_stream;
     int modebuffer[2];
+    double lastPos; /* previous position in the table, to know the increment with a mipmap */
 } Pointer;
 
 static void
 Pointer_readframes_a(Pointer *self) {
     MYFLT fpart;
-    double ph;
+    double ph, inc;
     int i, ipart;
     MYFLT *tablelist = TableStream_getData(self->table);
     int size = TableStream_getSize(self->table);
+    int mipmap = TableStream_hasMipmap(self->table);
 
     MYFLT *pha = Stream_getData((Stream *)self->index_stream);
 
@@ -3080,7 +3108,16 @@ Pointer_readframes_a(Pointer *self) {
         ph = Osc_clip(pha[i] * size, size);
         ipart = (int)ph;
         fpart = ph - ipart;
-        self->data[i] = tablelist[ipart] + (tablelist[ipart+1] - tablelist[ipart]) * fpart;
+        if (mipmap) {
+            /* distance to the previous position, the shortest way around the table. */
+            inc = MYFABS(ph - self->lastPos);
+            if (inc > (size * 0.5))
+                inc = size - inc;
+            self->data[i] = TableStream_readMipmap(self->table, linear, ipart, fpart, inc);
+        }
+        else
+            self->data[i] = tablelist[ipart] + (tablelist[ipart+1] - tablelist[ipart]) * fpart;
+        self->lastPos = ph;
     }
 }
 
@@ -3171,7 +3208,6 @@ Pointer_dealloc(Pointer* self)
 static PyObject *
 Pointer_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *tabletmp, *indextmp, *multmp=NULL, *addtmp=NULL;
     Pointer *self;
     self = (Pointer *)type->tp_alloc(type, 0);
@@ -3205,7 +3241,7 @@ Pointer_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -3541,7 +3577,6 @@ Pointer2_dealloc(Pointer2* self)
 static PyObject *
 Pointer2_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *tabletmp, *indextmp, *multmp=NULL, *addtmp=NULL;
     Pointer2 *self;
     self = (Pointer2 *)type->tp_alloc(type, 0);
@@ -3578,7 +3613,7 @@ Pointer2_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -3928,7 +3963,6 @@ TableIndex_dealloc(TableIndex* self)
 static PyObject *
 TableIndex_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *tabletmp, *indextmp, *multmp=NULL, *addtmp=NULL;
     TableIndex *self;
     self = (TableIndex *)type->tp_alloc(type, 0);
@@ -3962,7 +3996,7 @@ TableIndex_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -4278,7 +4312,6 @@ Lookup_dealloc(Lookup* self)
 static PyObject *
 Lookup_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *tabletmp, *indextmp, *multmp=NULL, *addtmp=NULL;
     Lookup *self;
     self = (Lookup *)type->tp_alloc(type, 0);
@@ -4312,7 +4345,7 @@ Lookup_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -4992,7 +5025,6 @@ Pulsar_dealloc(Pulsar* self)
 static PyObject *
 Pulsar_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *tabletmp, *envtmp, *freqtmp=NULL, *phasetmp=NULL, *fractmp=NULL, *multmp=NULL, *addtmp=NULL;
     Pulsar *self;
     self = (Pulsar *)type->tp_alloc(type, 0);
@@ -5051,7 +5083,7 @@ Pulsar_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -5394,12 +5426,13 @@ TableRead_readframes_i(TableRead *self) {
     int i, ipart;
     MYFLT *tablelist = TableStream_getData(self->table);
     int size = TableStream_getSize(self->table);
+    int mipmap = TableStream_hasMipmap(self->table);
 
     fr = PyFloat_AS_DOUBLE(self->freq);
     inc = fr * size / self->sr;
 
     if (self->go == 0)
-        PyObject_CallMethod((PyObject *)self, "stop", NULL);
+        Server_deferStop((Server *)self->server, (PyObject *)self);
 
     for (i=0; i<self->bufsize; i++) {
         self->trigsBuffer[i] = 0.0;
@@ -5420,7 +5453,10 @@ TableRead_readframes_i(TableRead *self) {
         if (self->go == 1) {
             ipart = (int)self->pointerPos;
             fpart = self->pointerPos - ipart;
-            self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
+            if (mipmap)
+                self->data[i] = TableStream_readMipmap(self->table, self->interp_func_ptr, ipart, fpart, inc);
+            else
+                self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
         }
         else
             self->data[i] = 0.0;
@@ -5435,15 +5471,17 @@ TableRead_readframes_a(TableRead *self) {
     int i, ipart;
     MYFLT *tablelist = TableStream_getData(self->table);
     int size = TableStream_getSize(self->table);
+    int mipmap = TableStream_hasMipmap(self->table);
 
     MYFLT *fr = Stream_getData((Stream *)self->freq_stream);
 
     sizeOnSr = size / self->sr;
 
     if (self->go == 0)
-        PyObject_CallMethod((PyObject *)self, "stop", NULL);
+        Server_deferStop((Server *)self->server, (PyObject *)self);
 
     for (i=0; i<self->bufsize; i++) {
+        inc = fr[i] * sizeOnSr;
         self->trigsBuffer[i] = 0.0;
         if (self->pointerPos < 0) {
             if (self->init == 0)
@@ -5462,12 +5500,14 @@ TableRead_readframes_a(TableRead *self) {
         if (self->go == 1) {
             ipart = (int)self->pointerPos;
             fpart = self->pointerPos - ipart;
-            self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
+            if (mipmap)
+                self->data[i] = TableStream_readMipmap(self->table, self->interp_func_ptr, ipart, fpart, inc);
+            else
+                self->data[i] = (*self->interp_func_ptr)(tablelist, ipart, fpart, size);
         }
         else
             self->data[i] = 0.0;
 
-        inc = fr[i] * sizeOnSr;
         self->pointerPos += inc;
     }
 }
@@ -5586,6 +5626,7 @@ TableRead_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, TableRead_compute_next_data_frame);
+    Stream_setSerial(self->stream, 3);
     self->mode_func_ptr = TableRead_setProcMode;
 
     static char *kwlist[] = {"table", "freq", "loop", "interp", "mul", "add", NULL};
@@ -5612,7 +5653,7 @@ TableRead_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->trigsBuffer = (MYFLT *)realloc(self->trigsBuffer, self->bufsize * sizeof(MYFLT));
 
@@ -6258,7 +6299,6 @@ Fm_dealloc(Fm* self)
 static PyObject *
 Fm_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *cartmp=NULL, *ratiotmp=NULL, *indextmp=NULL, *multmp=NULL, *addtmp=NULL;
     Fm *self;
     self = (Fm *)type->tp_alloc(type, 0);
@@ -6304,7 +6344,7 @@ Fm_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -6744,7 +6784,6 @@ CrossFm_dealloc(CrossFm* self)
 static PyObject *
 CrossFm_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *cartmp=NULL, *ratiotmp=NULL, *ind1tmp=NULL, *ind2tmp=NULL, *multmp=NULL, *addtmp=NULL;
     CrossFm *self;
     self = (CrossFm *)type->tp_alloc(type, 0);
@@ -6797,7 +6836,7 @@ CrossFm_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -7301,7 +7340,6 @@ Blit_dealloc(Blit* self)
 static PyObject *
 Blit_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *freqtmp=NULL, *harmstmp=NULL, *multmp=NULL, *addtmp=NULL;
     Blit *self;
     self = (Blit *)type->tp_alloc(type, 0);
@@ -7339,7 +7377,7 @@ Blit_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -7857,7 +7895,7 @@ Rossler_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->altBuffer = (MYFLT *)realloc(self->altBuffer, self->bufsize * sizeof(MYFLT));
 
@@ -8164,7 +8202,6 @@ RosslerAlt_dealloc(RosslerAlt* self)
 static PyObject *
 RosslerAlt_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL, *multmp=NULL, *addtmp=NULL;
     RosslerAlt *self;
     self = (RosslerAlt *)type->tp_alloc(type, 0);
@@ -8193,7 +8230,7 @@ RosslerAlt_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -8638,7 +8675,7 @@ Lorenz_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->altBuffer = (MYFLT *)realloc(self->altBuffer, self->bufsize * sizeof(MYFLT));
 
@@ -8945,7 +8982,6 @@ LorenzAlt_dealloc(LorenzAlt* self)
 static PyObject *
 LorenzAlt_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL, *multmp=NULL, *addtmp=NULL;
     LorenzAlt *self;
     self = (LorenzAlt *)type->tp_alloc(type, 0);
@@ -8974,7 +9010,7 @@ LorenzAlt_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -9566,7 +9602,6 @@ SumOsc_dealloc(SumOsc* self)
 static PyObject *
 SumOsc_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *freqtmp=NULL, *ratiotmp=NULL, *indextmp=NULL, *multmp=NULL, *addtmp=NULL;
     SumOsc *self;
     self = (SumOsc *)type->tp_alloc(type, 0);
@@ -9613,7 +9648,7 @@ SumOsc_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -10420,7 +10455,6 @@ SuperSaw_dealloc(SuperSaw* self)
 static PyObject *
 SuperSaw_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *freqtmp=NULL, *detunetmp=NULL, *baltmp=NULL, *multmp=NULL, *addtmp=NULL;
     SuperSaw *self;
     self = (SuperSaw *)type->tp_alloc(type, 0);
@@ -10475,7 +10509,7 @@ SuperSaw_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -10944,7 +10978,6 @@ RCOsc_dealloc(RCOsc* self)
 static PyObject *
 RCOsc_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *freqtmp=NULL, *sharptmp=NULL, *multmp=NULL, *addtmp=NULL;
     RCOsc *self;
     self = (RCOsc *)type->tp_alloc(type, 0);
@@ -10982,7 +11015,7 @@ RCOsc_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -11333,7 +11366,6 @@ TableScale_dealloc(TableScale* self)
 static PyObject *
 TableScale_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *tabletmp, *outtabletmp, *multmp=NULL, *addtmp=NULL;
     TableScale *self;
     self = (TableScale *)type->tp_alloc(type, 0);
@@ -11372,7 +11404,7 @@ TableScale_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
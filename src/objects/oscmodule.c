@@ -26,6 +26,7 @@
 #include "servermodule.h"
 #include "dummymodule.h"
 #include "lo/lo.h"
+#include "oscsender.h"
 
 void error(int num, const char *msg, const char *path)
 {
@@ -33,40 +34,102 @@ void error(int num, const char *msg, const char *path)
 }
 
 /* main OSC receiver */
+
+/* Value of a registered address. Written by the liblo thread, read by the audio thread. */
+typedef struct _OscSlot {
+    char *path;
+    unsigned int hash;
+    volatile double value;
+    volatile int active; /* 0 once the address is removed, the slot is kept until the receiver is deleted */
+    struct _OscSlot * volatile next;
+} OscSlot;
+
+#define OSC_SLOT_BUCKETS 64
+
 typedef struct {
     pyo_audio_HEAD
-    lo_server osc_server;
+    lo_server_thread osc_thread; /* receives and dispatches the messages outside of the audio thread */
     int port;
-    PyObject *dict;
+    OscSlot *slots[OSC_SLOT_BUCKETS]; /* hash table of the addresses, slots are only added */
     PyObject *address_path;
 } OscReceiver;
 
+static unsigned int
+OscSlot_hash(const char *path)
+{
+    unsigned int hash = 5381;
+    while (*path)
+        hash = hash * 33 + (unsigned char)*path++;
+    return hash;
+}
+
+static OscSlot *
+OscReceiver_findSlot(OscReceiver *self, const char *path)
+{
+    unsigned int hash = OscSlot_hash(path);
+    OscSlot *slot = self->slots[hash % OSC_SLOT_BUCKETS];
+
+    while (slot != NULL) {
+        if (slot->hash == hash && strcmp(slot->path, path) == 0)
+            return slot;
+        slot = slot->next;
+    }
+    return NULL;
+}
+
+/* Called with the GIL, the slots are linked after being fully initialized. */
+static OscSlot *
+OscReceiver_addSlot(OscReceiver *self, const char *path)
+{
+    unsigned int hash;
+    OscSlot *slot = OscReceiver_findSlot(self, path);
+
+    if (slot != NULL) {
+        slot->active = 1;
+        return slot;
+    }
+    hash = OscSlot_hash(path);
+    slot = (OscSlot *)malloc(sizeof(OscSlot));
+    slot->path = strdup(path);
+    slot->hash = hash;
+    slot->value = 0.0;
+    slot->active = 1;
+    slot->next = self->slots[hash % OSC_SLOT_BUCKETS];
+    __sync_synchronize();
+    self->slots[hash % OSC_SLOT_BUCKETS] = slot;
+    return slot;
+}
+
 int OscReceiver_handler(const char *path, const char *types, lo_arg **argv, int argc,
                         void *data, void *user_data)
 {
     OscReceiver *self = user_data;
-    PyDict_SetItem(self->dict, PyString_FromString(path), PyFloat_FromDouble(argv[0]->FLOAT_VALUE));
+    OscSlot *slot;
+
+    if (argc < 1 || !lo_is_numerical_type((lo_type)types[0]))
+        return 1;
+    slot = OscReceiver_findSlot(self, path);
+    if (slot != NULL && slot->active)
+        slot->value = (double)lo_hires_val((lo_type)types[0], argv[0]);
     return 0;
 }
 
-MYFLT OscReceiver_getValue(OscReceiver *self, PyObject *path)
+/* Returns the slot holding the value of an address, registering it if needed. */
+OscSlot * OscReceiver_getSlot(OscReceiver *self, PyObject *path)
 {
-    PyObject *tmp;
-    tmp = PyDict_GetItem(self->dict, path);
-    return PyFloat_AsDouble(tmp);
+    return OscReceiver_addSlot(self, PyString_AsString(path));
 }
 
 static void
 OscReceiver_compute_next_data_frame(OscReceiver *self)
 {
-    while (lo_server_recv_noblock(self->osc_server, 0) != 0) {};
+    /* The messages are received by the liblo thread. */
 }
 
 static int
 OscReceiver_traverse(OscReceiver *self, visitproc visit, void *arg)
 {
     pyo_VISIT
-    Py_VISIT(self->dict);
     Py_VISIT(self->address_path);
     return 0;
 }
@@ -75,7 +138,6 @@ static int
 OscReceiver_clear(OscReceiver *self)
 {
     pyo_CLEAR
-    Py_CLEAR(self->dict);
     Py_CLEAR(self->address_path);
     return 0;
 }
@@ -83,7 +145,20 @@ OscReceiver_clear(OscReceiver *self)
 static void
 OscReceiver_dealloc(OscReceiver* self)
 {
-    lo_server_free(self->osc_server);
+    int i;
+    OscSlot *slot, *next;
+
+    if (self->osc_thread != NULL) {
+        lo_server_thread_stop(self->osc_thread);
+        lo_server_thread_free(self->osc_thread);
+    }
+    for (i=0; i<OSC_SLOT_BUCKETS; i++) {
+        for (slot=self->slots[i]; slot!=NULL; slot=next) {
+            next = slot->next;
+            free(slot->path);
+            free(slot);
+        }
+    }
     pyo_DEALLOC
     OscReceiver_clear(self);
     self->ob_type->tp_free((PyObject*)self);
@@ -97,6 +172,11 @@ OscReceiver_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     OscReceiver *self;
     self = (OscReceiver *)type->tp_alloc(type, 0);
 
+    self->osc_thread = NULL;
+    for (i=0; i<OSC_SLOT_BUCKETS; i++) {
+        self->slots[i] = NULL;
+    }
+
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, OscReceiver_compute_next_data_frame);
 
@@ -105,9 +185,7 @@ OscReceiver_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     if (! PyArg_ParseTupleAndKeywords(args, kwds, "iO", kwlist, &self->port, &pathtmp))
         Py_RETURN_NONE;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
-
-    self->dict = PyDict_New();
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     if (PyString_Check(pathtmp) || PyList_Check(pathtmp)) {
         Py_INCREF(pathtmp);
@@ -120,20 +198,23 @@ OscReceiver_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     }
 
     if (PyString_Check(self->address_path)) {
-        PyDict_SetItem(self->dict, self->address_path, PyFloat_FromDouble(0.));
+        OscReceiver_addSlot(self, PyString_AsString(self->address_path));
     }
     else if (PyList_Check(self->address_path)) {
         int lsize = PyList_Size(self->address_path);
         for (i=0; i<lsize; i++) {
-            PyDict_SetItem(self->dict, PyList_GET_ITEM(self->address_path, i), PyFloat_FromDouble(0.));
+            OscReceiver_addSlot(self, PyString_AsString(PyList_GET_ITEM(self->address_path, i)));
         }
     }
 
     char buf[20];
     sprintf(buf, "%i", self->port);
-    self->osc_server = lo_server_new(buf, error);
+    self->osc_thread = lo_server_thread_new(buf, error);
 
-    lo_server_add_method(self->osc_server, NULL, TYPE_F, OscReceiver_handler, self);
+    if (self->osc_thread != NULL) {
+        lo_server_thread_add_method(self->osc_thread, NULL, NULL, OscReceiver_handler, self);
+        lo_server_thread_start(self->osc_thread);
+    }
 
     return (PyObject *)self;
 }
@@ -143,12 +224,12 @@ OscReceiver_addAddress(OscReceiver *self, PyObject *arg)
 {
     int i;
     if (PyString_Check(arg)) {
-        PyDict_SetItem(self->dict, arg, PyFloat_FromDouble(0.));
+        OscReceiver_addSlot(self, PyString_AsString(arg));
     }
     else if (PyList_Check(arg)) {
         Py_ssize_t lsize = PyList_Size(arg);
         for (i=0; i<lsize; i++) {
-            PyDict_SetItem(self->dict, PyList_GET_ITEM(arg, i), PyFloat_FromDouble(0.));
+            OscReceiver_addSlot(self, PyString_AsString(PyList_GET_ITEM(arg, i)));
         }
     }
 	Py_INCREF(Py_None);
@@ -159,13 +240,16 @@ static PyObject *
 OscReceiver_delAddress(OscReceiver *self, PyObject *arg)
 {
     int i;
+    OscSlot *slot;
     if (PyString_Check(arg)) {
-        PyDict_DelItem(self->dict, arg);
+        if ((slot = OscReceiver_findSlot(self, PyString_AsString(arg))) != NULL)
+            slot->active = 0;
     }
     else if (PyList_Check(arg)) {
         Py_ssize_t lsize = PyList_Size(arg);
         for (i=0; i<lsize; i++) {
-            PyDict_DelItem(self->dict, PyList_GET_ITEM(arg, i));
+            if ((slot = OscReceiver_findSlot(self, PyString_AsString(PyList_GET_ITEM(arg, i)))) != NULL)
+                slot->active = 0;
         }
     }
 	Py_INCREF(Py_None);
@@ -176,13 +260,17 @@ static PyObject *
 OscReceiver_setValue(OscReceiver *self, PyObject *args, PyObject *kwds)
 {
     PyObject *address, *value;
+    OscSlot *slot;
 
     static char *kwlist[] = {"address", "value", NULL};
 
     if (! PyArg_ParseTupleAndKeywords(args, kwds, "OO", kwlist, &address, &value))
         Py_RETURN_NONE;
 
-    PyDict_SetItem(self->dict, address, value);
+    if (PyString_Check(address) && PyNumber_Check(value)) {
+        if ((slot = OscReceiver_findSlot(self, PyString_AsString(address))) != NULL)
+            slot->value = PyFloat_AsDouble(value);
+    }
     Py_RETURN_NONE;
 }
 
@@ -198,8 +286,8 @@ static PyMemberDef OscReceiver_members[] = {
 static PyMethodDef OscReceiver_methods[] = {
 {"getServer", (PyCFunction)OscReceiver_getServer, METH_NOARGS, "Returns server object."},
 {"_getStream", (PyCFunction)OscReceiver_getStream, METH_NOARGS, "Returns stream object."},
-{"addAddress", (PyCFunction)OscReceiver_addAddress, METH_O, "Add a new address to the dictionary."},
-{"delAddress", (PyCFunction)OscReceiver_delAddress, METH_O, "Remove an address from the dictionary."},
+{"addAddress", (PyCFunction)OscReceiver_addAddress, METH_O, "Add a new address to the receiver."},
+{"delAddress", (PyCFunction)OscReceiver_delAddress, METH_O, "Remove an address from the receiver."},
 {"setValue", (PyCFunction)OscReceiver_setValue, METH_VARARGS|METH_KEYWORDS, "Sets value for a specified address."},
 {NULL}  /* Sentinel */
 };
@@ -251,9 +339,14 @@ typedef struct {
     pyo_audio_HEAD
     PyObject *input;
     PyObject *address_path;
+    OscSlot *slot;
     MYFLT value;
     MYFLT factor;
     int interpolation;
+    MYFLT ramp; /* linear ramp time, in seconds, 0 means smoothing */
+    MYFLT target;
+    MYFLT inc;
+    long rampcount;
     int modebuffer[2];
 } OscReceive;
 
@@ -308,9 +401,27 @@ static void
 OscReceive_compute_next_data_frame(OscReceive *self)
 {
     int i;
-    MYFLT val = OscReceiver_getValue((OscReceiver *)self->input, self->address_path);
-
-    if (self->interpolation == 1) {
+    MYFLT val = (MYFLT)self->slot->value;
+
+    if (self->interpolation == 1 && self->ramp > 0.0) {
+        if (val != self->target) {
+            self->target = val;
+            self->rampcount = (long)(self->ramp * self->sr);
+            if (self->rampcount < 1)
+                self->rampcount = 1;
+            self->inc = (self->target - self->value) / self->rampcount;
+        }
+        for (i=0; i<self->bufsize; i++) {
+            if (self->rampcount > 0) {
+                if (--self->rampcount == 0)
+                    self->value = self->target;
+                else
+                    self->value += self->inc;
+            }
+            self->data[i] = self->value;
+        }
+    }
+    else if (self->interpolation == 1) {
 
         for (i=0; i<self->bufsize; i++) {
             self->data[i] = self->value = self->value + (val - self->value) * self->factor;
@@ -354,13 +465,14 @@ OscReceive_dealloc(OscReceive* self)
 static PyObject *
 OscReceive_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp=NULL, *pathtmp=NULL, *multmp=NULL, *addtmp=NULL;;
     OscReceive *self;
     self = (OscReceive *)type->tp_alloc(type, 0);
 
-    self->value = 0.;
+    self->value = self->target = self->inc = 0.;
     self->interpolation = 1;
+    self->ramp = 0.;
+    self->rampcount = 0;
 	self->modebuffer[0] = 0;
 	self->modebuffer[1] = 0;
 
@@ -388,7 +500,7 @@ OscReceive_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     if (! PyString_Check(pathtmp)) {
         PyErr_SetString(PyExc_TypeError, "The address attributes must be a string.");
@@ -399,6 +511,9 @@ OscReceive_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_XDECREF(self->address_path);
     self->address_path = pathtmp;
 
+    /* The address is resolved once, the audio thread only reads the value of its slot. */
+    self->slot = OscReceiver_getSlot((OscReceiver *)self->input, self->address_path);
+
     (*self->mode_func_ptr)(self);
 
     return (PyObject *)self;
@@ -418,6 +533,26 @@ OscReceive_setInterpolation(OscReceive *self, PyObject *arg)
 	return Py_None;
 }
 
+static PyObject *
+OscReceive_setRamp(OscReceive *self, PyObject *arg)
+{
+	if (arg == NULL) {
+		Py_INCREF(Py_None);
+		return Py_None;
+	}
+
+	if (PyNumber_Check(arg)) {
+        self->ramp = PyFloat_AsDouble(arg);
+        if (self->ramp < 0.0)
+            self->ramp = 0.0;
+        self->target = self->value;
+        self->rampcount = 0;
+	}
+
+	Py_INCREF(Py_None);
+	return Py_None;
+}
+
 static PyObject * OscReceive_getServer(OscReceive* self) { GET_SERVER };
 static PyObject * OscReceive_getStream(OscReceive* self) { GET_STREAM };
 static PyObject * OscReceive_setMul(OscReceive *self, PyObject *arg) { SET_MUL };
@@ -451,6 +586,7 @@ static PyMethodDef OscReceive_methods[] = {
     {"play", (PyCFunction)OscReceive_play, METH_VARARGS|METH_KEYWORDS, "Starts computing without sending sound to soundcard."},
     {"stop", (PyCFunction)OscReceive_stop, METH_NOARGS, "Stops computing."},
     {"setInterpolation", (PyCFunction)OscReceive_setInterpolation, METH_O, "Sets interpolation on or off."},
+    {"setRamp", (PyCFunction)OscReceive_setRamp, METH_O, "Sets the duration of the interpolation ramp."},
     {"setMul", (PyCFunction)OscReceive_setMul, METH_O, "Sets oscillator mul factor."},
     {"setAdd", (PyCFunction)OscReceive_setAdd, METH_O, "Sets oscillator add factor."},
     {"setSub", (PyCFunction)OscReceive_setSub, METH_O, "Sets inverse add factor."},
@@ -548,7 +684,7 @@ typedef struct {
     PyObject *input;
     Stream *input_stream;
     PyObject *address_path;
-    lo_address address;
+    OscSender *sender;
     char *host;
     int port;
     int count;
@@ -562,13 +698,7 @@ OscSend_compute_next_data_frame(OscSend *self)
     if (self->count >= self->bufrate) {
         self->count = 0;
         MYFLT *in = Stream_getData((Stream *)self->input_stream);
-        float value = (float)in[0];
-
-        char *path  = PyString_AsString(self->address_path);
-
-        if (lo_send(self->address, path, "f", value) == -1) {
-            printf("OSC error %d: %s\n", lo_address_errno(self->address), lo_address_errstr(self->address));
-        }
+        OscSender_pushValue(self->sender, (float)in[0], Server_isRenderingOffline((Server *)self->server));
     }
 }
 
@@ -596,6 +726,7 @@ static void
 OscSend_dealloc(OscSend* self)
 {
     pyo_DEALLOC
+    OscSender_free(self->sender);
     OscSend_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -603,12 +734,12 @@ OscSend_dealloc(OscSend* self)
 static PyObject *
 OscSend_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *pathtmp;
     OscSend *self;
     self = (OscSend *)type->tp_alloc(type, 0);
 
     self->host = NULL;
+    self->sender = NULL;
     self->count = 0;
     self->bufrate = 1;
 
@@ -622,7 +753,7 @@ OscSend_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_INPUT_STREAM
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     if (! PyString_Check(pathtmp)) {
         PyErr_SetString(PyExc_TypeError, "The address attributes must be a string.");
@@ -633,9 +764,7 @@ OscSend_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_XDECREF(self->address_path);
     self->address_path = pathtmp;
 
-    char buf[20];
-    sprintf(buf, "%i", self->port);
-    self->address = lo_address_new(self->host, buf);
+    self->sender = OscSender_new(self->host, self->port, PyString_AsString(pathtmp), 0);
 
     return (PyObject *)self;
 }
@@ -652,10 +781,46 @@ OscSend_setBufferRate(OscSend *self, PyObject *arg)
     if (self->bufrate < 1)
         self->bufrate = 1;
 
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject *
+OscSend_setMaxRate(OscSend *self, PyObject *arg)
+{
+	if (arg == NULL) {
+		Py_INCREF(Py_None);
+		return Py_None;
+	}
+
+    if (PyNumber_Check(arg))
+        OscSender_setMaxRate(self->sender, PyFloat_AsDouble(PyNumber_Float(arg)));
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject *
+OscSend_setChangesOnly(OscSend *self, PyObject *arg)
+{
+	if (arg == NULL) {
+		Py_INCREF(Py_None);
+		return Py_None;
+	}
+
+    OscSender_setChangesOnly(self->sender, PyObject_IsTrue(arg));
+
 	Py_INCREF(Py_None);
 	return Py_None;
 }
 
+static PyObject *
+OscSend_getStats(OscSend *self)
+{
+    return Py_BuildValue("{s:l,s:l,s:l,s:l}", "sent", self->sender->sent, "coalesced", self->sender->coalesced,
+                         "filtered", self->sender->filtered, "dropped", self->sender->dropped);
+}
+
 static PyObject * OscSend_getServer(OscSend* self) { GET_SERVER };
 static PyObject * OscSend_getStream(OscSend* self) { GET_STREAM };
 
@@ -675,6 +840,9 @@ static PyMethodDef OscSend_methods[] = {
 {"play", (PyCFunction)OscSend_play, METH_VARARGS|METH_KEYWORDS, "Starts computing without sending sound to soundcard."},
 {"stop", (PyCFunction)OscSend_stop, METH_NOARGS, "Stops computing."},
 {"setBufferRate", (PyCFunction)OscSend_setBufferRate, METH_O, "Set how many buffers to wait before sending a new value."},
+{"setMaxRate", (PyCFunction)OscSend_setMaxRate, METH_O, "Sets the maximum number of values sent per second."},
+{"setChangesOnly", (PyCFunction)OscSend_setChangesOnly, METH_O, "If True, a value is sent only if it differs from the last one sent."},
+{"getStats", (PyCFunction)OscSend_getStats, METH_NOARGS, "Returns the counters of the sender."},
 {NULL}  /* Sentinel */
 };
 
@@ -723,61 +891,24 @@ OscSend_new,                 /* tp_new */
 /* OscDataSend object */
 typedef struct {
     pyo_audio_HEAD
-    PyObject *value;
     PyObject *address_path;
-    lo_address address;
+    OscSender *sender;
     char *host;
     char *types;
     int port;
-    int something_to_send;
     int num_items;
 } OscDataSend;
 
+/* The messages are queued by send() and sent by the OSC sending thread. */
 static void
 OscDataSend_compute_next_data_frame(OscDataSend *self)
 {
-    int i;
-    lo_message *msg;
-    char *path  = PyString_AsString(self->address_path);
-
-    if (self->something_to_send == 1) {
-        msg = lo_message_new();
-
-        for (i=0; i<self->num_items; i++) {
-            switch (self->types[i]) {
-                case LO_INT32:
-                    lo_message_add_int32(msg, PyInt_AsLong(PyList_GetItem(self->value, i)));
-                    break;
-                case LO_INT64:
-                    lo_message_add_int64(msg, (long)PyLong_AsLong(PyList_GetItem(self->value, i)));
-                    break;
-                case LO_FLOAT:
-                    lo_message_add_float(msg, PyFloat_AsDouble(PyList_GetItem(self->value, i)));
-                    break;
-                case LO_DOUBLE:
-                    lo_message_add_double(msg, (double)PyFloat_AsDouble(PyList_GetItem(self->value, i)));
-                    break;
-                case LO_STRING:
-                    lo_message_add_string(msg, PyString_AsString(PyList_GetItem(self->value, i)));
-                    break;
-                default:
-                    break;
-            }
-        }
-        if (lo_send_message(self->address, path, msg) == -1) {
-            printf("OSC error %d: %s\n", lo_address_errno(self->address), lo_address_errstr(self->address));
-        }
-        self->something_to_send = 0;
-        lo_message_free(msg);
-    }
-
 }
 
 static int
 OscDataSend_traverse(OscDataSend *self, visitproc visit, void *arg)
 {
     pyo_VISIT
-    Py_VISIT(self->value);
     Py_VISIT(self->address_path);
     return 0;
 }
@@ -786,7 +917,6 @@ static int
 OscDataSend_clear(OscDataSend *self)
 {
     pyo_CLEAR
-    Py_CLEAR(self->value);
     Py_CLEAR(self->address_path);
     return 0;
 }
@@ -795,6 +925,7 @@ static void
 OscDataSend_dealloc(OscDataSend* self)
 {
     pyo_DEALLOC
+    OscSender_free(self->sender);
     OscDataSend_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -802,12 +933,12 @@ OscDataSend_dealloc(OscDataSend* self)
 static PyObject *
 OscDataSend_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *pathtmp;
     OscDataSend *self;
     self = (OscDataSend *)type->tp_alloc(type, 0);
 
     self->host = NULL;
+    self->sender = NULL;
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, OscDataSend_compute_next_data_frame);
@@ -817,7 +948,7 @@ OscDataSend_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     if (! PyArg_ParseTupleAndKeywords(args, kwds, "siO|s", kwlist, &self->types, &self->port, &pathtmp, &self->host))
         Py_RETURN_NONE;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     if (! PyString_Check(pathtmp)) {
         PyErr_SetString(PyExc_TypeError, "The address attributes must be a string.");
@@ -830,9 +961,7 @@ OscDataSend_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_XDECREF(self->address_path);
     self->address_path = pathtmp;
 
-    char buf[20];
-    sprintf(buf, "%i", self->port);
-    self->address = lo_address_new(self->host, buf);
+    self->sender = OscSender_new(self->host, self->port, PyString_AsString(pathtmp), 1);
 
     return (PyObject *)self;
 }
@@ -843,28 +972,72 @@ static PyObject * OscDataSend_getStream(OscDataSend* self) { GET_STREAM };
 static PyObject * OscDataSend_play(OscDataSend *self, PyObject *args, PyObject *kwds) { PLAY };
 static PyObject * OscDataSend_stop(OscDataSend *self) { STOP };
 
+/* The message is built here, in the calling thread, and queued for the OSC sending thread.
+ * Nothing is sent while the object is stopped. */
 static PyObject *
 OscDataSend_send(OscDataSend *self, PyObject *arg)
 {
-    PyObject *tmp;
+    int i;
+    lo_message msg;
 
-	if (arg == NULL) {
+	if (arg == NULL || Stream_getStreamActive(self->stream) == 0) {
 		Py_INCREF(Py_None);
 		return Py_None;
 	}
 
     if (PyList_Check(arg)) {
-        tmp = arg;
-        Py_XDECREF(self->value);
-        Py_INCREF(tmp);
-        self->value = tmp;
-        self->something_to_send = 1;
+        msg = lo_message_new();
+
+        for (i=0; i<self->num_items; i++) {
+            switch (self->types[i]) {
+                case LO_INT32:
+                    lo_message_add_int32(msg, PyInt_AsLong(PyList_GetItem(arg, i)));
+                    break;
+                case LO_INT64:
+                    lo_message_add_int64(msg, (long)PyLong_AsLong(PyList_GetItem(arg, i)));
+                    break;
+                case LO_FLOAT:
+                    lo_message_add_float(msg, PyFloat_AsDouble(PyList_GetItem(arg, i)));
+                    break;
+                case LO_DOUBLE:
+                    lo_message_add_double(msg, (double)PyFloat_AsDouble(PyList_GetItem(arg, i)));
+                    break;
+                case LO_STRING:
+                    lo_message_add_string(msg, PyString_AsString(PyList_GetItem(arg, i)));
+                    break;
+                default:
+                    break;
+            }
+        }
+        OscSender_pushMessage(self->sender, msg, Server_isRenderingOffline((Server *)self->server));
     }
     else
         printf("argument to send() method must be a tuple of values.\n");
 
-	Py_INCREF(Py_None);
-	return Py_None;
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject *
+OscDataSend_setMaxRate(OscDataSend *self, PyObject *arg)
+{
+	if (arg == NULL) {
+		Py_INCREF(Py_None);
+		return Py_None;
+	}
+
+    if (PyNumber_Check(arg))
+        OscSender_setMaxRate(self->sender, PyFloat_AsDouble(PyNumber_Float(arg)));
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject *
+OscDataSend_getStats(OscDataSend *self)
+{
+    return Py_BuildValue("{s:l,s:l,s:l,s:l}", "sent", self->sender->sent, "coalesced", self->sender->coalesced,
+                         "filtered", self->sender->filtered, "dropped", self->sender->dropped);
 }
 
 static PyMemberDef OscDataSend_members[] = {
@@ -877,6 +1050,8 @@ static PyMethodDef OscDataSend_methods[] = {
     {"getServer", (PyCFunction)OscDataSend_getServer, METH_NOARGS, "Returns server object."},
     {"_getStream", (PyCFunction)OscDataSend_getStream, METH_NOARGS, "Returns stream object."},
     {"send", (PyCFunction)OscDataSend_send, METH_O, "Sets values to be sent."},
+    {"setMaxRate", (PyCFunction)OscDataSend_setMaxRate, METH_O, "Sets the maximum number of messages sent per second."},
+    {"getStats", (PyCFunction)OscDataSend_getStats, METH_NOARGS, "Returns the counters of the sender."},
     {"play", (PyCFunction)OscDataSend_play, METH_VARARGS|METH_KEYWORDS, "Starts computing without sending sound to soundcard."},
     {"stop", (PyCFunction)OscDataSend_stop, METH_NOARGS, "Stops computing."},
     {NULL}  /* Sentinel */
@@ -1017,7 +1192,6 @@ OscDataReceive_dealloc(OscDataReceive* self)
 static PyObject *
 OscDataReceive_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *pathtmp, *calltmp;
     OscDataReceive *self;
     self = (OscDataReceive *)type->tp_alloc(type, 0);
@@ -1030,7 +1204,7 @@ OscDataReceive_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     if (! PyArg_ParseTupleAndKeywords(args, kwds, "iOO", kwlist, &self->port, &pathtmp, &calltmp))
         Py_RETURN_NONE;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     Py_XDECREF(self->callable);
     self->callable = calltmp;
@@ -1232,7 +1406,7 @@ OscListReceiver_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     if (! PyArg_ParseTupleAndKeywords(args, kwds, "iO|i", kwlist, &self->port, &pathtmp, &self->num))
         Py_RETURN_NONE;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->dict = PyDict_New();
 
@@ -1501,7 +1675,6 @@ OscListReceive_dealloc(OscListReceive* self)
 static PyObject *
 OscListReceive_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp=NULL, *pathtmp=NULL, *multmp=NULL, *addtmp=NULL;;
     OscListReceive *self;
     self = (OscListReceive *)type->tp_alloc(type, 0);
@@ -1536,7 +1709,7 @@ OscListReceive_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     if (! PyString_Check(pathtmp)) {
         PyErr_SetString(PyExc_TypeError, "The address attributes must be a string.");
@@ -274,7 +274,6 @@ Panner_dealloc(Panner* self)
 static PyObject *
 Panner_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *pantmp=NULL, *spreadtmp=NULL;
     Panner *self;
     self = (Panner *)type->tp_alloc(type, 0);
@@ -304,7 +303,7 @@ Panner_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setSpread", "O", spreadtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     if (self->chnls < 1)
         self->chnls = 1;
@@ -548,7 +547,6 @@ Pan_dealloc(Pan* self)
 static PyObject *
 Pan_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL, *multmp=NULL, *addtmp=NULL;
     Pan *self;
     self = (Pan *)type->tp_alloc(type, 0);
@@ -577,7 +575,7 @@ Pan_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -957,7 +955,7 @@ SPanner_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setPan", "O", pantmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     if (self->chnls < 1)
         self->chnls = 1;
@@ -1170,7 +1168,6 @@ SPan_dealloc(SPan* self)
 static PyObject *
 SPan_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL, *multmp=NULL, *addtmp=NULL;
     SPan *self;
     self = (SPan *)type->tp_alloc(type, 0);
@@ -1199,7 +1196,7 @@ SPan_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -1509,7 +1506,7 @@ Switcher_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setVoice", "O", voicetmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->buffer_streams = (MYFLT *)realloc(self->buffer_streams, self->chnls * self->bufsize * sizeof(MYFLT));
 
@@ -1719,7 +1716,6 @@ Switch_dealloc(Switch* self)
 static PyObject *
 Switch_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL, *multmp=NULL, *addtmp=NULL;
     Switch *self;
     self = (Switch *)type->tp_alloc(type, 0);
@@ -1748,7 +1744,7 @@ Switch_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -2010,7 +2006,6 @@ VoiceManager_dealloc(VoiceManager* self)
 static PyObject *
 VoiceManager_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *triggerstmp=NULL, *multmp=NULL, *addtmp=NULL;
     VoiceManager *self;
     self = (VoiceManager *)type->tp_alloc(type, 0);
@@ -2043,7 +2038,7 @@ VoiceManager_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -2324,7 +2319,6 @@ Mixer_dealloc(Mixer* self)
 static PyObject *
 Mixer_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *timetmp=NULL;
     Mixer *self;
     self = (Mixer *)type->tp_alloc(type, 0);
@@ -2341,6 +2335,7 @@ Mixer_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Mixer_compute_next_data_frame);
+    Stream_setSerial(self->stream, 2);
     self->mode_func_ptr = Mixer_setProcMode;
 
     static char *kwlist[] = {"outs", "time", NULL};
@@ -2352,7 +2347,7 @@ Mixer_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setTime", "O", timetmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->buffer_streams = (MYFLT *)realloc(self->buffer_streams, self->num_outs * self->bufsize * sizeof(MYFLT));
 
@@ -2652,7 +2647,6 @@ MixerVoice_dealloc(MixerVoice* self)
 static PyObject *
 MixerVoice_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL, *multmp=NULL, *addtmp=NULL;
     MixerVoice *self;
     self = (MixerVoice *)type->tp_alloc(type, 0);
@@ -2681,7 +2675,7 @@ MixerVoice_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     return (PyObject *)self;
 }
@@ -2987,7 +2981,6 @@ Selector_dealloc(Selector* self)
 static PyObject *
 Selector_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputstmp=NULL, *voicetmp=NULL, *multmp=NULL, *addtmp=NULL;
     Selector *self;
     self = (Selector *)type->tp_alloc(type, 0);
@@ -2999,6 +2992,7 @@ Selector_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Selector_compute_next_data_frame);
+    Stream_setSerial(self->stream, 2);
     self->mode_func_ptr = Selector_setProcMode;
 
     static char *kwlist[] = {"inputs", "voice", "mul", "add", NULL};
@@ -3022,7 +3016,7 @@ Selector_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -36,11 +36,19 @@ typedef struct {
     int init;
 } Pattern;
 
+static void
+Pattern_call(Pattern *self, MYFLT *args) {
+    PyObject *result;
+
+    result = PyObject_Call((PyObject *)self->callable, PyTuple_New(0), NULL);
+    if (result == NULL)
+        PyErr_Print();
+}
+
 static void
 Pattern_generate_i(Pattern *self) {
     MYFLT tm;
     int i, flag;
-    PyObject *result;
 
     flag = 0;
     tm = PyFloat_AS_DOUBLE(self->time);
@@ -55,16 +63,13 @@ Pattern_generate_i(Pattern *self) {
     }
     if (flag == 1 || self->init == 1) {
         self->init = 0;
-        result = PyObject_Call((PyObject *)self->callable, PyTuple_New(0), NULL);
-        if (result == NULL)
-            PyErr_Print();
+        Server_deferCall((Server *)self->server, (PyObject *)self, (void (*)(PyObject *, MYFLT *))Pattern_call, NULL, 0);
     }
 }
 
 static void
 Pattern_generate_a(Pattern *self) {
     int i, flag;
-    PyObject *result;
 
     MYFLT *tm = Stream_getData((Stream *)self->time_stream);
 
@@ -79,9 +84,7 @@ Pattern_generate_a(Pattern *self) {
     }
     if (flag == 1 || self->init == 1) {
         self->init = 0;
-        result = PyObject_Call((PyObject *)self->callable, PyTuple_New(0), NULL);
-        if (result == NULL)
-            PyErr_Print();
+        Server_deferCall((Server *)self->server, (PyObject *)self, (void (*)(PyObject *, MYFLT *))Pattern_call, NULL, 0);
     }
 }
 
@@ -137,7 +140,6 @@ Pattern_dealloc(Pattern* self)
 static PyObject *
 Pattern_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *timetmp=NULL, *calltmp=NULL;
     Pattern *self;
     self = (Pattern *)type->tp_alloc(type, 0);
@@ -148,6 +150,7 @@ Pattern_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Pattern_compute_next_data_frame);
+    Stream_setSerial(self->stream, 3);
     self->mode_func_ptr = Pattern_setProcMode;
 
     Stream_setStreamActive(self->stream, 0);
@@ -168,7 +171,7 @@ Pattern_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setTime", "O", timetmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -369,7 +372,6 @@ Score_dealloc(Score* self)
 static PyObject *
 Score_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp;
     Score *self;
     self = (Score *)type->tp_alloc(type, 0);
@@ -387,7 +389,7 @@ Score_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_INPUT_STREAM
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -468,23 +470,29 @@ typedef struct {
     double currentTime;
 } CallAfter;
 
+static void
+CallAfter_call(CallAfter *self, MYFLT *args) {
+    PyObject *tuple, *result;
+
+    if (self->arg == Py_None)
+        tuple = PyTuple_New(0);
+    else {
+        tuple = PyTuple_New(1);
+        PyTuple_SET_ITEM(tuple, 0, self->arg);
+    }
+    result = PyObject_Call(self->callable, tuple, NULL);
+    if (result == NULL)
+        PyErr_Print();
+}
+
 static void
 CallAfter_generate(CallAfter *self) {
     int i;
-    PyObject *tuple, *result;
 
     for (i=0; i<self->bufsize; i++) {
         if (self->currentTime >= self->time) {
-            if (self->arg == Py_None)
-                tuple = PyTuple_New(0);
-            else {
-                tuple = PyTuple_New(1);
-                PyTuple_SET_ITEM(tuple, 0, self->arg);
-            }
-            result = PyObject_Call(self->callable, tuple, NULL);
-            if (result == NULL)
-                PyErr_Print();
-            PyObject_CallMethod((PyObject *)self, "stop", NULL);
+            Server_deferCall((Server *)self->server, (PyObject *)self, (void (*)(PyObject *, MYFLT *))CallAfter_call, NULL, 0);
+            Server_deferStop((Server *)self->server, (PyObject *)self);
             break;
         }
         self->currentTime += self->sampleToSec;
@@ -532,7 +540,6 @@ CallAfter_dealloc(CallAfter* self)
 static PyObject *
 CallAfter_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *calltmp=NULL, *argtmp=NULL;
     CallAfter *self;
     self = (CallAfter *)type->tp_alloc(type, 0);
@@ -542,6 +549,7 @@ CallAfter_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, CallAfter_compute_next_data_frame);
+    Stream_setSerial(self->stream, 3);
     self->mode_func_ptr = CallAfter_setProcMode;
 
     self->sampleToSec = 1. / self->sr;
@@ -565,7 +573,7 @@ CallAfter_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_XDECREF(self->callable);
     self->callable = calltmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -48,16 +48,16 @@ typedef struct {
     int incount;
     int inputLatency;
     int overcount;
+    int inpos; /* write position in input_buffer */
     MYFLT factor;
     MYFLT scale;
-    MYFLT *input_buffer;
+    MYFLT *input_buffer; /* circular history of the last `size` samples */
     MYFLT *inframe;
     MYFLT *outframe;
     MYFLT *real;
     MYFLT *imag;
     MYFLT *lastPhase;
-    MYFLT **twiddle;
-    MYFLT *window;
+    FFTPlan *plan;
     MYFLT **magn;
     MYFLT **freq;
     int *count;
@@ -66,7 +66,8 @@ typedef struct {
 
 static void
 PVAnal_realloc_memories(PVAnal *self) {
-    int i, j, n8;
+    int i, j;
+    FFTPlan *plan;
     self->hsize = self->size / 2;
     self->hopsize = self->size / self->olaps;
     self->factor = self->sr / (self->hopsize * TWOPI);
@@ -74,7 +75,6 @@ PVAnal_realloc_memories(PVAnal *self) {
     self->inputLatency = self->size - self->hopsize;
     self->incount = self->inputLatency;
     self->overcount = 0;
-    n8 = self->size >> 3;
     self->input_buffer = (MYFLT *)realloc(self->input_buffer, self->size * sizeof(MYFLT));
     self->inframe = (MYFLT *)realloc(self->inframe, self->size * sizeof(MYFLT));
     self->outframe = (MYFLT *)realloc(self->outframe, self->size * sizeof(MYFLT));
@@ -93,12 +93,10 @@ PVAnal_realloc_memories(PVAnal *self) {
     }
     for (i=0; i<self->hsize; i++)
         self->lastPhase[i] = self->real[i] = self->imag[i] = 0.0;
-    self->twiddle = (MYFLT **)realloc(self->twiddle, 4 * sizeof(MYFLT *));
-    for(i=0; i<4; i++)
-        self->twiddle[i] = (MYFLT *)malloc(n8 * sizeof(MYFLT));
-    fft_compute_split_twiddle(self->twiddle, self->size);
-    self->window = (MYFLT *)realloc(self->window, self->size * sizeof(MYFLT));
-    gen_window(self->window, self->size, self->wintype);
+    plan = fft_plan_acquire(self->size, self->wintype);
+    fft_plan_release(self->plan);
+    self->plan = plan;
+    self->inpos = 0;
     for (i=0; i<self->bufsize; i++)
         self->count[i] = self->incount;
     PVStream_setFFTsize(self->pv_stream, self->size);
@@ -110,21 +108,28 @@ PVAnal_realloc_memories(PVAnal *self) {
 
 static void
 PVAnal_process(PVAnal *self) {
-    int i, k, mod;
+    int i, k, mod, pos;
     MYFLT real, imag, mag, phase, tmp;
+    MYFLT *window = self->plan->window;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
     for (i=0; i<self->bufsize; i++) {
-        self->input_buffer[self->incount] = in[i];
+        self->input_buffer[self->inpos++] = in[i];
+        if (self->inpos == self->size)
+            self->inpos = 0;
         self->count[i] = self->incount;
         self->incount++;
         if (self->incount >= self->size) {
             self->incount = self->inputLatency;
+            /* The frame is the last `size` samples, the oldest first, rotated by the overlap. */
             mod = self->hopsize * self->overcount;
+            pos = self->inpos;
             for (k=0; k<self->size; k++) {
-                self->inframe[(k+mod)%self->size] = self->input_buffer[k] * self->window[k];
+                self->inframe[(k+mod)%self->size] = self->input_buffer[pos] * window[k];
+                if (++pos == self->size)
+                    pos = 0;
             }
-            realfft_split(self->inframe, self->outframe, self->size, self->twiddle);
+            realfft_plan(self->inframe, self->outframe, self->plan);
             self->real[0] = self->outframe[0];
             self->imag[0] = 0.0;
             for (k=1; k<self->hsize; k++) {
@@ -144,9 +149,6 @@ PVAnal_process(PVAnal *self) {
                 self->magn[self->overcount][k] = mag;
                 self->freq[self->overcount][k] = (tmp + k * self->scale) * self->factor;
             }
-            for (k=0; k<self->inputLatency; k++) {
-                self->input_buffer[k] = self->input_buffer[k + self->hopsize];
-            }
             self->overcount++;
             if (self->overcount >= self->olaps)
                 self->overcount = 0;
@@ -197,11 +199,7 @@ PVAnal_dealloc(PVAnal* self)
     free(self->real);
     free(self->imag);
     free(self->lastPhase);
-    for(i=0; i<4; i++) {
-        free(self->twiddle[i]);
-    }
-    free(self->twiddle);
-    free(self->window);
+    fft_plan_release(self->plan);
     for(i=0; i<self->olaps; i++) {
         free(self->magn[i]);
         free(self->freq[i]);
@@ -216,7 +214,7 @@ PVAnal_dealloc(PVAnal* self)
 static PyObject *
 PVAnal_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i, k;
+    int k;
     PyObject *inputtmp, *input_streamtmp;
     PVAnal *self;
     self = (PVAnal *)type->tp_alloc(type, 0);
@@ -235,16 +233,16 @@ PVAnal_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_INPUT_STREAM
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     MAKE_NEW_PV_STREAM(self->pv_stream, &PVStreamType, NULL);
 
-    if (!isPowerOfTwo(self->size)) {
-        k = 1;
+    if (!fft_size_is_valid(self->size)) {
+        k = 4;
         while (k < self->size)
             k *= 2;
         self->size = k;
-        printf("FFT size must be a power-of-2, using the next power-of-2 greater than size : %d\n", self->size);
+        printf("FFT size must be even with no prime factors other than 2, 3 and 5, using the next power-of-2 greater than size : %d\n", self->size);
     }
 
     self->count = (int *)realloc(self->count, self->bufsize * sizeof(int));
@@ -269,12 +267,12 @@ PVAnal_setSize(PVAnal *self, PyObject *arg)
     int k;
     if (PyLong_Check(arg) || PyInt_Check(arg)) {
         self->size = PyInt_AsLong(arg);
-        if (!isPowerOfTwo(self->size)) {
-            k = 1;
+        if (!fft_size_is_valid(self->size)) {
+            k = 4;
             while (k < self->size)
                 k *= 2;
             self->size = k;
-            printf("FFT size must be a power-of-2, using the next power-of-2 greater than size : %d\n", self->size);
+            printf("FFT size must be even with no prime factors other than 2, 3 and 5, using the next power-of-2 greater than size : %d\n", self->size);
         }
         PVAnal_realloc_memories(self);
     }
@@ -306,9 +304,13 @@ PVAnal_setOverlaps(PVAnal *self, PyObject *arg)
 static PyObject *
 PVAnal_setWinType(PVAnal *self, PyObject *arg)
 {
+    FFTPlan *plan;
+
     if (PyLong_Check(arg) || PyInt_Check(arg)) {
         self->wintype = PyInt_AsLong(arg);
-        gen_window(self->window, self->size, self->wintype);
+        plan = fft_plan_acquire(self->size, self->wintype);
+        fft_plan_release(self->plan);
+        self->plan = plan;
     }
 
     Py_INCREF(Py_None);
@@ -402,15 +404,15 @@ typedef struct {
     MYFLT *real;
     MYFLT *imag;
     MYFLT *sumPhase;
-    MYFLT **twiddle;
-    MYFLT *window;
+    FFTPlan *plan;
     int modebuffer[2]; // need at least 2 slots for mul & add
 } PVSynth;
 
 
 static void
 PVSynth_realloc_memories(PVSynth *self) {
-    int i, n8;
+    int i;
+    FFTPlan *plan;
     self->hsize = self->size / 2;
     self->hopsize = self->size / self->olaps;
     self->factor = self->hopsize * TWOPI / self->sr;
@@ -418,7 +420,6 @@ PVSynth_realloc_memories(PVSynth *self) {
     self->inputLatency = self->size - self->hopsize;
     self->overcount = 0;
     self->ampscl = 1.0 / MYSQRT(self->olaps);
-    n8 = self->size >> 3;
     self->output_buffer = (MYFLT *)realloc(self->output_buffer, self->size * sizeof(MYFLT));
     self->inframe = (MYFLT *)realloc(self->inframe, self->size * sizeof(MYFLT));
     self->outframe = (MYFLT *)realloc(self->outframe, self->size * sizeof(MYFLT));
@@ -432,12 +433,9 @@ PVSynth_realloc_memories(PVSynth *self) {
     self->outputAccum = (MYFLT *)realloc(self->outputAccum, (self->size+self->hopsize) * sizeof(MYFLT));
     for (i=0; i<(self->size+self->hopsize); i++)
         self->outputAccum[i] = 0.0;
-    self->twiddle = (MYFLT **)realloc(self->twiddle, 4 * sizeof(MYFLT *));
-    for(i=0; i<4; i++)
-        self->twiddle[i] = (MYFLT *)malloc(n8 * sizeof(MYFLT));
-    fft_compute_split_twiddle(self->twiddle, self->size);
-    self->window = (MYFLT *)realloc(self->window, self->size * sizeof(MYFLT));
-    gen_window(self->window, self->size, self->wintype);
+    plan = fft_plan_acquire(self->size, self->wintype);
+    fft_plan_release(self->plan);
+    self->plan = plan;
 }
 
 static void
@@ -475,10 +473,10 @@ PVSynth_process(PVSynth *self) {
                 self->inframe[k] = self->real[k];
                 self->inframe[self->size - k] = self->imag[k];
             }
-            irealfft_split(self->inframe, self->outframe, self->size, self->twiddle);
+            irealfft_plan(self->inframe, self->outframe, self->plan);
             mod = self->hopsize * self->overcount;
             for (k=0; k<self->size; k++) {
-                self->outputAccum[k] += self->outframe[(k+mod)%self->size] * self->window[k] * self->ampscl;
+                self->outputAccum[k] += self->outframe[(k+mod)%self->size] * self->plan->window[k] * self->ampscl;
             }
             for (k=0; k<self->hopsize; k++) {
                 self->output_buffer[k] = self->outputAccum[k];
@@ -572,7 +570,6 @@ PVSynth_clear(PVSynth *self)
 static void
 PVSynth_dealloc(PVSynth* self)
 {
-    int i;
     pyo_DEALLOC
     free(self->output_buffer);
     free(self->outputAccum);
@@ -581,11 +578,7 @@ PVSynth_dealloc(PVSynth* self)
     free(self->real);
     free(self->imag);
     free(self->sumPhase);
-    for(i=0; i<4; i++) {
-        free(self->twiddle[i]);
-    }
-    free(self->twiddle);
-    free(self->window);
+    fft_plan_release(self->plan);
     PVSynth_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -593,7 +586,6 @@ PVSynth_dealloc(PVSynth* self)
 static PyObject *
 PVSynth_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *multmp=NULL, *addtmp=NULL;
     PVSynth *self;
     self = (PVSynth *)type->tp_alloc(type, 0);
@@ -634,7 +626,7 @@ PVSynth_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     PVSynth_realloc_memories(self);
 
@@ -669,9 +661,13 @@ PVSynth_setInput(PVSynth *self, PyObject *arg)
 static PyObject *
 PVSynth_setWinType(PVSynth *self, PyObject *arg)
 {
+    FFTPlan *plan;
+
     if (PyLong_Check(arg) || PyInt_Check(arg)) {
         self->wintype = PyInt_AsLong(arg);
-        gen_window(self->window, self->size, self->wintype);
+        plan = fft_plan_acquire(self->size, self->wintype);
+        fft_plan_release(self->plan);
+        self->plan = plan;
     }
 
     Py_INCREF(Py_None);
@@ -1109,7 +1105,7 @@ PVAddSynth_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->table = (MYFLT *)realloc(self->table, 8193 * sizeof(MYFLT));
     for (i=0; i<8192; i++)
@@ -1547,7 +1543,6 @@ PVTranspose_dealloc(PVTranspose* self)
 static PyObject *
 PVTranspose_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *transpotmp;
     PVTranspose *self;
     self = (PVTranspose *)type->tp_alloc(type, 0);
@@ -1583,7 +1578,7 @@ PVTranspose_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setTranspo", "O", transpotmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     MAKE_NEW_PV_STREAM(self->pv_stream, &PVStreamType, NULL);
 
@@ -2064,7 +2059,6 @@ PVVerb_dealloc(PVVerb* self)
 static PyObject *
 PVVerb_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *revtimetmp=NULL, *damptmp=NULL;
     PVVerb *self;
     self = (PVVerb *)type->tp_alloc(type, 0);
@@ -2105,7 +2099,7 @@ PVVerb_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setDamp", "O", damptmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     MAKE_NEW_PV_STREAM(self->pv_stream, &PVStreamType, NULL);
 
@@ -2554,7 +2548,6 @@ PVGate_dealloc(PVGate* self)
 static PyObject *
 PVGate_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *threshtmp=NULL, *damptmp=NULL;
     PVGate *self;
     self = (PVGate *)type->tp_alloc(type, 0);
@@ -2595,7 +2588,7 @@ PVGate_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setDamp", "O", damptmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     MAKE_NEW_PV_STREAM(self->pv_stream, &PVStreamType, NULL);
 
@@ -2951,7 +2944,6 @@ PVCross_dealloc(PVCross* self)
 static PyObject *
 PVCross_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *input2tmp, *input2_streamtmp, *fadetmp;
     PVCross *self;
     self = (PVCross *)type->tp_alloc(type, 0);
@@ -2999,7 +2991,7 @@ PVCross_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setFade", "O", fadetmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     MAKE_NEW_PV_STREAM(self->pv_stream, &PVStreamType, NULL);
 
@@ -3292,7 +3284,6 @@ PVMult_dealloc(PVMult* self)
 static PyObject *
 PVMult_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *input2tmp, *input2_streamtmp;
     PVMult *self;
     self = (PVMult *)type->tp_alloc(type, 0);
@@ -3335,7 +3326,7 @@ PVMult_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->size = PVStream_getFFTsize(self->input_stream);
     self->olaps = PVStream_getOlaps(self->input_stream);
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     MAKE_NEW_PV_STREAM(self->pv_stream, &PVStreamType, NULL);
 
@@ -3654,7 +3645,6 @@ PVMorph_dealloc(PVMorph* self)
 static PyObject *
 PVMorph_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *input2tmp, *input2_streamtmp, *fadetmp;
     PVMorph *self;
     self = (PVMorph *)type->tp_alloc(type, 0);
@@ -3702,7 +3692,7 @@ PVMorph_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setFade", "O", fadetmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     MAKE_NEW_PV_STREAM(self->pv_stream, &PVStreamType, NULL);
 
@@ -4093,7 +4083,6 @@ PVFilter_dealloc(PVFilter* self)
 static PyObject *
 PVFilter_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *tabletmp, *gaintmp=NULL;
     PVFilter *self;
     self = (PVFilter *)type->tp_alloc(type, 0);
@@ -4134,7 +4123,7 @@ PVFilter_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setGain", "O", gaintmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     MAKE_NEW_PV_STREAM(self->pv_stream, &PVStreamType, NULL);
 
@@ -4576,7 +4565,6 @@ PVDelay_dealloc(PVDelay* self)
 static PyObject *
 PVDelay_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *deltabletmp, *feedtabletmp;
     PVDelay *self;
     self = (PVDelay *)type->tp_alloc(type, 0);
@@ -4615,7 +4603,7 @@ PVDelay_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_XDECREF(self->feedtable);
     self->feedtable = PyObject_CallMethod((PyObject *)feedtabletmp, "getTableStream", "");
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     MAKE_NEW_PV_STREAM(self->pv_stream, &PVStreamType, NULL);
 
@@ -5036,7 +5024,6 @@ PVBuffer_dealloc(PVBuffer* self)
 static PyObject *
 PVBuffer_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *indextmp, *pitchtmp=NULL;
     PVBuffer *self;
     self = (PVBuffer *)type->tp_alloc(type, 0);
@@ -5077,7 +5064,7 @@ PVBuffer_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setPitch", "O", pitchtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     MAKE_NEW_PV_STREAM(self->pv_stream, &PVStreamType, NULL);
 
@@ -5442,7 +5429,6 @@ PVShift_dealloc(PVShift* self)
 static PyObject *
 PVShift_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *shifttmp;
     PVShift *self;
     self = (PVShift *)type->tp_alloc(type, 0);
@@ -5478,7 +5464,7 @@ PVShift_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setShift", "O", shifttmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     MAKE_NEW_PV_STREAM(self->pv_stream, &PVStreamType, NULL);
 
@@ -5957,7 +5943,7 @@ PVAmpMod_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setSpread", "O", spreadtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     MAKE_NEW_PV_STREAM(self->pv_stream, &PVStreamType, NULL);
 
@@ -6566,7 +6552,7 @@ PVFreqMod_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setDepth", "O", depthtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     MAKE_NEW_PV_STREAM(self->pv_stream, &PVStreamType, NULL);
 
@@ -7061,7 +7047,6 @@ PVBufLoops_dealloc(PVBufLoops* self)
 static PyObject *
 PVBufLoops_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *lowtmp=NULL, *hightmp=NULL;
     PVBufLoops *self;
     self = (PVBufLoops *)type->tp_alloc(type, 0);
@@ -7076,6 +7061,7 @@ PVBufLoops_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->length = 1.0;
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, PVBufLoops_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = PVBufLoops_setProcMode;
 
     static char *kwlist[] = {"input", "low", "high", "mode", "length", NULL};
@@ -7106,7 +7092,7 @@ PVBufLoops_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setHigh", "O", hightmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     MAKE_NEW_PV_STREAM(self->pv_stream, &PVStreamType, NULL);
 
@@ -7495,7 +7481,6 @@ PVBufTabLoops_dealloc(PVBufTabLoops* self)
 static PyObject *
 PVBufTabLoops_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *speedtmp;
     PVBufTabLoops *self;
     self = (PVBufTabLoops *)type->tp_alloc(type, 0);
@@ -7530,7 +7515,7 @@ PVBufTabLoops_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_XDECREF(self->speed);
     self->speed = PyObject_CallMethod((PyObject *)speedtmp, "getTableStream", "");
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     MAKE_NEW_PV_STREAM(self->pv_stream, &PVStreamType, NULL);
 
@@ -7806,7 +7791,6 @@ PVMix_dealloc(PVMix* self)
 static PyObject *
 PVMix_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *input2tmp, *input2_streamtmp;
     PVMix *self;
     self = (PVMix *)type->tp_alloc(type, 0);
@@ -7849,7 +7833,7 @@ PVMix_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->size = PVStream_getFFTsize(self->input_stream);
     self->olaps = PVStream_getOlaps(self->input_stream);
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     MAKE_NEW_PV_STREAM(self->pv_stream, &PVStreamType, NULL);
 
@@ -351,7 +351,6 @@ Randi_dealloc(Randi* self)
 static PyObject *
 Randi_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     MYFLT mi, ma;
     PyObject *mintmp=NULL, *maxtmp=NULL, *freqtmp=NULL, *multmp=NULL, *addtmp=NULL;
     Randi *self;
@@ -370,6 +369,8 @@ Randi_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Randi_compute_next_data_frame);
+    Stream_setControlRateCapable(self->stream, 1);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = Randi_setProcMode;
 
     static char *kwlist[] = {"min", "max", "freq", "mul", "add", NULL};
@@ -397,7 +398,7 @@ Randi_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     Server_generateSeed((Server *)self->server, RANDI_ID);
 
@@ -960,7 +961,6 @@ Randh_dealloc(Randh* self)
 static PyObject *
 Randh_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     MYFLT mi, ma;
     PyObject *mintmp=NULL, *maxtmp=NULL, *freqtmp=NULL, *multmp=NULL, *addtmp=NULL;
     Randh *self;
@@ -979,6 +979,7 @@ Randh_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Randh_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = Randh_setProcMode;
 
     static char *kwlist[] = {"min", "max", "freq", "mul", "add", NULL};
@@ -1006,7 +1007,7 @@ Randh_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     Server_generateSeed((Server *)self->server, RANDH_ID);
 
@@ -1404,7 +1405,6 @@ Choice_dealloc(Choice* self)
 static PyObject *
 Choice_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *choicetmp=NULL, *freqtmp=NULL, *multmp=NULL, *addtmp=NULL;
     Choice *self;
     self = (Choice *)type->tp_alloc(type, 0);
@@ -1418,6 +1418,7 @@ Choice_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Choice_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = Choice_setProcMode;
 
     static char *kwlist[] = {"choice", "freq", "mul", "add", NULL};
@@ -1441,7 +1442,7 @@ Choice_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     Server_generateSeed((Server *)self->server, CHOICE_ID);
 
@@ -1833,7 +1834,6 @@ RandInt_dealloc(RandInt* self)
 static PyObject *
 RandInt_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maxtmp=NULL, *freqtmp=NULL, *multmp=NULL, *addtmp=NULL;
     RandInt *self;
     self = (RandInt *)type->tp_alloc(type, 0);
@@ -1849,6 +1849,7 @@ RandInt_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, RandInt_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = RandInt_setProcMode;
 
     static char *kwlist[] = {"max", "freq", "mul", "add", NULL};
@@ -1872,7 +1873,7 @@ RandInt_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     Server_generateSeed((Server *)self->server, RANDINT_ID);
 
@@ -2297,7 +2298,6 @@ RandDur_dealloc(RandDur* self)
 static PyObject *
 RandDur_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     MYFLT mi, ma;
     PyObject *mintmp=NULL, *maxtmp=NULL, *multmp=NULL, *addtmp=NULL;
     RandDur *self;
@@ -2314,6 +2314,7 @@ RandDur_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, RandDur_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = RandDur_setProcMode;
 
     static char *kwlist[] = {"min", "max", "mul", "add", NULL};
@@ -2337,7 +2338,7 @@ RandDur_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     Server_generateSeed((Server *)self->server, RANDDUR_ID);
 
@@ -3185,6 +3186,7 @@ Xnoise_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->loopLen = (rand() % 10) + 3;
 
     Stream_setFunctionPtr(self->stream, Xnoise_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = Xnoise_setProcMode;
 
     static char *kwlist[] = {"type", "freq", "x1", "x2", "mul", "add", NULL};
@@ -3212,7 +3214,7 @@ Xnoise_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     Xnoise_setRandomType(self);
 
@@ -4141,6 +4143,7 @@ XnoiseMidi_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->loopLen = (rand() % 10) + 3;
 
     Stream_setFunctionPtr(self->stream, XnoiseMidi_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = XnoiseMidi_setProcMode;
 
     static char *kwlist[] = {"type", "freq", "x1", "x2", "scale", "range", "mul", "add", NULL};
@@ -4172,7 +4175,7 @@ XnoiseMidi_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     XnoiseMidi_setRandomType(self);
 
@@ -4953,6 +4956,7 @@ XnoiseDur_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->loopLen = (rand() % 10) + 3;
 
     Stream_setFunctionPtr(self->stream, XnoiseDur_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = XnoiseDur_setProcMode;
 
     static char *kwlist[] = {"type", "min", "max", "x1", "x2", "mul", "add", NULL};
@@ -4984,7 +4988,7 @@ XnoiseDur_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     if (self->modebuffer[2] == 0)
         mi = PyFloat_AS_DOUBLE(self->min);
@@ -5509,6 +5513,7 @@ Urn_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Urn_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = Urn_setProcMode;
 
     static char *kwlist[] = {"max", "freq", "mul", "add", NULL};
@@ -5528,7 +5533,7 @@ Urn_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->trigsBuffer = (MYFLT *)realloc(self->trigsBuffer, self->bufsize * sizeof(MYFLT));
 
@@ -25,6 +25,7 @@
 #include "servermodule.h"
 #include "dummymodule.h"
 #include "sndfile.h"
+#include "sfwriter.h"
 #include "interpolation.h"
 
 /************/
@@ -39,8 +40,9 @@ typedef struct {
     int count;
     int listlen;
     char *recpath;
-    SNDFILE *recfile;
     SF_INFO recinfo;
+    SfWriter *writer;
+    long overruns; /* overruns of the writer, once it is closed */
     MYFLT *buffer;
 } Record;
 
@@ -70,7 +72,7 @@ Record_process(Record *self) {
     self->count++;
 
     if (self->count == self->buffering)
-        SF_WRITE(self->recfile, self->buffer, totlen);
+        SfWriter_write(self->writer, self->buffer, self->bufsize*self->buffering, Server_isRenderingOffline((Server *)self->server));
 }
 
 static void
@@ -103,11 +105,13 @@ Record_clear(Record *self)
     return 0;
 }
 
+static PyObject * Record_stop(Record *self);
+
 static void
 Record_dealloc(Record* self)
 {
-    if (Stream_getStreamActive(self->stream))
-        PyObject_CallMethod((PyObject *)self, "stop", NULL);
+    /* Called directly, a method call would resurrect the object being deallocated. */
+    Py_XDECREF(Record_stop(self));
     pyo_DEALLOC
     free(self->buffer);
     Record_clear(self);
@@ -120,6 +124,9 @@ Record_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     int i, buflen;
     int fileformat = 0;
     int sampletype = 0;
+    int sync = SfWriterSyncNever;
+    long size;
+    SNDFILE *recfile;
     PyObject *input_listtmp;
     Record *self;
     self = (Record *)type->tp_alloc(type, 0);
@@ -127,14 +134,16 @@ Record_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->chnls = 2;
     self->buffering = 4;
     self->count = 0;
+    self->writer = NULL;
+    self->overruns = 0;
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Record_compute_next_data_frame);
     self->mode_func_ptr = Record_setProcMode;
 
-    static char *kwlist[] = {"input", "filename", "chnls", "fileformat", "sampletype", "buffering", NULL};
+    static char *kwlist[] = {"input", "filename", "chnls", "fileformat", "sampletype", "buffering", "sync", NULL};
 
-    if (! PyArg_ParseTupleAndKeywords(args, kwds, "Os|iiii", kwlist, &input_listtmp, &self->recpath, &self->chnls, &fileformat, &sampletype, &self->buffering))
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, "Os|iiiii", kwlist, &input_listtmp, &self->recpath, &self->chnls, &fileformat, &sampletype, &self->buffering, &sync))
         Py_RETURN_NONE;
 
     Py_XDECREF(self->input_list);
@@ -202,18 +211,26 @@ Record_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     }
 
     /* Open the output file. */
-    if (! (self->recfile = sf_open(self->recpath, SFM_WRITE, &self->recinfo))) {
+    if (! (recfile = sf_open(self->recpath, SFM_WRITE, &self->recinfo))) {
         printf ("Not able to open output file %s.\n", self->recpath);
         Py_RETURN_NONE;
     }
 
+    /* The frames are written by a background thread, the ring holds the prefetch duration. */
+    size = (long)(Server_getPrefetch((Server *)self->server) * self->sr);
+    if (size < 16384)
+        size = 16384;
+    if (size < self->bufsize * self->buffering * 2)
+        size = self->bufsize * self->buffering * 2;
+    self->writer = SfWriter_new(recfile, self->chnls, size, 0, sync);
+
     buflen = self->bufsize * self->chnls * self->buffering;
     self->buffer = (MYFLT *)realloc(self->buffer, buflen * sizeof(MYFLT));
     for (i=0; i<buflen; i++) {
         self->buffer[i] = 0.;
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -226,10 +243,41 @@ static PyObject * Record_getStream(Record* self) { GET_STREAM };
 static PyObject * Record_play(Record *self, PyObject *args, PyObject *kwds) { PLAY };
 static PyObject * Record_stop(Record *self)
 {
-    sf_close(self->recfile);
-    STOP
+    int i;
+    SfWriter *writer;
+
+    /* Not wrapped by the server, detaches the writer from the audio thread under the dsp
+     * mutex, then waits for the remaining frames to be written on the disk without it. */
+    Server_lockDsp((Server *)self->server);
+    writer = self->writer;
+    self->writer = NULL;
+    if (writer != NULL)
+        self->overruns = SfWriter_getOverruns(writer);
+    Stream_setStreamActive(self->stream, 0);
+    Stream_setStreamChnl(self->stream, 0);
+    Stream_setStreamToDac(self->stream, 0);
+    for (i=0; i<self->bufsize; i++) {
+        self->data[i] = 0;
+    }
+    Server_unlockDsp((Server *)self->server);
+
+    if (writer != NULL) {
+        Py_BEGIN_ALLOW_THREADS
+        SfWriter_close(writer);
+        Py_END_ALLOW_THREADS
+    }
+    Py_INCREF(Py_None);
+    return Py_None;
 };
 
+static PyObject *
+Record_getOverruns(Record *self)
+{
+    if (self->writer == NULL)
+        return PyInt_FromLong(self->overruns);
+    return PyInt_FromLong(SfWriter_getOverruns(self->writer));
+}
+
 static PyMemberDef Record_members[] = {
 {"server", T_OBJECT_EX, offsetof(Record, server), 0, "Pyo server."},
 {"stream", T_OBJECT_EX, offsetof(Record, stream), 0, "Stream object."},
@@ -242,6 +290,7 @@ static PyMethodDef Record_methods[] = {
 {"_getStream", (PyCFunction)Record_getStream, METH_NOARGS, "Returns stream object."},
 {"play", (PyCFunction)Record_play, METH_VARARGS|METH_KEYWORDS, "Starts computing without sending sound to soundcard."},
 {"stop", (PyCFunction)Record_stop, METH_NOARGS, "Stops computing."},
+{"getOverruns", (PyCFunction)Record_getOverruns, METH_NOARGS, "Returns the number of buffers not written in time to the disk."},
 {NULL}  /* Sentinel */
 };
 
@@ -376,7 +425,6 @@ ControlRec_dealloc(ControlRec* self)
 static PyObject *
 ControlRec_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     long j;
     PyObject *inputtmp, *input_streamtmp;
     ControlRec *self;
@@ -388,6 +436,7 @@ ControlRec_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, ControlRec_compute_next_data_frame);
+    Stream_setSerial(self->stream, 2);
     self->mode_func_ptr = ControlRec_setProcMode;
 
     static char *kwlist[] = {"input", "rate", "dur", NULL};
@@ -397,7 +446,7 @@ ControlRec_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_INPUT_STREAM
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     if (self->dur > 0.0) {
         self->size = (long)(self->dur * self->rate + 1);
@@ -538,7 +587,7 @@ ControlRead_readframes_i(ControlRead *self) {
     MYFLT invmodulo = 1.0 / self->modulo;
 
     if (self->go == 0)
-        PyObject_CallMethod((PyObject *)self, "stop", NULL);
+        Server_deferStop((Server *)self->server, (PyObject *)self);
 
     for (i=0; i<self->bufsize; i++) {
         self->trigsBuffer[i] = 0.0;
@@ -665,6 +714,7 @@ ControlRead_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, ControlRead_compute_next_data_frame);
+    Stream_setSerial(self->stream, 3);
     self->mode_func_ptr = ControlRead_setProcMode;
 
     static char *kwlist[] = {"values", "rate", "loop", "interp", "mul", "add", NULL};
@@ -684,7 +734,7 @@ ControlRead_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->trigsBuffer = (MYFLT *)realloc(self->trigsBuffer, self->bufsize * sizeof(MYFLT));
 
@@ -1003,7 +1053,6 @@ NoteinRec_dealloc(NoteinRec* self)
 static PyObject *
 NoteinRec_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputptmp, *inputp_streamtmp, *inputvtmp, *inputv_streamtmp;
     NoteinRec *self;
     self = (NoteinRec *)type->tp_alloc(type, 0);
@@ -1015,6 +1064,7 @@ NoteinRec_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, NoteinRec_compute_next_data_frame);
+    Stream_setSerial(self->stream, 2);
     self->mode_func_ptr = NoteinRec_setProcMode;
 
     static char *kwlist[] = {"inputp", "inputv", NULL};
@@ -1036,7 +1086,7 @@ NoteinRec_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_XDECREF(self->inputv_stream);
     self->inputv_stream = (Stream *)inputv_streamtmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -1153,7 +1203,7 @@ NoteinRead_readframes_i(NoteinRead *self) {
     long i;
 
     if (self->go == 0)
-        PyObject_CallMethod((PyObject *)self, "stop", NULL);
+        Server_deferStop((Server *)self->server, (PyObject *)self);
 
     for (i=0; i<self->bufsize; i++) {
         self->trigsBuffer[i] = 0.0;
@@ -1279,6 +1329,7 @@ NoteinRead_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, NoteinRead_compute_next_data_frame);
+    Stream_setSerial(self->stream, 3);
     self->mode_func_ptr = NoteinRead_setProcMode;
 
     static char *kwlist[] = {"values", "timestamps", "loop", "mul", "add", NULL};
@@ -1302,7 +1353,7 @@ NoteinRead_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->trigsBuffer = (MYFLT *)realloc(self->trigsBuffer, self->bufsize * sizeof(MYFLT));
 
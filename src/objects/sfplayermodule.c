@@ -26,8 +26,19 @@
 #include "servermodule.h"
 #include "dummymodule.h"
 #include "sndfile.h"
+#include "sfstreamer.h"
 #include "interpolation.h"
 
+/* Starts streaming a sound from the disk, the ring size is given by the server's prefetch duration. */
+static SfStreamer *
+Sf_newStreamer(PyObject *server, SNDFILE *sf, SF_INFO *info, long position)
+{
+    long size = (long)(Server_getPrefetch((Server *)server) * info->samplerate);
+    if (size < 16384)
+        size = 16384;
+    return SfStreamer_new(sf, info->channels, (long)info->frames, size, position, Server_isRenderingOffline((Server *)server));
+}
+
 /* SfPlayer object */
 typedef struct {
     pyo_audio_HEAD
@@ -36,6 +47,7 @@ typedef struct {
     int modebuffer[1];
     SNDFILE *sf;
     SF_INFO info;
+    SfStreamer *streamer;
     char *path;
     int loop;
     int interp; /* 0 = default to 2, 1 = nointerp, 2 = linear, 3 = cos, 4 = cubic */
@@ -93,11 +105,14 @@ SfPlayer_readframes_i(SfPlayer *self) {
     MYFLT buffer[totlen];
     MYFLT buffer2[self->sndChnls][buflen];
 
+    if (self->streamer != NULL)
+        self->streamer->blocking = Server_isRenderingOffline((Server *)self->server);
+
     if (sp > 0) { /* forward reading */
         if (self->pointerPos >= self->sndSize) {
             self->pointerPos -= self->sndSize - self->startPos;
             if (self->loop == 0) {
-                PyObject_CallMethod((PyObject *)self, "stop", NULL);
+                Server_deferStop((Server *)self->server, (PyObject *)self);
                 for (i=0; i<(self->bufsize * self->sndChnls); i++) {
                     self->samplesBuffer[i] = 0.0;
                 }
@@ -108,14 +123,13 @@ SfPlayer_readframes_i(SfPlayer *self) {
             }
         }
         index = (int)self->pointerPos;
-        sf_seek(self->sf, index, SEEK_SET); /* sets position pointer in the file */
 
         /* fill a buffer with enough samples to satisfy speed reading */
         /* if not enough samples left in the file */
         if ((index+buflen) > self->sndSize) {
             shortbuflen = self->sndSize - index;
             pad = (buflen-shortbuflen)*self->sndChnls;
-            SF_READ(self->sf, buffer, shortbuflen*self->sndChnls);
+            SfStreamer_read(self->streamer, index, buffer, shortbuflen, 1);
             if (self->loop == 0) { /* with zero padding if noloop */
                 for (i=0; i<pad; i++) {
                     buffer[i+shortbuflen*self->sndChnls] = 0.;
@@ -123,15 +137,14 @@ SfPlayer_readframes_i(SfPlayer *self) {
             }
             else { /* wrap around and read new samples if loop */
                 MYFLT buftemp[pad];
-                sf_seek(self->sf, (int)self->startPos, SEEK_SET);
-                SF_READ(self->sf, buftemp, pad);
+                SfStreamer_read(self->streamer, (int)self->startPos, buftemp, buflen-shortbuflen, 1);
                 for (i=0; i<(pad); i++) {
                     buffer[i+shortbuflen*self->sndChnls] = buftemp[i];
                 }
             }
         }
         else /* without zero padding */
-            SF_READ(self->sf, buffer, totlen);
+            SfStreamer_read(self->streamer, index, buffer, buflen, 1);
 
         /* de-interleave samples */
         for (i=0; i<totlen; i++) {
@@ -162,7 +175,7 @@ SfPlayer_readframes_i(SfPlayer *self) {
         if (self->pointerPos <= 0) {
             self->pointerPos += startPos;
             if (self->loop == 0) {
-                PyObject_CallMethod((PyObject *)self, "stop", NULL);
+                Server_deferStop((Server *)self->server, (PyObject *)self);
                 for (i=0; i<(self->bufsize * self->sndChnls); i++) {
                     self->samplesBuffer[i] = 0.0;
                 }
@@ -189,23 +202,20 @@ SfPlayer_readframes_i(SfPlayer *self) {
             }
             else { /* wrap around and read new samples if loop */
                 MYFLT buftemp[padlen];
-                sf_seek(self->sf, (int)startPos-pad, SEEK_SET);
-                SF_READ(self->sf, buftemp, padlen);
+                SfStreamer_read(self->streamer, (int)startPos-pad, buftemp, pad, -1);
                 for (i=0; i<padlen; i++) {
                     buffer[i] = buftemp[i];
                 }
             }
 
             MYFLT buftemp2[shortbuflen*self->sndChnls];
-            sf_seek(self->sf, 0, SEEK_SET); /* sets position pointer in the file */
-            SF_READ(self->sf, buftemp2, shortbuflen*self->sndChnls);
+            SfStreamer_read(self->streamer, 0, buftemp2, shortbuflen, -1);
             for (i=0; i<(shortbuflen*self->sndChnls); i++) {
                 buffer[i+padlen] = buftemp2[i];
             }
         }
         else /* without zero padding */
-            sf_seek(self->sf, index-buflen, SEEK_SET); /* sets position pointer in the file */
-            SF_READ(self->sf, buffer, totlen);
+            SfStreamer_read(self->streamer, index-buflen, buffer, buflen, -1);
 
         /* de-interleave samples */
         for (i=0; i<totlen; i++) {
@@ -249,6 +259,17 @@ SfPlayer_readframes_i(SfPlayer *self) {
     }
 }
 
+/* Keeps in memory the sound around the start position, where the reading wraps around. */
+static void
+SfPlayer_setLoopPoints(SfPlayer *self)
+{
+    SfStreamer_setLoopPoint(self->streamer, (long)self->startPos, 1);
+    if (self->startPos == 0.)
+        SfStreamer_setLoopPoint(self->streamer, self->sndSize - 1, -1);
+    else
+        SfStreamer_setLoopPoint(self->streamer, (long)self->startPos, -1);
+}
+
 static void
 SfPlayer_setProcMode(SfPlayer *self)
 {
@@ -285,6 +306,7 @@ static void
 SfPlayer_dealloc(SfPlayer* self)
 {
     pyo_DEALLOC
+    SfStreamer_free(self->streamer);
     if (self->sf != NULL)
         sf_close(self->sf);
     free(self->trigsBuffer);
@@ -310,6 +332,7 @@ SfPlayer_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, SfPlayer_compute_next_data_frame);
+    Stream_setSerial(self->stream, 3);
     self->mode_func_ptr = SfPlayer_setProcMode;
 
     static char *kwlist[] = {"path", "speed", "loop", "offset", "interp", NULL};
@@ -321,7 +344,7 @@ SfPlayer_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setSpeed", "O", speedtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -355,6 +378,11 @@ SfPlayer_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     self->pointerPos = self->startPos;
 
+    if (self->sf != NULL) {
+        self->streamer = Sf_newStreamer(self->server, self->sf, &self->info, (long)self->startPos);
+        SfPlayer_setLoopPoints(self);
+    }
+
     return (PyObject *)self;
 }
 
@@ -366,6 +394,8 @@ static PyObject * SfPlayer_play(SfPlayer *self, PyObject *args, PyObject *kwds)
 {
     self->init = 1;
     self->pointerPos = self->startPos;
+    if (self->streamer != NULL)
+        SfStreamer_seek(self->streamer, (long)self->startPos, 1);
     PLAY
 };
 
@@ -373,6 +403,8 @@ static PyObject * SfPlayer_out(SfPlayer *self, PyObject *args, PyObject *kwds)
 {
     self->init = 1;
     self->pointerPos = self->startPos;
+    if (self->streamer != NULL)
+        SfStreamer_seek(self->streamer, (long)self->startPos, 1);
     OUT
 };
 
@@ -423,6 +455,8 @@ SfPlayer_setSound(SfPlayer *self, PyObject *arg)
 
     self->path = PyString_AsString(arg);
 
+    SfStreamer_free(self->streamer);
+    self->streamer = NULL;
     sf_close(self->sf);
 
     /* Open the sound file. */
@@ -442,6 +476,11 @@ SfPlayer_setSound(SfPlayer *self, PyObject *arg)
     self->startPos = 0.0;
     self->pointerPos = self->startPos;
 
+    if (self->sf != NULL) {
+        self->streamer = Sf_newStreamer(self->server, self->sf, &self->info, 0);
+        SfPlayer_setLoopPoints(self);
+    }
+
     Py_INCREF(Py_None);
     return Py_None;
 }
@@ -474,6 +513,8 @@ SfPlayer_setOffset(SfPlayer *self, PyObject *arg)
 		self->startPos = PyFloat_AsDouble(PyNumber_Float(arg)) * self->sr * self->srScale;
         if (self->startPos < 0.0 || self->startPos >= self->sndSize)
             self->startPos = 0.0;
+        if (self->streamer != NULL)
+            SfPlayer_setLoopPoints(self);
     }
 
     Py_INCREF(Py_None);
@@ -500,6 +541,14 @@ SfPlayer_setInterp(SfPlayer *self, PyObject *arg)
     return Py_None;
 }
 
+static PyObject *
+SfPlayer_getUnderruns(SfPlayer *self)
+{
+    if (self->streamer == NULL)
+        return PyInt_FromLong(0);
+    return PyInt_FromLong(SfStreamer_getUnderruns(self->streamer));
+}
+
 MYFLT *
 SfPlayer_getSamplesBuffer(SfPlayer *self)
 {
@@ -526,6 +575,7 @@ static PyMethodDef SfPlayer_methods[] = {
 {"setLoop", (PyCFunction)SfPlayer_setLoop, METH_O, "Sets sfplayer loop mode (0 = no loop, 1 = loop)."},
 {"setOffset", (PyCFunction)SfPlayer_setOffset, METH_O, "Sets sfplayer start position."},
 {"setInterp", (PyCFunction)SfPlayer_setInterp, METH_O, "Sets sfplayer interpolation mode."},
+{"getUnderruns", (PyCFunction)SfPlayer_getUnderruns, METH_NOARGS, "Returns the number of buffers not read in time from the disk."},
 {NULL}  /* Sentinel */
 };
 
@@ -668,7 +718,6 @@ SfPlay_dealloc(SfPlay* self)
 static PyObject *
 SfPlay_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL, *multmp=NULL, *addtmp=NULL;
     SfPlay *self;
     self = (SfPlay *)type->tp_alloc(type, 0);
@@ -698,7 +747,7 @@ SfPlay_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -840,6 +889,7 @@ typedef struct {
     int modebuffer[1];
     SNDFILE *sf;
     SF_INFO info;
+    SfStreamer *streamer;
     char *path;
     int interp; /* 0 = default to 2, 1 = nointerp, 2 = linear, 3 = cos, 4 = cubic */
     int sndSize; /* number of frames */
@@ -880,6 +930,9 @@ SfMarkerShuffler_readframes_i(SfMarkerShuffler *self) {
     MYFLT buffer[totlen];
     MYFLT buffer2[self->sndChnls][buflen];
 
+    if (self->streamer != NULL)
+        self->streamer->blocking = Server_isRenderingOffline((Server *)self->server);
+
     if (sp > 0) { /* reading forward */
         if (self->startPos == -1 || self->lastDir == 0) {
             self->lastDir = 1;
@@ -893,26 +946,24 @@ SfMarkerShuffler_readframes_i(SfMarkerShuffler *self) {
             self->lastDir = 1;
         }
         index = (int)self->pointerPos;
-        sf_seek(self->sf, index, SEEK_SET); /* sets position pointer in the file */
 
         /* fill a buffer with enough samples to satisfy speed reading */
         /* if not enough samples to read in the file */
         if ((index+buflen) > self->endPos) {
             shortbuflen = self->endPos - index;
-            SF_READ(self->sf, buffer, shortbuflen*self->sndChnls);
+            SfStreamer_read(self->streamer, index, buffer, shortbuflen, 1);
 
             /* wrap around and read new samples from new marker */
             int pad = buflen - shortbuflen;
             int padlen = pad*self->sndChnls;
             MYFLT buftemp[padlen];
-            sf_seek(self->sf, (int)self->nextStartPos, SEEK_SET);
-            SF_READ(self->sf, buftemp, padlen);
+            SfStreamer_read(self->streamer, (int)self->nextStartPos, buftemp, pad, 1);
             for (i=0; i<padlen; i++) {
                 buffer[i+shortbuflen*self->sndChnls] = buftemp[i];
             }
         }
         else /* without wraparound */
-            SF_READ(self->sf, buffer, totlen);
+            SfStreamer_read(self->streamer, index, buffer, buflen, 1);
 
         /* de-interleave samples */
         for (i=0; i<totlen; i++) {
@@ -952,22 +1003,19 @@ SfMarkerShuffler_readframes_i(SfMarkerShuffler *self) {
 
             /* wrap around and read new samples from new marker */
             MYFLT buftemp[padlen];
-            sf_seek(self->sf, (int)self->nextStartPos-pad, SEEK_SET);
-            SF_READ(self->sf, buftemp, padlen);
+            SfStreamer_read(self->streamer, (int)self->nextStartPos-pad, buftemp, pad, -1);
             for (i=0; i<padlen; i++) {
                 buffer[i] = buftemp[i];
             }
 
             MYFLT buftemp2[shortbuflen*self->sndChnls];
-            sf_seek(self->sf, self->endPos, SEEK_SET); /* sets position pointer in the file */
-            SF_READ(self->sf, buftemp2, shortbuflen*self->sndChnls);
+            SfStreamer_read(self->streamer, (int)self->endPos, buftemp2, shortbuflen, -1);
             for (i=0; i<(shortbuflen*self->sndChnls); i++) {
                 buffer[i+padlen] = buftemp2[i];
             }
         }
         else { /* without wraparound */
-            sf_seek(self->sf, index-buflen, SEEK_SET); /* sets position pointer in the file */
-            SF_READ(self->sf, buffer, totlen);
+            SfStreamer_read(self->streamer, index-buflen, buffer, buflen, -1);
         }
         /* de-interleave samples */
         for (i=0; i<totlen; i++) {
@@ -1056,6 +1104,12 @@ SfMarkerShuffler_chooseNewMark(SfMarkerShuffler *self, int dir)
         self->nextStartPos = self->markers[mark] * self->srScale;
         self->nextEndPos = self->markers[mark-1] * self->srScale;
     }
+
+    /* Segments start anywhere in the sound, keep the current and the next ones in memory. */
+    if (self->streamer != NULL) {
+        SfStreamer_setLoopPoint(self->streamer, (long)self->startPos, dir == 1 ? 1 : -1);
+        SfStreamer_setLoopPoint(self->streamer, (long)self->nextStartPos, dir == 1 ? 1 : -1);
+    }
 }
 
 static void
@@ -1094,6 +1148,7 @@ static void
 SfMarkerShuffler_dealloc(SfMarkerShuffler* self)
 {
     pyo_DEALLOC
+    SfStreamer_free(self->streamer);
     if (self->sf != NULL)
         sf_close(self->sf);
     free(self->samplesBuffer);
@@ -1105,7 +1160,6 @@ SfMarkerShuffler_dealloc(SfMarkerShuffler* self)
 static PyObject *
 SfMarkerShuffler_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *speedtmp=NULL, *markerstmp=NULL;
     SfMarkerShuffler *self;
     self = (SfMarkerShuffler *)type->tp_alloc(type, 0);
@@ -1118,6 +1172,7 @@ SfMarkerShuffler_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->lastDir = 1;
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, SfMarkerShuffler_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = SfMarkerShuffler_setProcMode;
 
     static char *kwlist[] = {"path", "markers", "speed", "interp", NULL};
@@ -1129,7 +1184,7 @@ SfMarkerShuffler_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setSpeed", "O", speedtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -1160,6 +1215,8 @@ SfMarkerShuffler_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(markerstmp);
     SfMarkerShuffler_setMarkers((SfMarkerShuffler *)self, markerstmp);
 
+    self->streamer = Sf_newStreamer(self->server, self->sf, &self->info, 0);
+
     self->samplesBuffer = (MYFLT *)realloc(self->samplesBuffer, self->bufsize * self->sndChnls * sizeof(MYFLT));
 
     Server_generateSeed((Server *)self->server, SFMARKERSHUFFLER_ID);
@@ -1208,6 +1265,14 @@ SfMarkerShuffler_setSpeed(SfMarkerShuffler *self, PyObject *arg)
 	return Py_None;
 }
 
+static PyObject *
+SfMarkerShuffler_getUnderruns(SfMarkerShuffler *self)
+{
+    if (self->streamer == NULL)
+        return PyInt_FromLong(0);
+    return PyInt_FromLong(SfStreamer_getUnderruns(self->streamer));
+}
+
 static PyObject *
 SfMarkerShuffler_setInterp(SfMarkerShuffler *self, PyObject *arg)
 {
@@ -1258,6 +1323,7 @@ static PyMethodDef SfMarkerShuffler_methods[] = {
 {"stop", (PyCFunction)SfMarkerShuffler_stop, METH_NOARGS, "Stops computing."},
 {"setSpeed", (PyCFunction)SfMarkerShuffler_setSpeed, METH_O, "Sets sfplayer reading speed."},
 {"setInterp", (PyCFunction)SfMarkerShuffler_setInterp, METH_O, "Sets sfplayer interpolation mode."},
+{"getUnderruns", (PyCFunction)SfMarkerShuffler_getUnderruns, METH_NOARGS, "Returns the number of buffers not read in time from the disk."},
 {NULL}  /* Sentinel */
 };
 
@@ -1400,7 +1466,6 @@ SfMarkerShuffle_dealloc(SfMarkerShuffle* self)
 static PyObject *
 SfMarkerShuffle_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL, *multmp=NULL, *addtmp=NULL;
     SfMarkerShuffle *self;
     self = (SfMarkerShuffle *)type->tp_alloc(type, 0);
@@ -1430,7 +1495,7 @@ SfMarkerShuffle_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -1574,6 +1639,7 @@ typedef struct {
     int modebuffer[2];
     SNDFILE *sf;
     SF_INFO info;
+    SfStreamer *streamer;
     char *path;
     int interp; /* 0 = default to 2, 1 = nointerp, 2 = linear, 3 = cos, 4 = cubic */
     int sndSize; /* number of frames */
@@ -1615,6 +1681,9 @@ SfMarkerLooper_readframes_i(SfMarkerLooper *self) {
     MYFLT buffer[totlen];
     MYFLT buffer2[self->sndChnls][buflen];
 
+    if (self->streamer != NULL)
+        self->streamer->blocking = Server_isRenderingOffline((Server *)self->server);
+
     if (sp > 0) { /* reading forward */
         if (self->startPos == -1 || self->lastDir == 0) {
             self->lastDir = 1;
@@ -1628,26 +1697,24 @@ SfMarkerLooper_readframes_i(SfMarkerLooper *self) {
             self->lastDir = 1;
         }
         index = (int)self->pointerPos;
-        sf_seek(self->sf, index, SEEK_SET); /* sets position pointer in the file */
 
         /* fill a buffer with enough samples to satisfy speed reading */
         /* if not enough samples to read in the file */
         if ((index+buflen) > self->endPos) {
             shortbuflen = self->endPos - index;
-            SF_READ(self->sf, buffer, shortbuflen*self->sndChnls);
+            SfStreamer_read(self->streamer, index, buffer, shortbuflen, 1);
 
             /* wrap around and read new samples if loop */
             int pad = buflen - shortbuflen;
             int padlen = pad*self->sndChnls;
             MYFLT buftemp[padlen];
-            sf_seek(self->sf, (int)self->nextStartPos, SEEK_SET);
-            SF_READ(self->sf, buftemp, padlen);
+            SfStreamer_read(self->streamer, (int)self->nextStartPos, buftemp, pad, 1);
             for (i=0; i<(padlen); i++) {
                 buffer[i+shortbuflen*self->sndChnls] = buftemp[i];
             }
         }
         else /* without zero padding */
-            SF_READ(self->sf, buffer, totlen);
+            SfStreamer_read(self->streamer, index, buffer, buflen, 1);
 
         /* de-interleave samples */
         for (i=0; i<totlen; i++) {
@@ -1687,22 +1754,19 @@ SfMarkerLooper_readframes_i(SfMarkerLooper *self) {
 
             /* wrap around and read new samples if loop */
             MYFLT buftemp[padlen];
-            sf_seek(self->sf, (int)self->nextStartPos-pad, SEEK_SET);
-            SF_READ(self->sf, buftemp, padlen);
+            SfStreamer_read(self->streamer, (int)self->nextStartPos-pad, buftemp, pad, -1);
             for (i=0; i<padlen; i++) {
                 buffer[i] = buftemp[i];
             }
 
             MYFLT buftemp2[shortbuflen*self->sndChnls];
-            sf_seek(self->sf, self->endPos, SEEK_SET); /* sets position pointer in the file */
-            SF_READ(self->sf, buftemp2, shortbuflen*self->sndChnls);
+            SfStreamer_read(self->streamer, (int)self->endPos, buftemp2, shortbuflen, -1);
             for (i=0; i<(shortbuflen*self->sndChnls); i++) {
                 buffer[i+padlen] = buftemp2[i];
             }
         }
         else { /* without zero padding */
-            sf_seek(self->sf, index-buflen, SEEK_SET); /* sets position pointer in the file */
-            SF_READ(self->sf, buffer, totlen);
+            SfStreamer_read(self->streamer, index-buflen, buffer, buflen, -1);
         }
         /* de-interleave samples */
         for (i=0; i<totlen; i++) {
@@ -1798,6 +1862,12 @@ SfMarkerLooper_chooseNewMark(SfMarkerLooper *self, int dir)
         self->nextStartPos = self->markers[mark] * self->srScale;
         self->nextEndPos = self->markers[mark-1] * self->srScale;
     }
+
+    /* Segments start anywhere in the sound, keep the current and the next ones in memory. */
+    if (self->streamer != NULL) {
+        SfStreamer_setLoopPoint(self->streamer, (long)self->startPos, dir == 1 ? 1 : -1);
+        SfStreamer_setLoopPoint(self->streamer, (long)self->nextStartPos, dir == 1 ? 1 : -1);
+    }
 }
 
 static void
@@ -1840,6 +1910,7 @@ static void
 SfMarkerLooper_dealloc(SfMarkerLooper* self)
 {
     pyo_DEALLOC
+    SfStreamer_free(self->streamer);
     if (self->sf != NULL)
         sf_close(self->sf);
     free(self->samplesBuffer);
@@ -1851,7 +1922,6 @@ SfMarkerLooper_dealloc(SfMarkerLooper* self)
 static PyObject *
 SfMarkerLooper_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *speedtmp=NULL, *marktmp=NULL, *markerstmp=NULL;
     SfMarkerLooper *self;
     self = (SfMarkerLooper *)type->tp_alloc(type, 0);
@@ -1883,7 +1953,7 @@ SfMarkerLooper_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setMark", "O", marktmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -1914,6 +1984,8 @@ SfMarkerLooper_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(markerstmp);
     SfMarkerLooper_setMarkers((SfMarkerLooper *)self, markerstmp);
 
+    self->streamer = Sf_newStreamer(self->server, self->sf, &self->info, 0);
+
     self->samplesBuffer = (MYFLT *)realloc(self->samplesBuffer, self->bufsize * self->sndChnls * sizeof(MYFLT));
 
     Server_generateSeed((Server *)self->server, SFMARKERLOOPER_ID);
@@ -1992,6 +2064,14 @@ SfMarkerLooper_setMark(SfMarkerLooper *self, PyObject *arg)
 	return Py_None;
 }
 
+static PyObject *
+SfMarkerLooper_getUnderruns(SfMarkerLooper *self)
+{
+    if (self->streamer == NULL)
+        return PyInt_FromLong(0);
+    return PyInt_FromLong(SfStreamer_getUnderruns(self->streamer));
+}
+
 static PyObject *
 SfMarkerLooper_setInterp(SfMarkerLooper *self, PyObject *arg)
 {
@@ -2044,6 +2124,7 @@ static PyMethodDef SfMarkerLooper_methods[] = {
     {"setSpeed", (PyCFunction)SfMarkerLooper_setSpeed, METH_O, "Sets sfplayer reading speed."},
     {"setMark", (PyCFunction)SfMarkerLooper_setMark, METH_O, "Sets marker to loop."},
     {"setInterp", (PyCFunction)SfMarkerLooper_setInterp, METH_O, "Sets sfplayer interpolation mode."},
+    {"getUnderruns", (PyCFunction)SfMarkerLooper_getUnderruns, METH_NOARGS, "Returns the number of buffers not read in time from the disk."},
     {NULL}  /* Sentinel */
 };
 
@@ -2186,7 +2267,6 @@ SfMarkerLoop_dealloc(SfMarkerLoop* self)
 static PyObject *
 SfMarkerLoop_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL, *multmp=NULL, *addtmp=NULL;
     SfMarkerLoop *self;
     self = (SfMarkerLoop *)type->tp_alloc(type, 0);
@@ -2216,7 +2296,7 @@ SfMarkerLoop_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -127,7 +127,6 @@ Sig_dealloc(Sig* self)
 static PyObject *
 Sig_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *valuetmp=NULL, *multmp=NULL, *addtmp=NULL;
     Sig *self;
     self = (Sig *)type->tp_alloc(type, 0);
@@ -158,7 +157,7 @@ Sig_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -505,6 +504,7 @@ SigTo_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, SigTo_compute_next_data_frame);
+    Stream_setControlRateCapable(self->stream, 1);
     self->mode_func_ptr = SigTo_setProcMode;
 
     static char *kwlist[] = {"value", "time", "init", "mul", "add", NULL};
@@ -528,7 +528,7 @@ SigTo_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->lastValue = self->currentValue = inittmp;
     self->timeStep = (long)(self->time * self->sr);
@@ -741,10 +741,26 @@ typedef struct {
     int flag;
 } VarPort;
 
+static void
+VarPort_call(VarPort *self, MYFLT *args) {
+    PyObject *tuple, *result;
+
+    if (self->arg != Py_None) {
+        tuple = PyTuple_New(1);
+        PyTuple_SET_ITEM(tuple, 0, self->arg);
+    }
+    else {
+        tuple = PyTuple_New(0);
+    }
+
+    result = PyObject_Call(self->callable, tuple, NULL);
+    if (result == NULL)
+        PyErr_Print();
+}
+
 static void
 VarPort_generates_i(VarPort *self) {
     int i;
-    PyObject *tuple, *result;
 
     if (self->value != self->lastValue) {
         self->flag = 1;
@@ -773,21 +789,8 @@ VarPort_generates_i(VarPort *self) {
 
     if (self->timeCount >= self->timeout && self->flag == 1) {
         self->flag = 0;
-        if (self->callable != Py_None) {
-            if (self->arg != Py_None) {
-                tuple = PyTuple_New(1);
-                PyTuple_SET_ITEM(tuple, 0, self->arg);
-            }
-            else {
-                tuple = PyTuple_New(0);
-            }
-
-            result = PyObject_Call(self->callable, tuple, NULL);
-            if (result == NULL) {
-                PyErr_Print();
-                return;
-            }
-        }
+        if (self->callable != Py_None)
+            Server_deferCall((Server *)self->server, (PyObject *)self, (void (*)(PyObject *, MYFLT *))VarPort_call, NULL, 0);
     }
 }
 
@@ -896,6 +899,7 @@ VarPort_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, VarPort_compute_next_data_frame);
+    Stream_setSerial(self->stream, 3);
     self->mode_func_ptr = VarPort_setProcMode;
 
     static char *kwlist[] = {"value", "time", "init", "callable", "arg", "mul", "add", NULL};
@@ -931,7 +935,7 @@ VarPort_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         self->arg = argtmp;
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->lastValue = self->currentValue = inittmp;
 
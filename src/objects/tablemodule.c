@@ -27,6 +27,16 @@
 #include "dummymodule.h"
 #include "sndfile.h"
 #include "wind.h"
+#include "fft.h"
+#include "interpolation.h"
+#ifndef _WIN32
+#include <stdlib.h>
+#include <limits.h>
+#include <unistd.h>
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#endif
 
 #define __TABLE_MODULE
 #include "tablemodule.h"
@@ -38,6 +48,7 @@
 static void
 TableStream_dealloc(TableStream* self)
 {
+    free(self->mipmap);
     self->ob_type->tp_free((PyObject*)self);
 }
 
@@ -85,6 +96,187 @@ TableStream_setSamplingRate(TableStream *self, double sr)
     self->samplingRate = sr;
 }
 
+/* Mipmap, band-limited versions of the table read by the oscillators to avoid aliasing.
+   The level k keeps the harmonics up to size / 2^(k+1), it can be read without aliasing
+   with an increment up to 2^k samples per sample. All the levels have the size of the
+   table, so they are read with the same index and the same interpolation. */
+int
+TableStream_hasMipmap(TableStream *self)
+{
+    return self->mipmap != NULL && self->mipmap_size == self->size;
+}
+
+/* Reads the table at `ipart` + `fpart` for a reader moving by `inc` samples per sample.
+   Between 2^(k-1) and 2^k, the levels k and k+1 are crossfaded, linearly with the
+   mantissa of the increment (cheaper than log2 and continuous from one octave to the next). */
+MYFLT
+TableStream_readMipmap(TableStream *self, MYFLT (*interp)(MYFLT *, int, MYFLT, int), int ipart, MYFLT fpart, double inc)
+{
+    int level;
+    double mix;
+    MYFLT low, high, *lowtable;
+
+    if (inc < 0)
+        inc = -inc;
+    if (inc <= 0.5)
+        return (*interp)(self->data, ipart, fpart, self->size);
+
+    /* inc = m * 2^level, with m in [0.5, 1[ */
+    mix = frexp(inc, &level) * 2.0 - 1.0;
+    if (level >= (self->mipmap_levels - 1))
+        return (*interp)(self->mipmap + (self->mipmap_levels - 2) * (self->size + 1), ipart, fpart, self->size);
+
+    lowtable = level == 0 ? self->data : self->mipmap + (level - 1) * (self->size + 1);
+    low = (*interp)(lowtable, ipart, fpart, self->size);
+    high = (*interp)(self->mipmap + level * (self->size + 1), ipart, fpart, self->size);
+    return low + (high - low) * mix;
+}
+
+/* Resamples one period of `size` samples to `outsize` samples, with cubic interpolation. */
+static void
+TableStream_resamplePeriod(MYFLT *in, int size, MYFLT *out, int outsize)
+{
+    int i, ipart;
+    double pos, ratio = (double)size / outsize;
+    MYFLT *padded = (MYFLT *)malloc((size + 3) * sizeof(MYFLT));
+
+    /* wraps around, so the interpolation never reaches the ends of the buffer. */
+    padded[0] = in[size - 1];
+    memcpy(padded + 1, in, size * sizeof(MYFLT));
+    padded[size + 1] = in[0];
+    padded[size + 2] = in[1 % size];
+    for (i=0; i<outsize; i++) {
+        pos = i * ratio;
+        ipart = (int)pos;
+        out[i] = cubic(padded, ipart + 1, (MYFLT)(pos - ipart), size + 3);
+    }
+    free(padded);
+}
+
+/* Returns True if the table has a mipmap afterwards, False if it was removed.
+   The fft needs an even size with no prime factors other than 2, 3 and 5, other
+   tables are resampled to the next valid size and the levels back to the table size. */
+static PyObject *
+TableStream_setMipmap(TableStream *self, PyObject *arg)
+{
+    int i, level, levels = 0, harms, fftsize, size = self->size;
+    MYFLT *mipmap = NULL, *old, *spectrum, *frame, *table, *level_table = NULL;
+    FFTPlan *plan;
+    Server *server;
+
+    if (PyObject_IsTrue(arg)) {
+        levels = 1;
+        while ((size >> (levels + 1)) >= 1)
+            levels++;
+
+        fftsize = size + (size & 1);
+        while (! fft_size_is_valid(fftsize))
+            fftsize += 2;
+
+        plan = fft_plan_acquire(fftsize, -1);
+        spectrum = (MYFLT *)malloc(fftsize * sizeof(MYFLT));
+        frame = (MYFLT *)malloc(fftsize * sizeof(MYFLT));
+        mipmap = (MYFLT *)malloc((levels - 1) * (size + 1) * sizeof(MYFLT));
+
+        if (fftsize != size) {
+            level_table = (MYFLT *)malloc(fftsize * sizeof(MYFLT));
+            TableStream_resamplePeriod(self->data, size, frame, fftsize);
+        }
+        else
+            memcpy(frame, self->data, size * sizeof(MYFLT));
+        realfft_plan(frame, spectrum, plan);
+        for (level=1; level<levels; level++) {
+            /* in harmonics of the table, whatever the size of the fft. */
+            harms = size >> (level + 1);
+            table = mipmap + (level - 1) * (size + 1);
+            memcpy(frame, spectrum, fftsize * sizeof(MYFLT));
+            /* real parts of the bins above `harms`, then their imaginary parts. */
+            for (i=harms+1; i<(fftsize-harms); i++)
+                frame[i] = 0.0;
+            if (fftsize != size) {
+                irealfft_plan(frame, level_table, plan);
+                TableStream_resamplePeriod(level_table, fftsize, table, size);
+            }
+            else
+                irealfft_plan(frame, table, plan);
+            table[size] = table[0];
+        }
+
+        free(spectrum);
+        free(frame);
+        free(level_table);
+        fft_plan_release(plan);
+    }
+
+    /* The audio thread may be reading the levels when it doesn't hold the GIL. */
+    server = (Server *)PyServer_get_server();
+    if (server != NULL)
+        Server_lockDsp(server);
+    old = self->mipmap;
+    self->mipmap = mipmap;
+    self->mipmap_levels = levels;
+    self->mipmap_size = size;
+    if (server != NULL)
+        Server_unlockDsp(server);
+    free(old);
+
+    return PyBool_FromLong(mipmap != NULL);
+}
+
+static PyMethodDef TableStream_methods[] = {
+{"setMipmap", (PyCFunction)TableStream_setMipmap, METH_O, "Computes the band-limited versions of the table, or removes them. Returns True if the table has them."},
+{NULL}  /* Sentinel */
+};
+
+/* Buffer protocol, gives read/write access to the samples without copy.
+   The guard point (data[size]) is not part of the exported memory. */
+static Py_ssize_t
+TableStream_getReadBuffer(TableStream *self, Py_ssize_t index, void **ptr)
+{
+    if (index != 0) {
+        PyErr_SetString(PyExc_SystemError, "TableStream has only one buffer segment.");
+        return -1;
+    }
+    *ptr = (void *)self->data;
+    return (Py_ssize_t)self->size * sizeof(MYFLT);
+}
+
+static Py_ssize_t
+TableStream_getSegCount(TableStream *self, Py_ssize_t *lenp)
+{
+    if (lenp)
+        *lenp = (Py_ssize_t)self->size * sizeof(MYFLT);
+    return 1;
+}
+
+static int
+TableStream_getBuffer(TableStream *self, Py_buffer *view, int flags)
+{
+    if (PyBuffer_FillInfo(view, (PyObject *)self, (void *)self->data, (Py_ssize_t)self->size * sizeof(MYFLT), 0, flags) < 0)
+        return -1;
+    view->itemsize = sizeof(MYFLT);
+    if ((flags & PyBUF_FORMAT) == PyBUF_FORMAT)
+        view->format = sizeof(MYFLT) == sizeof(float) ? "f" : "d";
+    if ((flags & PyBUF_ND) == PyBUF_ND) {
+        self->view_shape[0] = self->size;
+        view->shape = self->view_shape;
+    }
+    if ((flags & PyBUF_STRIDES) == PyBUF_STRIDES) {
+        self->view_strides[0] = sizeof(MYFLT);
+        view->strides = self->view_strides;
+    }
+    return 0;
+}
+
+static PyBufferProcs TableStream_as_buffer = {
+(readbufferproc)TableStream_getReadBuffer, /*bf_getreadbuffer*/
+(writebufferproc)TableStream_getReadBuffer, /*bf_getwritebuffer*/
+(segcountproc)TableStream_getSegCount, /*bf_getsegcount*/
+0, /*bf_getcharbuffer*/
+(getbufferproc)TableStream_getBuffer, /*bf_getbuffer*/
+0, /*bf_releasebuffer*/
+};
+
 PyTypeObject TableStreamType = {
 PyObject_HEAD_INIT(NULL)
 0, /*ob_size*/
@@ -105,8 +297,8 @@ sizeof(TableStream), /*tp_basicsize*/
 0, /*tp_str*/
 0, /*tp_getattro*/
 0, /*tp_setattro*/
-0, /*tp_as_buffer*/
-Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE, /*tp_flags*/
+&TableStream_as_buffer, /*tp_as_buffer*/
+Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
 "TableStream objects. For internal use only. Must never be instantiated by the user.", /* tp_doc */
 0, /* tp_traverse */
 0, /* tp_clear */
@@ -114,7 +306,7 @@ Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE, /*tp_flags*/
 0, /* tp_weaklistoffset */
 0, /* tp_iter */
 0, /* tp_iternext */
-0, /* tp_methods */
+TableStream_methods, /* tp_methods */
 0, /* tp_members */
 0, /* tp_getset */
 0, /* tp_base */
@@ -127,40 +319,181 @@ Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE, /*tp_flags*/
 TableStream_new, /* tp_new */
 };
 
+/********************************/
+/* Cache of the generated tables */
+/********************************/
+
+/* Tables of the same kind, size and parameters have the same content. The generated
+   contents are kept in a small process-wide cache, indexed by a hash of the parameters,
+   and copied into the data of the tables (tables stay writable), so replace() with
+   parameters already seen doesn't compute the waveform again. The least recently used
+   entries are dropped first. */
+#define TABLE_CACHE_ENTRIES 64
+#define TABLE_CACHE_SAMPLES 2097152
+
+enum {
+    TABLE_CACHE_HARM = 0,
+    TABLE_CACHE_CHEBY
+};
+
+typedef struct _TableCacheEntry {
+    int kind;
+    int size;
+    int nparams;
+    unsigned long hash;
+    MYFLT *params;
+    MYFLT *data; /* size + 1 samples, the guard point included */
+    struct _TableCacheEntry *next;
+} TableCacheEntry;
+
+static TableCacheEntry *table_cache = NULL; /* the most recently used first */
+static int table_cache_count = 0;
+static long table_cache_samples = 0;
+
+static unsigned long
+TableCache_hash(int kind, int size, MYFLT *params, int nparams)
+{
+    int i;
+    unsigned char *bytes = (unsigned char *)params;
+    unsigned long hash = 2166136261UL;
+
+    hash = (hash ^ kind) * 16777619UL;
+    hash = (hash ^ size) * 16777619UL;
+    for (i=0; i<(nparams * (int)sizeof(MYFLT)); i++)
+        hash = (hash ^ bytes[i]) * 16777619UL;
+    return hash;
+}
+
+static MYFLT *
+TableCache_lookup(int kind, int size, MYFLT *params, int nparams, unsigned long hash)
+{
+    TableCacheEntry *entry, **link;
+
+    for (link=&table_cache; *link!=NULL; link=&(*link)->next) {
+        entry = *link;
+        if (entry->hash == hash && entry->kind == kind && entry->size == size && entry->nparams == nparams &&
+            memcmp(entry->params, params, nparams * sizeof(MYFLT)) == 0) {
+            *link = entry->next;
+            entry->next = table_cache;
+            table_cache = entry;
+            return entry->data;
+        }
+    }
+    return NULL;
+}
+
+static void
+TableCache_store(int kind, int size, MYFLT *params, int nparams, unsigned long hash, MYFLT *data)
+{
+    TableCacheEntry *entry, **link;
+
+    if ((size + 1) > TABLE_CACHE_SAMPLES)
+        return;
+
+    entry = (TableCacheEntry *)malloc(sizeof(TableCacheEntry));
+    entry->kind = kind;
+    entry->size = size;
+    entry->nparams = nparams;
+    entry->hash = hash;
+    entry->params = (MYFLT *)malloc((nparams > 0 ? nparams : 1) * sizeof(MYFLT));
+    memcpy(entry->params, params, nparams * sizeof(MYFLT));
+    entry->data = (MYFLT *)malloc((size + 1) * sizeof(MYFLT));
+    memcpy(entry->data, data, (size + 1) * sizeof(MYFLT));
+    entry->next = table_cache;
+    table_cache = entry;
+    table_cache_count++;
+    table_cache_samples += size + 1;
+
+    while (table_cache_count > TABLE_CACHE_ENTRIES || table_cache_samples > TABLE_CACHE_SAMPLES) {
+        for (link=&table_cache; (*link)->next!=NULL; link=&(*link)->next);
+        entry = *link;
+        *link = NULL;
+        table_cache_count--;
+        table_cache_samples -= entry->size + 1;
+        free(entry->params);
+        free(entry->data);
+        free(entry);
+    }
+}
+
 /***********************/
 /* HarmTable structure */
 /***********************/
 typedef struct {
     pyo_table_HEAD
     PyObject *amplist;
+    FFTPlan *plan;
 } HarmTable;
 
+/* The table is one period of a sum of harmonics. With a size the fft can compute, it is
+   the inverse fft of the spectrum, otherwise the sines are summed directly. */
 static void
 HarmTable_generate(HarmTable *self) {
-    int i, j, ampsize;
+    int i, j, k, ampsize;
+    unsigned long hash;
     MYFLT factor, amplitude, val;
+    MYFLT *cached, *spectrum, *frame;
+    FFTPlan *plan;
 
     ampsize = PyList_Size(self->amplist);
-    MYFLT array[ampsize];
+    MYFLT array[ampsize > 0 ? ampsize : 1];
     for(j=0; j<ampsize; j++) {
-        array[j] =  PyFloat_AS_DOUBLE(PyNumber_Float(PyList_GET_ITEM(self->amplist, j)));
+        array[j] = PyFloat_AsDouble(PyList_GET_ITEM(self->amplist, j));
     }
+    while (ampsize > 0 && array[ampsize-1] == 0.0)
+        ampsize--;
 
-    factor = 1. / (self->size * 0.5) * PI;
+    hash = TableCache_hash(TABLE_CACHE_HARM, self->size, array, ampsize);
+    cached = TableCache_lookup(TABLE_CACHE_HARM, self->size, array, ampsize, hash);
+    if (cached != NULL) {
+        memcpy(self->data, cached, (self->size+1) * sizeof(MYFLT));
+        return;
+    }
 
-    for(i=0; i<self->size; i++) {
-        val = 0;
+    if (fft_size_is_valid(self->size)) {
+        if (self->plan == NULL || self->plan->size != self->size) {
+            plan = fft_plan_acquire(self->size, -1);
+            fft_plan_release(self->plan);
+            self->plan = plan;
+        }
+        spectrum = (MYFLT *)calloc(self->size, sizeof(MYFLT));
+        frame = (MYFLT *)malloc(self->size * sizeof(MYFLT));
+        /* amp * sin(2pi k i / size) is the bin k with an imaginary part of -amp / 2,
+           harmonics above the nyquist frequency fold back with the opposite sign. */
         for(j=0; j<ampsize; j++) {
-            amplitude = array[j];
-            if (amplitude != 0.0) {
-                val += MYSIN((j+1) * i * factor) * amplitude;
+            k = (j + 1) % self->size;
+            amplitude = array[j] * -0.5;
+            if (k > self->size / 2) {
+                k = self->size - k;
+                amplitude = -amplitude;
             }
+            if (k != 0 && k != self->size / 2)
+                spectrum[self->size - k] += amplitude;
+        }
+        irealfft_plan(spectrum, frame, self->plan);
+        memcpy(self->data, frame, self->size * sizeof(MYFLT));
+        free(spectrum);
+        free(frame);
+    }
+    else {
+        factor = 1. / (self->size * 0.5) * PI;
+
+        for(i=0; i<self->size; i++) {
+            val = 0;
+            for(j=0; j<ampsize; j++) {
+                amplitude = array[j];
+                if (amplitude != 0.0) {
+                    val += MYSIN((j+1) * i * factor) * amplitude;
+                }
+            }
+            self->data[i] = val;
         }
-        self->data[i] = val;
     }
 
     val = self->data[0];
     self->data[self->size] = val;
+
+    TableCache_store(TABLE_CACHE_HARM, self->size, array, ampsize, hash, self->data);
 }
 
 static int
@@ -183,6 +516,7 @@ static void
 HarmTable_dealloc(HarmTable* self)
 {
     free(self->data);
+    fft_plan_release(self->plan);
     HarmTable_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -218,7 +552,7 @@ HarmTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     TableStream_setData(self->tablestream, self->data);
     HarmTable_generate(self);
 
-    double sr = PyFloat_AsDouble(PyObject_CallMethod(self->server, "getSamplingRate", NULL));
+    double sr = ((Server *)self->server)->samplingRate;
     TableStream_setSamplingRate(self->tablestream, sr);
 
     return (PyObject *)self;
@@ -388,73 +722,53 @@ typedef struct {
     PyObject *amplist;
 } ChebyTable;
 
+/* The Chebyshev polynomials of the first kind are evaluated with their recurrence,
+   T(k+1) = 2x T(k) - T(k-1). */
 static void
 ChebyTable_generate(ChebyTable *self) {
     int i, j, ampsize, halfsize;
-    MYFLT amplitude, val, ihalfsize, index, x;
+    unsigned long hash;
+    MYFLT val, ihalfsize, index, t0, t1, t2;
+    MYFLT *cached;
 
     ampsize = PyList_Size(self->amplist);
     if (ampsize > 12)
         ampsize = 12;
-    MYFLT array[ampsize];
+    MYFLT array[ampsize > 0 ? ampsize : 1];
     for(j=0; j<ampsize; j++) {
-        array[j] =  PyFloat_AS_DOUBLE(PyNumber_Float(PyList_GET_ITEM(self->amplist, j)));
+        array[j] = PyFloat_AsDouble(PyList_GET_ITEM(self->amplist, j));
+    }
+    while (ampsize > 0 && array[ampsize-1] == 0.0)
+        ampsize--;
+
+    hash = TableCache_hash(TABLE_CACHE_CHEBY, self->size, array, ampsize);
+    cached = TableCache_lookup(TABLE_CACHE_CHEBY, self->size, array, ampsize, hash);
+    if (cached != NULL) {
+        memcpy(self->data, cached, (self->size+1) * sizeof(MYFLT));
+        return;
     }
 
     halfsize = self->size / 2;
     ihalfsize = 1.0 / halfsize;
 
-    x = 0.0;
     for(i=0; i<self->size; i++) {
         val = 0;
         index = (i - halfsize) * ihalfsize;
+        t0 = 1.0;
+        t1 = index;
         for(j=0; j<ampsize; j++) {
-            amplitude = array[j];
-            switch (j) {
-                case 0:
-                    x = index;
-                    break;
-                case 1:
-                    x = 2 * MYPOW(index, 2) - 1;
-                    break;
-                case 2:
-                    x = 4 * MYPOW(index, 3) - 3 * index;
-                    break;
-                case 3:
-                    x = 8 * MYPOW(index, 4) - 8 * MYPOW(index, 2) + 1;
-                    break;
-                case 4:
-                    x = 16 * MYPOW(index, 5) - 20 * MYPOW(index, 3) + 5 * index;
-                    break;
-                case 5:
-                    x = 32 * MYPOW(index, 6) - 48 * MYPOW(index, 4) + 18 * MYPOW(index, 2) - 1;
-                    break;
-                case 6:
-                    x = 64 * MYPOW(index, 7) - 112 * MYPOW(index, 5) + 56 * MYPOW(index, 3) - 7 * index;
-                    break;
-                case 7:
-                    x = 128 * MYPOW(index, 8) - 256 * MYPOW(index, 6) + 160 * MYPOW(index, 4) - 32 * MYPOW(index, 2) + 1;
-                    break;
-                case 8:
-                    x = 256 * MYPOW(index, 9) - 576 * MYPOW(index, 7) + 432 * MYPOW(index, 5) - 120 * MYPOW(index, 3) + 9 * index;
-                    break;
-                case 9:
-                    x = 512 * MYPOW(index, 10) - 1280 * MYPOW(index, 8) + 1120 * MYPOW(index, 6) - 400 * MYPOW(index, 4) + 50 * MYPOW(index, 2) - 1;
-                    break;
-                case 10:
-                    x = 1024 * MYPOW(index, 11) - 2816 * MYPOW(index, 9) + 2816 * MYPOW(index, 7) - 1232 * MYPOW(index, 5) + 220 * MYPOW(index, 3) - 11 * index;
-                    break;
-                case 11:
-                    x = 2048 * MYPOW(index, 12) - 6144 * MYPOW(index, 10) + 6912 * MYPOW(index, 8) - 3584 * MYPOW(index, 6) + 840 * MYPOW(index, 4) - 72 * MYPOW(index, 2) + 1;
-                    break;
-            }
-            val += x * amplitude;
+            val += t1 * array[j];
+            t2 = 2 * index * t1 - t0;
+            t0 = t1;
+            t1 = t2;
         }
         self->data[i] = val;
     }
 
     val = self->data[self->size-1];
     self->data[self->size] = val;
+
+    TableCache_store(TABLE_CACHE_CHEBY, self->size, array, ampsize, hash, self->data);
 }
 
 static int
@@ -512,7 +826,7 @@ ChebyTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     TableStream_setData(self->tablestream, self->data);
     ChebyTable_generate(self);
 
-    double sr = PyFloat_AsDouble(PyObject_CallMethod(self->server, "getSamplingRate", NULL));
+    double sr = ((Server *)self->server)->samplingRate;
     TableStream_setSamplingRate(self->tablestream, sr);
 
     return (PyObject *)self;
@@ -814,7 +1128,7 @@ HannTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 	TableStream_setData(self->tablestream, self->data);
     HannTable_generate(self);
 
-    double sr = PyFloat_AsDouble(PyObject_CallMethod(self->server, "getSamplingRate", NULL));
+    double sr = ((Server *)self->server)->samplingRate;
     TableStream_setSamplingRate(self->tablestream, sr);
 
     return (PyObject *)self;
@@ -1038,7 +1352,7 @@ SincTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 	TableStream_setData(self->tablestream, self->data);
     SincTable_generate(self);
 
-    double sr = PyFloat_AsDouble(PyObject_CallMethod(self->server, "getSamplingRate", NULL));
+    double sr = ((Server *)self->server)->samplingRate;
     TableStream_setSamplingRate(self->tablestream, sr);
 
     return (PyObject *)self;
@@ -1270,7 +1584,7 @@ WinTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 	TableStream_setData(self->tablestream, self->data);
     WinTable_generate(self);
 
-    double sr = PyFloat_AsDouble(PyObject_CallMethod(self->server, "getSamplingRate", NULL));
+    double sr = ((Server *)self->server)->samplingRate;
     TableStream_setSamplingRate(self->tablestream, sr);
 
     return (PyObject *)self;
@@ -1502,7 +1816,7 @@ ParaTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 	TableStream_setData(self->tablestream, self->data);
     ParaTable_generate(self);
 
-    double sr = PyFloat_AsDouble(PyObject_CallMethod(self->server, "getSamplingRate", NULL));
+    double sr = ((Server *)self->server)->samplingRate;
     TableStream_setSamplingRate(self->tablestream, sr);
 
     return (PyObject *)self;
@@ -1746,7 +2060,7 @@ LinTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     TableStream_setData(self->tablestream, self->data);
     LinTable_generate(self);
 
-    double sr = PyFloat_AsDouble(PyObject_CallMethod(self->server, "getSamplingRate", NULL));
+    double sr = ((Server *)self->server)->samplingRate;
     TableStream_setSamplingRate(self->tablestream, sr);
 
     return (PyObject *)self;
@@ -2070,7 +2384,7 @@ LogTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     TableStream_setData(self->tablestream, self->data);
     LogTable_generate(self);
 
-    double sr = PyFloat_AsDouble(PyObject_CallMethod(self->server, "getSamplingRate", NULL));
+    double sr = ((Server *)self->server)->samplingRate;
     TableStream_setSamplingRate(self->tablestream, sr);
 
     return (PyObject *)self;
@@ -2372,7 +2686,7 @@ CosTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     TableStream_setData(self->tablestream, self->data);
     CosTable_generate(self);
 
-    double sr = PyFloat_AsDouble(PyObject_CallMethod(self->server, "getSamplingRate", NULL));
+    double sr = ((Server *)self->server)->samplingRate;
     TableStream_setSamplingRate(self->tablestream, sr);
 
     return (PyObject *)self;
@@ -2698,7 +3012,7 @@ CosLogTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     TableStream_setData(self->tablestream, self->data);
     CosLogTable_generate(self);
 
-    double sr = PyFloat_AsDouble(PyObject_CallMethod(self->server, "getSamplingRate", NULL));
+    double sr = ((Server *)self->server)->samplingRate;
     TableStream_setSamplingRate(self->tablestream, sr);
 
     return (PyObject *)self;
@@ -3027,7 +3341,7 @@ CurveTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     TableStream_setData(self->tablestream, self->data);
     CurveTable_generate(self);
 
-    double sr = PyFloat_AsDouble(PyObject_CallMethod(self->server, "getSamplingRate", NULL));
+    double sr = ((Server *)self->server)->samplingRate;
     TableStream_setSamplingRate(self->tablestream, sr);
 
     return (PyObject *)self;
@@ -3397,7 +3711,7 @@ ExpTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     TableStream_setData(self->tablestream, self->data);
     ExpTable_generate(self);
 
-    double sr = PyFloat_AsDouble(PyObject_CallMethod(self->server, "getSamplingRate", NULL));
+    double sr = ((Server *)self->server)->samplingRate;
     TableStream_setSamplingRate(self->tablestream, sr);
 
     return (PyObject *)self;
@@ -3646,8 +3960,235 @@ typedef struct {
     MYFLT stop;
     MYFLT crossfade;
     MYFLT insertPos;
+    int use_mmap;
+    char *mapped; /* memory-mapped cache file, data points inside it. */
+    size_t mapped_size;
 } SndTable;
 
+/* Memory-mapped sounds. The channels of a sound are converted once to raw MYFLT
+** files in a cache directory, then mapped copy-on-write by the tables. Tables,
+** and processes, loading the same sound share the pages of the cache and only
+** the parts of the sound actually read are loaded in memory. */
+#define SNDTABLE_CACHE_MAGIC 0x6f79706e
+#define SNDTABLE_CACHE_HEADER 4096 /* samples start on a page boundary */
+#define SNDTABLE_CACHE_CHUNK 65536
+
+typedef struct {
+    unsigned int magic;
+    unsigned int sample_size;
+    long long frames;
+    int samplerate;
+    int channels;
+    long long source_size;
+    long long source_mtime;
+} SndTableCacheHeader;
+
+#ifndef _WIN32
+static void
+SndTable_cachePath(char *dest, const char *path, int chnl)
+{
+    char fullpath[PATH_MAX];
+    const char *dir, *c;
+    unsigned long long hash = 14695981039346656037ULL;
+
+    if (realpath(path, fullpath) == NULL)
+        strncpy(fullpath, path, PATH_MAX-1);
+    fullpath[PATH_MAX-1] = '\0';
+    for (c=fullpath; *c; c++) {
+        hash = (hash ^ (unsigned char)*c) * 1099511628211ULL;
+    }
+
+    dir = getenv("PYO_CACHE_DIR");
+    if (dir == NULL) {
+        dir = getenv("TMPDIR");
+        if (dir == NULL)
+            dir = "/tmp";
+        snprintf(dest, PATH_MAX, "%s/pyo-cache-%d", dir, (int)getuid());
+    }
+    else
+        snprintf(dest, PATH_MAX, "%s", dir);
+    mkdir(dest, 0700);
+    snprintf(dest + strlen(dest), PATH_MAX - strlen(dest), "/%016llx-%d-%d.raw", hash, chnl, (int)(sizeof(MYFLT)*8));
+}
+
+static int
+SndTable_checkCache(const char *cachepath, struct stat *source, SndTableCacheHeader *header)
+{
+    int ok = 0;
+    FILE *f = fopen(cachepath, "rb");
+
+    if (f == NULL)
+        return 0;
+    if (fread(header, sizeof(SndTableCacheHeader), 1, f) == 1)
+        ok = header->magic == SNDTABLE_CACHE_MAGIC && header->sample_size == sizeof(MYFLT) &&
+             header->source_size == (long long)source->st_size && header->source_mtime == (long long)source->st_mtime;
+    fclose(f);
+    return ok;
+}
+
+/* Converts all channels of the sound in one pass. Each file is written under a
+** temporary name then renamed, so concurrent processes never see partial caches. */
+static int
+SndTable_buildCache(const char *path, struct stat *source)
+{
+    SNDFILE *sf;
+    SF_INFO info;
+    SndTableCacheHeader header;
+    int i, j, num, err = 0;
+    char cachepath[PATH_MAX];
+    char **tmppaths;
+    FILE **files;
+    MYFLT *buffer, *channel;
+    char padding[SNDTABLE_CACHE_HEADER];
+
+    info.format = 0;
+    sf = sf_open(path, SFM_READ, &info);
+    if (sf == NULL)
+        return -1;
+
+    header.magic = SNDTABLE_CACHE_MAGIC;
+    header.sample_size = sizeof(MYFLT);
+    header.frames = info.frames;
+    header.samplerate = info.samplerate;
+    header.channels = info.channels;
+    header.source_size = source->st_size;
+    header.source_mtime = source->st_mtime;
+    memset(padding, 0, SNDTABLE_CACHE_HEADER);
+    memcpy(padding, &header, sizeof(SndTableCacheHeader));
+
+    tmppaths = (char **)malloc(info.channels * sizeof(char *));
+    files = (FILE **)malloc(info.channels * sizeof(FILE *));
+    for (i=0; i<info.channels; i++) {
+        SndTable_cachePath(cachepath, path, i);
+        tmppaths[i] = (char *)malloc(PATH_MAX);
+        snprintf(tmppaths[i], PATH_MAX, "%s.%d.tmp", cachepath, (int)getpid());
+        files[i] = fopen(tmppaths[i], "wb");
+        if (files[i] == NULL || fwrite(padding, SNDTABLE_CACHE_HEADER, 1, files[i]) != 1)
+            err = 1;
+    }
+
+    buffer = (MYFLT *)malloc(SNDTABLE_CACHE_CHUNK * info.channels * sizeof(MYFLT));
+    channel = (MYFLT *)malloc((SNDTABLE_CACHE_CHUNK + 1) * sizeof(MYFLT));
+    while (!err) {
+        num = (int)SF_READ(sf, buffer, SNDTABLE_CACHE_CHUNK * info.channels) / info.channels;
+        if (num <= 0)
+            break;
+        for (i=0; i<info.channels; i++) {
+            for (j=0; j<num; j++) {
+                channel[j] = buffer[j*info.channels+i];
+            }
+            if (fwrite(channel, sizeof(MYFLT), num, files[i]) != (size_t)num)
+                err = 1;
+        }
+    }
+    sf_close(sf);
+
+    /* Extra sample, the guard point of a table reaching the end of the sound. */
+    channel[0] = 0.0;
+    for (i=0; i<info.channels; i++) {
+        if (files[i] != NULL) {
+            if (fwrite(channel, sizeof(MYFLT), 1, files[i]) != 1)
+                err = 1;
+            if (fclose(files[i]) != 0)
+                err = 1;
+        }
+        SndTable_cachePath(cachepath, path, i);
+        if (err || rename(tmppaths[i], cachepath) != 0) {
+            unlink(tmppaths[i]);
+            err = 1;
+        }
+        free(tmppaths[i]);
+    }
+    free(tmppaths);
+    free(files);
+    free(buffer);
+    free(channel);
+    return err ? -1 : 0;
+}
+#endif
+
+/* Releases the mapping. If `keep` is 1, the samples are first copied in memory. */
+static void
+SndTable_unmapSound(SndTable *self, int keep) {
+#ifndef _WIN32
+    MYFLT *tmp = NULL;
+
+    if (self->mapped == NULL)
+        return;
+    if (keep) {
+        tmp = (MYFLT *)malloc((self->size + 1) * sizeof(MYFLT));
+        memcpy(tmp, self->data, (self->size + 1) * sizeof(MYFLT));
+    }
+    munmap(self->mapped, self->mapped_size);
+    self->mapped = NULL;
+    self->mapped_size = 0;
+    self->data = tmp;
+    TableStream_setData(self->tablestream, self->data);
+#endif
+}
+
+/* Returns 0 if the sound is mapped, -1 if it must be loaded in memory. */
+static int
+SndTable_mapSound(SndTable *self) {
+#ifndef _WIN32
+    int fd;
+    unsigned int start, stop, snd_size;
+    char cachepath[PATH_MAX];
+    struct stat source;
+    SndTableCacheHeader header;
+    char *mapped;
+    size_t mapped_size;
+
+    if (stat(self->path, &source) != 0)
+        return -1;
+
+    SndTable_cachePath(cachepath, self->path, self->chnl);
+    if (!SndTable_checkCache(cachepath, &source, &header)) {
+        if (SndTable_buildCache(self->path, &source) != 0 || !SndTable_checkCache(cachepath, &source, &header))
+            return -1;
+    }
+
+    fd = open(cachepath, O_RDONLY);
+    if (fd < 0)
+        return -1;
+    mapped_size = SNDTABLE_CACHE_HEADER + (header.frames + 1) * sizeof(MYFLT);
+    mapped = (char *)mmap(NULL, mapped_size, PROT_READ | PROT_WRITE, MAP_PRIVATE, fd, 0);
+    close(fd);
+    if (mapped == MAP_FAILED)
+        return -1;
+
+    snd_size = (unsigned int)header.frames;
+    self->sndSr = header.samplerate;
+
+    if (self->stop <= 0 || self->stop <= self->start || (self->stop*self->sndSr) > snd_size)
+        stop = snd_size;
+    else
+        stop = (unsigned int)(self->stop * self->sndSr);
+
+    if (self->start < 0 || (self->start*self->sndSr) > snd_size)
+        start = 0;
+    else
+        start = (unsigned int)(self->start * self->sndSr);
+
+    SndTable_unmapSound(self, 0);
+    self->mapped = mapped;
+    self->mapped_size = mapped_size;
+    self->size = stop - start;
+    self->data = (MYFLT *)(mapped + SNDTABLE_CACHE_HEADER) + start;
+    /* Copy-on-write, only this page becomes private to the table. */
+    self->data[self->size] = self->data[0];
+
+    self->start = 0.0;
+    self->stop = -1.0;
+    TableStream_setSize(self->tablestream, self->size);
+    TableStream_setSamplingRate(self->tablestream, self->sndSr);
+    TableStream_setData(self->tablestream, self->data);
+    return 0;
+#else
+    return -1;
+#endif
+}
+
 static void
 SndTable_loadSound(SndTable *self) {
     SNDFILE *sf;
@@ -3656,6 +4197,13 @@ SndTable_loadSound(SndTable *self) {
     unsigned int num_count = 0;
     MYFLT *tmp;
 
+    if (self->use_mmap) {
+        if (SndTable_mapSound(self) == 0)
+            return;
+        printf("SndTable can't map the sound, loading it in memory.\n");
+    }
+    SndTable_unmapSound(self, 1);
+
     info.format = 0;
     sf = sf_open(self->path, SFM_READ, &info);
     if (sf == NULL)
@@ -3729,6 +4277,9 @@ SndTable_appendSound(SndTable *self) {
     MYFLT *tmp, *tmp_data;
     MYFLT cross_amp;
 
+    /* The table is resized, a mapped sound is copied in memory first. */
+    SndTable_unmapSound(self, 1);
+
     info.format = 0;
     sf = sf_open(self->path, SFM_READ, &info);
     if (sf == NULL)
@@ -3826,6 +4377,9 @@ SndTable_prependSound(SndTable *self) {
     MYFLT *tmp, *tmp_data;
     MYFLT cross_amp;
 
+    /* The table is resized, a mapped sound is copied in memory first. */
+    SndTable_unmapSound(self, 1);
+
     info.format = 0;
     sf = sf_open(self->path, SFM_READ, &info);
     if (sf == NULL)
@@ -3920,6 +4474,9 @@ SndTable_insertSound(SndTable *self) {
     MYFLT *tmp, *tmp_data;
     MYFLT cross_amp;
 
+    /* The table is resized, a mapped sound is copied in memory first. */
+    SndTable_unmapSound(self, 1);
+
     info.format = 0;
     sf = sf_open(self->path, SFM_READ, &info);
     if (sf == NULL)
@@ -4040,7 +4597,10 @@ SndTable_clear(SndTable *self)
 static void
 SndTable_dealloc(SndTable* self)
 {
-    free(self->data);
+    if (self->mapped != NULL)
+        SndTable_unmapSound(self, 0);
+    else
+        free(self->data);
     SndTable_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -4054,7 +4614,7 @@ SndTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self = (SndTable *)type->tp_alloc(type, 0);
 
     self->server = PyServer_get_server();
-    self->sr = (MYFLT)PyFloat_AsDouble(PyObject_CallMethod(self->server, "getSamplingRate", NULL));
+    self->sr = (MYFLT)((Server *)self->server)->samplingRate;
 
     self->chnl = 0;
     self->stop = -1.0;
@@ -4063,9 +4623,9 @@ SndTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     MAKE_NEW_TABLESTREAM(self->tablestream, &TableStreamType, NULL);
 
-    static char *kwlist[] = {"path", "chnl", "start", "stop", NULL};
+    static char *kwlist[] = {"path", "chnl", "start", "stop", "mmap", NULL};
 
-    if (! PyArg_ParseTupleAndKeywords(args, kwds, TYPE_S_IFF, kwlist, &self->path, &self->chnl, &self->start, &self->stop))
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, TYPE_S_IFFI, kwlist, &self->path, &self->chnl, &self->start, &self->stop, &self->use_mmap))
         return PyInt_FromLong(-1);
 
     if (strcmp(self->path, "") == 0) {
@@ -4091,7 +4651,7 @@ SndTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
 static PyObject * SndTable_getServer(SndTable* self) { GET_SERVER };
 static PyObject * SndTable_getTableStream(SndTable* self) { GET_TABLE_STREAM };
-static PyObject * SndTable_setData(SndTable *self, PyObject *arg) { SET_TABLE_DATA };
+static PyObject * SndTable_setData(SndTable *self, PyObject *arg) { SndTable_unmapSound(self, 1); SET_TABLE_DATA };
 static PyObject * SndTable_normalize(SndTable *self) { NORMALIZE };
 static PyObject * SndTable_reset(SndTable *self) { TABLE_RESET };
 static PyObject * SndTable_removeDC(SndTable *self) { REMOVE_DC };
@@ -4333,6 +4893,7 @@ SndTable_setSize(SndTable *self, PyObject *value)
 {
     Py_ssize_t i;
 
+    SndTable_unmapSound(self, 0);
     self->size = PyInt_AsLong(value);
 
     self->data = (MYFLT *)realloc(self->data, (self->size+1) * sizeof(MYFLT));
@@ -4359,7 +4920,7 @@ SndTable_getSize(SndTable *self)
 static PyObject *
 SndTable_getRate(SndTable *self)
 {
-    MYFLT sr = PyFloat_AsDouble(PyObject_CallMethod(self->server, "getSamplingRate", NULL)); \
+    MYFLT sr = ((Server *)self->server)->samplingRate; \
     return PyFloat_FromDouble(sr * (self->sndSr/sr) / self->size);
 };
 
@@ -4535,7 +5096,7 @@ NewTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     if (! PyArg_ParseTupleAndKeywords(args, kwds, TYPE_F_OF, kwlist, &self->length, &inittmp, &self->feedback))
         Py_RETURN_NONE;
 
-    self->sr = (MYFLT)PyFloat_AsDouble(PyObject_CallMethod(self->server, "getSamplingRate", NULL));
+    self->sr = (MYFLT)((Server *)self->server)->samplingRate;
     self->size = (int)(self->length * self->sr + 0.5);
     self->data = (MYFLT *)realloc(self->data, (self->size + 1) * sizeof(MYFLT));
 
@@ -4695,7 +5256,7 @@ NewTable_getLength(NewTable *self)
 static PyObject *
 NewTable_getRate(NewTable *self)
 {
-    MYFLT sr = PyFloat_AsDouble(PyObject_CallMethod(self->server, "getSamplingRate", NULL)); \
+    MYFLT sr = ((Server *)self->server)->samplingRate; \
     return PyFloat_FromDouble(sr / self->size);
 };
 
@@ -4864,7 +5425,7 @@ DataTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     TableStream_setData(self->tablestream, self->data);
 
-    double sr = PyFloat_AsDouble(PyObject_CallMethod(self->server, "getSamplingRate", NULL));
+    double sr = ((Server *)self->server)->samplingRate;
     TableStream_setSamplingRate(self->tablestream, sr);
 
     return (PyObject *)self;
@@ -4903,7 +5464,7 @@ DataTable_getSize(DataTable *self)
 static PyObject *
 DataTable_getRate(DataTable *self)
 {
-    MYFLT sr = PyFloat_AsDouble(PyObject_CallMethod(self->server, "getSamplingRate", NULL)); \
+    MYFLT sr = ((Server *)self->server)->samplingRate; \
     return PyFloat_FromDouble(sr / self->size);
 };
 
@@ -5058,7 +5619,7 @@ AtanTable_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 	TableStream_setData(self->tablestream, self->data);
     AtanTable_generate(self);
 
-    double sr = PyFloat_AsDouble(PyObject_CallMethod(self->server, "getSamplingRate", NULL));
+    double sr = ((Server *)self->server)->samplingRate;
     TableStream_setSamplingRate(self->tablestream, sr);
 
     return (PyObject *)self;
@@ -5365,7 +5926,7 @@ TableRec_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(tabletmp);
     self->table = (NewTable *)tabletmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->buffer = (MYFLT *)realloc(self->buffer, self->bufsize * sizeof(MYFLT));
     self->trigsBuffer = (MYFLT *)realloc(self->trigsBuffer, self->bufsize * sizeof(MYFLT));
@@ -5573,7 +6134,6 @@ TableRecTimeStream_dealloc(TableRecTimeStream* self)
 static PyObject *
 TableRecTimeStream_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL;
     TableRecTimeStream *self;
     self = (TableRecTimeStream *)type->tp_alloc(type, 0);
@@ -5594,7 +6154,7 @@ TableRecTimeStream_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(maintmp);
     self->mainPlayer = (TableRec *)maintmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -5829,7 +6389,6 @@ TableMorph_dealloc(TableMorph* self)
 static PyObject *
 TableMorph_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *tabletmp, *sourcestmp;
     TableMorph *self;
     self = (TableMorph *)type->tp_alloc(type, 0);
@@ -5837,6 +6396,7 @@ TableMorph_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     INIT_OBJECT_COMMON
 
     Stream_setFunctionPtr(self->stream, TableMorph_compute_next_data_frame);
+    Stream_setSerial(self->stream, 2);
 
     static char *kwlist[] = {"input", "table", "sources", NULL};
 
@@ -5859,7 +6419,7 @@ TableMorph_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     TableMorph_alloc_memories(self);
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     return (PyObject *)self;
 }
@@ -6171,7 +6731,7 @@ TrigTableRec_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(tabletmp);
     self->table = (NewTable *)tabletmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->trigsBuffer = (MYFLT *)realloc(self->trigsBuffer, self->bufsize * sizeof(MYFLT));
     self->time_buffer_streams = (MYFLT *)realloc(self->time_buffer_streams, self->bufsize * sizeof(MYFLT));
@@ -6373,7 +6933,6 @@ TrigTableRecTimeStream_dealloc(TrigTableRecTimeStream* self)
 static PyObject *
 TrigTableRecTimeStream_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL;
     TrigTableRecTimeStream *self;
     self = (TrigTableRecTimeStream *)type->tp_alloc(type, 0);
@@ -6394,7 +6953,7 @@ TrigTableRecTimeStream_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(maintmp);
     self->mainPlayer = (TrigTableRec *)maintmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -6630,7 +7189,7 @@ TablePut_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(tabletmp);
     self->table = (DataTable *)tabletmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->trigsBuffer = (MYFLT *)realloc(self->trigsBuffer, self->bufsize * sizeof(MYFLT));
 
@@ -6807,7 +7366,6 @@ TableWrite_dealloc(TableWrite* self)
 static PyObject *
 TableWrite_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *postmp, *tabletmp;
     TableWrite *self;
     self = (TableWrite *)type->tp_alloc(type, 0);
@@ -6815,6 +7373,7 @@ TableWrite_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     INIT_OBJECT_COMMON
 
     Stream_setFunctionPtr(self->stream, TableWrite_compute_next_data_frame);
+    Stream_setSerial(self->stream, 2);
     Stream_setStreamActive(self->stream, 1);
 
     static char *kwlist[] = {"input", "pos", "table", NULL};
@@ -6836,7 +7395,7 @@ TableWrite_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(tabletmp);
     self->table = (NewTable *)tabletmp;
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     return (PyObject *)self;
 }
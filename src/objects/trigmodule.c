@@ -161,7 +161,6 @@ TrigRandInt_dealloc(TrigRandInt* self)
 static PyObject *
 TrigRandInt_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     MYFLT ma;
     PyObject *inputtmp, *input_streamtmp, *maxtmp=NULL, *multmp=NULL, *addtmp=NULL;
     TrigRandInt *self;
@@ -175,6 +174,7 @@ TrigRandInt_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, TrigRandInt_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = TrigRandInt_setProcMode;
 
     static char *kwlist[] = {"input", "max", "mul", "add", NULL};
@@ -196,7 +196,7 @@ TrigRandInt_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     Server_generateSeed((Server *)self->server, TRIGRANDINT_ID);
 
@@ -620,7 +620,6 @@ TrigRand_dealloc(TrigRand* self)
 static PyObject *
 TrigRand_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     MYFLT inittmp = 0.0;
     PyObject *inputtmp, *input_streamtmp, *mintmp=NULL, *maxtmp=NULL, *multmp=NULL, *addtmp=NULL;
     TrigRand *self;
@@ -639,6 +638,7 @@ TrigRand_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, TrigRand_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = TrigRand_setProcMode;
 
     static char *kwlist[] = {"input", "min", "max", "port", "init", "mul", "add", NULL};
@@ -664,7 +664,7 @@ TrigRand_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     Server_generateSeed((Server *)self->server, TRIGRAND_ID);
 
@@ -1030,7 +1030,6 @@ TrigChoice_dealloc(TrigChoice* self)
 static PyObject *
 TrigChoice_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     MYFLT inittmp = 0.0;
     PyObject *inputtmp, *input_streamtmp, *choicetmp=NULL, *multmp=NULL, *addtmp=NULL;
     TrigChoice *self;
@@ -1045,6 +1044,7 @@ TrigChoice_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, TrigChoice_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = TrigChoice_setProcMode;
 
     static char *kwlist[] = {"input", "choice", "port", "init", "mul", "add", NULL};
@@ -1066,7 +1066,7 @@ TrigChoice_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     Server_generateSeed((Server *)self->server, TRIGCHOICE_ID);
 
@@ -1265,30 +1265,32 @@ typedef struct {
     PyObject *func;
 } TrigFunc;
 
+static void
+TrigFunc_call(TrigFunc *self, MYFLT *args) {
+    PyObject *tuple, *result;
+
+    if (self->arg == Py_None) {
+        result = PyObject_Call(self->func, PyTuple_New(0), NULL);
+        if (result == NULL)
+            PyErr_Print();
+    }
+    else {
+        tuple = PyTuple_New(1);
+        PyTuple_SET_ITEM(tuple, 0, self->arg);
+        result = PyObject_Call(self->func, tuple, NULL);
+        if (result == NULL)
+            PyErr_Print();
+    }
+}
+
 static void
 TrigFunc_generate(TrigFunc *self) {
     int i;
-    PyObject *tuple, *result;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
     for (i=0; i<self->bufsize; i++) {
         if (in[i] == 1) {
-            if (self->arg == Py_None) {
-                result = PyObject_Call(self->func, PyTuple_New(0), NULL);
-                if (result == NULL) {
-                    PyErr_Print();
-                    return;
-                }
-            }
-            else {
-                tuple = PyTuple_New(1);
-                PyTuple_SET_ITEM(tuple, 0, self->arg);
-                result = PyObject_Call(self->func, tuple, NULL);
-                if (result == NULL) {
-                    PyErr_Print();
-                    return;
-                }
-            }
+            Server_deferCall((Server *)self->server, (PyObject *)self, (void (*)(PyObject *, MYFLT *))TrigFunc_call, NULL, 0);
         }
     }
 }
@@ -1332,7 +1334,6 @@ TrigFunc_dealloc(TrigFunc* self)
 static PyObject *
 TrigFunc_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *functmp=NULL, *argtmp=NULL;
     TrigFunc *self;
     self = (TrigFunc *)type->tp_alloc(type, 0);
@@ -1341,6 +1342,7 @@ TrigFunc_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, TrigFunc_compute_next_data_frame);
+    Stream_setSerial(self->stream, 3);
 
     static char *kwlist[] = {"input", "function", "arg", NULL};
 
@@ -1357,7 +1359,7 @@ TrigFunc_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setArg", "O", argtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     return (PyObject *)self;
 }
@@ -1710,7 +1712,7 @@ TrigEnv_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->trigsBuffer = (MYFLT *)realloc(self->trigsBuffer, self->bufsize * sizeof(MYFLT));
 
@@ -2152,7 +2154,7 @@ TrigLinseg_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->trigsBuffer = (MYFLT *)realloc(self->trigsBuffer, self->bufsize * sizeof(MYFLT));
 
@@ -2555,7 +2557,7 @@ TrigExpseg_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->trigsBuffer = (MYFLT *)realloc(self->trigsBuffer, self->bufsize * sizeof(MYFLT));
 
@@ -3250,6 +3252,7 @@ TrigXnoise_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->loopLen = (rand() % 10) + 3;
 
     Stream_setFunctionPtr(self->stream, TrigXnoise_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = TrigXnoise_setProcMode;
 
     static char *kwlist[] = {"input", "type", "x1", "x2", "mul", "add", NULL};
@@ -3275,7 +3278,7 @@ TrigXnoise_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     TrigXnoise_setRandomType(self);
 
@@ -4038,6 +4041,7 @@ TrigXnoiseMidi_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->loopLen = (rand() % 10) + 3;
 
     Stream_setFunctionPtr(self->stream, TrigXnoiseMidi_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = TrigXnoiseMidi_setProcMode;
 
     static char *kwlist[] = {"input", "type", "x1", "x2", "scale", "range", "mul", "add", NULL};
@@ -4067,7 +4071,7 @@ TrigXnoiseMidi_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     TrigXnoiseMidi_setRandomType(self);
 
@@ -4474,7 +4478,6 @@ Counter_dealloc(Counter* self)
 static PyObject *
 Counter_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *multmp=NULL, *addtmp=NULL;
     Counter *self;
     self = (Counter *)type->tp_alloc(type, 0);
@@ -4505,7 +4508,7 @@ Counter_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     if (self->dir == 0 || self->dir == 2)
         self->tmp = self->min;
@@ -4913,7 +4916,6 @@ Thresh_dealloc(Thresh* self)
 static PyObject *
 Thresh_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *thresholdtmp, *multmp=NULL, *addtmp=NULL;
     Thresh *self;
     self = (Thresh *)type->tp_alloc(type, 0);
@@ -4947,7 +4949,7 @@ Thresh_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -5272,7 +5274,6 @@ Percent_dealloc(Percent* self)
 static PyObject *
 Percent_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *percenttmp, *multmp=NULL, *addtmp=NULL;
     Percent *self;
     self = (Percent *)type->tp_alloc(type, 0);
@@ -5284,6 +5285,7 @@ Percent_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Percent_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = Percent_setProcMode;
 
     static char *kwlist[] = {"input", "percent", "mul", "add", NULL};
@@ -5304,7 +5306,7 @@ Percent_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     Server_generateSeed((Server *)self->server, PERCENT_ID);
 
@@ -5600,7 +5602,6 @@ Timer_dealloc(Timer* self)
 static PyObject *
 Timer_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *input2tmp, *input2_streamtmp, *multmp=NULL, *addtmp=NULL;
     Timer *self;
     self = (Timer *)type->tp_alloc(type, 0);
@@ -5637,7 +5638,7 @@ Timer_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -5885,7 +5886,6 @@ Iter_dealloc(Iter* self)
 static PyObject *
 Iter_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     MYFLT inittmp = 0.0;
     PyObject *inputtmp, *input_streamtmp, *choicetmp=NULL, *multmp=NULL, *addtmp=NULL;
     Iter *self;
@@ -5919,7 +5919,7 @@ Iter_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->value = inittmp;
 
@@ -6215,7 +6215,6 @@ Count_dealloc(Count* self)
 static PyObject *
 Count_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *multmp=NULL, *addtmp=NULL;
     Count *self;
     self = (Count *)type->tp_alloc(type, 0);
@@ -6246,7 +6245,7 @@ Count_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -6520,7 +6519,6 @@ NextTrig_dealloc(NextTrig* self)
 static PyObject *
 NextTrig_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *input2tmp, *input2_streamtmp, *multmp=NULL, *addtmp=NULL;
     NextTrig *self;
     self = (NextTrig *)type->tp_alloc(type, 0);
@@ -6555,7 +6553,7 @@ NextTrig_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
@@ -6821,7 +6819,6 @@ TrigVal_dealloc(TrigVal* self)
 static PyObject *
 TrigVal_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *inputtmp, *input_streamtmp, *valuetmp=NULL, *multmp=NULL, *addtmp=NULL;
     TrigVal *self;
     self = (TrigVal *)type->tp_alloc(type, 0);
@@ -6855,7 +6852,7 @@ TrigVal_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 
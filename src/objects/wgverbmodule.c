@@ -425,11 +425,26 @@ WGVerb_setProcMode(WGVerb *self)
     }
 }
 
+/* Called by the server when the stream falls asleep. */
+static void
+WGVerb_reset_memories(WGVerb *self)
+{
+    int i, j;
+    self->total_signal = 0.0;
+    for (i=0; i<8; i++) {
+        self->lastSamples[i] = 0.0;
+        for (j=0; j<(self->size[i]+1); j++) {
+            self->buffer[i][j] = 0.;
+        }
+    }
+}
+
 static void
 WGVerb_compute_next_data_frame(WGVerb *self)
 {
     (*self->proc_func_ptr)(self);
     (*self->mix_func_ptr)(self);
+    Stream_measureRinging(self->stream);
     (*self->muladd_func_ptr)(self);
 }
 
@@ -497,6 +512,8 @@ WGVerb_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, WGVerb_compute_next_data_frame);
+    Stream_setResetFunctionPtr(self->stream, WGVerb_reset_memories);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = WGVerb_setProcMode;
 
     for (i=0; i<8; i++) {
@@ -537,7 +554,7 @@ WGVerb_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     for (i=0; i<8; i++) {
         self->size[i] = reverbParams[i][0] * (self->sr / 44100.0) + (int)(reverbParams[i][1] * self->sr + 0.5);
@@ -545,6 +562,8 @@ WGVerb_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         for (j=0; j<(self->size[i]+1); j++) {
             self->buffer[i][j] = 0.;
         }
+        if (self->size[i] > self->stream->tail)
+            Stream_setTail(self->stream, (int)self->size[i]);
     }
 
     (*self->mode_func_ptr)(self);
@@ -1485,6 +1504,7 @@ STReverb_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self->srfac = self->sr / 44100.0;
 
     Stream_setFunctionPtr(self->stream, STReverb_compute_next_data_frame);
+    Stream_setSerial(self->stream, 1);
     self->mode_func_ptr = STReverb_setProcMode;
 
     static char *kwlist[] = {"input", "inpos", "revtime", "cutoff", "mix", "roomSize", "firstRefGain", NULL};
@@ -1510,7 +1530,7 @@ STReverb_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setMix", "O", mixtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     self->firstRefGain = MYPOW(10.0, firstRefTmp * 0.05);
     if (roomSize < 0.25)
@@ -1949,7 +1969,6 @@ STRev_dealloc(STRev* self)
 static PyObject *
 STRev_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i;
     PyObject *maintmp=NULL, *multmp=NULL, *addtmp=NULL;
     STRev *self;
     self = (STRev *)type->tp_alloc(type, 0);
@@ -1978,7 +1997,7 @@ STRev_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         PyObject_CallMethod((PyObject *)self, "setAdd", "O", addtmp);
     }
 
-    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+    Server_appendStream((Server *)self->server, (PyObject *)self->stream);
 
     (*self->mode_func_ptr)(self);
 